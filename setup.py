@@ -23,7 +23,7 @@ setup(name='unified_planning',
       install_requires=['pyparsing'],
       extras_require={
           'dev':['tarski[arithmetic]','pytest','pytest-cov','mypy'],
-          'grpc': ['grpcio', 'grpcio-tools', 'grpc-stubs'],
+          'grpc': ['grpcio', 'grpcio-tools', 'grpc-stubs', 'protobuf>=3.20'],
           'tarski': ['tarski[arithmetic]'],
           'pyperplan': ['up-pyperplan==0.1.0.14.dev1'],
           'tamer': ['up-tamer==0.1.0.15.dev1'],
@@ -1,12 +1,10 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: unified_planning.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -15,2372 +13,111 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='unified_planning.proto',
-  package='',
-  syntax='proto3',
-  serialized_options=None,
-  serialized_pb=_b('\n\x16unified_planning.proto\"i\n\nExpression\x12\x13\n\x04\x61tom\x18\x01 \x01(\x0b\x32\x05.Atom\x12\x19\n\x04list\x18\x02 \x03(\x0b\x32\x0b.Expression\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x1d\n\x04kind\x18\x04 \x01(\x0e\x32\x0f.ExpressionKind\"\\\n\x04\x41tom\x12\x10\n\x06symbol\x18\x01 \x01(\tH\x00\x12\r\n\x03int\x18\x02 \x01(\x03H\x00\x12\x15\n\x04real\x18\x03 \x01(\x0b\x32\x05.RealH\x00\x12\x11\n\x07\x62oolean\x18\x04 \x01(\x08H\x00\x42\t\n\x07\x63ontent\".\n\x04Real\x12\x11\n\tnumerator\x18\x01 \x01(\x03\x12\x13\n\x0b\x64\x65nominator\x18\x02 \x01(\x03\"9\n\x0fTypeDeclaration\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\x13\n\x0bparent_type\x18\x02 \x01(\t\"\'\n\tParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"n\n\x06\x46luent\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nvalue_type\x18\x02 \x01(\t\x12\x1e\n\nparameters\x18\x03 \x03(\x0b\x32\n.Parameter\x12\"\n\rdefault_value\x18\x04 \x01(\x0b\x32\x0b.Expression\"/\n\x11ObjectDeclaration\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"\xcd\x01\n\x10\x45\x66\x66\x65\x63tExpression\x12*\n\x04kind\x18\x01 \x01(\x0e\x32\x1c.EffectExpression.EffectKind\x12\x1b\n\x06\x66luent\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x03 \x01(\x0b\x32\x0b.Expression\x12\x1e\n\tcondition\x18\x04 \x01(\x0b\x32\x0b.Expression\"4\n\nEffectKind\x12\n\n\x06\x41SSIGN\x10\x00\x12\x0c\n\x08INCREASE\x10\x01\x12\x0c\n\x08\x44\x45\x43REASE\x10\x02\"M\n\x06\x45\x66\x66\x65\x63t\x12!\n\x06\x65\x66\x66\x65\x63t\x18\x01 \x01(\x0b\x32\x11.EffectExpression\x12 \n\x0foccurrence_time\x18\x02 \x01(\x0b\x32\x07.Timing\"C\n\tCondition\x12\x19\n\x04\x63ond\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1b\n\x04span\x18\x02 \x01(\x0b\x32\r.TimeInterval\"\x8d\x01\n\x06\x41\x63tion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1e\n\nparameters\x18\x02 \x03(\x0b\x32\n.Parameter\x12\x1b\n\x08\x64uration\x18\x03 \x01(\x0b\x32\t.Duration\x12\x1e\n\nconditions\x18\x04 \x03(\x0b\x32\n.Condition\x12\x18\n\x07\x65\x66\x66\x65\x63ts\x18\x05 \x03(\x0b\x32\x07.Effect\"z\n\tTimepoint\x12&\n\x04kind\x18\x01 \x01(\x0e\x32\x18.Timepoint.TimepointKind\"E\n\rTimepointKind\x12\x10\n\x0cGLOBAL_START\x10\x00\x12\x0e\n\nGLOBAL_END\x10\x01\x12\t\n\x05START\x10\x02\x12\x07\n\x03\x45ND\x10\x03\"=\n\x06Timing\x12\x1d\n\ttimepoint\x18\x01 \x01(\x0b\x32\n.Timepoint\x12\x14\n\x05\x64\x65lay\x18\x02 \x01(\x0b\x32\x05.Real\"o\n\x08Interval\x12\x14\n\x0cis_left_open\x18\x01 \x01(\x08\x12\x1a\n\x05lower\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x15\n\ris_right_open\x18\x03 \x01(\x08\x12\x1a\n\x05upper\x18\x04 \x01(\x0b\x32\x0b.Expression\"k\n\x0cTimeInterval\x12\x14\n\x0cis_left_open\x18\x01 \x01(\x08\x12\x16\n\x05lower\x18\x02 \x01(\x0b\x32\x07.Timing\x12\x15\n\ris_right_open\x18\x03 \x01(\x08\x12\x16\n\x05upper\x18\x04 \x01(\x0b\x32\x07.Timing\"5\n\x08\x44uration\x12)\n\x16\x63ontrollable_in_bounds\x18\x01 \x01(\x0b\x32\t.Interval\"@\n\x04Goal\x12\x19\n\x04goal\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x06timing\x18\x02 \x01(\x0b\x32\r.TimeInterval\"R\n\x0bTimedEffect\x12!\n\x06\x65\x66\x66\x65\x63t\x18\x01 \x01(\x0b\x32\x11.EffectExpression\x12 \n\x0foccurrence_time\x18\x02 \x01(\x0b\x32\x07.Timing\"E\n\nAssignment\x12\x1b\n\x06\x66luent\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\"\x9c\x03\n\x06Metric\x12 \n\x04kind\x18\x01 \x01(\x0e\x32\x12.Metric.MetricKind\x12\x1f\n\nexpression\x18\x02 \x01(\x0b\x32\x0b.Expression\x12.\n\x0c\x61\x63tion_costs\x18\x03 \x03(\x0b\x32\x18.Metric.ActionCostsEntry\x12(\n\x13\x64\x65\x66\x61ult_action_cost\x18\x04 \x01(\x0b\x32\x0b.Expression\x1a?\n\x10\x41\x63tionCostsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression:\x02\x38\x01\"\xb3\x01\n\nMetricKind\x12\x19\n\x15MINIMIZE_ACTION_COSTS\x10\x00\x12#\n\x1fMINIMIZE_SEQUENTIAL_PLAN_LENGTH\x10\x01\x12\x15\n\x11MINIMIZE_MAKESPAN\x10\x02\x12&\n\"MINIMIZE_EXPRESSION_ON_FINAL_STATE\x10\x03\x12&\n\"MAXIMIZE_EXPRESSION_ON_FINAL_STATE\x10\x04\"\xc3\x02\n\x07Problem\x12\x13\n\x0b\x64omain_name\x18\x01 \x01(\t\x12\x14\n\x0cproblem_name\x18\x02 \x01(\t\x12\x1f\n\x05types\x18\x03 \x03(\x0b\x32\x10.TypeDeclaration\x12\x18\n\x07\x66luents\x18\x04 \x03(\x0b\x32\x07.Fluent\x12#\n\x07objects\x18\x05 \x03(\x0b\x32\x12.ObjectDeclaration\x12\x18\n\x07\x61\x63tions\x18\x06 \x03(\x0b\x32\x07.Action\x12\"\n\rinitial_state\x18\x07 \x03(\x0b\x32\x0b.Assignment\x12#\n\rtimed_effects\x18\x08 \x03(\x0b\x32\x0c.TimedEffect\x12\x14\n\x05goals\x18\t \x03(\x0b\x32\x05.Goal\x12\x1a\n\x08\x66\x65\x61tures\x18\n \x03(\x0e\x32\x08.Feature\x12\x18\n\x07metrics\x18\x0b \x03(\x0b\x32\x07.Metric\"\x80\x01\n\x0e\x41\x63tionInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x61\x63tion_name\x18\x02 \x01(\t\x12\x19\n\nparameters\x18\x03 \x03(\x0b\x32\x05.Atom\x12\x19\n\nstart_time\x18\x04 \x01(\x0b\x32\x05.Real\x12\x17\n\x08\x65nd_time\x18\x05 \x01(\x0b\x32\x05.Real\"(\n\x04Plan\x12 \n\x07\x61\x63tions\x18\x01 \x03(\x0b\x32\x0f.ActionInstance\"\x86\x02\n\x0bPlanRequest\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12*\n\x0fresolution_mode\x18\x02 \x01(\x0e\x32\x11.PlanRequest.Mode\x12\x0f\n\x07timeout\x18\x03 \x01(\x01\x12\x39\n\x0fplanner_options\x18\x04 \x03(\x0b\x32 .PlanRequest.PlannerOptionsEntry\x1a\x35\n\x13PlannerOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"-\n\x04Mode\x12\x0f\n\x0bSATISFIABLE\x10\x00\x12\x14\n\x10SOLVED_OPTIMALLY\x10\x01\"C\n\x11ValidationRequest\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12\x13\n\x04plan\x18\x02 \x01(\x0b\x32\x05.Plan\"{\n\nLogMessage\x12#\n\x05level\x18\x01 \x01(\x0e\x32\x14.LogMessage.LogLevel\x12\x0f\n\x07message\x18\x02 \x01(\t\"7\n\x08LogLevel\x12\t\n\x05\x44\x45\x42UG\x10\x00\x12\x08\n\x04INFO\x10\x01\x12\x0b\n\x07WARNING\x10\x02\x12\t\n\x05\x45RROR\x10\x03\"\xbf\x03\n\x14PlanGenerationResult\x12,\n\x06status\x18\x01 \x01(\x0e\x32\x1c.PlanGenerationResult.Status\x12\x13\n\x04plan\x18\x02 \x01(\x0b\x32\x05.Plan\x12\x33\n\x07metrics\x18\x03 \x03(\x0b\x32\".PlanGenerationResult.MetricsEntry\x12!\n\x0clog_messages\x18\x04 \x03(\x0b\x32\x0b.LogMessage\x12\x17\n\x06\x65ngine\x18\x05 \x01(\x0b\x32\x07.Engine\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xc2\x01\n\x06Status\x12\x16\n\x12SOLVED_SATISFICING\x10\x00\x12\x14\n\x10SOLVED_OPTIMALLY\x10\x01\x12\x15\n\x11UNSOLVABLE_PROVEN\x10\x02\x12\x1b\n\x17UNSOLVABLE_INCOMPLETELY\x10\x03\x12\x0b\n\x07TIMEOUT\x10\r\x12\n\n\x06MEMOUT\x10\x0e\x12\x12\n\x0eINTERNAL_ERROR\x10\x0f\x12\x17\n\x13UNSUPPORTED_PROBLEM\x10\x10\x12\x10\n\x0cINTERMEDIATE\x10\x11\"\x16\n\x06\x45ngine\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xba\x01\n\x10ValidationResult\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ValidationResult.ValidationResultStatus\x12!\n\x0clog_messages\x18\x02 \x03(\x0b\x32\x0b.LogMessage\x12\x17\n\x06\x65ngine\x18\x03 \x01(\x0b\x32\x07.Engine\"0\n\x16ValidationResultStatus\x12\t\n\x05VALID\x10\x00\x12\x0b\n\x07INVALID\x10\x01\"\xee\x01\n\x0fGroundingResult\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12=\n\x10map_to_lift_plan\x18\x02 \x03(\x0b\x32#.GroundingResult.MapToLiftPlanEntry\x12!\n\x0clog_messages\x18\x03 \x03(\x0b\x32\x0b.LogMessage\x12\x17\n\x06\x65ngine\x18\x04 \x01(\x0b\x32\x07.Engine\x1a\x45\n\x12MapToLiftPlanEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1e\n\x05value\x18\x02 \x01(\x0b\x32\x0f.ActionInstance:\x02\x38\x01*\x9e\x01\n\x0e\x45xpressionKind\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0c\n\x08\x43ONSTANT\x10\x01\x12\r\n\tPARAMETER\x10\x02\x12\x0c\n\x08VARIABLE\x10\x07\x12\x11\n\rFLUENT_SYMBOL\x10\x03\x12\x13\n\x0f\x46UNCTION_SYMBOL\x10\x04\x12\x12\n\x0eSTATE_VARIABLE\x10\x05\x12\x18\n\x14\x46UNCTION_APPLICATION\x10\x06*\xc2\x04\n\x07\x46\x65\x61ture\x12\x10\n\x0c\x41\x43TION_BASED\x10\x00\x12\x13\n\x0f\x43ONTINUOUS_TIME\x10\x01\x12\x11\n\rDISCRETE_TIME\x10\x02\x12\'\n#INTERMEDIATE_CONDITIONS_AND_EFFECTS\x10\x03\x12\x10\n\x0cTIMED_EFFECT\x10\x04\x12\x0f\n\x0bTIMED_GOALS\x10\x05\x12\x19\n\x15\x44URATION_INEQUALITIES\x10\x06\x12\x16\n\x12\x43ONTINUOUS_NUMBERS\x10\x07\x12\x14\n\x10\x44ISCRETE_NUMBERS\x10\x08\x12\x17\n\x13NEGATIVE_CONDITIONS\x10\t\x12\x1a\n\x16\x44ISJUNCTIVE_CONDITIONS\x10\n\x12\x0c\n\x08\x45QUALITY\x10\x0b\x12\x1a\n\x16\x45XISTENTIAL_CONDITIONS\x10\x0c\x12\x18\n\x14UNIVERSAL_CONDITIONS\x10\r\x12\x17\n\x13\x43ONDITIONAL_EFFECTS\x10\x0e\x12\x14\n\x10INCREASE_EFFECTS\x10\x0f\x12\x14\n\x10\x44\x45\x43REASE_EFFECTS\x10\x10\x12\x0f\n\x0b\x46LAT_TYPING\x10\x11\x12\x17\n\x13HIERARCHICAL_TYPING\x10\x12\x12\x13\n\x0fNUMERIC_FLUENTS\x10\x13\x12\x12\n\x0eOBJECT_FLUENTS\x10\x14\x12\x10\n\x0c\x41\x43TIONS_COST\x10\x15\x12\x0f\n\x0b\x46INAL_VALUE\x10\x16\x12\x0c\n\x08MAKESPAN\x10\x17\x12\x0f\n\x0bPLAN_LENGTH\x10\x18\x12\x15\n\x11SIMULATED_EFFECTS\x10\x19\x32\xa8\x01\n\x0fUnifiedPlanning\x12\x34\n\x0bplanOneShot\x12\x0c.PlanRequest\x1a\x15.PlanGenerationResult0\x01\x12\x36\n\rplanValdation\x12\x12.ValidationRequest\x1a\x11.ValidationResult\x12\'\n\tgrounding\x12\x08.Problem\x1a\x10.GroundingResultb\x06proto3')
-)
-
-_EXPRESSIONKIND = _descriptor.EnumDescriptor(
-  name='ExpressionKind',
-  full_name='ExpressionKind',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKNOWN', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONSTANT', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PARAMETER', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VARIABLE', index=3, number=7,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FLUENT_SYMBOL', index=4, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FUNCTION_SYMBOL', index=5, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STATE_VARIABLE', index=6, number=5,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FUNCTION_APPLICATION', index=7, number=6,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3999,
-  serialized_end=4157,
-)
-_sym_db.RegisterEnumDescriptor(_EXPRESSIONKIND)
-
-ExpressionKind = enum_type_wrapper.EnumTypeWrapper(_EXPRESSIONKIND)
-_FEATURE = _descriptor.EnumDescriptor(
-  name='Feature',
-  full_name='Feature',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='ACTION_BASED', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONTINUOUS_TIME', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DISCRETE_TIME', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INTERMEDIATE_CONDITIONS_AND_EFFECTS', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TIMED_EFFECT', index=4, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TIMED_GOALS', index=5, number=5,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DURATION_INEQUALITIES', index=6, number=6,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONTINUOUS_NUMBERS', index=7, number=7,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DISCRETE_NUMBERS', index=8, number=8,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NEGATIVE_CONDITIONS', index=9, number=9,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DISJUNCTIVE_CONDITIONS', index=10, number=10,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EQUALITY', index=11, number=11,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EXISTENTIAL_CONDITIONS', index=12, number=12,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNIVERSAL_CONDITIONS', index=13, number=13,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONDITIONAL_EFFECTS', index=14, number=14,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INCREASE_EFFECTS', index=15, number=15,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DECREASE_EFFECTS', index=16, number=16,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FLAT_TYPING', index=17, number=17,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='HIERARCHICAL_TYPING', index=18, number=18,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NUMERIC_FLUENTS', index=19, number=19,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OBJECT_FLUENTS', index=20, number=20,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ACTIONS_COST', index=21, number=21,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FINAL_VALUE', index=22, number=22,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MAKESPAN', index=23, number=23,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PLAN_LENGTH', index=24, number=24,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SIMULATED_EFFECTS', index=25, number=25,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=4160,
-  serialized_end=4738,
-)
-_sym_db.RegisterEnumDescriptor(_FEATURE)
-
-Feature = enum_type_wrapper.EnumTypeWrapper(_FEATURE)
-UNKNOWN = 0
-CONSTANT = 1
-PARAMETER = 2
-VARIABLE = 7
-FLUENT_SYMBOL = 3
-FUNCTION_SYMBOL = 4
-STATE_VARIABLE = 5
-FUNCTION_APPLICATION = 6
-ACTION_BASED = 0
-CONTINUOUS_TIME = 1
-DISCRETE_TIME = 2
-INTERMEDIATE_CONDITIONS_AND_EFFECTS = 3
-TIMED_EFFECT = 4
-TIMED_GOALS = 5
-DURATION_INEQUALITIES = 6
-CONTINUOUS_NUMBERS = 7
-DISCRETE_NUMBERS = 8
-NEGATIVE_CONDITIONS = 9
-DISJUNCTIVE_CONDITIONS = 10
-EQUALITY = 11
-EXISTENTIAL_CONDITIONS = 12
-UNIVERSAL_CONDITIONS = 13
-CONDITIONAL_EFFECTS = 14
-INCREASE_EFFECTS = 15
-DECREASE_EFFECTS = 16
-FLAT_TYPING = 17
-HIERARCHICAL_TYPING = 18
-NUMERIC_FLUENTS = 19
-OBJECT_FLUENTS = 20
-ACTIONS_COST = 21
-FINAL_VALUE = 22
-MAKESPAN = 23
-PLAN_LENGTH = 24
-SIMULATED_EFFECTS = 25
-
-
-_EFFECTEXPRESSION_EFFECTKIND = _descriptor.EnumDescriptor(
-  name='EffectKind',
-  full_name='EffectExpression.EffectKind',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='ASSIGN', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INCREASE', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DECREASE', index=2, number=2,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=690,
-  serialized_end=742,
-)
-_sym_db.RegisterEnumDescriptor(_EFFECTEXPRESSION_EFFECTKIND)
-
-_TIMEPOINT_TIMEPOINTKIND = _descriptor.EnumDescriptor(
-  name='TimepointKind',
-  full_name='Timepoint.TimepointKind',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='GLOBAL_START', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GLOBAL_END', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='START', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='END', index=3, number=3,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1089,
-  serialized_end=1158,
-)
-_sym_db.RegisterEnumDescriptor(_TIMEPOINT_TIMEPOINTKIND)
-
-_METRIC_METRICKIND = _descriptor.EnumDescriptor(
-  name='MetricKind',
-  full_name='Metric.MetricKind',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='MINIMIZE_ACTION_COSTS', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MINIMIZE_SEQUENTIAL_PLAN_LENGTH', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MINIMIZE_MAKESPAN', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MINIMIZE_EXPRESSION_ON_FINAL_STATE', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MAXIMIZE_EXPRESSION_ON_FINAL_STATE', index=4, number=4,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1955,
-  serialized_end=2134,
-)
-_sym_db.RegisterEnumDescriptor(_METRIC_METRICKIND)
-
-_PLANREQUEST_MODE = _descriptor.EnumDescriptor(
-  name='Mode',
-  full_name='PlanRequest.Mode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SATISFIABLE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SOLVED_OPTIMALLY', index=1, number=1,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2853,
-  serialized_end=2898,
-)
-_sym_db.RegisterEnumDescriptor(_PLANREQUEST_MODE)
-
-_LOGMESSAGE_LOGLEVEL = _descriptor.EnumDescriptor(
-  name='LogLevel',
-  full_name='LogMessage.LogLevel',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='DEBUG', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INFO', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WARNING', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ERROR', index=3, number=3,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3037,
-  serialized_end=3092,
-)
-_sym_db.RegisterEnumDescriptor(_LOGMESSAGE_LOGLEVEL)
-
-_PLANGENERATIONRESULT_STATUS = _descriptor.EnumDescriptor(
-  name='Status',
-  full_name='PlanGenerationResult.Status',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SOLVED_SATISFICING', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SOLVED_OPTIMALLY', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNSOLVABLE_PROVEN', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNSOLVABLE_INCOMPLETELY', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TIMEOUT', index=4, number=13,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MEMOUT', index=5, number=14,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INTERNAL_ERROR', index=6, number=15,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNSUPPORTED_PROBLEM', index=7, number=16,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INTERMEDIATE', index=8, number=17,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3348,
-  serialized_end=3542,
-)
-_sym_db.RegisterEnumDescriptor(_PLANGENERATIONRESULT_STATUS)
-
-_VALIDATIONRESULT_VALIDATIONRESULTSTATUS = _descriptor.EnumDescriptor(
-  name='ValidationResultStatus',
-  full_name='ValidationResult.ValidationResultStatus',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='VALID', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INVALID', index=1, number=1,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3707,
-  serialized_end=3755,
-)
-_sym_db.RegisterEnumDescriptor(_VALIDATIONRESULT_VALIDATIONRESULTSTATUS)
-
-
-_EXPRESSION = _descriptor.Descriptor(
-  name='Expression',
-  full_name='Expression',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='atom', full_name='Expression.atom', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='list', full_name='Expression.list', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='Expression.type', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='Expression.kind', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=26,
-  serialized_end=131,
-)
-
-
-_ATOM = _descriptor.Descriptor(
-  name='Atom',
-  full_name='Atom',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='symbol', full_name='Atom.symbol', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='int', full_name='Atom.int', index=1,
-      number=2, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='real', full_name='Atom.real', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='boolean', full_name='Atom.boolean', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='content', full_name='Atom.content',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=133,
-  serialized_end=225,
-)
-
-
-_REAL = _descriptor.Descriptor(
-  name='Real',
-  full_name='Real',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='numerator', full_name='Real.numerator', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='denominator', full_name='Real.denominator', index=1,
-      number=2, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=227,
-  serialized_end=273,
-)
-
-
-_TYPEDECLARATION = _descriptor.Descriptor(
-  name='TypeDeclaration',
-  full_name='TypeDeclaration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type_name', full_name='TypeDeclaration.type_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parent_type', full_name='TypeDeclaration.parent_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=275,
-  serialized_end=332,
-)
-
-
-_PARAMETER = _descriptor.Descriptor(
-  name='Parameter',
-  full_name='Parameter',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Parameter.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='Parameter.type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=334,
-  serialized_end=373,
-)
-
-
-_FLUENT = _descriptor.Descriptor(
-  name='Fluent',
-  full_name='Fluent',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Fluent.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value_type', full_name='Fluent.value_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parameters', full_name='Fluent.parameters', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='default_value', full_name='Fluent.default_value', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=375,
-  serialized_end=485,
-)
-
-
-_OBJECTDECLARATION = _descriptor.Descriptor(
-  name='ObjectDeclaration',
-  full_name='ObjectDeclaration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='ObjectDeclaration.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='ObjectDeclaration.type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=487,
-  serialized_end=534,
-)
-
-
-_EFFECTEXPRESSION = _descriptor.Descriptor(
-  name='EffectExpression',
-  full_name='EffectExpression',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='EffectExpression.kind', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='fluent', full_name='EffectExpression.fluent', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='EffectExpression.value', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='condition', full_name='EffectExpression.condition', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _EFFECTEXPRESSION_EFFECTKIND,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=537,
-  serialized_end=742,
-)
-
-
-_EFFECT = _descriptor.Descriptor(
-  name='Effect',
-  full_name='Effect',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='effect', full_name='Effect.effect', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='occurrence_time', full_name='Effect.occurrence_time', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=744,
-  serialized_end=821,
-)
-
-
-_CONDITION = _descriptor.Descriptor(
-  name='Condition',
-  full_name='Condition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='cond', full_name='Condition.cond', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='span', full_name='Condition.span', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=823,
-  serialized_end=890,
-)
-
-
-_ACTION = _descriptor.Descriptor(
-  name='Action',
-  full_name='Action',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Action.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parameters', full_name='Action.parameters', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='duration', full_name='Action.duration', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='conditions', full_name='Action.conditions', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='effects', full_name='Action.effects', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=893,
-  serialized_end=1034,
-)
-
-
-_TIMEPOINT = _descriptor.Descriptor(
-  name='Timepoint',
-  full_name='Timepoint',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='Timepoint.kind', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _TIMEPOINT_TIMEPOINTKIND,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1036,
-  serialized_end=1158,
-)
-
-
-_TIMING = _descriptor.Descriptor(
-  name='Timing',
-  full_name='Timing',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='timepoint', full_name='Timing.timepoint', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='delay', full_name='Timing.delay', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1160,
-  serialized_end=1221,
-)
-
-
-_INTERVAL = _descriptor.Descriptor(
-  name='Interval',
-  full_name='Interval',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='is_left_open', full_name='Interval.is_left_open', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='lower', full_name='Interval.lower', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='is_right_open', full_name='Interval.is_right_open', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='upper', full_name='Interval.upper', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1223,
-  serialized_end=1334,
-)
-
-
-_TIMEINTERVAL = _descriptor.Descriptor(
-  name='TimeInterval',
-  full_name='TimeInterval',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='is_left_open', full_name='TimeInterval.is_left_open', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='lower', full_name='TimeInterval.lower', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='is_right_open', full_name='TimeInterval.is_right_open', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='upper', full_name='TimeInterval.upper', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1336,
-  serialized_end=1443,
-)
-
-
-_DURATION = _descriptor.Descriptor(
-  name='Duration',
-  full_name='Duration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='controllable_in_bounds', full_name='Duration.controllable_in_bounds', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1445,
-  serialized_end=1498,
-)
-
-
-_GOAL = _descriptor.Descriptor(
-  name='Goal',
-  full_name='Goal',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='goal', full_name='Goal.goal', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='timing', full_name='Goal.timing', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1500,
-  serialized_end=1564,
-)
-
-
-_TIMEDEFFECT = _descriptor.Descriptor(
-  name='TimedEffect',
-  full_name='TimedEffect',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='effect', full_name='TimedEffect.effect', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='occurrence_time', full_name='TimedEffect.occurrence_time', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1566,
-  serialized_end=1648,
-)
-
-
-_ASSIGNMENT = _descriptor.Descriptor(
-  name='Assignment',
-  full_name='Assignment',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='fluent', full_name='Assignment.fluent', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='Assignment.value', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1650,
-  serialized_end=1719,
-)
-
-
-_METRIC_ACTIONCOSTSENTRY = _descriptor.Descriptor(
-  name='ActionCostsEntry',
-  full_name='Metric.ActionCostsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='Metric.ActionCostsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='Metric.ActionCostsEntry.value', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1889,
-  serialized_end=1952,
-)
-
-_METRIC = _descriptor.Descriptor(
-  name='Metric',
-  full_name='Metric',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='kind', full_name='Metric.kind', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='expression', full_name='Metric.expression', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='action_costs', full_name='Metric.action_costs', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='default_action_cost', full_name='Metric.default_action_cost', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_METRIC_ACTIONCOSTSENTRY, ],
-  enum_types=[
-    _METRIC_METRICKIND,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1722,
-  serialized_end=2134,
-)
-
-
-_PROBLEM = _descriptor.Descriptor(
-  name='Problem',
-  full_name='Problem',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='domain_name', full_name='Problem.domain_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='problem_name', full_name='Problem.problem_name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='types', full_name='Problem.types', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='fluents', full_name='Problem.fluents', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='objects', full_name='Problem.objects', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='actions', full_name='Problem.actions', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='initial_state', full_name='Problem.initial_state', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='timed_effects', full_name='Problem.timed_effects', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='goals', full_name='Problem.goals', index=8,
-      number=9, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='features', full_name='Problem.features', index=9,
-      number=10, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='metrics', full_name='Problem.metrics', index=10,
-      number=11, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2137,
-  serialized_end=2460,
-)
-
-
-_ACTIONINSTANCE = _descriptor.Descriptor(
-  name='ActionInstance',
-  full_name='ActionInstance',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='ActionInstance.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='action_name', full_name='ActionInstance.action_name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parameters', full_name='ActionInstance.parameters', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='start_time', full_name='ActionInstance.start_time', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='end_time', full_name='ActionInstance.end_time', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2463,
-  serialized_end=2591,
-)
-
-
-_PLAN = _descriptor.Descriptor(
-  name='Plan',
-  full_name='Plan',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='actions', full_name='Plan.actions', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2593,
-  serialized_end=2633,
-)
-
-
-_PLANREQUEST_PLANNEROPTIONSENTRY = _descriptor.Descriptor(
-  name='PlannerOptionsEntry',
-  full_name='PlanRequest.PlannerOptionsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='PlanRequest.PlannerOptionsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='PlanRequest.PlannerOptionsEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2798,
-  serialized_end=2851,
-)
-
-_PLANREQUEST = _descriptor.Descriptor(
-  name='PlanRequest',
-  full_name='PlanRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='problem', full_name='PlanRequest.problem', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='resolution_mode', full_name='PlanRequest.resolution_mode', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='timeout', full_name='PlanRequest.timeout', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='planner_options', full_name='PlanRequest.planner_options', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_PLANREQUEST_PLANNEROPTIONSENTRY, ],
-  enum_types=[
-    _PLANREQUEST_MODE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2636,
-  serialized_end=2898,
-)
-
-
-_VALIDATIONREQUEST = _descriptor.Descriptor(
-  name='ValidationRequest',
-  full_name='ValidationRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='problem', full_name='ValidationRequest.problem', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='plan', full_name='ValidationRequest.plan', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2900,
-  serialized_end=2967,
-)
-
-
-_LOGMESSAGE = _descriptor.Descriptor(
-  name='LogMessage',
-  full_name='LogMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='level', full_name='LogMessage.level', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='LogMessage.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _LOGMESSAGE_LOGLEVEL,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2969,
-  serialized_end=3092,
-)
-
-
-_PLANGENERATIONRESULT_METRICSENTRY = _descriptor.Descriptor(
-  name='MetricsEntry',
-  full_name='PlanGenerationResult.MetricsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='PlanGenerationResult.MetricsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='PlanGenerationResult.MetricsEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3299,
-  serialized_end=3345,
-)
-
-_PLANGENERATIONRESULT = _descriptor.Descriptor(
-  name='PlanGenerationResult',
-  full_name='PlanGenerationResult',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='PlanGenerationResult.status', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='plan', full_name='PlanGenerationResult.plan', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='metrics', full_name='PlanGenerationResult.metrics', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='log_messages', full_name='PlanGenerationResult.log_messages', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='engine', full_name='PlanGenerationResult.engine', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_PLANGENERATIONRESULT_METRICSENTRY, ],
-  enum_types=[
-    _PLANGENERATIONRESULT_STATUS,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3095,
-  serialized_end=3542,
-)
-
-
-_ENGINE = _descriptor.Descriptor(
-  name='Engine',
-  full_name='Engine',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='Engine.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3544,
-  serialized_end=3566,
-)
-
-
-_VALIDATIONRESULT = _descriptor.Descriptor(
-  name='ValidationResult',
-  full_name='ValidationResult',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='ValidationResult.status', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='log_messages', full_name='ValidationResult.log_messages', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='engine', full_name='ValidationResult.engine', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _VALIDATIONRESULT_VALIDATIONRESULTSTATUS,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3569,
-  serialized_end=3755,
-)
-
-
-_GROUNDINGRESULT_MAPTOLIFTPLANENTRY = _descriptor.Descriptor(
-  name='MapToLiftPlanEntry',
-  full_name='GroundingResult.MapToLiftPlanEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='GroundingResult.MapToLiftPlanEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='GroundingResult.MapToLiftPlanEntry.value', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3927,
-  serialized_end=3996,
-)
-
-_GROUNDINGRESULT = _descriptor.Descriptor(
-  name='GroundingResult',
-  full_name='GroundingResult',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='problem', full_name='GroundingResult.problem', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='map_to_lift_plan', full_name='GroundingResult.map_to_lift_plan', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='log_messages', full_name='GroundingResult.log_messages', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='engine', full_name='GroundingResult.engine', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_GROUNDINGRESULT_MAPTOLIFTPLANENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3758,
-  serialized_end=3996,
-)
-
-_EXPRESSION.fields_by_name['atom'].message_type = _ATOM
-_EXPRESSION.fields_by_name['list'].message_type = _EXPRESSION
-_EXPRESSION.fields_by_name['kind'].enum_type = _EXPRESSIONKIND
-_ATOM.fields_by_name['real'].message_type = _REAL
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['symbol'])
-_ATOM.fields_by_name['symbol'].containing_oneof = _ATOM.oneofs_by_name['content']
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['int'])
-_ATOM.fields_by_name['int'].containing_oneof = _ATOM.oneofs_by_name['content']
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['real'])
-_ATOM.fields_by_name['real'].containing_oneof = _ATOM.oneofs_by_name['content']
-_ATOM.oneofs_by_name['content'].fields.append(
-  _ATOM.fields_by_name['boolean'])
-_ATOM.fields_by_name['boolean'].containing_oneof = _ATOM.oneofs_by_name['content']
-_FLUENT.fields_by_name['parameters'].message_type = _PARAMETER
-_FLUENT.fields_by_name['default_value'].message_type = _EXPRESSION
-_EFFECTEXPRESSION.fields_by_name['kind'].enum_type = _EFFECTEXPRESSION_EFFECTKIND
-_EFFECTEXPRESSION.fields_by_name['fluent'].message_type = _EXPRESSION
-_EFFECTEXPRESSION.fields_by_name['value'].message_type = _EXPRESSION
-_EFFECTEXPRESSION.fields_by_name['condition'].message_type = _EXPRESSION
-_EFFECTEXPRESSION_EFFECTKIND.containing_type = _EFFECTEXPRESSION
-_EFFECT.fields_by_name['effect'].message_type = _EFFECTEXPRESSION
-_EFFECT.fields_by_name['occurrence_time'].message_type = _TIMING
-_CONDITION.fields_by_name['cond'].message_type = _EXPRESSION
-_CONDITION.fields_by_name['span'].message_type = _TIMEINTERVAL
-_ACTION.fields_by_name['parameters'].message_type = _PARAMETER
-_ACTION.fields_by_name['duration'].message_type = _DURATION
-_ACTION.fields_by_name['conditions'].message_type = _CONDITION
-_ACTION.fields_by_name['effects'].message_type = _EFFECT
-_TIMEPOINT.fields_by_name['kind'].enum_type = _TIMEPOINT_TIMEPOINTKIND
-_TIMEPOINT_TIMEPOINTKIND.containing_type = _TIMEPOINT
-_TIMING.fields_by_name['timepoint'].message_type = _TIMEPOINT
-_TIMING.fields_by_name['delay'].message_type = _REAL
-_INTERVAL.fields_by_name['lower'].message_type = _EXPRESSION
-_INTERVAL.fields_by_name['upper'].message_type = _EXPRESSION
-_TIMEINTERVAL.fields_by_name['lower'].message_type = _TIMING
-_TIMEINTERVAL.fields_by_name['upper'].message_type = _TIMING
-_DURATION.fields_by_name['controllable_in_bounds'].message_type = _INTERVAL
-_GOAL.fields_by_name['goal'].message_type = _EXPRESSION
-_GOAL.fields_by_name['timing'].message_type = _TIMEINTERVAL
-_TIMEDEFFECT.fields_by_name['effect'].message_type = _EFFECTEXPRESSION
-_TIMEDEFFECT.fields_by_name['occurrence_time'].message_type = _TIMING
-_ASSIGNMENT.fields_by_name['fluent'].message_type = _EXPRESSION
-_ASSIGNMENT.fields_by_name['value'].message_type = _EXPRESSION
-_METRIC_ACTIONCOSTSENTRY.fields_by_name['value'].message_type = _EXPRESSION
-_METRIC_ACTIONCOSTSENTRY.containing_type = _METRIC
-_METRIC.fields_by_name['kind'].enum_type = _METRIC_METRICKIND
-_METRIC.fields_by_name['expression'].message_type = _EXPRESSION
-_METRIC.fields_by_name['action_costs'].message_type = _METRIC_ACTIONCOSTSENTRY
-_METRIC.fields_by_name['default_action_cost'].message_type = _EXPRESSION
-_METRIC_METRICKIND.containing_type = _METRIC
-_PROBLEM.fields_by_name['types'].message_type = _TYPEDECLARATION
-_PROBLEM.fields_by_name['fluents'].message_type = _FLUENT
-_PROBLEM.fields_by_name['objects'].message_type = _OBJECTDECLARATION
-_PROBLEM.fields_by_name['actions'].message_type = _ACTION
-_PROBLEM.fields_by_name['initial_state'].message_type = _ASSIGNMENT
-_PROBLEM.fields_by_name['timed_effects'].message_type = _TIMEDEFFECT
-_PROBLEM.fields_by_name['goals'].message_type = _GOAL
-_PROBLEM.fields_by_name['features'].enum_type = _FEATURE
-_PROBLEM.fields_by_name['metrics'].message_type = _METRIC
-_ACTIONINSTANCE.fields_by_name['parameters'].message_type = _ATOM
-_ACTIONINSTANCE.fields_by_name['start_time'].message_type = _REAL
-_ACTIONINSTANCE.fields_by_name['end_time'].message_type = _REAL
-_PLAN.fields_by_name['actions'].message_type = _ACTIONINSTANCE
-_PLANREQUEST_PLANNEROPTIONSENTRY.containing_type = _PLANREQUEST
-_PLANREQUEST.fields_by_name['problem'].message_type = _PROBLEM
-_PLANREQUEST.fields_by_name['resolution_mode'].enum_type = _PLANREQUEST_MODE
-_PLANREQUEST.fields_by_name['planner_options'].message_type = _PLANREQUEST_PLANNEROPTIONSENTRY
-_PLANREQUEST_MODE.containing_type = _PLANREQUEST
-_VALIDATIONREQUEST.fields_by_name['problem'].message_type = _PROBLEM
-_VALIDATIONREQUEST.fields_by_name['plan'].message_type = _PLAN
-_LOGMESSAGE.fields_by_name['level'].enum_type = _LOGMESSAGE_LOGLEVEL
-_LOGMESSAGE_LOGLEVEL.containing_type = _LOGMESSAGE
-_PLANGENERATIONRESULT_METRICSENTRY.containing_type = _PLANGENERATIONRESULT
-_PLANGENERATIONRESULT.fields_by_name['status'].enum_type = _PLANGENERATIONRESULT_STATUS
-_PLANGENERATIONRESULT.fields_by_name['plan'].message_type = _PLAN
-_PLANGENERATIONRESULT.fields_by_name['metrics'].message_type = _PLANGENERATIONRESULT_METRICSENTRY
-_PLANGENERATIONRESULT.fields_by_name['log_messages'].message_type = _LOGMESSAGE
-_PLANGENERATIONRESULT.fields_by_name['engine'].message_type = _ENGINE
-_PLANGENERATIONRESULT_STATUS.containing_type = _PLANGENERATIONRESULT
-_VALIDATIONRESULT.fields_by_name['status'].enum_type = _VALIDATIONRESULT_VALIDATIONRESULTSTATUS
-_VALIDATIONRESULT.fields_by_name['log_messages'].message_type = _LOGMESSAGE
-_VALIDATIONRESULT.fields_by_name['engine'].message_type = _ENGINE
-_VALIDATIONRESULT_VALIDATIONRESULTSTATUS.containing_type = _VALIDATIONRESULT
-_GROUNDINGRESULT_MAPTOLIFTPLANENTRY.fields_by_name['value'].message_type = _ACTIONINSTANCE
-_GROUNDINGRESULT_MAPTOLIFTPLANENTRY.containing_type = _GROUNDINGRESULT
-_GROUNDINGRESULT.fields_by_name['problem'].message_type = _PROBLEM
-_GROUNDINGRESULT.fields_by_name['map_to_lift_plan'].message_type = _GROUNDINGRESULT_MAPTOLIFTPLANENTRY
-_GROUNDINGRESULT.fields_by_name['log_messages'].message_type = _LOGMESSAGE
-_GROUNDINGRESULT.fields_by_name['engine'].message_type = _ENGINE
-DESCRIPTOR.message_types_by_name['Expression'] = _EXPRESSION
-DESCRIPTOR.message_types_by_name['Atom'] = _ATOM
-DESCRIPTOR.message_types_by_name['Real'] = _REAL
-DESCRIPTOR.message_types_by_name['TypeDeclaration'] = _TYPEDECLARATION
-DESCRIPTOR.message_types_by_name['Parameter'] = _PARAMETER
-DESCRIPTOR.message_types_by_name['Fluent'] = _FLUENT
-DESCRIPTOR.message_types_by_name['ObjectDeclaration'] = _OBJECTDECLARATION
-DESCRIPTOR.message_types_by_name['EffectExpression'] = _EFFECTEXPRESSION
-DESCRIPTOR.message_types_by_name['Effect'] = _EFFECT
-DESCRIPTOR.message_types_by_name['Condition'] = _CONDITION
-DESCRIPTOR.message_types_by_name['Action'] = _ACTION
-DESCRIPTOR.message_types_by_name['Timepoint'] = _TIMEPOINT
-DESCRIPTOR.message_types_by_name['Timing'] = _TIMING
-DESCRIPTOR.message_types_by_name['Interval'] = _INTERVAL
-DESCRIPTOR.message_types_by_name['TimeInterval'] = _TIMEINTERVAL
-DESCRIPTOR.message_types_by_name['Duration'] = _DURATION
-DESCRIPTOR.message_types_by_name['Goal'] = _GOAL
-DESCRIPTOR.message_types_by_name['TimedEffect'] = _TIMEDEFFECT
-DESCRIPTOR.message_types_by_name['Assignment'] = _ASSIGNMENT
-DESCRIPTOR.message_types_by_name['Metric'] = _METRIC
-DESCRIPTOR.message_types_by_name['Problem'] = _PROBLEM
-DESCRIPTOR.message_types_by_name['ActionInstance'] = _ACTIONINSTANCE
-DESCRIPTOR.message_types_by_name['Plan'] = _PLAN
-DESCRIPTOR.message_types_by_name['PlanRequest'] = _PLANREQUEST
-DESCRIPTOR.message_types_by_name['ValidationRequest'] = _VALIDATIONREQUEST
-DESCRIPTOR.message_types_by_name['LogMessage'] = _LOGMESSAGE
-DESCRIPTOR.message_types_by_name['PlanGenerationResult'] = _PLANGENERATIONRESULT
-DESCRIPTOR.message_types_by_name['Engine'] = _ENGINE
-DESCRIPTOR.message_types_by_name['ValidationResult'] = _VALIDATIONRESULT
-DESCRIPTOR.message_types_by_name['GroundingResult'] = _GROUNDINGRESULT
-DESCRIPTOR.enum_types_by_name['ExpressionKind'] = _EXPRESSIONKIND
-DESCRIPTOR.enum_types_by_name['Feature'] = _FEATURE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Expression = _reflection.GeneratedProtocolMessageType('Expression', (_message.Message,), dict(
-  DESCRIPTOR = _EXPRESSION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Expression)
-  ))
-_sym_db.RegisterMessage(Expression)
-
-Atom = _reflection.GeneratedProtocolMessageType('Atom', (_message.Message,), dict(
-  DESCRIPTOR = _ATOM,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Atom)
-  ))
-_sym_db.RegisterMessage(Atom)
-
-Real = _reflection.GeneratedProtocolMessageType('Real', (_message.Message,), dict(
-  DESCRIPTOR = _REAL,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Real)
-  ))
-_sym_db.RegisterMessage(Real)
-
-TypeDeclaration = _reflection.GeneratedProtocolMessageType('TypeDeclaration', (_message.Message,), dict(
-  DESCRIPTOR = _TYPEDECLARATION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:TypeDeclaration)
-  ))
-_sym_db.RegisterMessage(TypeDeclaration)
-
-Parameter = _reflection.GeneratedProtocolMessageType('Parameter', (_message.Message,), dict(
-  DESCRIPTOR = _PARAMETER,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Parameter)
-  ))
-_sym_db.RegisterMessage(Parameter)
-
-Fluent = _reflection.GeneratedProtocolMessageType('Fluent', (_message.Message,), dict(
-  DESCRIPTOR = _FLUENT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Fluent)
-  ))
-_sym_db.RegisterMessage(Fluent)
-
-ObjectDeclaration = _reflection.GeneratedProtocolMessageType('ObjectDeclaration', (_message.Message,), dict(
-  DESCRIPTOR = _OBJECTDECLARATION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:ObjectDeclaration)
-  ))
-_sym_db.RegisterMessage(ObjectDeclaration)
-
-EffectExpression = _reflection.GeneratedProtocolMessageType('EffectExpression', (_message.Message,), dict(
-  DESCRIPTOR = _EFFECTEXPRESSION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:EffectExpression)
-  ))
-_sym_db.RegisterMessage(EffectExpression)
-
-Effect = _reflection.GeneratedProtocolMessageType('Effect', (_message.Message,), dict(
-  DESCRIPTOR = _EFFECT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Effect)
-  ))
-_sym_db.RegisterMessage(Effect)
-
-Condition = _reflection.GeneratedProtocolMessageType('Condition', (_message.Message,), dict(
-  DESCRIPTOR = _CONDITION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Condition)
-  ))
-_sym_db.RegisterMessage(Condition)
-
-Action = _reflection.GeneratedProtocolMessageType('Action', (_message.Message,), dict(
-  DESCRIPTOR = _ACTION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Action)
-  ))
-_sym_db.RegisterMessage(Action)
-
-Timepoint = _reflection.GeneratedProtocolMessageType('Timepoint', (_message.Message,), dict(
-  DESCRIPTOR = _TIMEPOINT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Timepoint)
-  ))
-_sym_db.RegisterMessage(Timepoint)
-
-Timing = _reflection.GeneratedProtocolMessageType('Timing', (_message.Message,), dict(
-  DESCRIPTOR = _TIMING,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Timing)
-  ))
-_sym_db.RegisterMessage(Timing)
-
-Interval = _reflection.GeneratedProtocolMessageType('Interval', (_message.Message,), dict(
-  DESCRIPTOR = _INTERVAL,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Interval)
-  ))
-_sym_db.RegisterMessage(Interval)
-
-TimeInterval = _reflection.GeneratedProtocolMessageType('TimeInterval', (_message.Message,), dict(
-  DESCRIPTOR = _TIMEINTERVAL,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:TimeInterval)
-  ))
-_sym_db.RegisterMessage(TimeInterval)
-
-Duration = _reflection.GeneratedProtocolMessageType('Duration', (_message.Message,), dict(
-  DESCRIPTOR = _DURATION,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Duration)
-  ))
-_sym_db.RegisterMessage(Duration)
-
-Goal = _reflection.GeneratedProtocolMessageType('Goal', (_message.Message,), dict(
-  DESCRIPTOR = _GOAL,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Goal)
-  ))
-_sym_db.RegisterMessage(Goal)
-
-TimedEffect = _reflection.GeneratedProtocolMessageType('TimedEffect', (_message.Message,), dict(
-  DESCRIPTOR = _TIMEDEFFECT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:TimedEffect)
-  ))
-_sym_db.RegisterMessage(TimedEffect)
-
-Assignment = _reflection.GeneratedProtocolMessageType('Assignment', (_message.Message,), dict(
-  DESCRIPTOR = _ASSIGNMENT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Assignment)
-  ))
-_sym_db.RegisterMessage(Assignment)
-
-Metric = _reflection.GeneratedProtocolMessageType('Metric', (_message.Message,), dict(
-
-  ActionCostsEntry = _reflection.GeneratedProtocolMessageType('ActionCostsEntry', (_message.Message,), dict(
-    DESCRIPTOR = _METRIC_ACTIONCOSTSENTRY,
-    __module__ = 'unified_planning_pb2'
-    # @@protoc_insertion_point(class_scope:Metric.ActionCostsEntry)
-    ))
-  ,
-  DESCRIPTOR = _METRIC,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Metric)
-  ))
-_sym_db.RegisterMessage(Metric)
-_sym_db.RegisterMessage(Metric.ActionCostsEntry)
-
-Problem = _reflection.GeneratedProtocolMessageType('Problem', (_message.Message,), dict(
-  DESCRIPTOR = _PROBLEM,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Problem)
-  ))
-_sym_db.RegisterMessage(Problem)
-
-ActionInstance = _reflection.GeneratedProtocolMessageType('ActionInstance', (_message.Message,), dict(
-  DESCRIPTOR = _ACTIONINSTANCE,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:ActionInstance)
-  ))
-_sym_db.RegisterMessage(ActionInstance)
-
-Plan = _reflection.GeneratedProtocolMessageType('Plan', (_message.Message,), dict(
-  DESCRIPTOR = _PLAN,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Plan)
-  ))
-_sym_db.RegisterMessage(Plan)
-
-PlanRequest = _reflection.GeneratedProtocolMessageType('PlanRequest', (_message.Message,), dict(
-
-  PlannerOptionsEntry = _reflection.GeneratedProtocolMessageType('PlannerOptionsEntry', (_message.Message,), dict(
-    DESCRIPTOR = _PLANREQUEST_PLANNEROPTIONSENTRY,
-    __module__ = 'unified_planning_pb2'
-    # @@protoc_insertion_point(class_scope:PlanRequest.PlannerOptionsEntry)
-    ))
-  ,
-  DESCRIPTOR = _PLANREQUEST,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:PlanRequest)
-  ))
-_sym_db.RegisterMessage(PlanRequest)
-_sym_db.RegisterMessage(PlanRequest.PlannerOptionsEntry)
-
-ValidationRequest = _reflection.GeneratedProtocolMessageType('ValidationRequest', (_message.Message,), dict(
-  DESCRIPTOR = _VALIDATIONREQUEST,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:ValidationRequest)
-  ))
-_sym_db.RegisterMessage(ValidationRequest)
-
-LogMessage = _reflection.GeneratedProtocolMessageType('LogMessage', (_message.Message,), dict(
-  DESCRIPTOR = _LOGMESSAGE,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:LogMessage)
-  ))
-_sym_db.RegisterMessage(LogMessage)
-
-PlanGenerationResult = _reflection.GeneratedProtocolMessageType('PlanGenerationResult', (_message.Message,), dict(
-
-  MetricsEntry = _reflection.GeneratedProtocolMessageType('MetricsEntry', (_message.Message,), dict(
-    DESCRIPTOR = _PLANGENERATIONRESULT_METRICSENTRY,
-    __module__ = 'unified_planning_pb2'
-    # @@protoc_insertion_point(class_scope:PlanGenerationResult.MetricsEntry)
-    ))
-  ,
-  DESCRIPTOR = _PLANGENERATIONRESULT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:PlanGenerationResult)
-  ))
-_sym_db.RegisterMessage(PlanGenerationResult)
-_sym_db.RegisterMessage(PlanGenerationResult.MetricsEntry)
-
-Engine = _reflection.GeneratedProtocolMessageType('Engine', (_message.Message,), dict(
-  DESCRIPTOR = _ENGINE,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:Engine)
-  ))
-_sym_db.RegisterMessage(Engine)
-
-ValidationResult = _reflection.GeneratedProtocolMessageType('ValidationResult', (_message.Message,), dict(
-  DESCRIPTOR = _VALIDATIONRESULT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:ValidationResult)
-  ))
-_sym_db.RegisterMessage(ValidationResult)
-
-GroundingResult = _reflection.GeneratedProtocolMessageType('GroundingResult', (_message.Message,), dict(
-
-  MapToLiftPlanEntry = _reflection.GeneratedProtocolMessageType('MapToLiftPlanEntry', (_message.Message,), dict(
-    DESCRIPTOR = _GROUNDINGRESULT_MAPTOLIFTPLANENTRY,
-    __module__ = 'unified_planning_pb2'
-    # @@protoc_insertion_point(class_scope:GroundingResult.MapToLiftPlanEntry)
-    ))
-  ,
-  DESCRIPTOR = _GROUNDINGRESULT,
-  __module__ = 'unified_planning_pb2'
-  # @@protoc_insertion_point(class_scope:GroundingResult)
-  ))
-_sym_db.RegisterMessage(GroundingResult)
-_sym_db.RegisterMessage(GroundingResult.MapToLiftPlanEntry)
-
-
-_METRIC_ACTIONCOSTSENTRY._options = None
-_PLANREQUEST_PLANNEROPTIONSENTRY._options = None
-_PLANGENERATIONRESULT_METRICSENTRY._options = None
-_GROUNDINGRESULT_MAPTOLIFTPLANENTRY._options = None
-
-_UNIFIEDPLANNING = _descriptor.ServiceDescriptor(
-  name='UnifiedPlanning',
-  full_name='UnifiedPlanning',
-  file=DESCRIPTOR,
-  index=0,
-  serialized_options=None,
-  serialized_start=4741,
-  serialized_end=4909,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='planOneShot',
-    full_name='UnifiedPlanning.planOneShot',
-    index=0,
-    containing_service=None,
-    input_type=_PLANREQUEST,
-    output_type=_PLANGENERATIONRESULT,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='planValdation',
-    full_name='UnifiedPlanning.planValdation',
-    index=1,
-    containing_service=None,
-    input_type=_VALIDATIONREQUEST,
-    output_type=_VALIDATIONRESULT,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='grounding',
-    full_name='UnifiedPlanning.grounding',
-    index=2,
-    containing_service=None,
-    input_type=_PROBLEM,
-    output_type=_GROUNDINGRESULT,
-    serialized_options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_UNIFIEDPLANNING)
-
-DESCRIPTOR.services_by_name['UnifiedPlanning'] = _UNIFIEDPLANNING
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16unified_planning.proto\"\x83\x01\n\nExpression\x12\x13\n\x04\x61tom\x18\x01 \x01(\x0b\x32\x05.Atom\x12\x19\n\x04list\x18\x02 \x03(\x0b\x32\x0b.Expression\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x1d\n\x04kind\x18\x04 \x01(\x0e\x32\x0f.ExpressionKind\x12\x10\n\x03ref\x18\x05 \x01(\x03H\x00\x88\x01\x01\x42\x06\n\x04_ref\"1\n\x0f\x45xpressionTable\x12\x1e\n\x05nodes\x18\x01 \x03(\x0b\x32\x0f.ExpressionNode\"`\n\x0e\x45xpressionNode\x12\x13\n\x04\x61tom\x18\x01 \x01(\x0b\x32\x05.Atom\x12\x0c\n\x04list\x18\x02 \x03(\x03\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x1d\n\x04kind\x18\x04 \x01(\x0e\x32\x0f.ExpressionKind\"\\\n\x04\x41tom\x12\x10\n\x06symbol\x18\x01 \x01(\tH\x00\x12\r\n\x03int\x18\x02 \x01(\x03H\x00\x12\x15\n\x04real\x18\x03 \x01(\x0b\x32\x05.RealH\x00\x12\x11\n\x07\x62oolean\x18\x04 \x01(\x08H\x00\x42\t\n\x07\x63ontent\".\n\x04Real\x12\x11\n\tnumerator\x18\x01 \x01(\x03\x12\x13\n\x0b\x64\x65nominator\x18\x02 \x01(\x03\"9\n\x0fTypeDeclaration\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\x13\n\x0bparent_type\x18\x02 \x01(\t\"\'\n\tParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"n\n\x06\x46luent\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nvalue_type\x18\x02 \x01(\t\x12\x1e\n\nparameters\x18\x03 \x03(\x0b\x32\n.Parameter\x12\"\n\rdefault_value\x18\x04 \x01(\x0b\x32\x0b.Expression\"/\n\x11ObjectDeclaration\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"\xcd\x01\n\x10\x45\x66\x66\x65\x63tExpression\x12*\n\x04kind\x18\x01 \x01(\x0e\x32\x1c.EffectExpression.EffectKind\x12\x1b\n\x06\x66luent\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x03 \x01(\x0b\x32\x0b.Expression\x12\x1e\n\tcondition\x18\x04 \x01(\x0b\x32\x0b.Expression\"4\n\nEffectKind\x12\n\n\x06\x41SSIGN\x10\x00\x12\x0c\n\x08INCREASE\x10\x01\x12\x0c\n\x08\x44\x45\x43REASE\x10\x02\"M\n\x06\x45\x66\x66\x65\x63t\x12!\n\x06\x65\x66\x66\x65\x63t\x18\x01 \x01(\x0b\x32\x11.EffectExpression\x12 \n\x0foccurrence_time\x18\x02 \x01(\x0b\x32\x07.Timing\"C\n\tCondition\x12\x19\n\x04\x63ond\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1b\n\x04span\x18\x02 \x01(\x0b\x32\r.TimeInterval\"\x8d\x01\n\x06\x41\x63tion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1e\n\nparameters\x18\x02 \x03(\x0b\x32\n.Parameter\x12\x1b\n\x08\x64uration\x18\x03 \x01(\x0b\x32\t.Duration\x12\x1e\n\nconditions\x18\x04 \x03(\x0b\x32\n.Condition\x12\x18\n\x07\x65\x66\x66\x65\x63ts\x18\x05 \x03(\x0b\x32\x07.Effect\"z\n\tTimepoint\x12&\n\x04kind\x18\x01 \x01(\x0e\x32\x18.Timepoint.TimepointKind\"E\n\rTimepointKind\x12\x10\n\x0cGLOBAL_START\x10\x00\x12\x0e\n\nGLOBAL_END\x10\x01\x12\t\n\x05START\x10\x02\x12\x07\n\x03\x45ND\x10\x03\"=\n\x06Timing\x12\x1d\n\ttimepoint\x18\x01 \x01(\x0b\x32\n.Timepoint\x12\x14\n\x05\x64\x65lay\x18\x02 \x01(\x0b\x32\x05.Real\"o\n\x08Interval\x12\x14\n\x0cis_left_open\x18\x01 \x01(\x08\x12\x1a\n\x05lower\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x15\n\ris_right_open\x18\x03 \x01(\x08\x12\x1a\n\x05upper\x18\x04 \x01(\x0b\x32\x0b.Expression\"k\n\x0cTimeInterval\x12\x14\n\x0cis_left_open\x18\x01 \x01(\x08\x12\x16\n\x05lower\x18\x02 \x01(\x0b\x32\x07.Timing\x12\x15\n\ris_right_open\x18\x03 \x01(\x08\x12\x16\n\x05upper\x18\x04 \x01(\x0b\x32\x07.Timing\"5\n\x08\x44uration\x12)\n\x16\x63ontrollable_in_bounds\x18\x01 \x01(\x0b\x32\t.Interval\"@\n\x04Goal\x12\x19\n\x04goal\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x06timing\x18\x02 \x01(\x0b\x32\r.TimeInterval\"R\n\x0bTimedEffect\x12!\n\x06\x65\x66\x66\x65\x63t\x18\x01 \x01(\x0b\x32\x11.EffectExpression\x12 \n\x0foccurrence_time\x18\x02 \x01(\x0b\x32\x07.Timing\"E\n\nAssignment\x12\x1b\n\x06\x66luent\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\"\x9c\x03\n\x06Metric\x12 \n\x04kind\x18\x01 \x01(\x0e\x32\x12.Metric.MetricKind\x12\x1f\n\nexpression\x18\x02 \x01(\x0b\x32\x0b.Expression\x12.\n\x0c\x61\x63tion_costs\x18\x03 \x03(\x0b\x32\x18.Metric.ActionCostsEntry\x12(\n\x13\x64\x65\x66\x61ult_action_cost\x18\x04 \x01(\x0b\x32\x0b.Expression\x1a?\n\x10\x41\x63tionCostsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression:\x02\x38\x01\"\xb3\x01\n\nMetricKind\x12\x19\n\x15MINIMIZE_ACTION_COSTS\x10\x00\x12#\n\x1fMINIMIZE_SEQUENTIAL_PLAN_LENGTH\x10\x01\x12\x15\n\x11MINIMIZE_MAKESPAN\x10\x02\x12&\n\"MINIMIZE_EXPRESSION_ON_FINAL_STATE\x10\x03\x12&\n\"MAXIMIZE_EXPRESSION_ON_FINAL_STATE\x10\x04\"\xef\x02\n\x07Problem\x12\x13\n\x0b\x64omain_name\x18\x01 \x01(\t\x12\x14\n\x0cproblem_name\x18\x02 \x01(\t\x12\x1f\n\x05types\x18\x03 \x03(\x0b\x32\x10.TypeDeclaration\x12\x18\n\x07\x66luents\x18\x04 \x03(\x0b\x32\x07.Fluent\x12#\n\x07objects\x18\x05 \x03(\x0b\x32\x12.ObjectDeclaration\x12\x18\n\x07\x61\x63tions\x18\x06 \x03(\x0b\x32\x07.Action\x12\"\n\rinitial_state\x18\x07 \x03(\x0b\x32\x0b.Assignment\x12#\n\rtimed_effects\x18\x08 \x03(\x0b\x32\x0c.TimedEffect\x12\x14\n\x05goals\x18\t \x03(\x0b\x32\x05.Goal\x12\x1a\n\x08\x66\x65\x61tures\x18\n \x03(\x0e\x32\x08.Feature\x12\x18\n\x07metrics\x18\x0b \x03(\x0b\x32\x07.Metric\x12*\n\x10\x65xpression_table\x18\x0c \x01(\x0b\x32\x10.ExpressionTable\"\x80\x01\n\x0e\x41\x63tionInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x61\x63tion_name\x18\x02 \x01(\t\x12\x19\n\nparameters\x18\x03 \x03(\x0b\x32\x05.Atom\x12\x19\n\nstart_time\x18\x04 \x01(\x0b\x32\x05.Real\x12\x17\n\x08\x65nd_time\x18\x05 \x01(\x0b\x32\x05.Real\"(\n\x04Plan\x12 \n\x07\x61\x63tions\x18\x01 \x03(\x0b\x32\x0f.ActionInstance\"\x86\x02\n\x0bPlanRequest\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12*\n\x0fresolution_mode\x18\x02 \x01(\x0e\x32\x11.PlanRequest.Mode\x12\x0f\n\x07timeout\x18\x03 \x01(\x01\x12\x39\n\x0fplanner_options\x18\x04 \x03(\x0b\x32 .PlanRequest.PlannerOptionsEntry\x1a\x35\n\x13PlannerOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"-\n\x04Mode\x12\x0f\n\x0bSATISFIABLE\x10\x00\x12\x14\n\x10SOLVED_OPTIMALLY\x10\x01\"C\n\x11ValidationRequest\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12\x13\n\x04plan\x18\x02 \x01(\x0b\x32\x05.Plan\"{\n\nLogMessage\x12#\n\x05level\x18\x01 \x01(\x0e\x32\x14.LogMessage.LogLevel\x12\x0f\n\x07message\x18\x02 \x01(\t\"7\n\x08LogLevel\x12\t\n\x05\x44\x45\x42UG\x10\x00\x12\x08\n\x04INFO\x10\x01\x12\x0b\n\x07WARNING\x10\x02\x12\t\n\x05\x45RROR\x10\x03\"\xbf\x03\n\x14PlanGenerationResult\x12,\n\x06status\x18\x01 \x01(\x0e\x32\x1c.PlanGenerationResult.Status\x12\x13\n\x04plan\x18\x02 \x01(\x0b\x32\x05.Plan\x12\x33\n\x07metrics\x18\x03 \x03(\x0b\x32\".PlanGenerationResult.MetricsEntry\x12!\n\x0clog_messages\x18\x04 \x03(\x0b\x32\x0b.LogMessage\x12\x17\n\x06\x65ngine\x18\x05 \x01(\x0b\x32\x07.Engine\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xc2\x01\n\x06Status\x12\x16\n\x12SOLVED_SATISFICING\x10\x00\x12\x14\n\x10SOLVED_OPTIMALLY\x10\x01\x12\x15\n\x11UNSOLVABLE_PROVEN\x10\x02\x12\x1b\n\x17UNSOLVABLE_INCOMPLETELY\x10\x03\x12\x0b\n\x07TIMEOUT\x10\r\x12\n\n\x06MEMOUT\x10\x0e\x12\x12\n\x0eINTERNAL_ERROR\x10\x0f\x12\x17\n\x13UNSUPPORTED_PROBLEM\x10\x10\x12\x10\n\x0cINTERMEDIATE\x10\x11\"\x16\n\x06\x45ngine\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xba\x01\n\x10ValidationResult\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ValidationResult.ValidationResultStatus\x12!\n\x0clog_messages\x18\x02 \x03(\x0b\x32\x0b.LogMessage\x12\x17\n\x06\x65ngine\x18\x03 \x01(\x0b\x32\x07.Engine\"0\n\x16ValidationResultStatus\x12\t\n\x05VALID\x10\x00\x12\x0b\n\x07INVALID\x10\x01\"\xee\x01\n\x0fGroundingResult\x12\x19\n\x07problem\x18\x01 \x01(\x0b\x32\x08.Problem\x12=\n\x10map_to_lift_plan\x18\x02 \x03(\x0b\x32#.GroundingResult.MapToLiftPlanEntry\x12!\n\x0clog_messages\x18\x03 \x03(\x0b\x32\x0b.LogMessage\x12\x17\n\x06\x65ngine\x18\x04 \x01(\x0b\x32\x07.Engine\x1a\x45\n\x12MapToLiftPlanEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1e\n\x05value\x18\x02 \x01(\x0b\x32\x0f.ActionInstance:\x02\x38\x01*\x9e\x01\n\x0e\x45xpressionKind\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0c\n\x08\x43ONSTANT\x10\x01\x12\r\n\tPARAMETER\x10\x02\x12\x0c\n\x08VARIABLE\x10\x07\x12\x11\n\rFLUENT_SYMBOL\x10\x03\x12\x13\n\x0f\x46UNCTION_SYMBOL\x10\x04\x12\x12\n\x0eSTATE_VARIABLE\x10\x05\x12\x18\n\x14\x46UNCTION_APPLICATION\x10\x06*\xc2\x04\n\x07\x46\x65\x61ture\x12\x10\n\x0c\x41\x43TION_BASED\x10\x00\x12\x13\n\x0f\x43ONTINUOUS_TIME\x10\x01\x12\x11\n\rDISCRETE_TIME\x10\x02\x12\'\n#INTERMEDIATE_CONDITIONS_AND_EFFECTS\x10\x03\x12\x10\n\x0cTIMED_EFFECT\x10\x04\x12\x0f\n\x0bTIMED_GOALS\x10\x05\x12\x19\n\x15\x44URATION_INEQUALITIES\x10\x06\x12\x16\n\x12\x43ONTINUOUS_NUMBERS\x10\x07\x12\x14\n\x10\x44ISCRETE_NUMBERS\x10\x08\x12\x17\n\x13NEGATIVE_CONDITIONS\x10\t\x12\x1a\n\x16\x44ISJUNCTIVE_CONDITIONS\x10\n\x12\x0c\n\x08\x45QUALITY\x10\x0b\x12\x1a\n\x16\x45XISTENTIAL_CONDITIONS\x10\x0c\x12\x18\n\x14UNIVERSAL_CONDITIONS\x10\r\x12\x17\n\x13\x43ONDITIONAL_EFFECTS\x10\x0e\x12\x14\n\x10INCREASE_EFFECTS\x10\x0f\x12\x14\n\x10\x44\x45\x43REASE_EFFECTS\x10\x10\x12\x0f\n\x0b\x46LAT_TYPING\x10\x11\x12\x17\n\x13HIERARCHICAL_TYPING\x10\x12\x12\x13\n\x0fNUMERIC_FLUENTS\x10\x13\x12\x12\n\x0eOBJECT_FLUENTS\x10\x14\x12\x10\n\x0c\x41\x43TIONS_COST\x10\x15\x12\x0f\n\x0b\x46INAL_VALUE\x10\x16\x12\x0c\n\x08MAKESPAN\x10\x17\x12\x0f\n\x0bPLAN_LENGTH\x10\x18\x12\x15\n\x11SIMULATED_EFFECTS\x10\x19\x32\xa8\x01\n\x0fUnifiedPlanning\x12\x34\n\x0bplanOneShot\x12\x0c.PlanRequest\x1a\x15.PlanGenerationResult0\x01\x12\x36\n\rplanValdation\x12\x12.ValidationRequest\x1a\x11.ValidationResult\x12\'\n\tgrounding\x12\x08.Problem\x1a\x10.GroundingResultb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'unified_planning_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _METRIC_ACTIONCOSTSENTRY._options = None
+  _METRIC_ACTIONCOSTSENTRY._serialized_options = b'8\001'
+  _PLANREQUEST_PLANNEROPTIONSENTRY._options = None
+  _PLANREQUEST_PLANNEROPTIONSENTRY._serialized_options = b'8\001'
+  _PLANGENERATIONRESULT_METRICSENTRY._options = None
+  _PLANGENERATIONRESULT_METRICSENTRY._serialized_options = b'8\001'
+  _GROUNDINGRESULT_MAPTOLIFTPLANENTRY._options = None
+  _GROUNDINGRESULT_MAPTOLIFTPLANENTRY._serialized_options = b'8\001'
+  _EXPRESSIONKIND._serialized_start=4219
+  _EXPRESSIONKIND._serialized_end=4377
+  _FEATURE._serialized_start=4380
+  _FEATURE._serialized_end=4958
+  _EXPRESSION._serialized_start=27
+  _EXPRESSION._serialized_end=158
+  _EXPRESSIONTABLE._serialized_start=160
+  _EXPRESSIONTABLE._serialized_end=209
+  _EXPRESSIONNODE._serialized_start=211
+  _EXPRESSIONNODE._serialized_end=307
+  _ATOM._serialized_start=309
+  _ATOM._serialized_end=401
+  _REAL._serialized_start=403
+  _REAL._serialized_end=449
+  _TYPEDECLARATION._serialized_start=451
+  _TYPEDECLARATION._serialized_end=508
+  _PARAMETER._serialized_start=510
+  _PARAMETER._serialized_end=549
+  _FLUENT._serialized_start=551
+  _FLUENT._serialized_end=661
+  _OBJECTDECLARATION._serialized_start=663
+  _OBJECTDECLARATION._serialized_end=710
+  _EFFECTEXPRESSION._serialized_start=713
+  _EFFECTEXPRESSION._serialized_end=918
+  _EFFECTEXPRESSION_EFFECTKIND._serialized_start=866
+  _EFFECTEXPRESSION_EFFECTKIND._serialized_end=918
+  _EFFECT._serialized_start=920
+  _EFFECT._serialized_end=997
+  _CONDITION._serialized_start=999
+  _CONDITION._serialized_end=1066
+  _ACTION._serialized_start=1069
+  _ACTION._serialized_end=1210
+  _TIMEPOINT._serialized_start=1212
+  _TIMEPOINT._serialized_end=1334
+  _TIMEPOINT_TIMEPOINTKIND._serialized_start=1265
+  _TIMEPOINT_TIMEPOINTKIND._serialized_end=1334
+  _TIMING._serialized_start=1336
+  _TIMING._serialized_end=1397
+  _INTERVAL._serialized_start=1399
+  _INTERVAL._serialized_end=1510
+  _TIMEINTERVAL._serialized_start=1512
+  _TIMEINTERVAL._serialized_end=1619
+  _DURATION._serialized_start=1621
+  _DURATION._serialized_end=1674
+  _GOAL._serialized_start=1676
+  _GOAL._serialized_end=1740
+  _TIMEDEFFECT._serialized_start=1742
+  _TIMEDEFFECT._serialized_end=1824
+  _ASSIGNMENT._serialized_start=1826
+  _ASSIGNMENT._serialized_end=1895
+  _METRIC._serialized_start=1898
+  _METRIC._serialized_end=2310
+  _METRIC_ACTIONCOSTSENTRY._serialized_start=2065
+  _METRIC_ACTIONCOSTSENTRY._serialized_end=2128
+  _METRIC_METRICKIND._serialized_start=2131
+  _METRIC_METRICKIND._serialized_end=2310
+  _PROBLEM._serialized_start=2313
+  _PROBLEM._serialized_end=2680
+  _ACTIONINSTANCE._serialized_start=2683
+  _ACTIONINSTANCE._serialized_end=2811
+  _PLAN._serialized_start=2813
+  _PLAN._serialized_end=2853
+  _PLANREQUEST._serialized_start=2856
+  _PLANREQUEST._serialized_end=3118
+  _PLANREQUEST_PLANNEROPTIONSENTRY._serialized_start=3018
+  _PLANREQUEST_PLANNEROPTIONSENTRY._serialized_end=3071
+  _PLANREQUEST_MODE._serialized_start=3073
+  _PLANREQUEST_MODE._serialized_end=3118
+  _VALIDATIONREQUEST._serialized_start=3120
+  _VALIDATIONREQUEST._serialized_end=3187
+  _LOGMESSAGE._serialized_start=3189
+  _LOGMESSAGE._serialized_end=3312
+  _LOGMESSAGE_LOGLEVEL._serialized_start=3257
+  _LOGMESSAGE_LOGLEVEL._serialized_end=3312
+  _PLANGENERATIONRESULT._serialized_start=3315
+  _PLANGENERATIONRESULT._serialized_end=3762
+  _PLANGENERATIONRESULT_METRICSENTRY._serialized_start=3519
+  _PLANGENERATIONRESULT_METRICSENTRY._serialized_end=3565
+  _PLANGENERATIONRESULT_STATUS._serialized_start=3568
+  _PLANGENERATIONRESULT_STATUS._serialized_end=3762
+  _ENGINE._serialized_start=3764
+  _ENGINE._serialized_end=3786
+  _VALIDATIONRESULT._serialized_start=3789
+  _VALIDATIONRESULT._serialized_end=3975
+  _VALIDATIONRESULT_VALIDATIONRESULTSTATUS._serialized_start=3927
+  _VALIDATIONRESULT_VALIDATIONRESULTSTATUS._serialized_end=3975
+  _GROUNDINGRESULT._serialized_start=3978
+  _GROUNDINGRESULT._serialized_end=4216
+  _GROUNDINGRESULT_MAPTOLIFTPLANENTRY._serialized_start=4147
+  _GROUNDINGRESULT_MAPTOLIFTPLANENTRY._serialized_end=4216
+  _UNIFIEDPLANNING._serialized_start=4961
+  _UNIFIEDPLANNING._serialized_end=5129
 # @@protoc_insertion_point(module_scope)
@@ -14,7 +14,7 @@
 #
 # type: ignore[attr-defined]
 from functools import partial
-from typing import Tuple, Union, Optional
+from typing import Dict, Tuple, Union, Optional
 import fractions
 from typing import OrderedDict
 from unified_planning.exceptions import UPException
@@ -94,7 +94,80 @@ def op_to_node_type(op: str) -> OperatorKind:
     raise ValueError(f"Unknown operator `{op}`")
 
 
+class ExpressionTableReader:
+    """Rebuilds the nodes of the expression table of a problem message.
+
+    Every node is rebuilt once, after its sub-expressions, when it is first referred,
+    since the symbols of the objects and of the fluents can be resolved only after
+    they are added to the problem."""
+    def __init__(self, msg: proto.ExpressionTable, reader: "ProtobufReader", problem: Problem):
+        self._msg_nodes = msg.nodes
+        self._reader = reader
+        self._problem = problem
+        self._nodes: list = [None] * len(msg.nodes)
+        self._types: Dict[str, model.types.Type] = {}
+
+    def get(self, index: int) -> model.FNode:
+        nodes = self._nodes
+        if not 0 <= index < len(nodes):
+            raise UPException(f"Reference to the node {index} of an expression table of {len(nodes)} nodes")
+        stack = [index]
+        while stack:
+            i = stack[-1]
+            if nodes[i] is not None:
+                stack.pop()
+                continue
+            msg = self._msg_nodes[i]
+            if any(not 0 <= j < i for j in msg.list):
+                raise UPException(f"The node {i} of an expression table refers to a node that does not precede it")
+            missing = [j for j in msg.list if nodes[j] is None]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            nodes[i] = self._convert_node(msg)
+        return nodes[index]
+
+    def _type(self, s: str) -> model.types.Type:
+        res = self._types.get(s, None)
+        if res is None:
+            res = convert_type_str(s, self._problem)
+            self._types[s] = res
+        return res
+
+    def _convert_node(self, msg: proto.ExpressionNode):
+        em = self._problem.env.expression_manager
+        nodes = self._nodes
+        if msg.kind == proto.ExpressionKind.Value("CONSTANT"):
+            return self._reader.convert(msg.atom, self._problem)
+        elif msg.kind == proto.ExpressionKind.Value("PARAMETER"):
+            return em.ParameterExp(param=Parameter(msg.atom.symbol, self._type(msg.type)))
+        elif msg.kind == proto.ExpressionKind.Value("VARIABLE"):
+            return em.VariableExp(var=Variable(msg.atom.symbol, self._type(msg.type)))
+        elif msg.kind == proto.ExpressionKind.Value("FLUENT_SYMBOL"):
+            return self._problem.fluent(msg.atom.symbol)
+        elif msg.kind == proto.ExpressionKind.Value("FUNCTION_SYMBOL"):
+            return op_to_node_type(msg.atom.symbol)
+        elif msg.kind == proto.ExpressionKind.Value("STATE_VARIABLE"):
+            return em.FluentExp(nodes[msg.list[0]], tuple(nodes[i] for i in msg.list[1:]))
+        elif msg.kind == proto.ExpressionKind.Value("FUNCTION_APPLICATION"):
+            node_type = nodes[msg.list[0]]
+            if node_type in [OperatorKind.EXISTS, OperatorKind.FORALL]:
+                return em.create_node(
+                    node_type=node_type,
+                    args=(nodes[msg.list[-1]],),
+                    payload=tuple(nodes[i].variable() for i in msg.list[1:-1]),
+                )
+            return em.create_node(node_type=node_type, args=tuple(nodes[i] for i in msg.list[1:]))
+        raise ValueError(f"Unknown expression kind `{msg.kind}`")
+
+
 class ProtobufReader(Converter):
+    def __init__(self):
+        super().__init__()
+        # The expression table of the problem being converted
+        self._expression_table: Optional[ExpressionTableReader] = None
+
     @handles(proto.Parameter)
     def _convert_parameter(self, msg: proto.Parameter, problem: Problem) -> model.Parameter:
         return model.Parameter(
@@ -122,7 +195,11 @@ class ProtobufReader(Converter):
 
     @handles(proto.Expression)
     def _convert_expression(self, msg: proto.Expression, problem: Problem) -> model.Expression:
-        if msg.kind == proto.ExpressionKind.Value("CONSTANT"):
+        if msg.HasField("ref"):
+            if self._expression_table is None:
+                raise UPException("Reference to an expression table outside of a problem")
+            return self._expression_table.get(msg.ref)
+        elif msg.kind == proto.ExpressionKind.Value("CONSTANT"):
             assert msg.atom is not None
             return self.convert(msg.atom, problem)
 
@@ -231,7 +308,15 @@ class ProtobufReader(Converter):
     @handles(proto.Problem)
     def _convert_problem(self, msg: proto.Problem, env: Optional[Environment] = None) -> Problem:
         problem = Problem(name=msg.problem_name, env=env)
+        expression_table = self._expression_table
+        self._expression_table = ExpressionTableReader(msg.expression_table, self, problem)
+        try:
+            self._convert_problem_content(msg, problem)
+        finally:
+            self._expression_table = expression_table
+        return problem
 
+    def _convert_problem_content(self, msg: proto.Problem, problem: Problem):
         for t in msg.types:
             problem._add_user_type(self.convert(t, problem))
         for obj in msg.objects:
@@ -272,8 +357,6 @@ class ProtobufReader(Converter):
         for metric in msg.metrics:
             problem.add_quality_metric(self.convert(metric, problem))
 
-        return problem
-
     @handles(proto.Metric)
     def _convert_metric(self, msg: proto.Metric, problem: Problem) -> Union[metrics.MinimizeActionCosts,
                                                                             metrics.MinimizeSequentialPlanLength,
@@ -521,6 +604,12 @@ class ProtobufReader(Converter):
             status = (
                 unified_planning.solvers.results.PlanGenerationResultStatus.UNSUPPORTED_PROBLEM
             )
+        elif result.status == proto.PlanGenerationResult.Status.Value(
+            "INTERMEDIATE"
+        ):
+            status = (
+                unified_planning.solvers.results.PlanGenerationResultStatus.INTERMEDIATE
+            )
         else:
             raise UPException(f"Unknown Planner Status: {result.status}")
 
@@ -535,7 +624,7 @@ class ProtobufReader(Converter):
 
         return unified_planning.solvers.PlanGenerationResult(
             status=status,
-            plan=self.convert(result.plan, problem),
+            plan=self.convert(result.plan, problem) if result.HasField("plan") else None,
             engine_name=result.engine.name,
             metrics=metrics,
             log_messages=log_messages,
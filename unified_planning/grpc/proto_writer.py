@@ -29,7 +29,7 @@ from unified_planning.model.operators import (
     OperatorKind,
 )
 from unified_planning.model.timing import TimepointKind
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 
 def map_operator(op: int) -> str:
@@ -72,9 +72,13 @@ class FNode2Protobuf(walkers.DagWalker):
     def convert(self, expression: model.FNode) -> proto.Expression:
         return self.walk(expression)
 
+    def _expression(self, atom: Optional[proto.Atom], list: List[proto.Expression],
+                    kind: int, type: str) -> proto.Expression:
+        return proto.Expression(atom=atom, list=list, kind=kind, type=type)
+
     def walk_bool_constant(self, expression: model.FNode,
                            args: List[proto.Expression]) -> proto.Expression:
-        return proto.Expression(
+        return self._expression(
             atom=proto.Atom(boolean=expression.bool_constant_value()),
             list=[],
             kind=proto.ExpressionKind.Value("CONSTANT"),
@@ -83,7 +87,7 @@ class FNode2Protobuf(walkers.DagWalker):
 
     def walk_int_constant(self, expression: model.FNode,
                           args: List[proto.Expression]) -> proto.Expression:
-        return proto.Expression(
+        return self._expression(
             atom=proto.Atom(int=expression.int_constant_value()),
             list=[],
             kind=proto.ExpressionKind.Value("CONSTANT"),
@@ -92,7 +96,7 @@ class FNode2Protobuf(walkers.DagWalker):
 
     def walk_real_constant(self, expression: model.FNode,
                            args: List[proto.Expression]) -> proto.Expression:
-        return proto.Expression(
+        return self._expression(
             atom=proto.Atom(real=self._protobuf_writer.convert(expression.real_constant_value())),
             list=[],
             kind=proto.ExpressionKind.Value("CONSTANT"),
@@ -101,7 +105,7 @@ class FNode2Protobuf(walkers.DagWalker):
 
     def walk_param_exp(self, expression: model.FNode,
                        args: List[proto.Expression]) -> proto.Expression:
-        return proto.Expression(
+        return self._expression(
             atom=proto.Atom(symbol=expression.parameter().name),
             list=[],
             kind=proto.ExpressionKind.Value("PARAMETER"),
@@ -110,7 +114,7 @@ class FNode2Protobuf(walkers.DagWalker):
 
     def walk_variable_exp(self, expression: model.FNode,
                           args: List[proto.Expression]) -> proto.Expression:
-        return proto.Expression(
+        return self._expression(
             atom=proto.Atom(symbol=expression.variable().name),
             list=[],
             kind=proto.ExpressionKind.Value("VARIABLE"),
@@ -119,7 +123,7 @@ class FNode2Protobuf(walkers.DagWalker):
 
     def walk_object_exp(self, expression: model.FNode,
                         args: List[proto.Expression]) -> proto.Expression:
-        return proto.Expression(
+        return self._expression(
             atom=proto.Atom(symbol=expression.object().name),
             list=[],
             kind=proto.ExpressionKind.Value("CONSTANT"),
@@ -130,14 +134,15 @@ class FNode2Protobuf(walkers.DagWalker):
                         args: List[proto.Expression]) -> proto.Expression:
         sub_list = []
         sub_list.append(
-            proto.Expression(
+            self._expression(
                 atom=proto.Atom(symbol=expression.fluent().name),
+                list=[],
                 kind=proto.ExpressionKind.Value("FLUENT_SYMBOL"),
                 type=str(expression.fluent().type),
             )
         )
         sub_list.extend(args)
-        return proto.Expression(
+        return self._expression(
             atom=None,
             list=sub_list,
             kind=proto.ExpressionKind.Value("STATE_VARIABLE"),
@@ -149,7 +154,7 @@ class FNode2Protobuf(walkers.DagWalker):
                       args: List[proto.Expression]) -> proto.Expression:
         sub_list = []
         sub_list.append(
-            proto.Expression(
+            self._expression(
                 atom=proto.Atom(symbol=map_operator(expression.node_type)),
                 list=[],
                 kind=proto.ExpressionKind.Value("FUNCTION_SYMBOL"),
@@ -158,10 +163,18 @@ class FNode2Protobuf(walkers.DagWalker):
         )
         # forall/exists: add the declared variables from the payload to the beginning of the parameter list.
         if expression.is_exists() or expression.is_forall():
-            sub_list.extend([self._protobuf_writer.convert(p) for p in expression.variables()])
+            sub_list.extend([
+                self._expression(
+                    atom=proto.Atom(symbol=v.name),
+                    list=[],
+                    kind=proto.ExpressionKind.Value("VARIABLE"),
+                    type=str(v.type),
+                )
+                for v in expression.variables()
+            ])
 
         sub_list.extend(args)
-        return proto.Expression(
+        return self._expression(
             atom=None,
             list=sub_list,
             kind=proto.ExpressionKind.Value("FUNCTION_APPLICATION"),
@@ -169,6 +182,34 @@ class FNode2Protobuf(walkers.DagWalker):
         )
 
 
+class FNode2ProtobufTable(FNode2Protobuf):
+    """Converts the expressions into references to the nodes of an expression table, where
+    every distinct expression and every distinct atom are stored once, after their sub-expressions."""
+    def __init__(self, protobuf_writer):
+        super().__init__(protobuf_writer)
+        self.table = proto.ExpressionTable()
+        # (kind, type, serialized atom) -> index of the atom in the table
+        self._atoms: Dict[Tuple[int, str, bytes], int] = {}
+
+    def convert(self, expression: model.FNode) -> proto.Expression:
+        return proto.Expression(ref=self.walk(expression))
+
+    def _expression(self, atom: Optional[proto.Atom], list: List[int], kind: int, type: str) -> int:
+        key = None
+        if len(list) == 0:
+            # The symbols of the fluents, operators and variables are not FNodes, so they
+            # are not memoized by the walker
+            key = (kind, type, b"" if atom is None else atom.SerializeToString())
+            index = self._atoms.get(key, None)
+            if index is not None:
+                return index
+        index = len(self.table.nodes)
+        self.table.nodes.add(atom=atom, list=list, kind=kind, type=type)
+        if key is not None:
+            self._atoms[key] = index
+        return index
+
+
 def map_feature(feature: str) -> proto.Feature:
     pb_feature = proto.Feature.Value(feature)
     if pb_feature is None:
@@ -177,9 +218,12 @@ def map_feature(feature: str) -> proto.Feature:
 
 
 class ProtobufWriter(Converter):
-    def __init__(self):
+    def __init__(self, expression_table: bool = False):
+        """If expression_table is True, the expressions of the problems are encoded in the
+        expression table of the problem message, instead of being nested in their messages."""
         super().__init__()
         self._fnode2proto = FNode2Protobuf(self)
+        self._expression_table = expression_table
 
     @handles(model.Fluent)
     def _convert_fluent(self, fluent: model.Fluent, problem: model.Problem) -> proto.Fluent:
@@ -355,6 +399,18 @@ class ProtobufWriter(Converter):
 
     @handles(model.Problem)
     def _convert_problem(self, problem: model.Problem) -> proto.Problem:
+        if not self._expression_table:
+            return self._convert_problem_content(problem)
+        fnode2proto = self._fnode2proto
+        self._fnode2proto = FNode2ProtobufTable(self)
+        try:
+            res = self._convert_problem_content(problem)
+            res.expression_table.CopyFrom(self._fnode2proto.table)
+        finally:
+            self._fnode2proto = fnode2proto
+        return res
+
+    def _convert_problem_content(self, problem: model.Problem) -> proto.Problem:
         goals = [proto.Goal(goal=self.convert(g)) for g in problem.goals]
         for (t, gs) in problem.timed_goals:
             goals += [
@@ -481,7 +537,7 @@ class ProtobufWriter(Converter):
 
         return proto.PlanGenerationResult(
             status=self.convert(result.status),
-            plan=self.convert(result.plan),
+            plan=self.convert(result.plan) if result.plan is not None else None,
             engine=proto.Engine(name=result.engine_name),
             metrics=result.metrics,
             log_messages=log_messages,
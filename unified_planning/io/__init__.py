@@ -2,3 +2,5 @@ from unified_planning.io.python_writer import PythonWriter
 from unified_planning.io.pddl_reader import PDDLReader
 from unified_planning.io.pddl_writer import PDDLWriter
 from unified_planning.io.anml_writer import ANMLWriter
+from unified_planning.io.binary_writer import BinaryWriter
+from unified_planning.io.binary_reader import BinaryReader
@@ -0,0 +1,420 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+'''This module defines the reader of the binary format of the problems, described
+in the unified_planning.io.binary_writer module.'''
+
+
+import mmap
+import sys
+from array import array
+from collections import OrderedDict
+from fractions import Fraction
+import unified_planning as up
+from unified_planning.environment import get_env
+from unified_planning.exceptions import UPValueError
+from unified_planning.io.binary_writer import (MAGIC, VERSION, HEADER, SECTION, NONE, SYMBOLS_INDEX, SYMBOLS_TEXT,
+                                               PROBLEM, TYPES, OBJECTS, FLUENTS, DEFAULTS, EXPRESSIONS_INDEX,
+                                               EXPRESSIONS, ACTIONS_INDEX, ACTIONS, INITIAL_STATE, GOALS,
+                                               TIMED_GOALS, TIMED_EFFECTS, METRICS, BOOL_TYPE, INT_TYPE, REAL_TYPE,
+                                               USER_TYPE, TIME_TYPE, INSTANTANEOUS_ACTION, ACTIONS_COSTS,
+                                               PLAN_LENGTH, MAKESPAN, MINIMIZE_EXPRESSION, MAXIMIZE_EXPRESSION)
+from unified_planning.model.operators import OperatorKind
+from typing import Dict, List, Optional, Sequence, Union
+
+
+OPERATORS = {k.value: k for k in OperatorKind}
+TIMEPOINTS = {k.value: k for k in up.model.timing.TimepointKind}
+EFFECTS = {k.value: k for k in up.model.effect.EffectKind}
+
+
+class BinaryReader:
+    '''This class can be used to read the problems written by the BinaryWriter.'''
+    def __init__(self, env: Optional['up.environment.Environment'] = None):
+        self._env = get_env(env)
+
+    def open(self, filename: str) -> 'BinaryProblemFile':
+        '''Memory-maps the given file, whose content is decoded when it is first accessed.'''
+        return BinaryProblemFile(filename, self._env)
+
+    def read_problem(self, filename: str) -> 'up.model.Problem':
+        '''Reads the problem written in the given file.'''
+        with self.open(filename) as problem_file:
+            return problem_file.problem
+
+
+class _Cursor:
+    '''Reads sequentially the integers of a section.'''
+    def __init__(self, data: Sequence[int], pos: int):
+        self.data = data
+        self.pos = pos
+
+    def next(self) -> int:
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    def take(self, n: int) -> List[int]:
+        self.pos += n
+        return list(self.data[self.pos - n:self.pos])
+
+
+class BinaryProblemFile:
+    '''A problem written by the BinaryWriter, memory-mapped from its file.
+
+    The types and the fluents are decoded when the file is opened, the symbols, the
+    objects, the expressions and the actions when they are first accessed; the file
+    must be open until the needed parts of the problem are decoded.'''
+    def __init__(self, filename: str, env: Optional['up.environment.Environment'] = None):
+        self._env = get_env(env)
+        self._file = open(filename, 'rb')
+        self._mmap: Optional[mmap.mmap] = None
+        self._views: List[memoryview] = []
+        try:
+            if HEADER.size <= self._file.seek(0, 2):
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mmap is None or self._mmap[:len(MAGIC)] != MAGIC:
+                raise UPValueError(f'{filename} is not a problem in the binary format!')
+            _, version, sections_count = HEADER.unpack_from(self._mmap, 0)
+            if version != VERSION:
+                raise UPValueError(f'{filename} is written in the version {version} of the binary format, '
+                                   f'while the supported one is {VERSION}!')
+            view = memoryview(self._mmap)
+            self._views.append(view)
+            self._sections: Dict[bytes, Sequence[int]] = {}
+            for i in range(sections_count):
+                tag, offset, size = SECTION.unpack_from(self._mmap, HEADER.size + i * SECTION.size)
+                if tag == SYMBOLS_TEXT:
+                    self._symbols_text = view[offset:offset + size]
+                    self._views.append(self._symbols_text)
+                else:
+                    self._sections[tag] = self._integers(view[offset:offset + size])
+        except:
+            self.close()
+            raise
+        self._symbols: List[Optional[str]] = [None] * self._sections[SYMBOLS_INDEX][0]
+        self._types = self._read_types()
+        self._objects: List[Optional['up.model.object.Object']] = [None] * self._sections[OBJECTS][0]
+        self._nodes: List[Optional['up.model.fnode.FNode']] = [None] * self._sections[EXPRESSIONS_INDEX][0]
+        self._fluents, self._fluents_defaults = self._read_fluents()
+        self._actions: List[Optional['up.model.action.Action']] = [None] * self._sections[ACTIONS_INDEX][0]
+        self._actions_by_name: Optional[Dict[str, int]] = None
+        self._problem: Optional['up.model.Problem'] = None
+
+    def _integers(self, view: memoryview) -> Sequence[int]:
+        if sys.byteorder == 'little':
+            res = view.cast('i')
+            self._views.append(view)
+            self._views.append(res)
+            return res
+        data = array('i')
+        data.frombytes(view)
+        data.byteswap()
+        view.release()
+        return data
+
+    def close(self):
+        '''Unmaps and closes the file.'''
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def name(self) -> Optional[str]:
+        '''Returns the name of the problem.'''
+        name = self._sections[PROBLEM][0]
+        return None if name == NONE else self._symbol(name)
+
+    @property
+    def fluents(self) -> List['up.model.fluent.Fluent']:
+        '''Returns the fluents of the problem.'''
+        return self._fluents
+
+    @property
+    def objects(self) -> List['up.model.object.Object']:
+        '''Returns the objects of the problem.'''
+        return [self._object(i) for i in range(len(self._objects))]
+
+    @property
+    def action_names(self) -> List[str]:
+        '''Returns the names of the actions of the problem, without decoding the actions.'''
+        index = self._sections[ACTIONS_INDEX]
+        return [self._symbol(index[1 + i]) for i in range(len(self._actions))]
+
+    def action(self, name: str) -> 'up.model.action.Action':
+        '''Returns the action with the given name, decoding it if it is first accessed.'''
+        if self._actions_by_name is None:
+            self._actions_by_name = {n: i for i, n in enumerate(self.action_names)}
+        i = self._actions_by_name.get(name, None)
+        if i is None:
+            raise UPValueError(f'Action of name: {name} is not defined!')
+        return self._action(i)
+
+    @property
+    def actions(self) -> List['up.model.action.Action']:
+        '''Returns the actions of the problem.'''
+        return [self._action(i) for i in range(len(self._actions))]
+
+    @property
+    def goals(self) -> List['up.model.fnode.FNode']:
+        '''Returns the goals of the problem.'''
+        goals = self._sections[GOALS]
+        return [self._expression(g) for g in goals[1:1 + goals[0]]]
+
+    @property
+    def problem(self) -> 'up.model.Problem':
+        '''Returns the problem, decoding all the parts not decoded yet.'''
+        if self._problem is None:
+            self._problem = self._read_problem()
+        return self._problem
+
+    def _symbol(self, index: int) -> str:
+        res = self._symbols[index]
+        if res is None:
+            offsets = self._sections[SYMBOLS_INDEX]
+            res = str(self._symbols_text[offsets[1 + index]:offsets[2 + index]], 'utf-8')
+            self._symbols[index] = res
+        return res
+
+    def _number(self, index: int) -> Union[int, Fraction]:
+        text = self._symbol(index)
+        return Fraction(text) if '/' in text else int(text)
+
+    def _read_types(self) -> List['up.model.types.Type']:
+        tm = self._env.type_manager
+        data = self._sections[TYPES]
+        res: List['up.model.types.Type'] = []
+        for i in range(0, len(data), 3):
+            kind, a, b = data[i:i + 3]
+            if kind == BOOL_TYPE:
+                res.append(tm.BoolType())
+            elif kind == TIME_TYPE:
+                res.append(up.model.types.TIME)
+            elif kind == USER_TYPE:
+                res.append(tm.UserType(self._symbol(a), None if b == NONE else res[b]))
+            elif kind == INT_TYPE:
+                res.append(tm.IntType(None if a == NONE else int(self._symbol(a)),
+                                      None if b == NONE else int(self._symbol(b))))
+            else:
+                assert kind == REAL_TYPE
+                res.append(tm.RealType(None if a == NONE else Fraction(self._symbol(a)),
+                                       None if b == NONE else Fraction(self._symbol(b))))
+        return res
+
+    def _read_fluents(self):
+        c = _Cursor(self._sections[FLUENTS], 0)
+        fluents = []
+        defaults = []
+        for _ in range(c.next()):
+            name, typename, default, arity = c.take(4)
+            signature = OrderedDict()
+            for _ in range(arity):
+                param_name, param_type = c.take(2)
+                signature[self._symbol(param_name)] = self._types[param_type]
+            fluents.append(up.model.Fluent(self._symbol(name), self._types[typename], signature, self._env))
+            defaults.append(default)
+        return fluents, defaults
+
+    def _object(self, index: int) -> 'up.model.object.Object':
+        res = self._objects[index]
+        if res is None:
+            data = self._sections[OBJECTS]
+            res = up.model.Object(self._symbol(data[1 + index]), self._types[data[1 + len(self._objects) + index]])
+            self._objects[index] = res
+        return res
+
+    def _expression(self, index: int) -> 'up.model.fnode.FNode':
+        '''Returns the expression with the given index, decoding it, together with its
+        arguments, if it is first accessed.'''
+        nodes = self._nodes
+        res = nodes[index]
+        if res is not None:
+            return res
+        create_node = self._env.expression_manager.create_node
+        positions = self._sections[EXPRESSIONS_INDEX]
+        data = self._sections[EXPRESSIONS]
+        stack = [index]
+        while stack:
+            i = stack[-1]
+            if nodes[i] is not None:
+                stack.pop()
+                continue
+            pos = positions[1 + i]
+            payload_size = data[pos + 1]
+            args_pos = pos + 2 + payload_size
+            args = data[args_pos + 1:args_pos + 1 + data[args_pos]]
+            missing = [a for a in args if nodes[a] is None]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            node_type = OPERATORS[data[pos]]
+            payload = self._payload(node_type, data[pos + 2:args_pos])
+            nodes[i] = create_node(node_type, tuple(nodes[a] for a in args), payload)
+        return nodes[index] # type: ignore
+
+    def _payload(self, node_type: OperatorKind, payload: Sequence[int]):
+        if node_type == OperatorKind.BOOL_CONSTANT:
+            return bool(payload[0])
+        elif node_type == OperatorKind.INT_CONSTANT:
+            return int(self._symbol(payload[0]))
+        elif node_type == OperatorKind.REAL_CONSTANT:
+            return Fraction(self._symbol(payload[0]))
+        elif node_type == OperatorKind.OBJECT_EXP:
+            return self._object(payload[0])
+        elif node_type == OperatorKind.FLUENT_EXP:
+            return self._fluents[payload[0]]
+        elif node_type == OperatorKind.PARAM_EXP:
+            return up.model.Parameter(self._symbol(payload[0]), self._types[payload[1]])
+        elif node_type == OperatorKind.VARIABLE_EXP:
+            return up.model.Variable(self._symbol(payload[0]), self._types[payload[1]])
+        elif node_type == OperatorKind.EXISTS or node_type == OperatorKind.FORALL:
+            return tuple(up.model.Variable(self._symbol(payload[i]), self._types[payload[i + 1]])
+                         for i in range(0, len(payload), 2))
+        elif node_type == OperatorKind.TIMING_EXP:
+            return self._timing(_Cursor(payload, 0))
+        return None
+
+    def _expressions(self, c: _Cursor) -> List['up.model.fnode.FNode']:
+        return [self._expression(e) for e in c.take(c.next())]
+
+    def _timing(self, c: _Cursor) -> 'up.model.timing.Timing':
+        kind, delay = c.take(2)
+        return up.model.Timing(self._number(delay), up.model.timing.Timepoint(TIMEPOINTS[kind]))
+
+    def _time_interval(self, c: _Cursor) -> 'up.model.timing.TimeInterval':
+        lower = self._timing(c)
+        upper = self._timing(c)
+        is_left_open, is_right_open = c.take(2)
+        return up.model.TimeInterval(lower, upper, bool(is_left_open), bool(is_right_open))
+
+    def _effects(self, c: _Cursor) -> List['up.model.effect.Effect']:
+        res = []
+        for _ in range(c.next()):
+            kind, fluent, value, condition = c.take(4)
+            res.append(up.model.Effect(self._expression(fluent), self._expression(value),
+                                       self._expression(condition), EFFECTS[kind]))
+        return res
+
+    def _conditions(self, c: _Cursor) -> Dict['up.model.timing.TimeInterval', List['up.model.fnode.FNode']]:
+        res = {}
+        for _ in range(c.next()):
+            interval = self._time_interval(c)
+            res[interval] = self._expressions(c)
+        return res
+
+    def _action(self, index: int) -> 'up.model.action.Action':
+        res = self._actions[index]
+        if res is not None:
+            return res
+        c = _Cursor(self._sections[ACTIONS], self._sections[ACTIONS_INDEX][1 + len(self._actions) + index])
+        kind, name, arity = c.take(3)
+        parameters = OrderedDict()
+        for _ in range(arity):
+            param_name, param_type = c.take(2)
+            parameters[self._symbol(param_name)] = self._types[param_type]
+        if kind == INSTANTANEOUS_ACTION:
+            action = up.model.InstantaneousAction(self._symbol(name), parameters, self._env)
+            action._preconditions = self._expressions(c)
+            action._preconditions_wait = self._expressions(c)
+            action._effects = self._effects(c)
+        else:
+            durative_action = up.model.DurativeAction(self._symbol(name), parameters, self._env)
+            lower, upper, is_left_open, is_right_open = c.take(4)
+            durative_action._duration = up.model.DurationInterval(self._expression(lower), self._expression(upper),
+                                                                  bool(is_left_open), bool(is_right_open))
+            durative_action._conditions = self._conditions(c)
+            durative_action._conditions_wait = self._conditions(c)
+            for _ in range(c.next()):
+                timing = self._timing(c)
+                durative_action._effects[timing] = self._effects(c)
+            action = durative_action
+        self._actions[index] = action
+        return action
+
+    def _read_problem(self) -> 'up.model.Problem':
+        c = _Cursor(self._sections[DEFAULTS], 0)
+        initial_defaults = {}
+        for _ in range(c.next()):
+            typename, value = c.take(2)
+            initial_defaults[self._types[typename]] = self._expression(value)
+        problem = up.model.Problem(self.name, self._env, initial_defaults=initial_defaults)
+        for t in self._types:
+            if t.is_user_type():
+                problem._add_user_type(t)
+        for f, default in zip(self._fluents, self._fluents_defaults):
+            problem.add_fluent(f, default_initial_value=None if default == NONE else self._expression(default))
+        problem.add_objects(self.objects)
+        for a in self.actions:
+            problem.add_action(a)
+        # The initial state is decoded column by column, bypassing the checks of set_initial_value
+        create_node = self._env.expression_manager.create_node
+        expression = self._expression
+        initial_value = problem._initial_value
+        data = self._sections[INITIAL_STATE]
+        pos = 1
+        for _ in range(data[0]):
+            fluent = self._fluents[data[pos]]
+            n = data[pos + 1]
+            pos += 2
+            columns = []
+            for _ in range(fluent.arity):
+                columns.append([expression(a) for a in data[pos:pos + n]])
+                pos += n
+            values = [expression(v) for v in data[pos:pos + n]]
+            pos += n
+            for args, value in zip(zip(*columns) if columns else [()] * n, values):
+                initial_value[create_node(OperatorKind.FLUENT_EXP, args, fluent)] = value
+        for g in self.goals:
+            problem.add_goal(g)
+        c = _Cursor(self._sections[TIMED_GOALS], 0)
+        for _ in range(c.next()):
+            interval = self._time_interval(c)
+            for g in self._expressions(c):
+                problem.add_timed_goal(interval, g)
+        c = _Cursor(self._sections[TIMED_EFFECTS], 0)
+        for _ in range(c.next()):
+            timing = self._timing(c)
+            for e in self._effects(c):
+                problem._add_effect_instance(timing, e)
+        c = _Cursor(self._sections[METRICS], 0)
+        for _ in range(c.next()):
+            kind = c.next()
+            metric: up.model.metrics.PlanQualityMetric
+            if kind == ACTIONS_COSTS:
+                default, costs_count = c.take(2)
+                costs = {}
+                for _ in range(costs_count):
+                    action, cost = c.take(2)
+                    costs[self._action(action)] = self._expression(cost)
+                metric = up.model.metrics.MinimizeActionCosts(costs, None if default == NONE else self._expression(default))
+            elif kind == PLAN_LENGTH:
+                metric = up.model.metrics.MinimizeSequentialPlanLength()
+            elif kind == MAKESPAN:
+                metric = up.model.metrics.MinimizeMakespan()
+            elif kind == MINIMIZE_EXPRESSION:
+                metric = up.model.metrics.MinimizeExpressionOnFinalState(self._expression(c.next()))
+            else:
+                assert kind == MAXIMIZE_EXPRESSION
+                metric = up.model.metrics.MaximizeExpressionOnFinalState(self._expression(c.next()))
+            problem.add_quality_metric(metric)
+        return problem
@@ -0,0 +1,351 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+'''This module defines the writer of the binary format of the problems.
+
+A file in the binary format starts with a header, made of the magic bytes, the
+version of the format and the table of the sections (tag, offset and size in
+bytes); all the sections, but the text of the symbols, are arrays of little-endian
+32-bit integers:
+ - the names and the numbers of the problem are interned in a table of symbols
+   and are referred by their indexes;
+ - every distinct FNode is stored once, after its arguments, as a record made of
+   its node type, its payload and the indexes of its arguments;
+ - the initial state is stored in columns, grouped by fluent;
+ - every action is stored in a record, that can be decoded independently from
+   the other ones through the index of the actions.
+
+The BinaryReader memory-maps the file and decodes its content lazily.'''
+
+
+import struct
+import sys
+from array import array
+from io import BytesIO
+import unified_planning as up
+from unified_planning.exceptions import UPUnsupportedProblemTypeError
+from typing import IO, Dict, List, Optional, Tuple
+
+
+MAGIC = b'UPBP'
+VERSION = 1
+# magic, version, number of sections
+HEADER = struct.Struct('<4sII')
+# tag, offset, size
+SECTION = struct.Struct('<4sQQ')
+
+# The tags of the sections
+SYMBOLS_INDEX = b'SYMI'
+SYMBOLS_TEXT = b'SYMT'
+PROBLEM = b'PROB'
+TYPES = b'TYPE'
+OBJECTS = b'OBJS'
+FLUENTS = b'FLNT'
+DEFAULTS = b'DFLT'
+EXPRESSIONS_INDEX = b'EXPI'
+EXPRESSIONS = b'EXPR'
+ACTIONS_INDEX = b'ACTI'
+ACTIONS = b'ACTS'
+INITIAL_STATE = b'INIT'
+GOALS = b'GOAL'
+TIMED_GOALS = b'TGOL'
+TIMED_EFFECTS = b'TEFF'
+METRICS = b'METR'
+
+# The kinds of the types
+BOOL_TYPE, INT_TYPE, REAL_TYPE, USER_TYPE, TIME_TYPE = range(5)
+# The kinds of the actions
+INSTANTANEOUS_ACTION, DURATIVE_ACTION = range(2)
+# The kinds of the metrics
+ACTIONS_COSTS, PLAN_LENGTH, MAKESPAN, MINIMIZE_EXPRESSION, MAXIMIZE_EXPRESSION = range(5)
+# The index of the missing symbols, types and expressions
+NONE = -1
+
+
+class BinaryWriter:
+    '''This class can be used to write a Problem in the binary format read by the BinaryReader.'''
+    def __init__(self, problem: 'up.model.Problem'):
+        self.problem = problem
+
+    def _write_problem(self, out: IO[bytes]):
+        sections = _ProblemEncoder(self.problem).encode()
+        offset = HEADER.size + SECTION.size * len(sections)
+        out.write(HEADER.pack(MAGIC, VERSION, len(sections)))
+        for tag, data in sections:
+            out.write(SECTION.pack(tag, offset, len(data)))
+            offset += len(data) + (-len(data) % 4)
+        for _, data in sections:
+            out.write(data)
+            out.write(b'\0' * (-len(data) % 4))
+
+    def get_problem(self) -> bytes:
+        '''Returns the binary representation of the problem.'''
+        out = BytesIO()
+        self._write_problem(out)
+        return out.getvalue()
+
+    def write_problem(self, filename: str):
+        '''Dumps to file the binary representation of the problem.'''
+        with open(filename, 'wb') as f:
+            self._write_problem(f)
+
+
+class _ProblemEncoder:
+    '''Encodes the sections of a problem, interning its symbols, types and expressions.'''
+    def __init__(self, problem: 'up.model.Problem'):
+        if type(problem) is not up.model.Problem or len(problem.agents) > 0:
+            raise UPUnsupportedProblemTypeError('The binary format supports only the action based problems without agents!')
+        self._problem = problem
+        self._symbols: Dict[str, int] = {}
+        self._types: Dict['up.model.types.Type', int] = {}
+        self._types_data = array('i')
+        self._objects = {o: i for i, o in enumerate(problem.all_objects)}
+        self._fluents = {f: i for i, f in enumerate(problem.fluents)}
+        self._expressions: Dict['up.model.fnode.FNode', int] = {}
+        self._expressions_index = array('i')
+        self._expressions_data = array('i')
+
+    def encode(self) -> List[Tuple[bytes, bytes]]:
+        '''Returns the tags and the contents of the sections of the problem.'''
+        problem = self._problem
+        em = problem.env.expression_manager
+        sections = [(PROBLEM, array('i', [NONE if problem.name is None else self._symbol(problem.name)]))]
+        for t in problem.user_types:
+            self._type(t)
+        objects = array('i', [len(self._objects)])
+        objects.extend(self._symbol(o.name) for o in problem.all_objects)
+        objects.extend(self._type(o.type) for o in problem.all_objects)
+        fluents = array('i', [len(self._fluents)])
+        for f in problem.fluents:
+            default = problem.fluents_defaults.get(f, None)
+            fluents.extend((self._symbol(f.name), self._type(f.type),
+                            NONE if default is None else self._expression(default), f.arity))
+            for p in f.signature:
+                fluents.extend((self._symbol(p.name), self._type(p.type)))
+        defaults = array('i', [len(problem.initial_defaults)])
+        for t, v in problem.initial_defaults.items():
+            defaults.extend((self._type(t), self._expression(v)))
+        actions_index = array('i', [len(problem.actions)])
+        actions_index.extend(self._symbol(a.name) for a in problem.actions)
+        actions = array('i')
+        for a in problem.actions:
+            actions_index.append(len(actions))
+            self._action(a, actions)
+        # The initial state, grouped by fluent: the columns of the arguments and the one of the values
+        groups: Dict['up.model.fluent.Fluent', Tuple[List[List[int]], List[int]]] = {}
+        for fluent_exp, value in problem.explicit_initial_values.items():
+            fluent = fluent_exp.fluent()
+            if fluent not in groups:
+                groups[fluent] = ([[] for _ in range(fluent.arity)], [])
+            columns, values = groups[fluent]
+            for column, arg in zip(columns, fluent_exp.args):
+                column.append(self._expression(arg))
+            values.append(self._expression(value))
+        initial_state = array('i', [len(groups)])
+        for fluent, (columns, values) in groups.items():
+            initial_state.extend((self._fluents[fluent], len(values)))
+            for column in columns:
+                initial_state.extend(column)
+            initial_state.extend(values)
+        goals = array('i', [len(problem.goals)])
+        goals.extend(self._expression(g) for g in problem.goals)
+        timed_goals = array('i', [len(problem.timed_goals)])
+        for i, gl in problem.timed_goals.items():
+            self._time_interval(i, timed_goals)
+            timed_goals.append(len(gl))
+            timed_goals.extend(self._expression(g) for g in gl)
+        timed_effects = array('i', [len(problem.timed_effects)])
+        for t, el in problem.timed_effects.items():
+            self._timing(t, timed_effects)
+            self._effects(el, timed_effects)
+        metrics = array('i', [len(problem.quality_metrics)])
+        actions_positions = {a: i for i, a in enumerate(problem.actions)}
+        for m in problem.quality_metrics:
+            if isinstance(m, up.model.metrics.MinimizeActionCosts):
+                metrics.extend((ACTIONS_COSTS, NONE if m.default is None else self._expression(m.default), len(m.costs)))
+                for a, c in m.costs.items():
+                    metrics.extend((actions_positions[a], self._expression(c)))
+            elif isinstance(m, up.model.metrics.MinimizeSequentialPlanLength):
+                metrics.append(PLAN_LENGTH)
+            elif isinstance(m, up.model.metrics.MinimizeMakespan):
+                metrics.append(MAKESPAN)
+            elif isinstance(m, up.model.metrics.MinimizeExpressionOnFinalState):
+                metrics.extend((MINIMIZE_EXPRESSION, self._expression(m.expression)))
+            elif isinstance(m, up.model.metrics.MaximizeExpressionOnFinalState):
+                metrics.extend((MAXIMIZE_EXPRESSION, self._expression(m.expression)))
+            else:
+                raise UPUnsupportedProblemTypeError(f'The metric {m} is not supported by the binary format!')
+        expressions_index = array('i', [len(self._expressions_index)])
+        expressions_index.extend(self._expressions_index)
+        symbols = list(self._symbols)
+        symbols_text = [s.encode('utf-8') for s in symbols]
+        symbols_index = array('i', [len(symbols), 0])
+        end = 0
+        for text in symbols_text:
+            end += len(text)
+            symbols_index.append(end)
+        sections.extend([(TYPES, self._types_data), (OBJECTS, objects), (FLUENTS, fluents),
+                         (DEFAULTS, defaults), (EXPRESSIONS_INDEX, expressions_index),
+                         (EXPRESSIONS, self._expressions_data), (ACTIONS_INDEX, actions_index),
+                         (ACTIONS, actions), (INITIAL_STATE, initial_state), (GOALS, goals),
+                         (TIMED_GOALS, timed_goals), (TIMED_EFFECTS, timed_effects),
+                         (METRICS, metrics), (SYMBOLS_INDEX, symbols_index)])
+        res = [(tag, _to_bytes(data)) for tag, data in sections]
+        res.append((SYMBOLS_TEXT, b''.join(symbols_text)))
+        return res
+
+    def _symbol(self, text: str) -> int:
+        res = self._symbols.get(text, None)
+        if res is None:
+            res = len(self._symbols)
+            self._symbols[text] = res
+        return res
+
+    def _type(self, t: 'up.model.types.Type') -> int:
+        res = self._types.get(t, None)
+        if res is not None:
+            return res
+        if t.is_bool_type():
+            row = (BOOL_TYPE, NONE, NONE)
+        elif t.is_time_type():
+            row = (TIME_TYPE, NONE, NONE)
+        elif t.is_user_type():
+            # The father is interned before its heirs
+            father = t.father # type: ignore
+            row = (USER_TYPE, self._symbol(t.name), NONE if father is None else self._type(father)) # type: ignore
+        else:
+            assert t.is_int_type() or t.is_real_type()
+            lower, upper = t.lower_bound, t.upper_bound # type: ignore
+            row = (INT_TYPE if t.is_int_type() else REAL_TYPE,
+                   NONE if lower is None else self._symbol(str(lower)),
+                   NONE if upper is None else self._symbol(str(upper)))
+        res = len(self._types)
+        self._types[t] = res
+        self._types_data.extend(row)
+        return res
+
+    def _expression(self, expression: 'up.model.fnode.FNode') -> int:
+        '''Returns the index of the given expression, storing it, after its arguments,
+        if it is not stored yet.'''
+        ids = self._expressions
+        res = ids.get(expression, None)
+        if res is not None:
+            return res
+        data = self._expressions_data
+        stack = [expression]
+        while stack:
+            e = stack[-1]
+            if e in ids:
+                stack.pop()
+                continue
+            missing = [a for a in e.args if a not in ids]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            ids[e] = len(self._expressions_index)
+            self._expressions_index.append(len(data))
+            payload = self._payload(e)
+            data.extend((e.node_type.value, len(payload)))
+            data.extend(payload)
+            data.append(len(e.args))
+            data.extend(ids[a] for a in e.args)
+        return ids[expression]
+
+    def _payload(self, e: 'up.model.fnode.FNode') -> List[int]:
+        if e.is_bool_constant():
+            return [int(e.bool_constant_value())]
+        elif e.is_int_constant() or e.is_real_constant():
+            return [self._symbol(str(e.constant_value()))]
+        elif e.is_object_exp():
+            return [self._objects[e.object()]]
+        elif e.is_fluent_exp():
+            return [self._fluents[e.fluent()]]
+        elif e.is_parameter_exp():
+            return [self._symbol(e.parameter().name), self._type(e.parameter().type)]
+        elif e.is_variable_exp():
+            return [self._symbol(e.variable().name), self._type(e.variable().type)]
+        elif e.is_exists() or e.is_forall():
+            res = []
+            for v in e.variables():
+                res.extend((self._symbol(v.name), self._type(v.type)))
+            return res
+        elif e.is_timing_exp():
+            timing = array('i')
+            self._timing(e.timing(), timing)
+            return list(timing)
+        return []
+
+    def _timing(self, timing: 'up.model.timing.Timing', out: array):
+        timepoint = timing._timepoint
+        if timepoint.container is not None:
+            raise UPUnsupportedProblemTypeError('The timepoints of the subtasks are not supported by the binary format!')
+        out.extend((timepoint.kind.value, self._symbol(str(timing.delay))))
+
+    def _time_interval(self, interval: 'up.model.timing.TimeInterval', out: array):
+        self._timing(interval.lower, out)
+        self._timing(interval.upper, out)
+        out.extend((int(interval.is_left_open()), int(interval.is_right_open())))
+
+    def _effects(self, effects: List['up.model.effect.Effect'], out: array):
+        out.append(len(effects))
+        for e in effects:
+            out.extend((e.kind.value, self._expression(e.fluent), self._expression(e.value),
+                        self._expression(e.condition)))
+
+    def _conditions(self, conditions: Dict['up.model.timing.TimeInterval', List['up.model.fnode.FNode']], out: array):
+        out.append(len(conditions))
+        for i, cl in conditions.items():
+            self._time_interval(i, out)
+            out.append(len(cl))
+            out.extend(self._expression(c) for c in cl)
+
+    def _action(self, action: 'up.model.action.Action', out: array):
+        if action.agent is not None:
+            raise UPUnsupportedProblemTypeError('The actions of the agents are not supported by the binary format!')
+        if isinstance(action, up.model.InstantaneousAction):
+            kind = INSTANTANEOUS_ACTION
+            simulated = action.simulated_effect is not None
+        elif isinstance(action, up.model.DurativeAction):
+            kind = DURATIVE_ACTION
+            simulated = len(action.simulated_effects) > 0
+        else:
+            raise UPUnsupportedProblemTypeError(f'The action {action.name} is not supported by the binary format!')
+        if simulated:
+            raise UPUnsupportedProblemTypeError('The simulated effects are not supported by the binary format!')
+        out.extend((kind, self._symbol(action.name), len(action.parameters)))
+        for p in action.parameters:
+            out.extend((self._symbol(p.name), self._type(p.type)))
+        if isinstance(action, up.model.InstantaneousAction):
+            for pl in (action.preconditions, action.preconditions_wait):
+                out.append(len(pl))
+                out.extend(self._expression(p) for p in pl)
+            self._effects(action.effects, out)
+        else:
+            duration = action.duration
+            out.extend((self._expression(duration.lower), self._expression(duration.upper),
+                        int(duration.is_left_open()), int(duration.is_right_open())))
+            self._conditions(action.conditions, out)
+            self._conditions(action.conditions_wait, out)
+            out.append(len(action.effects))
+            for t, el in action.effects.items():
+                self._timing(t, out)
+                self._effects(el, out)
+
+
+def _to_bytes(data: array) -> bytes:
+    if sys.byteorder == 'big':
+        data = array('i', data)
+        data.byteswap()
+    return data.tobytes()
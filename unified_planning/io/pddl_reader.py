@@ -17,12 +17,15 @@ import unified_planning as up
 import unified_planning.model
 import unified_planning.model.htn as htn
 import pyparsing # type: ignore
+import re
 import typing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from mimetypes import types_map
 from unified_planning.environment import Environment, get_env
 from collections import OrderedDict
 from fractions import Fraction
-from typing import Dict, Union, Callable, List, cast
+from typing import Any, Dict, Iterable, Iterator, Union, Callable, List, Tuple, cast
 from pyparsing import Word, alphanums, alphas, ZeroOrMore, OneOrMore, Keyword
 from pyparsing import Optional, Suppress, nestedExpr, Group, restOfLine
 if pyparsing.__version__ < '3.0.0':
@@ -142,11 +145,326 @@ class PDDLGrammar:
         return self._parameters
 
 
+class _SExpressionParser:
+    """
+    A tokenizer and recursive-descent parser of the S-expressions of a PDDL file.
+
+    The expressions are returned as nested lists of strings, with the same structure
+    of the ones produced by the pyparsing grammar, and the sections of a problem can
+    be consumed one element at a time, without building the parse tree of the file.
+    """
+    _comment = re.compile(r';[^\n]*')
+    _token = re.compile(r'[()]|[^\s()]+')
+
+    def __init__(self, text: str, filename: str = '<string>'):
+        self._tokens = self._token.findall(self._comment.sub('', text))
+        self._pos = 0
+        self._filename = filename
+
+    @staticmethod
+    def from_file(filename: str) -> '_SExpressionParser':
+        with open(filename) as f:
+            return _SExpressionParser(f.read(), filename)
+
+    def _error(self, message: str) -> SyntaxError:
+        return SyntaxError(f'{message} in {self._filename}, at token {self._pos}')
+
+    def peek(self) -> typing.Optional[str]:
+        """Returns the next token, without consuming it, or None at the end of the file."""
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def next(self) -> str:
+        """Consumes and returns the next token."""
+        if self._pos >= len(self._tokens):
+            raise self._error('Unexpected end of file')
+        tok = self._tokens[self._pos]
+        self._pos += 1
+        return tok
+
+    def expect(self, token: str):
+        """Consumes the next token, that must be the given one (ignoring the case)."""
+        tok = self.next()
+        if tok.lower() != token:
+            raise self._error(f'Expected "{token}", found "{tok}"')
+
+    def expression(self) -> Union[str, List[Any]]:
+        """Consumes and returns the next expression: a token or a list of expressions."""
+        tok = self.next()
+        if tok != '(':
+            if tok == ')':
+                raise self._error('Unexpected ")"')
+            return tok
+        stack: List[List[Any]] = [[]]
+        tokens = self._tokens
+        pos = self._pos
+        try:
+            while True:
+                tok = tokens[pos]
+                pos += 1
+                if tok == '(':
+                    stack.append([])
+                elif tok == ')':
+                    e = stack.pop()
+                    if len(stack) == 0:
+                        return e
+                    stack[-1].append(e)
+                else:
+                    stack[-1].append(tok)
+        except IndexError:
+            raise self._error('Unexpected end of file')
+        finally:
+            self._pos = pos
+
+    def rest(self) -> List[Any]:
+        """Consumes and returns the expressions up to the closing parenthesis of the current list."""
+        res = []
+        while self.peek() != ')':
+            res.append(self.expression())
+        self.next()
+        return res
+
+
+def _typed_list(items: List[Any], variables: bool = False) -> List[List[Any]]:
+    """Returns the groups of a typed list of names (or of variables, without
+    their "?"), as [[names], type] or [[names]] for the last untyped names."""
+    groups: List[List[Any]] = []
+    names: List[str] = []
+    i = 0
+    while i < len(items):
+        item = items[i]
+        if item == '-':
+            if i + 1 >= len(items) or not isinstance(items[i + 1], str):
+                raise SyntaxError(f'Not able to handle the typed list: {items}')
+            groups.append([names, items[i + 1]])
+            names = []
+            i += 2
+            continue
+        if isinstance(item, str) and item[0] == '-': # a type attached to its "-"
+            groups.append([names, item[1:]])
+            names = []
+            i += 1
+            continue
+        if not isinstance(item, str):
+            raise SyntaxError(f'Not able to handle the typed list: {items}')
+        names.append(item[1:] if variables and item[0] == '?' else item)
+        i += 1
+    if len(names) > 0:
+        groups.append([names])
+    return groups
+
+
+def _keyword_values(items: List[Any]) -> Dict[str, Any]:
+    """Returns the values of the given list of keywords followed by their value."""
+    if len(items) % 2 != 0:
+        raise SyntaxError(f'Not able to handle: {items}')
+    res = {}
+    for i in range(0, len(items), 2):
+        if not isinstance(items[i], str) or items[i][0] != ':':
+            raise SyntaxError(f'Not able to handle: {items}')
+        res[items[i].lower()] = items[i + 1]
+    return res
+
+
+def _parse_domain_sexp(domain: List[Any]) -> Dict[str, Any]:
+    """Returns the given domain S-expression, structured as the result of the
+    domain of the pyparsing PDDLGrammar."""
+    if len(domain) < 2 or str(domain[0]).lower() != 'define' or not isinstance(domain[1], list) or \
+       len(domain[1]) != 2 or str(domain[1][0]).lower() != 'domain':
+        raise SyntaxError('Not able to handle the domain header')
+    res: Dict[str, Any] = {'name': domain[1][1], 'tasks': [], 'methods': [], 'actions': []}
+    for section in domain[2:]:
+        if not isinstance(section, list) or len(section) == 0 or not isinstance(section[0], str):
+            raise SyntaxError(f'Not able to handle: {section}')
+        key = section[0].lower()
+        if key == ':requirements':
+            res['features'] = section
+        elif key in (':types', ':constants'):
+            res[key[1:]] = _typed_list(section[1:])
+        elif key in (':predicates', ':functions'):
+            res[key[1:]] = [[p[0], _typed_list(p[1:], True)] for p in section[1:]]
+        elif key == ':task':
+            values = _keyword_values(section[2:])
+            res['tasks'].append({'name': section[1], 'params': _typed_list(values[':parameters'], True)})
+        elif key in (':action', ':durative-action', ':method'):
+            values = _keyword_values(section[2:])
+            item: Dict[str, Any] = {'name': section[1], 'params': _typed_list(values.pop(':parameters', []), True)}
+            for k, v in values.items():
+                item[{':precondition': 'pre', ':effect': 'eff', ':condition': 'cond'}.get(k, k[1:])] = [v]
+            if key == ':method':
+                res['methods'].append(item)
+            else:
+                res['actions'].append(item)
+        else:
+            raise SyntaxError(f'Not able to handle the domain section {section[0]}')
+    return res
+
+
+def _sexp_problem_items(parser: _SExpressionParser) -> Iterator[Tuple[str, Any]]:
+    """Yields the elements of the problem read by the given parser, as soon as they are
+    parsed, as the pairs ('name', name), ('objects', typed list), ('htn', task network),
+    ('init', initial value), for each initial value, ('goal', goal) and
+    ('metric', (optimization, metric))."""
+    parser.expect('(')
+    parser.expect('define')
+    header = parser.expression()
+    if not isinstance(header, list) or len(header) != 2 or str(header[0]).lower() != 'problem':
+        raise SyntaxError('Not able to handle the problem header')
+    yield 'name', header[1]
+    while parser.peek() != ')':
+        parser.expect('(')
+        section = parser.next().lower()
+        if section == ':domain' or section == ':requirements':
+            parser.rest()
+        elif section == ':objects':
+            yield 'objects', _typed_list(parser.rest())
+        elif section == ':htn':
+            tasknet = {'tasks': [[]], 'ordering': [[]], 'constraints': [[]]}
+            tasknet.update((k[1:], [v]) for k, v in _keyword_values(parser.rest()).items())
+            yield 'htn', tasknet
+        elif section == ':init':
+            while parser.peek() != ')':
+                i = parser.expression()
+                if not isinstance(i, list):
+                    raise SyntaxError(f'Not able to handle the initial value {i}')
+                yield 'init', i
+            parser.next()
+        elif section == ':goal':
+            goal = parser.rest()
+            if len(goal) != 1:
+                raise SyntaxError(f'Not able to handle the goal {goal}')
+            yield 'goal', goal[0]
+        elif section == ':metric':
+            values = parser.rest()
+            if len(values) != 2 or values[0] not in ('minimize', 'maximize'):
+                raise SyntaxError(f'Not able to handle the metric {values}')
+            yield 'metric', (values[0], values[1])
+        else:
+            raise SyntaxError(f'Not able to handle the problem section {section}')
+    parser.next()
+    if parser.peek() is not None:
+        raise SyntaxError('Unexpected content after the end of the problem')
+
+
+def _parse_results_problem_items(problem_res: ParseResults) -> Iterator[Tuple[str, Any]]:
+    """Yields the elements of the given problem parsed by the PDDLGrammar, as
+    _sexp_problem_items."""
+    yield 'name', problem_res['name']
+    objects = problem_res.get('objects', None)
+    if objects is not None:
+        yield 'objects', objects
+    tasknet = problem_res.get('htn', None)
+    if tasknet is not None:
+        yield 'htn', {k: tasknet.get(k, [[]]) for k in ('tasks', 'ordering', 'constraints')}
+    for i in problem_res.get('init', []):
+        yield 'init', i
+    if 'goal' in problem_res:
+        yield 'goal', problem_res['goal'][0]
+    metric = problem_res.get('metric', None)
+    if metric is not None:
+        # The metric is the only element of its ParseResults
+        yield 'metric', (problem_res.get('optimization', None), metric[0])
+
+
+def _as_list(value: Any) -> Any:
+    """Returns the given value with the ParseResults in it replaced by lists."""
+    if isinstance(value, ParseResults):
+        return value.asList()
+    elif isinstance(value, dict):
+        return {k: _as_list(v) for k, v in value.items()}
+    elif isinstance(value, tuple):
+        return tuple(_as_list(v) for v in value)
+    return value
+
+
+_grammar: typing.Optional[PDDLGrammar] = None
+
+
+def _parse_problem_items(backend: str, problem_filename: str) -> List[Tuple[str, Any]]:
+    """Returns the elements of the given problem file, as picklable lists of strings;
+    used to parse the problem files in a pool of processes.
+
+    The elements have the same shape on both backends, so that the metric is either
+    a string or the list of its expression."""
+    if backend == 'streaming':
+        return list(_sexp_problem_items(_SExpressionParser.from_file(problem_filename)))
+    global _grammar
+    if _grammar is None:
+        _grammar = PDDLGrammar()
+    problem_res = _grammar.problem.parseFile(problem_filename)
+    return [(k, _as_list(v)) for k, v in _parse_results_problem_items(problem_res)]
+
+
+class PDDLDomainTemplate:
+    """
+    A PDDL domain parsed by PDDLReader.parse_domain, from which the problems of its
+    problem files are created.
+
+    The problems created from the same template share the fluents, the user types,
+    the constants and the actions (and the tasks and methods of a hierarchical
+    domain) of the template, that must not be modified.
+    """
+    def __init__(self, domain: up.model.Problem, types_map: Dict[str, up.model.Type],
+                 has_actions_cost: bool, totalcost: typing.Optional[up.model.FNode],
+                 fluents: Dict[str, up.model.Fluent], objects: Dict[str, up.model.FNode]):
+        self._domain = domain
+        self._types_map = types_map
+        self._has_actions_cost = has_actions_cost
+        self._totalcost = totalcost
+        self._fluents = fluents
+        self._objects = objects
+        self._actions_costs: typing.Optional[Tuple[List[up.model.Action],
+                                                   Dict[up.model.Action, up.model.FNode], bool]] = None
+
+    @property
+    def domain(self) -> up.model.Problem:
+        """Returns the problem with the elements of the domain, without objects, initial values and goals."""
+        return self._domain
+
+    def new_problem(self) -> up.model.Problem:
+        """Returns a new problem that shares the elements of the domain."""
+        return self._domain.share_domain()
+
+    def actions_costs(self) -> Tuple[List[up.model.Action], Dict[up.model.Action, up.model.FNode], bool]:
+        """Returns the actions of the domain without their increases of the total-cost,
+        the costs of the actions and if they all have cost 1; the actions are computed
+        once and shared by the problems that use the total-cost as metric."""
+        if self._actions_costs is None:
+            actions: List[up.model.Action] = []
+            costs: Dict[up.model.Action, up.model.FNode] = {}
+            use_plan_length = all(False for _ in self._domain.durative_actions)
+            for a in self._domain.actions:
+                if isinstance(a, up.model.InstantaneousAction):
+                    cost = None
+                    for i, e in enumerate(a.effects):
+                        if e.fluent == self._totalcost:
+                            cost = i
+                            break
+                    if cost is not None:
+                        a = a.clone()
+                        value = a._effects.pop(cost).value
+                        costs[a] = value
+                        if value != 1:
+                            use_plan_length = False
+                    else:
+                        use_plan_length = False
+                actions.append(a)
+            self._actions_costs = (actions, costs, use_plan_length)
+        return self._actions_costs
+
+
 class PDDLReader:
     """
     Parse a PDDL problem and generate a unified_planning problem.
+
+    The backend can be 'pyparsing', that parses the files with the PDDLGrammar, or
+    'streaming', that uses a hand-written tokenizer and recursive-descent parser and
+    adds the initial values and the goals of the problem as soon as they are parsed;
+    the latter is much faster, and uses much less memory, on large problem files.
     """
-    def __init__(self, env: Environment = None):
+    def __init__(self, env: Environment = None, backend: str = 'pyparsing'):
+        if backend not in ('pyparsing', 'streaming'):
+            raise up.exceptions.UPUsageError(f'Unknown PDDLReader backend: {backend}')
+        self._backend = backend
         self._env = get_env(env)
         self._em = self._env.expression_manager
         self._tm = self._env.type_manager
@@ -168,9 +486,67 @@ class PDDLReader:
         grammar = PDDLGrammar()
         self._pp_domain = grammar.domain
         self._pp_problem = grammar.problem
-        self._pp_parameters = grammar.parameters
         self._fve = up.walkers.FreeVarsExtractor()
         self._totalcost: typing.Optional[up.model.FNode] = None
+        # The symbol tables of the problem being parsed, reset by _reset_symbols
+        self._fluents: Dict[str, up.model.Fluent] = {}
+        self._objects: Dict[str, up.model.FNode] = {}
+        self._constants: Dict[str, up.model.FNode] = {}
+        self._variables: Dict[typing.Tuple[str, ...], Dict[str, up.model.Variable]] = {}
+        self._parameters_owner: typing.Optional[Union[up.model.Action, htn.Method]] = None
+        self._parameters: Dict[str, up.model.FNode] = {}
+
+    def _reset_symbols(self, template: typing.Optional[PDDLDomainTemplate] = None):
+        self._fluents = {} if template is None else template._fluents
+        self._objects = {} if template is None else dict(template._objects)
+        self._constants = {}
+        self._variables = {}
+        self._parameters_owner = None
+        self._parameters = {}
+
+    def _add_fluent(self, problem: up.model.Problem, fluent: up.model.Fluent):
+        problem.add_fluent(fluent)
+        self._fluents[fluent.name] = fluent
+
+    def _add_object(self, problem: up.model.Problem, obj: up.model.Object):
+        problem.add_object(obj)
+        self._objects[obj.name] = self._em.ObjectExp(obj)
+
+    def _quantified_variables(self, types_map: Dict[str, up.model.Type],
+                              variables: Union[ParseResults, List[str]]) -> Dict[str, up.model.Variable]:
+        '''Returns the variables of the given typed list of a quantifier, parsing it
+        only the first time it is found.'''
+        key = tuple(variables)
+        res = self._variables.get(key, None)
+        if res is None:
+            res = {}
+            for g in _typed_list(list(key), True):
+                t = types_map[g[1] if len(g) > 1 else 'object']
+                for o in g[0]:
+                    res[o] = up.model.Variable(o, t)
+            self._variables[key] = res
+        return res
+
+    def _parameter_exp(self, act: Union[up.model.Action, htn.Method], name: str) -> up.model.FNode:
+        if act is not self._parameters_owner:
+            self._parameters_owner = act
+            self._parameters = {}
+        res = self._parameters.get(name, None)
+        if res is None:
+            res = self._em.ParameterExp(act.parameter(name))
+            self._parameters[name] = res
+        return res
+
+    def _constant_exp(self, token: str) -> up.model.FNode:
+        res = self._constants.get(token, None)
+        if res is None:
+            n = Fraction(token)
+            if n.denominator == 1:
+                res = self._em.Int(n.numerator)
+            else:
+                res = self._em.Real(n)
+            self._constants[token] = res
+        return res
 
     def _parse_exp(self, problem: up.model.Problem, act: typing.Optional[Union[up.model.Action, htn.Method]],
                    types_map: Dict[str, up.model.Type], var: Dict[str, up.model.Variable],
@@ -188,14 +564,14 @@ class PDDLReader:
                 elif exp[0] in ['exists', 'forall']: # quantifier operators
                     q_op: Callable = self._em.Exists if exp[0] == 'exists' else self._em.Forall
                     solved.append(q_op(solved.pop(), *var.values()))
-                elif problem.has_fluent(exp[0]): # fluent reference
-                    f = problem.fluent(exp[0])
+                elif exp[0] in self._fluents: # fluent reference
+                    f = self._fluents[exp[0]]
                     args = [solved.pop() for _ in exp[1:]]
                     solved.append(self._em.FluentExp(f, tuple(args)))
                 else:
                     raise up.exceptions.UPUnreachableCodeError
             else:
-                if isinstance(exp, ParseResults):
+                if isinstance(exp, (ParseResults, list)):
                     if len(exp) == 0: # empty precodition
                         solved.append(self._em.TRUE())
                     elif exp[0] == '-' and len(exp) == 2: # unary minus
@@ -206,16 +582,10 @@ class PDDLReader:
                         for e in exp[1:]:
                             stack.append((var, e, False))
                     elif exp[0] in ['exists', 'forall']: # quantifier operators
-                        vars_string = ' '.join(exp[1])
-                        vars_res = self._pp_parameters.parseString(vars_string)
-                        vars = {}
-                        for g in vars_res['params']:
-                            t = types_map[g[1] if len(g) > 1 else 'object']
-                            for o in g[0]:
-                                vars[o] = up.model.Variable(o, t)
+                        vars = self._quantified_variables(types_map, exp[1])
                         stack.append((vars, exp, True))
                         stack.append((vars, exp[2], False))
-                    elif problem.has_fluent(exp[0]): # fluent reference
+                    elif exp[0] in self._fluents: # fluent reference
                         stack.append((var, exp, True))
                         for e in exp[1:]:
                             stack.append((var, e, False))
@@ -228,17 +598,13 @@ class PDDLReader:
                         solved.append(self._em.VariableExp(var[exp[1:]]))
                     elif exp[0] == '?': # action parameter
                         assert act is not None
-                        solved.append(self._em.ParameterExp(act.parameter(exp[1:])))
-                    elif problem.has_fluent(exp): # fluent
-                        solved.append(self._em.FluentExp(problem.fluent(exp)))
-                    elif problem.has_object(exp): # object
-                        solved.append(self._em.ObjectExp(problem.object(exp)))
+                        solved.append(self._parameter_exp(act, exp[1:]))
+                    elif exp in self._fluents: # fluent
+                        solved.append(self._em.FluentExp(self._fluents[exp]))
+                    elif exp in self._objects: # object
+                        solved.append(self._objects[exp])
                     else: # number
-                        n = Fraction(exp)
-                        if n.denominator == 1:
-                            solved.append(self._em.Int(n.numerator))
-                        else:
-                            solved.append(self._em.Real(n))
+                        solved.append(self._constant_exp(exp))
                 else:
                     raise SyntaxError(f'Not able to handle: {exp}')
         assert len(solved) == 1 #sanity check
@@ -295,14 +661,7 @@ class PDDLReader:
                 for e in exp[1:]:
                     to_add.append((e, vars))
             elif op == 'forall':
-                vars_string = ' '.join(exp[1])
-                vars_res = self._pp_parameters.parseString(vars_string)
-                if vars is None:
-                    vars = {}
-                for g in vars_res['params']:
-                    t = types_map[g[1] if len(g) > 1 else 'object']
-                    for o in g[0]:
-                        vars[o] = up.model.Variable(o, t)
+                vars = {**({} if vars is None else vars), **self._quantified_variables(types_map, exp[1])}
                 to_add.append((exp[2], vars))
             elif len(exp) == 3 and op == 'at' and exp[1] == 'start':
                 cond = self._parse_exp(problem, act, types_map, {} if vars is None else vars, exp[2])
@@ -431,9 +790,136 @@ class PDDLReader:
                 return False
         return True
 
+    def _add_task_network(self, problem: up.model.Problem, types_map: Dict[str, up.model.Type], tasknet):
+        assert isinstance(problem, htn.HierarchicalProblem)
+        tasks = self._parse_subtasks(tasknet['tasks'][0], None, problem, types_map)
+        for task in tasks:
+            problem.task_network.add_subtask(task)
+        if len(tasknet['ordering'][0]) != 0:
+            raise SyntaxError("Ordering not supported in the initial task network")
+        if len(tasknet['constraints'][0]) != 0:
+            raise SyntaxError("Constraints not supported in the initial task network")
+
+    def _add_initial_value(self, problem: up.model.Problem, types_map: Dict[str, up.model.Type],
+                           i: Union[ParseResults, List[Any]]):
+        if i[0] == '=':
+            problem.set_initial_value(self._parse_exp(problem, None, types_map, {}, i[1]),
+                                      self._parse_exp(problem, None, types_map, {}, i[2]))
+        elif len(i) == 3 and i[0] == 'at' and i[1].replace('.','',1).isdigit():
+            ti = up.model.StartTiming(Fraction(i[1]))
+            va = self._parse_exp(problem, None, types_map, {}, i[2])
+            if va.is_fluent_exp():
+                problem.add_timed_effect(ti, va, self._em.TRUE())
+            elif va.is_not():
+                problem.add_timed_effect(ti, va.arg(0), self._em.FALSE())
+            elif va.is_equals():
+                problem.add_timed_effect(ti, va.arg(0), va.arg(1))
+            else:
+                raise SyntaxError(f'Not able to handle this TIL {i}')
+        else:
+            problem.set_initial_value(self._parse_exp(problem, None, types_map, {}, i), self._em.TRUE())
+
+    def _add_metric(self, problem: up.model.Problem, template: PDDLDomainTemplate,
+                    optimization: str, metric: Union[ParseResults, List[Any], str], has_actions_cost: bool):
+        types_map = template._types_map
+        if optimization == 'minimize' and _as_list(metric) in ('total-time', ['total-time']):
+            problem.add_quality_metric(up.model.metrics.MinimizeMakespan())
+        else:
+            metric_exp = self._parse_exp(problem, None, types_map, {}, metric)
+            if has_actions_cost and optimization == 'minimize' and metric_exp == self._totalcost:
+                problem.remove_fluent(self._totalcost.fluent())
+                actions, costs, use_plan_length = template.actions_costs()
+                problem.clear_actions()
+                for a in actions:
+                    problem.add_action(a)
+                if use_plan_length:
+                    problem.add_quality_metric(up.model.metrics.MinimizeSequentialPlanLength())
+                else:
+                    problem.add_quality_metric(up.model.metrics.MinimizeActionCosts(costs, self._em.Int(0)))
+            else:
+                if optimization == 'minimize':
+                    problem.add_quality_metric(up.model.metrics.MinimizeExpressionOnFinalState(metric_exp))
+                elif optimization == 'maximize':
+                    problem.add_quality_metric(up.model.metrics.MaximizeExpressionOnFinalState(metric_exp))
+
+    def _add_problem_items(self, template: PDDLDomainTemplate,
+                           items: Iterable[Tuple[str, Any]]) -> up.model.Problem:
+        """Returns a new problem of the given domain with the given elements, as yielded
+        by _sexp_problem_items."""
+        self._reset_symbols(template)
+        self._totalcost = template._totalcost
+        types_map = template._types_map
+        problem = template.new_problem()
+        has_goal = False
+        optimization, metric = None, None
+        for key, value in items:
+            if key == 'init':
+                self._add_initial_value(problem, types_map, value)
+            elif key == 'name':
+                problem.name = value
+            elif key == 'objects':
+                for g in value:
+                    t = types_map[g[1] if len(g) > 1 else 'object']
+                    for o in g[0]:
+                        self._add_object(problem, up.model.Object(o, t))
+            elif key == 'htn':
+                self._add_task_network(problem, types_map, value)
+            elif key == 'goal':
+                problem.add_goal(self._parse_exp(problem, None, types_map, {}, value))
+                has_goal = True
+            elif key == 'metric':
+                optimization, metric = value
+            else:
+                raise up.exceptions.UPUnreachableCodeError
+        if not has_goal and not isinstance(problem, htn.HierarchicalProblem):
+            raise SyntaxError("Missing goal section in problem file.")
+        has_actions_cost = template._has_actions_cost and self._problem_has_actions_cost(problem)
+        if metric is not None:
+            self._add_metric(problem, template, optimization, metric, has_actions_cost)
+        return problem
+
+    def parse_problem_file(self, template: PDDLDomainTemplate, problem_filename: str) -> 'up.model.Problem':
+        """Parses the given problem file of the domain of the given template; the returned
+        problem shares the fluents, the types and the actions of the template."""
+        if self._backend == 'streaming':
+            parser = _SExpressionParser.from_file(problem_filename)
+            return self._add_problem_items(template, _sexp_problem_items(parser))
+        problem_res = self._pp_problem.parseFile(problem_filename)
+        return self._add_problem_items(template, _parse_results_problem_items(problem_res))
+
+    def parse_problems(self, domain: Union[str, PDDLDomainTemplate], problem_filenames: Iterable[str],
+                       max_workers: typing.Optional[int] = None) -> List['up.model.Problem']:
+        """Parses the given problem files of the given domain (a domain file or a template
+        returned by parse_domain), parsing the domain only once; the returned problems
+        share the fluents, the types and the actions of the domain.
+
+        If max_workers is given, the problem files are read in a pool of max_workers
+        processes, while the problems are created in this process."""
+        template = domain if isinstance(domain, PDDLDomainTemplate) else self.parse_domain(domain)
+        if max_workers is None:
+            return [self.parse_problem_file(template, f) for f in problem_filenames]
+        if max_workers < 1:
+            raise up.exceptions.UPUsageError('The max_workers of parse_problems must be at least 1.')
+        with ProcessPoolExecutor(max_workers) as executor:
+            return [self._add_problem_items(template, items)
+                    for items in executor.map(_parse_problem_items, repeat(self._backend), problem_filenames)]
+
     def parse_problem(self, domain_filename: str,
                       problem_filename: typing.Optional[str] = None) -> 'up.model.Problem':
-        domain_res = self._pp_domain.parseFile(domain_filename)
+        template = self.parse_domain(domain_filename)
+        if problem_filename is None:
+            return template.domain
+        return self.parse_problem_file(template, problem_filename)
+
+    def parse_domain(self, domain_filename: str) -> PDDLDomainTemplate:
+        """Parses the given domain file into a template, from which the problems of its
+        problem files are created by parse_problem_file."""
+        self._reset_symbols()
+        self._totalcost = None
+        if self._backend == 'streaming':
+            domain_res = _parse_domain_sexp(cast(List[Any], _SExpressionParser.from_file(domain_filename).expression()))
+        else:
+            domain_res = self._pp_domain.parseFile(domain_filename)
 
         problem: up.model.Problem
         if ":hierarchy" in set(domain_res.get('features', [])):
@@ -477,7 +963,7 @@ class PDDLReader:
                 for param_name in g[0]:
                     params[param_name] = param_type
             f = up.model.Fluent(n, self._tm.BoolType(), params, self._env)
-            problem.add_fluent(f)
+            self._add_fluent(problem, f)
 
         for p in domain_res.get('functions', []):
             n = p[0]
@@ -490,12 +976,12 @@ class PDDLReader:
             if n == 'total-cost':
                 has_actions_cost = True
                 self._totalcost = cast(up.model.FNode, self._em.FluentExp(f))
-            problem.add_fluent(f)
+            self._add_fluent(problem, f)
 
         for g in domain_res.get('constants', []):
             t = types_map[g[1] if len(g) > 1 else 'object']
             for o in g[0]:
-                problem.add_object(up.model.Object(o, t))
+                self._add_object(problem, up.model.Object(o, t))
 
         for task in domain_res.get('tasks', []):
             assert isinstance(problem, htn.HierarchicalProblem)
@@ -583,86 +1069,5 @@ class PDDLReader:
                     method.add_subtask(s)
             problem.add_method(method)
 
-        if problem_filename is not None:
-            problem_res = self._pp_problem.parseFile(problem_filename)
-
-            problem.name = problem_res['name']
-
-            for g in problem_res.get('objects', []):
-                t = types_map[g[1] if len(g) > 1 else 'object']
-                for o in g[0]:
-                    problem.add_object(up.model.Object(o, t))
-
-            tasknet = problem_res.get('htn', None)
-            if tasknet is not None:
-                assert isinstance(problem, htn.HierarchicalProblem)
-                tasks = self._parse_subtasks(tasknet['tasks'][0], None, problem, types_map)
-                for task in tasks:
-                    problem.task_network.add_subtask(task)
-                if len(tasknet['ordering'][0]) != 0:
-                    raise SyntaxError("Ordering not supported in the initial task network")
-                if len(tasknet['constraints'][0]) != 0:
-                    raise SyntaxError("Constraints not supported in the initial task network")
-
-            for i in problem_res.get('init', []):
-                if i[0] == '=':
-                    problem.set_initial_value(self._parse_exp(problem, None, types_map, {}, i[1]),
-                                              self._parse_exp(problem, None, types_map, {}, i[2]))
-                elif len(i) == 3 and i[0] == 'at' and i[1].replace('.','',1).isdigit():
-                    ti = up.model.StartTiming(Fraction(i[1]))
-                    va = self._parse_exp(problem, None, types_map, {}, i[2])
-                    if va.is_fluent_exp():
-                        problem.add_timed_effect(ti, va, self._em.TRUE())
-                    elif va.is_not():
-                        problem.add_timed_effect(ti, va.arg(0), self._em.FALSE())
-                    elif va.is_equals():
-                        problem.add_timed_effect(ti, va.arg(0), va.arg(1))
-                    else:
-                        raise SyntaxError(f'Not able to handle this TIL {i}')
-                else:
-                    problem.set_initial_value(self._parse_exp(problem, None, types_map, {}, i), self._em.TRUE())
-
-            if 'goal' in problem_res:
-                problem.add_goal(self._parse_exp(problem, None, types_map, {}, problem_res['goal'][0]))
-            elif not isinstance(problem, htn.HierarchicalProblem):
-                raise SyntaxError("Missing goal section in problem file.")
-
-            has_actions_cost = has_actions_cost and self._problem_has_actions_cost(problem)
-
-            optimization = problem_res.get('optimization', None)
-            metric = problem_res.get('metric', None)
-
-            if metric is not None:
-                if optimization == 'minimize' and len(metric) == 1 and metric[0] == 'total-time':
-                    problem.add_quality_metric(up.model.metrics.MinimizeMakespan())
-                else:
-                    metric_exp = self._parse_exp(problem, None, types_map, {}, metric)
-                    if has_actions_cost and optimization == 'minimize' and metric_exp == self._totalcost:
-                        costs = {}
-                        problem._fluents.remove(self._totalcost.fluent())
-                        problem._initial_value.pop(self._totalcost)
-                        use_plan_length = all(False for _ in problem.durative_actions)
-                        for a in problem.instantaneous_actions:
-                            cost = None
-                            for e in a.effects:
-                                if e.fluent == self._totalcost:
-                                    cost = e
-                                    break
-                            if cost is not None:
-                                costs[a] = cost.value
-                                a._effects.remove(cost)
-                                if cost.value != 1:
-                                    use_plan_length = False
-                            else:
-                                use_plan_length = False
-                        if use_plan_length:
-                            problem.add_quality_metric(up.model.metrics.MinimizeSequentialPlanLength())
-                        else:
-                            problem.add_quality_metric(up.model.metrics.MinimizeActionCosts(costs, self._em.Int(0)))
-                    else:
-                        if optimization == 'minimize':
-                            problem.add_quality_metric(up.model.metrics.MinimizeExpressionOnFinalState(metric_exp))
-                        elif optimization == 'maximize':
-                            problem.add_quality_metric(up.model.metrics.MaximizeExpressionOnFinalState(metric_exp))
-
-        return problem
+        return PDDLDomainTemplate(problem, types_map, has_actions_cost, self._totalcost,
+                                  self._fluents, self._objects)
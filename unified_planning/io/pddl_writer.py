@@ -16,6 +16,7 @@
 
 from fractions import Fraction
 import sys
+import threading
 
 from decimal import Decimal, localcontext
 from warnings import warn
@@ -25,11 +26,21 @@ import unified_planning.environment
 import unified_planning.walkers as walkers
 from unified_planning.model import DurativeAction
 from unified_planning.exceptions import UPTypeError, UPProblemDefinitionError
-from typing import IO, List, Optional
+from typing import IO, Dict, Hashable, Iterable, List, Optional
 from io import StringIO
+from collections import OrderedDict
 from functools import reduce
 
 
+# The texts of the most recently written domains, by domain key (see PDDLWriter._domain_key)
+DOMAINS_CACHE_SIZE = 32
+_domains: 'OrderedDict[Hashable, str]' = OrderedDict()
+_domains_lock = threading.Lock()
+
+# The buffer size of the written problem files
+BUFFER_SIZE = 1 << 16
+
+
 class ConverterToPDDLString(walkers.DagWalker):
     '''Expression converter to a PDDL string.'''
 
@@ -146,11 +157,29 @@ class PDDLWriter:
         self.problem = problem
         self.needs_requirements = needs_requirements
         self.object_freshname = 'object'
+        # The converter is kept between calls, so the strings of the expressions are computed once
+        self._converter = ConverterToPDDLString(problem.env)
 
     def _type_name_or_object_freshname(self, type: 'unified_planning.model.Type') -> str:
         return type.name if type.name != "object" else self.object_freshname # type: ignore
 
-    def _write_domain(self, out: IO[str]):
+    def _update_object_freshname(self):
+        if self.problem.kind.has_hierarchical_typing(): # type: ignore
+            while self.problem.has_type(self.object_freshname):
+                self.object_freshname = self.object_freshname + '_'
+
+    def _domain_key(self) -> Hashable:
+        '''Returns a key that identifies the domain text of the problem: the domain fingerprint,
+        the declaration order of the user types, fluents and actions, that the fingerprint
+        ignores, the written requirements and the quality metrics, that determine the action costs.'''
+        problem = self.problem
+        order = (tuple(t.name for t in problem.user_types), tuple(f.name for f in problem.fluents), # type: ignore
+                 tuple(a.name for a in problem.actions))
+        metrics = tuple(repr(m) for m in problem.quality_metrics)
+        return (problem.domain_fingerprint, order, self.needs_requirements,
+                frozenset(problem.kind.features), metrics)
+
+    def _write_domain(self, out: IO[str], actions: Optional[Iterable['up.model.Action']] = None):
         problem_kind = self.problem.kind
         if problem_kind.has_intermediate_conditions_and_effects(): # type: ignore
             raise UPProblemDefinitionError('PDDL2.1 does not support ICE.\nICE are Intermediate Conditions and Effects therefore when an Effect (or Condition) are not at StartTIming(0) or EndTIming(0).')
@@ -194,8 +223,7 @@ class PDDLWriter:
 
 
         if problem_kind.has_hierarchical_typing(): # type: ignore
-            while self.problem.has_type(self.object_freshname):
-                self.object_freshname = self.object_freshname + '_'
+            self._update_object_freshname()
             user_types_hierarchy = self.problem.user_types_hierarchy
             out.write(f' (:types\n')
             stack: List['unified_planning.model.Type'] = user_types_hierarchy[None] if None in user_types_hierarchy else []
@@ -241,20 +269,22 @@ class PDDLWriter:
         out.write(f' (:predicates {" ".join(predicates)})\n' if len(predicates) > 0 else '')
         out.write(f' (:functions {" ".join(functions)})\n' if len(functions) > 0 else '')
 
-        converter = ConverterToPDDLString(self.problem.env)
-        costs = {}
+        converter = self._converter
+        costs_metric: Optional['up.model.metrics.PlanQualityMetric'] = None
         metrics = self.problem.quality_metrics
         if len(metrics) == 1:
             metric = metrics[0]
-            if isinstance(metric, up.model.metrics.MinimizeActionCosts):
-                for a in self.problem.actions:
-                    costs[a] = metric.get_action_cost(a)
-            elif isinstance(metric, up.model.metrics.MinimizeSequentialPlanLength):
-                for a in self.problem.actions:
-                    costs[a] = self.problem.env.expression_manager.Int(1)
+            if (isinstance(metric, up.model.metrics.MinimizeActionCosts) or
+                isinstance(metric, up.model.metrics.MinimizeSequentialPlanLength)):
+                costs_metric = metric
         elif len(metrics) > 1:
             raise up.exceptions.UPUnsupportedProblemTypeError('Only one metric is supported!')
-        for a in self.problem.actions:
+        for a in (self.problem.actions if actions is None else actions):
+            cost: Optional['up.model.FNode'] = None
+            if isinstance(costs_metric, up.model.metrics.MinimizeActionCosts):
+                cost = costs_metric.get_action_cost(a)
+            elif isinstance(costs_metric, up.model.metrics.MinimizeSequentialPlanLength):
+                cost = self.problem.env.expression_manager.Int(1)
             if isinstance(a, up.model.InstantaneousAction):
                 out.write(f' (:action {a.name}')
                 out.write(f'\n  :parameters (')
@@ -284,8 +314,8 @@ class PDDLWriter:
                         if e.is_conditional():
                             out.write(f')')
 
-                    if a in costs:
-                        out.write(f' (increase total-cost {converter.convert(costs[a])})')
+                    if cost is not None:
+                        out.write(f' (increase total-cost {converter.convert(cost)})')
                     out.write(')')
                 out.write(')\n')
             elif isinstance(a, DurativeAction):
@@ -350,8 +380,8 @@ class PDDLWriter:
                             if e.is_conditional():
                                 out.write(f')')
                             out.write(')')
-                    if a in costs:
-                        out.write(f' (at end (increase total-cost {converter.convert(costs[a])}))')
+                    if cost is not None:
+                        out.write(f' (at end (increase total-cost {converter.convert(cost)}))')
                     out.write(')')
                 out.write(')\n')
             else:
@@ -365,26 +395,39 @@ class PDDLWriter:
             name = f'{self.problem.name}'
         out.write(f'(define (problem {name}-problem)\n')
         out.write(f' (:domain {name}-domain)\n')
+        self._update_object_freshname()
         if len(self.problem.user_types) > 0:
+            objects_by_type: Dict['up.model.Type', List[str]] = {t: [] for t in self.problem.user_types}
+            for o in self.problem.all_objects:
+                objects_by_type[o.type].append(o.name)
             out.write(' (:objects ')
-            for t in self.problem.user_types:
-                objects = [o for o in self.problem.all_objects if o.type == t]
+            for t, objects in objects_by_type.items():
                 if len(objects) > 0:
-                    out.write(f'\n   {" ".join([o.name for o in objects])} - {self._type_name_or_object_freshname(t)}')
+                    out.write('\n  ')
+                    for o_name in objects:
+                        out.write(' ')
+                        out.write(o_name)
+                    out.write(f' - {self._type_name_or_object_freshname(t)}')
             out.write('\n )\n')
-        converter = ConverterToPDDLString(self.problem.env)
+        converter = self._converter
         out.write(' (:init')
-        for f, v in self.problem.initial_values.items():
+        em = self.problem.env.expression_manager
+        for fluent, args, v in self.problem.initial_values.ground_items():
+            if v.is_false():
+                continue
+            f = em.FluentExp(fluent, args)
             if v.is_true():
                 out.write(f' {converter.convert(f)}')
-            elif v.is_false():
-                pass
             else:
                 out.write(f' (= {converter.convert(f)} {converter.convert(v)})')
         if self.problem.kind.has_actions_cost(): # type: ignore
             out.write(f' (= total-cost 0)')
         out.write(')\n')
-        out.write(f' (:goal (and {" ".join([converter.convert(p) for p in self.problem.goals])}))\n')
+        out.write(' (:goal (and')
+        for p in self.problem.goals:
+            out.write(' ')
+            out.write(converter.convert(p))
+        out.write('))\n')
         metrics = self.problem.quality_metrics
         if len(metrics) == 1:
             metric = metrics[0]
@@ -414,10 +457,27 @@ class PDDLWriter:
         self._write_problem(sys.stdout)
 
     def get_domain(self) -> str:
-        '''Returns the PDDL domain.'''
+        '''Returns the PDDL domain.
+
+        The texts of the recently written domains are cached by the domain fingerprint of
+        the problem (see Problem.domain_fingerprint), so the domain shared by many problems
+        is generated once.'''
+        return self._get_domain(self._domain_key())
+
+    def _get_domain(self, key: Hashable) -> str:
+        with _domains_lock:
+            domain = _domains.get(key, None)
+            if domain is not None:
+                _domains.move_to_end(key)
+                return domain
         out = StringIO()
         self._write_domain(out)
-        return out.getvalue()
+        domain = out.getvalue()
+        with _domains_lock:
+            _domains[key] = domain
+            if len(_domains) > DOMAINS_CACHE_SIZE:
+                _domains.popitem(last=False)
+        return domain
 
     def get_problem(self) -> str:
         '''Returns the PDDL problem.'''
@@ -428,9 +488,17 @@ class PDDLWriter:
     def write_domain(self, filename: str):
         '''Dumps to file the PDDL domain.'''
         with open(filename, 'w') as f:
-            self._write_domain(f)
+            f.write(self.get_domain())
+
+    def write_domain_with_actions(self, filename: str, actions: Iterable['up.model.Action']):
+        '''Dumps to file the PDDL domain, with the given actions in place of the actions of
+        the problem. The actions are written as soon as they are produced, so they can
+        be streamed without storing them, for example from the grounded actions of
+        unified_planning.transformers.Grounder.ground_actions().'''
+        with open(filename, 'w') as f:
+            self._write_domain(f, actions)
 
     def write_problem(self, filename: str):
         '''Dumps to file the PDDL problem.'''
-        with open(filename, 'w') as f:
+        with open(filename, 'w', buffering=BUFFER_SIZE) as f:
             self._write_problem(f)
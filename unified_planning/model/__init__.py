@@ -26,7 +26,7 @@ from unified_planning.model.parameter import Parameter
 from unified_planning.model.abstract_problem import AbstractProblem
 from unified_planning.model.problem import Problem
 from unified_planning.model.problem_kind import ProblemKind
-from unified_planning.model.state import State
+from unified_planning.model.state import State, CompactState, GroundFluentsIndex
 from unified_planning.model.timing import TimepointKind, Timing, StartTiming, EndTiming, GlobalStartTiming, GlobalEndTiming, DurationInterval, ClosedDurationInterval
 from unified_planning.model.timing import FixedDuration, OpenDurationInterval, LeftOpenDurationInterval, RightOpenDurationInterval
 from unified_planning.model.timing import TimeInterval, TimePointInterval, ClosedTimeInterval, OpenTimeInterval, LeftOpenTimeInterval, RightOpenTimeInterval
@@ -44,7 +44,7 @@ __all__ = [ 'Action', 'InstantaneousAction', 'DurativeAction',
             'OperatorKind',
             'Parameter',
             'AbstractProblem', 'Problem', 'ProblemKind',
-            'State',
+            'State', 'CompactState', 'GroundFluentsIndex',
             'TimepointKind', 'Timing', 'StartTiming', 'EndTiming', 'GlobalStartTiming', 'GlobalEndTiming',
             'DurationInterval', 'ClosedDurationInterval', 'FixedDuration', 'OpenDurationInterval', 'LeftOpenDurationInterval', 'RightOpenDurationInterval',
             'TimeInterval', 'TimePointInterval', 'ClosedTimeInterval', 'OpenTimeInterval', 'LeftOpenTimeInterval', 'RightOpenTimeInterval',
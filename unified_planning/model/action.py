@@ -20,6 +20,7 @@ and a list of effects.
 
 
 import unified_planning as up
+import weakref
 from unified_planning.environment import get_env, Environment
 from unified_planning.exceptions import UPTypeError, UPUnboundedVariablesError, UPProblemDefinitionError
 from fractions import Fraction
@@ -28,11 +29,18 @@ from collections import OrderedDict
 
 class Action:
     """This is the action interface."""
+
+    # Counts the modifications of all the actions, so that the problems can
+    # detect when the information they cache about their actions is out of date.
+    _modifications = 0
     def __init__(self, _name: str, _parameters: 'OrderedDict[str, up.model.types.Type]' = None,
                  _env: Environment = None, **kwargs: 'up.model.types.Type'):
         self._env = get_env(_env)
         self._name = _name
+        self._version = 0
         self._agent = None
+        # The actions sets containing this action, by id, notified when it is renamed
+        self._owners: Dict[int, 'weakref.ref'] = {}
         self._parameters: 'OrderedDict[str, up.model.parameter.Parameter]' = OrderedDict()
         if _parameters is not None:
             assert len(kwargs) == 0
@@ -45,6 +53,16 @@ class Action:
     def __eq__(self, oth: object) -> bool:
         raise NotImplementedError
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The actions sets register their actions again when they are unpickled
+        del state['_owners']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._owners = {}
+
     def __hash__(self) -> int:
         raise NotImplementedError
 
@@ -59,7 +77,13 @@ class Action:
     @name.setter
     def name(self, new_name: str):
         """Sets the parameter name."""
+        old_name = self._name
         self._name = new_name
+        for owner_ref in list(self._owners.values()):
+            owner = owner_ref()
+            if owner is not None:
+                owner._action_renamed(self, old_name)
+        self._modified()
 
     @property
     def agent(self) -> 'up.model.agent.Agent':
@@ -84,6 +108,18 @@ class Action:
         """Returns True if the action has conditional effects."""
         raise NotImplementedError
 
+    def _add_owner(self, owner: 'up.model.actions_set.ActionsSetMixin'):
+        """Registers the given actions set, to be notified when this action is renamed."""
+        key = id(owner)
+        if key not in self._owners:
+            owners = self._owners
+            owners[key] = weakref.ref(owner, lambda _: owners.pop(key, None))
+
+    def _modified(self):
+        """Records a modification of this action."""
+        self._version += 1
+        Action._modifications += 1
+
 
 class InstantaneousAction(Action):
     """Represents an instantaneous action."""
@@ -164,6 +200,7 @@ class InstantaneousAction(Action):
     def clear_preconditions(self):
         """Removes all action preconditions"""
         self._preconditions = []
+        self._modified()
 
     @property
     def preconditions_wait(self) -> List['up.model.fnode.FNode']:
@@ -172,7 +209,8 @@ class InstantaneousAction(Action):
 
     def clear_preconditions_wait(self):
         """Removes all action wait preconditions"""
-        self._preconditions_wait = []        
+        self._preconditions_wait = []
+        self._modified()
 
     @property
     def effects(self) -> List['up.model.effect.Effect']:
@@ -182,6 +220,7 @@ class InstantaneousAction(Action):
     def clear_effects(self):
         """Removes all effects."""
         self._effects = []
+        self._modified()
 
     @property
     def conditional_effects(self) -> List['up.model.effect.Effect']:
@@ -214,6 +253,7 @@ class InstantaneousAction(Action):
             raise UPUnboundedVariablesError(f"The precondition {str(precondition_exp)} has unbounded variables:\n{str(free_vars)}")
         if precondition_exp not in self._preconditions:
             self._preconditions.append(precondition_exp)
+            self._modified()
 
     def add_precondition_wait(self, precondition: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent', 'up.model.parameter.Parameter', bool]):
         """Adds the given action wait precondition."""
@@ -225,7 +265,8 @@ class InstantaneousAction(Action):
         if len(free_vars) != 0:
             raise UPUnboundedVariablesError(f"The wait precondition {str(precondition_exp)} has unbounded variables:\n{str(free_vars)}")
         if precondition_exp not in self._preconditions_wait:
-            self._preconditions_wait.append(precondition_exp)            
+            self._preconditions_wait.append(precondition_exp)
+            self._modified()
 
     def add_effect(self, fluent: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent'],
                    value: 'up.model.expression.Expression', condition: 'up.model.expression.BoolExpression' = True):
@@ -263,6 +304,7 @@ class InstantaneousAction(Action):
     def _add_effect_instance(self, effect: 'up.model.effect.Effect'):
         if effect not in self._effects:
             self._effects.append(effect)
+            self._modified()
 
     @property
     def simulated_effect(self) -> Optional['up.model.effect.SimulatedEffect']:
@@ -272,12 +314,15 @@ class InstantaneousAction(Action):
     def set_simulated_effect(self, simulated_effect: 'up.model.effect.SimulatedEffect'):
         '''Sets the given simulated effect.'''
         self._simulated_effect = simulated_effect
+        self._modified()
 
     def _set_preconditions(self, preconditions: List['up.model.fnode.FNode']):
         self._preconditions = preconditions
+        self._modified()
 
     def _set_preconditions_wait(self, preconditions_wait: List['up.model.fnode.FNode']):
         self._preconditions_wait = preconditions_wait
+        self._modified()
 
 
 class DurativeAction(Action):
@@ -353,6 +398,8 @@ class DurativeAction(Action):
                     return False
                 elif set(el) != set(oth_el):
                     return False
+            if len(self._simulated_effects) != len(oth._simulated_effects):
+                return False
             for t, se in self._simulated_effects.items():
                 oth_se = oth._simulated_effects.get(t, None)
                 if oth_se is None:
@@ -406,6 +453,7 @@ class DurativeAction(Action):
     def clear_conditions(self):
         '''Removes all conditions.'''
         self._conditions = {}
+        self._modified()
 
     @property
     def conditions_wait(self) -> Dict['up.model.timing.TimeInterval', List['up.model.fnode.FNode']]:
@@ -414,7 +462,8 @@ class DurativeAction(Action):
 
     def clear_conditions_wait(self):
         '''Removes all conditions.'''
-        self._conditions_wait = {}        
+        self._conditions_wait = {}
+        self._modified()
 
     @property
     def effects(self) -> Dict['up.model.timing.Timing', List['up.model.effect.Effect']]:
@@ -424,6 +473,7 @@ class DurativeAction(Action):
     def clear_effects(self):
         '''Removes all effects.'''
         self._effects = {}
+        self._modified()
 
     @property
     def conditional_effects(self) -> Dict['up.model.timing.Timing', List['up.model.effect.Effect']]:
@@ -467,6 +517,7 @@ class DurativeAction(Action):
                (duration.is_left_open() or duration.is_right_open()))):
             raise UPProblemDefinitionError(f'{duration} is an empty interval duration of action: {self.name}.')
         self._duration = duration
+        self._modified()
 
     def set_fixed_duration(self, value: Union['up.model.fnode.FNode', int, Fraction]):
         value_exp, = self._env.expression_manager.auto_promote(value)
@@ -502,11 +553,14 @@ class DurativeAction(Action):
         if interval in self._conditions:
             if condition_exp not in self._conditions[interval]:
                 self._conditions[interval].append(condition_exp)
+                self._modified()
         else:
             self._conditions[interval] = [condition_exp]
+            self._modified()
 
     def _set_conditions(self, interval: 'up.model.timing.TimeInterval', conditions: List['up.model.fnode.FNode']):
         self._conditions[interval] = conditions
+        self._modified()
 
 
     def add_condition_wait(self, interval: Union['up.model.timing.Timing', 'up.model.timing.TimeInterval'],
@@ -519,11 +573,14 @@ class DurativeAction(Action):
         if interval in self._conditions_wait:
             if condition_exp not in self._conditions_wait[interval]:
                 self._conditions_wait[interval].append(condition_exp)
+                self._modified()
         else:
             self._conditions_wait[interval] = [condition_exp]
+            self._modified()
 
     def _set_conditions_wait(self, interval: 'up.model.timing.TimeInterval', conditions: List['up.model.fnode.FNode']):
-        self._conditions_wait[interval] = conditions        
+        self._conditions_wait[interval] = conditions
+        self._modified()
 
     def add_effect(self, timing: 'up.model.timing.Timing', fluent: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent'],
                    value: 'up.model.expression.Expression', condition: 'up.model.expression.BoolExpression' = True):
@@ -566,8 +623,10 @@ class DurativeAction(Action):
         if timing in self._effects:
             if effect not in self._effects[timing]:
                 self._effects[timing].append(effect)
+                self._modified()
         else:
             self._effects[timing] = [effect]
+            self._modified()
 
     @property
     def simulated_effects(self) -> Dict['up.model.timing.Timing', 'up.model.effect.SimulatedEffect']:
@@ -578,3 +637,4 @@ class DurativeAction(Action):
                              simulated_effect: 'up.model.effect.SimulatedEffect'):
         '''Sets the given simulated effect at the specified timing'''
         self._simulated_effects[timing] = simulated_effect
+        self._modified()
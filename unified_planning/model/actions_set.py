@@ -15,7 +15,7 @@
 
 import unified_planning as up
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
-from typing import Iterator, List
+from typing import Dict, Iterator, List
 
 
 class ActionsSetMixin:
@@ -32,6 +32,12 @@ class ActionsSetMixin:
         self._add_user_type_method = add_user_type_method
         self._has_name_method = has_name_method
         self._actions: List['up.model.action.Action'] = []
+        self._actions_by_name: Dict[str, 'up.model.action.Action'] = {}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for a in self._actions:
+            a._add_owner(self)
 
     @property
     def env(self) -> 'up.environment.Environment':
@@ -46,6 +52,7 @@ class ActionsSetMixin:
     def clear_actions(self):
         '''Removes all the problem actions.'''
         self._actions = []
+        self._actions_by_name = {}
 
     @property
     def instantaneous_actions(self) -> Iterator['up.model.action.InstantaneousAction']:
@@ -85,23 +92,36 @@ class ActionsSetMixin:
 
     def action(self, name: str) -> 'up.model.action.Action':
         '''Returns the action with the given name.'''
-        for a in self._actions:
-            if a.name == name:
-                return a
-        raise UPValueError(f'Action of name: {name} is not defined!')
+        a = self._actions_by_name.get(name, None)
+        if a is None:
+            raise UPValueError(f'Action of name: {name} is not defined!')
+        return a
 
     def has_action(self, name: str) -> bool:
         '''Returns True if the problem has the action with the given name .'''
-        for a in self._actions:
-            if a.name == name:
-                return True
-        return False
+        return name in self._actions_by_name
+
+    def _set_actions(self, actions: List['up.model.action.Action']):
+        '''Sets the given actions, that must have different names, as the actions of this set.'''
+        self._actions = actions
+        self._actions_by_name = {}
+        for a in actions:
+            self._actions_by_name[a.name] = a
+            a._add_owner(self)
+
+    def _action_renamed(self, action: 'up.model.action.Action', old_name: str):
+        '''Updates the map from names to actions after the renaming of the given action.'''
+        if self._actions_by_name.get(old_name, None) is action:
+            del self._actions_by_name[old_name]
+            self._actions_by_name[action.name] = action
 
     def add_action(self, action: 'up.model.action.Action'):
         '''Adds the given action.'''
         if self._has_name_method(action.name):
             raise UPProblemDefinitionError('Name ' + action.name + ' already defined!')
         self._actions.append(action)
+        self._actions_by_name[action.name] = action
+        action._add_owner(self)
         for param in action.parameters:
             if param.type.is_user_type():
                 self._add_user_type_method(param.type)
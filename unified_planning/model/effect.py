@@ -30,6 +30,9 @@ class EffectKind(Enum):
     DECREASE = auto()
 
 class Effect:
+    # Counts the modifications of all the effects, so that the problems can
+    # detect when the information they cache about their effects is out of date.
+    _modifications = 0
     def __init__(self, fluent: 'up.model.fnode.FNode', value: 'up.model.fnode.FNode',
                  condition: 'up.model.fnode.FNode', kind: EffectKind = EffectKind.ASSIGN):
         self._fluent = fluent
@@ -81,6 +84,7 @@ class Effect:
     def set_value(self, new_value: 'up.model.fnode.FNode'):
         """Sets the value given to the Fluent by this Effect."""
         self._value = new_value
+        Effect._modifications += 1
 
     @property
     def condition(self) -> 'up.model.fnode.FNode':
@@ -90,6 +94,7 @@ class Effect:
     def set_condition(self, new_condition: 'up.model.fnode.FNode'):
         """Sets the condition required for this Effect to be applied."""
         self._condition = new_condition
+        Effect._modifications += 1
 
     @property
     def kind(self) -> EffectKind:
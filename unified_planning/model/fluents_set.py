@@ -34,6 +34,7 @@ class FluentsSetMixin:
         self._add_user_type_method = add_user_type_method
         self._has_name_method = has_name_method
         self._fluents: List['up.model.fluent.Fluent'] = []
+        self._fluents_by_name: Dict[str, 'up.model.fluent.Fluent'] = {}
         self._fluents_defaults: Dict['up.model.fluent.Fluent', 'up.model.fnode.FNode'] = {}
         self._initial_defaults: Dict['up.model.types.Type', 'up.model.fnode.FNode'] = {}
         for k, v in initial_defaults.items():
@@ -54,17 +55,14 @@ class FluentsSetMixin:
 
     def fluent(self, name: str) -> 'up.model.fluent.Fluent':
         '''Returns the fluent with the given name.'''
-        for f in self._fluents:
-            if f.name == name:
-                return f
-        raise UPValueError(f'Fluent of name: {name} is not defined!')
+        f = self._fluents_by_name.get(name, None)
+        if f is None:
+            raise UPValueError(f'Fluent of name: {name} is not defined!')
+        return f
 
     def has_fluent(self, name: str) -> bool:
         '''Returns true if the fluent with the given name is in the problem.'''
-        for f in self._fluents:
-            if f.name == name:
-                return True
-        return False
+        return name in self._fluents_by_name
 
     def add_fluent(self, fluent_or_name: Union['up.model.fluent.Fluent', str],
                    typename: 'up.model.types.Type' = None, *,
@@ -101,6 +99,7 @@ class FluentsSetMixin:
         if self._has_name_method(fluent.name):
             raise UPProblemDefinitionError('Name ' + fluent.name + ' already defined!')
         self._fluents.append(fluent)
+        self._fluents_by_name[fluent.name] = fluent
         if not default_initial_value is None:
             v_exp, = self.env.expression_manager.auto_promote(default_initial_value)
             self._fluents_defaults[fluent] = v_exp
@@ -113,6 +112,14 @@ class FluentsSetMixin:
                 self._add_user_type_method(param.type)
         return fluent
 
+    def remove_fluent(self, fluent: 'up.model.fluent.Fluent'):
+        '''Removes the given fluent from the problem.'''
+        if self._fluents_by_name.get(fluent.name, None) != fluent:
+            raise UPValueError(f'Fluent {fluent.name} is not defined!')
+        self._fluents.remove(fluent)
+        del self._fluents_by_name[fluent.name]
+        self._fluents_defaults.pop(fluent, None)
+
     @property
     def fluents_defaults(self) -> Dict['up.model.fluent.Fluent', 'up.model.fnode.FNode']:
         '''Returns the problem's fluents defaults.'''
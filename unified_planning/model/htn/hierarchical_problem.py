@@ -60,15 +60,21 @@ class HierarchicalProblem(up.model.problem.Problem):
         res += hash(self._initial_task_network)
         return res
 
+    def share_domain(self) -> 'HierarchicalProblem':
+        '''Returns a new problem that shares the domain of this problem, including its
+        abstract tasks and methods, without its initial task network.'''
+        new_p = super().share_domain()
+        assert isinstance(new_p, HierarchicalProblem)
+        new_p._abstract_tasks = self._abstract_tasks.copy()
+        new_p._methods = self._methods.copy()
+        return new_p
+
     @property
     def kind(self) -> 'up.model.problem_kind.ProblemKind':
-        '''Returns the problem kind of this planning problem.
-
-        IMPORTANT NOTE: this property does a lot of computation, so it should be called as
-        minimum time as possible.'''
-        self._kind = super().kind
-        self._kind.set_problem_class('HIERARCHICAL')  # type: ignore
-        return self._kind
+        '''Returns the problem kind of this planning problem.'''
+        kind = super().kind
+        kind.set_problem_class('HIERARCHICAL')  # type: ignore
+        return kind
 
     @property
     def tasks(self) -> List[Task]:
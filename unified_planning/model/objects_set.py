@@ -16,7 +16,7 @@
 import unified_planning as up
 from unified_planning.model.types import _UserType
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
-from typing import Iterator, List, Union, Optional, cast
+from typing import Dict, Iterator, List, Union, Optional, cast
 
 
 class ObjectsSetMixin:
@@ -33,6 +33,9 @@ class ObjectsSetMixin:
         self._add_user_type_method = add_user_type_method
         self._has_name_method = has_name_method
         self._objects: List['up.model.object.Object'] = []
+        self._objects_by_name: Dict[str, 'up.model.object.Object'] = {}
+        self._objects_by_type: Dict['up.model.types.Type', List['up.model.object.Object']] = {}
+        self._objects_positions: Dict['up.model.types.Type', Dict['up.model.object.Object', int]] = {}
 
     @property
     def env(self) -> 'up.environment.Environment':
@@ -67,8 +70,15 @@ class ObjectsSetMixin:
         if self._has_name_method(obj.name):
             raise UPProblemDefinitionError('Name ' + obj.name + ' already defined!')
         self._objects.append(obj)
+        self._objects_by_name[obj.name] = obj
         if obj.type.is_user_type():
             self._add_user_type_method(obj.type)
+            t: Optional['up.model.types.Type'] = obj.type
+            while t is not None:
+                typed_objects = self._objects_by_type.setdefault(t, [])
+                self._objects_positions.setdefault(t, {})[obj] = len(typed_objects)
+                typed_objects.append(obj)
+                t = cast(_UserType, t).father
         return obj
 
     def add_objects(self, objs: List['up.model.object.Object']):
@@ -78,23 +88,33 @@ class ObjectsSetMixin:
 
     def object(self, name: str) -> 'up.model.object.Object':
         '''Returns the object with the given name.'''
-        for o in self._objects:
-            if o.name == name:
-                return o
-        raise UPValueError(f'Object of name: {name} is not defined!')
+        obj = self._objects_by_name.get(name, None)
+        if obj is None:
+            raise UPValueError(f'Object of name: {name} is not defined!')
+        return obj
 
     def has_object(self, name: str) -> bool:
         '''Returns true if the object with the given name is in the problem.'''
-        for o in self._objects:
-            if o.name == name:
-                return True
-        return False
+        return name in self._objects_by_name
 
     def objects(self, typename: 'up.model.types.Type') -> Iterator['up.model.object.Object']:
         '''Returns the objects of the given user type and of its heirs.'''
-        for obj in self._objects:
-            if cast(_UserType, obj.type).is_subtype(typename):
-                yield obj
+        return iter(self.typed_objects(typename))
+
+    def typed_objects(self, typename: 'up.model.types.Type') -> List['up.model.object.Object']:
+        '''Returns the list of the objects of the given user type and of its heirs,
+        in the order they were added.
+
+        IMPORTANT NOTE: the returned list is maintained by the objects set, so it
+        must not be modified.'''
+        return self._objects_by_type.get(typename, [])
+
+    def object_position(self, obj: 'up.model.object.Object', typename: 'up.model.types.Type') -> int:
+        '''Returns the position of the given object in the typed_objects of the given type.'''
+        positions = self._objects_positions.get(typename, {})
+        if obj not in positions:
+            raise UPValueError(f'Object {obj.name} is not an object of type {typename}!')
+        return positions[obj]
 
     @property
     def all_objects(self) -> List['up.model.object.Object']:
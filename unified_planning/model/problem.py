@@ -23,12 +23,333 @@ from unified_planning.model.user_types_set import UserTypesSetMixin
 from unified_planning.model.agents_set import AgentsSetMixin
 from unified_planning.model.expression import ConstantExpression
 from unified_planning.model.operators import OperatorKind
-from unified_planning.model.types import domain_size, domain_item
+from unified_planning.model.types import domain_size, domain_item, _UserType
+from unified_planning.model.fnode import FNodeContent
 from unified_planning.exceptions import UPProblemDefinitionError, UPTypeError, UPValueError, UPExpressionDefinitionError, UPUsageError
 from unified_planning.plan import ActionInstance
-from unified_planning.walkers import OperatorsExtractor
+from unified_planning.walkers import OperatorsExtractor, Digester
+from unified_planning.walkers.digester import MODULUS, digest, digest_of_set
+from collections.abc import Mapping
 from fractions import Fraction
-from typing import Iterator, List, Dict, Set, Union, Optional, cast
+from itertools import product
+from typing import Iterator, List, Dict, Set, Tuple, Union, Optional, cast
+
+
+class InitialValuesView(Mapping):
+    '''A read-only, live view of all the initial values of a Problem.
+
+    Values are resolved on demand from the explicit initial values and from
+    the fluents defaults, so the ground fluent expressions with a default
+    value are created only when the view is iterated. The iteration order
+    is the explicit initial values first, in insertion order, followed by
+    the remaining ground fluent expressions.'''
+    def __init__(self, problem: 'Problem'):
+        self._problem = problem
+
+    def _domain(self, typename: 'up.model.types.Type') -> List['up.model.fnode.FNode']:
+        if typename.is_user_type():
+            em = self._problem.env.expression_manager
+            return [em.ObjectExp(o) for o in self._problem.typed_objects(typename)]
+        size = domain_size(self._problem, typename)
+        return [domain_item(self._problem, typename, i) for i in range(size)]
+
+    def _in_domain(self, typename: 'up.model.types.Type', value: 'up.model.fnode.FNode') -> bool:
+        if typename.is_user_type():
+            if not value.is_object_exp():
+                return False
+            obj = value.object()
+            return self._problem.has_object(obj.name) and self._problem.object(obj.name) == obj and \
+                cast(_UserType, obj.type).is_subtype(typename)
+        elif typename.is_int_type():
+            lb = typename.lower_bound # type: ignore
+            ub = typename.upper_bound # type: ignore
+            return value.is_int_constant() and lb <= value.constant_value() <= ub
+        return value.is_bool_constant()
+
+    def _is_ground_fluent_exp(self, key: object) -> bool:
+        if not isinstance(key, up.model.fnode.FNode) or not key.is_fluent_exp():
+            return False
+        fluent = key.fluent()
+        if not self._problem.has_fluent(fluent.name) or self._problem.fluent(fluent.name) != fluent:
+            return False
+        return all(self._in_domain(p.type, a) for p, a in zip(fluent.signature, key.args))
+
+    def _default(self, fluent: 'up.model.fluent.Fluent') -> 'up.model.fnode.FNode':
+        value = self._problem._fluents_defaults.get(fluent, None)
+        if value is None:
+            raise UPProblemDefinitionError('Initial value not set!')
+        return value
+
+    def ground_items(self) -> Iterator[Tuple['up.model.fluent.Fluent', Tuple['up.model.fnode.FNode', ...], 'up.model.fnode.FNode']]:
+        '''Returns an iterator over the (fluent, arguments, value) triples of the
+        initial state, in the same order of the view.
+
+        Unlike items(), this method does not create the ground fluent
+        expressions of the fluents left to their default value.'''
+        explicit = self._problem.explicit_initial_values
+        for f_exp, v in explicit.items():
+            yield f_exp.fluent(), f_exp.args, v
+        em = self._problem.env.expression_manager
+        for f in self._problem.fluents:
+            domains = [self._domain(p.type) for p in reversed(f.signature)]
+            default = None
+            for rev_args in product(*domains):
+                args = rev_args[::-1]
+                f_exp = em.expressions.get(FNodeContent(OperatorKind.FLUENT_EXP, args, f), None)
+                if f_exp is not None and f_exp in explicit:
+                    continue
+                if default is None:
+                    default = self._default(f)
+                yield f, args, default
+
+    def ground_value(self, fluent: 'up.model.fluent.Fluent', args: Tuple['up.model.fnode.FNode', ...]) -> Optional['up.model.fnode.FNode']:
+        '''Returns the initial value of the given fluent applied to the given
+        constant arguments, or None if it is not a ground fluent expression
+        of the problem. No new expression is created by this method.'''
+        em = self._problem.env.expression_manager
+        # an expression that was never created can not be explicitly set
+        f_exp = em.expressions.get(FNodeContent(OperatorKind.FLUENT_EXP, tuple(args), fluent), None)
+        if f_exp is not None:
+            return self.get(f_exp, None)
+        if not self._problem.has_fluent(fluent.name) or self._problem.fluent(fluent.name) != fluent:
+            return None
+        if len(args) != fluent.arity or not all(self._in_domain(p.type, a) for p, a in zip(fluent.signature, args)):
+            return None
+        return self._default(fluent)
+
+    def __getitem__(self, key: 'up.model.fnode.FNode') -> 'up.model.fnode.FNode':
+        explicit = self._problem.explicit_initial_values
+        if key in explicit:
+            return explicit[key]
+        if not self._is_ground_fluent_exp(key):
+            raise KeyError(key)
+        return self._default(key.fluent())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._problem.explicit_initial_values or self._is_ground_fluent_exp(key)
+
+    def __iter__(self) -> Iterator['up.model.fnode.FNode']:
+        for f_exp, _ in self.items():
+            yield f_exp
+
+    def items(self): # type: ignore
+        em = self._problem.env.expression_manager
+        for f, args, v in self.ground_items():
+            yield em.FluentExp(f, args), v
+
+    def __len__(self) -> int:
+        res = 0
+        for f in self._problem.fluents:
+            ground_size = 1
+            for p in f.signature:
+                ground_size *= domain_size(self._problem, p.type)
+            res += ground_size
+        return res
+
+    def __repr__(self) -> str:
+        return f'InitialValuesView({self._problem.name})'
+
+
+class _ProblemDigests:
+    '''The digests of the parts of a Problem that define its fingerprint.
+
+    The digests are maintained incrementally, as the kind of the problem: the fluents,
+    user types, objects, actions and goals added to the problem are detected from the
+    length of their lists, the modifications of the actions from their versions and the
+    initial values are updated by Problem.set_initial_value. The problem creates new
+    digests when they are out of date, for example after an effect is modified.
+
+    The digest of the initial values is the sum, over all the ground fluent expressions,
+    of the digest of the fluent and of the value multiplied by the digests of the
+    arguments; with this definition the sum over the ground fluent expressions that take
+    a default value is computed without creating them, from the sums of the digests of
+    the objects of the types of the fluent parameters.'''
+    def __init__(self, problem: 'Problem'):
+        self._problem = problem
+        self._digester = Digester()
+        self._effects_modifications = up.model.effect.Effect._modifications
+        self._args_digests: Dict[Tuple[int, 'up.model.fnode.FNode'], int] = {}
+        self._domains_sums: Dict[Tuple[int, 'up.model.types.Type'], int] = {}
+        self._domains_objects = 0
+        self._fluents = 0
+        self._fluents_sum = 0
+        self._user_types = 0
+        self._user_types_sum = 0
+        self._objects = 0
+        self._objects_sum = 0
+        self._actions = problem._actions
+        self._actions_versions: List[int] = []
+        self._actions_digests: List[int] = []
+        self._actions_sum = 0
+        self._actions_modifications = up.model.action.Action._modifications
+        self._goals = problem._goals
+        self._goals_digests: Set[int] = set()
+        self._goals_count = 0
+        # The sum of the digests of the explicit initial values and, for every fluent,
+        # the sum of the digests of the arguments of its explicit initial values
+        self._initial_values_sum = 0
+        self._initial_values_args: Dict['up.model.fluent.Fluent', int] = {}
+        for fluent_exp, value in problem._initial_value.items():
+            self.set_initial_value(fluent_exp, None, value)
+        self._initial_values_count = len(problem._initial_value)
+
+    def is_up_to_date(self) -> bool:
+        '''Returns False if some part of the problem was changed in a way that can not
+        be detected incrementally.'''
+        return self._effects_modifications == up.model.effect.Effect._modifications and \
+            self._initial_values_count == len(self._problem._initial_value)
+
+    def set_initial_value(self, fluent_exp: 'up.model.fnode.FNode', old_value: Optional['up.model.fnode.FNode'],
+                          new_value: 'up.model.fnode.FNode'):
+        '''Updates the digests of the initial values with the given assignment.'''
+        fluent = fluent_exp.fluent()
+        args_digest = self._args_digest(fluent_exp.args)
+        fluent_args = self._initial_values_args.get(fluent, 0)
+        if old_value is not None:
+            self._initial_values_sum -= self._value_digest(fluent, old_value) * args_digest
+            fluent_args -= args_digest
+        self._initial_values_sum = (self._initial_values_sum + self._value_digest(fluent, new_value) * args_digest) % MODULUS
+        self._initial_values_args[fluent] = (fluent_args + args_digest) % MODULUS
+        self._initial_values_count = len(self._problem._initial_value)
+
+    def fingerprint(self) -> str:
+        '''Brings the digests up to date with the problem and returns its fingerprint.'''
+        problem = self._problem
+        self._update_domain()
+        for o in problem._objects[self._objects:]:
+            self._objects_sum += digest('object', repr(o.type), o.name)
+        self._objects = len(problem._objects)
+        self._update_goals()
+        timed_effects = digest_of_set(digest(repr(t), digest_of_set(self._effect_digest(e) for e in el))
+                                      for t, el in problem._timed_effects.items())
+        timed_goals = digest_of_set(digest(repr(i), digest_of_set(self._digester.get(g) for g in gl))
+                                    for i, gl in problem._timed_goals.items())
+        return format(digest('problem', problem.name, self._fluents_sum % MODULUS, self._user_types_sum % MODULUS,
+                             self._objects_sum % MODULUS, self._actions_sum % MODULUS, self._initial_values_digest(),
+                             sum(self._goals_digests) % MODULUS, timed_effects, timed_goals), '032x')
+
+    def domain_fingerprint(self) -> str:
+        '''Brings the digests of the fluents, user types and actions up to date and returns their digest.'''
+        self._update_domain()
+        return format(digest('domain', self._problem.name, self._fluents_sum % MODULUS, self._user_types_sum % MODULUS,
+                             self._actions_sum % MODULUS), '032x')
+
+    def _update_domain(self):
+        problem = self._problem
+        for f in problem._fluents[self._fluents:]:
+            self._fluents_sum += digest('fluent', repr(f))
+        self._fluents = len(problem._fluents)
+        for t in problem._user_types[self._user_types:]:
+            self._user_types_sum += digest('type', repr(t))
+        self._user_types = len(problem._user_types)
+        self._update_actions()
+
+    def _update_actions(self):
+        actions = self._problem._actions
+        if self._actions is not actions or len(self._actions_versions) > len(actions):
+            self._actions = actions
+            self._actions_versions = []
+            self._actions_digests = []
+            self._actions_sum = 0
+        if self._actions_modifications != up.model.action.Action._modifications:
+            for i, (a, v) in enumerate(zip(actions, self._actions_versions)):
+                if a._version != v:
+                    d = self._action_digest(a)
+                    self._actions_sum += d - self._actions_digests[i]
+                    self._actions_digests[i] = d
+                    self._actions_versions[i] = a._version
+        for a in actions[len(self._actions_versions):]:
+            d = self._action_digest(a)
+            self._actions_sum += d
+            self._actions_digests.append(d)
+            self._actions_versions.append(a._version)
+        self._actions_modifications = up.model.action.Action._modifications
+
+    def _update_goals(self):
+        goals = self._problem._goals
+        if self._goals is not goals or self._goals_count > len(goals):
+            self._goals = goals
+            self._goals_digests = set()
+            self._goals_count = 0
+        for g in goals[self._goals_count:]:
+            self._goals_digests.add(self._digester.get(g))
+        self._goals_count = len(goals)
+
+    def _action_digest(self, action: 'up.model.action.Action') -> int:
+        dg = self._digester.get
+        params = [repr(p) for p in action.parameters]
+        if isinstance(action, up.model.action.InstantaneousAction):
+            return digest('instantaneous action', action.name, len(params), *params,
+                          digest_of_set(dg(c) for c in action.preconditions),
+                          digest_of_set(dg(c) for c in action.preconditions_wait),
+                          digest_of_set(self._effect_digest(e) for e in action.effects),
+                          self._simulated_effect_digest(action.simulated_effect))
+        elif isinstance(action, up.model.action.DurativeAction):
+            return digest('durative action', action.name, len(params), *params, repr(action.duration),
+                          digest_of_set(digest(repr(i), digest_of_set(dg(c) for c in cl))
+                                        for i, cl in action.conditions.items()),
+                          digest_of_set(digest(repr(i), digest_of_set(dg(c) for c in cl))
+                                        for i, cl in action.conditions_wait.items()),
+                          digest_of_set(digest(repr(t), digest_of_set(self._effect_digest(e) for e in el))
+                                        for t, el in action.effects.items()),
+                          digest_of_set(digest(repr(t), self._simulated_effect_digest(se))
+                                        for t, se in action.simulated_effects.items()))
+        else:
+            raise NotImplementedError
+
+    def _effect_digest(self, effect: 'up.model.effect.Effect') -> int:
+        dg = self._digester.get
+        return digest('effect', effect.kind.name, dg(effect.fluent), dg(effect.value), dg(effect.condition))
+
+    def _simulated_effect_digest(self, simulated_effect: Optional['up.model.effect.SimulatedEffect']) -> int:
+        if simulated_effect is None:
+            return 0
+        function = simulated_effect.function
+        name = f'{getattr(function, "__module__", "")}.{getattr(function, "__qualname__", repr(function))}'
+        return digest('simulated effect', name, *(self._digester.get(f) for f in simulated_effect.fluents))
+
+    def _value_digest(self, fluent: 'up.model.fluent.Fluent', value: 'up.model.fnode.FNode') -> int:
+        return digest('initial value', repr(fluent), self._digester.get(value))
+
+    def _arg_digest(self, position: int, arg: 'up.model.fnode.FNode') -> int:
+        res = self._args_digests.get((position, arg), None)
+        if res is None:
+            res = digest('argument', position, self._digester.get(arg))
+            self._args_digests[(position, arg)] = res
+        return res
+
+    def _args_digest(self, args: List['up.model.fnode.FNode']) -> int:
+        res = 1
+        for i, a in enumerate(args):
+            res = (res * self._arg_digest(i, a)) % MODULUS
+        return res
+
+    def _domain_sum(self, position: int, typename: 'up.model.types.Type') -> int:
+        '''Returns the sum of the digests of the values of the given type in the given position.'''
+        problem = self._problem
+        if self._domains_objects != len(problem._objects):
+            self._domains_sums = {}
+            self._domains_objects = len(problem._objects)
+        res = self._domains_sums.get((position, typename), None)
+        if res is None:
+            if typename.is_user_type():
+                em = problem.env.expression_manager
+                domain = [em.ObjectExp(o) for o in problem.typed_objects(typename)]
+            else:
+                domain = [domain_item(problem, typename, j) for j in range(domain_size(problem, typename))]
+            res = sum(self._arg_digest(position, v) for v in domain) % MODULUS
+            self._domains_sums[(position, typename)] = res
+        return res
+
+    def _initial_values_digest(self) -> int:
+        res = self._initial_values_sum
+        for fluent, default in self._problem._fluents_defaults.items():
+            grounded_args = 1
+            for i, p in enumerate(fluent.signature):
+                grounded_args = (grounded_args * self._domain_sum(i, p.type)) % MODULUS
+            default_args = grounded_args - self._initial_values_args.get(fluent, 0)
+            res += self._value_digest(fluent, default) * default_args
+        return res % MODULUS
 
 
 class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMixin, ObjectsSetMixin, AgentsSetMixin):
@@ -47,6 +368,17 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
         self._timed_goals: Dict['up.model.timing.TimeInterval', List['up.model.fnode.FNode']] = {}
         self._goals: List['up.model.fnode.FNode'] = list()
         self._metrics: List['up.model.metrics.PlanQualityMetric'] = []
+        # The kind of the problem, maintained incrementally; None when it must be computed from scratch.
+        # The fluents and the actions added to the problem are detected from the length of their lists,
+        # the modifications of the actions from their versions.
+        self._kind: Optional['up.model.problem_kind.ProblemKind'] = None
+        self._kind_fluents = 0
+        self._kind_actions: List['up.model.action.Action'] = self._actions
+        self._kind_actions_versions: List[int] = []
+        self._kind_actions_modifications = 0
+        self._kind_effects_modifications = 0
+        # The digests defining the fingerprint of the problem, created when it is first requested
+        self._digests: Optional[_ProblemDigests] = None
 
     def __repr__(self) -> str:
         s = []
@@ -105,6 +437,8 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
     def __eq__(self, oth: object) -> bool:
         if not (isinstance(oth, Problem)) or self._env != oth._env:
             return False
+        if self.fingerprint != oth.fingerprint:
+            return False
         if self.kind != oth.kind or self._name != oth._name:
             return False
         if set(self._fluents) != set(oth._fluents) or set(self._goals) != set(oth._goals):
@@ -113,11 +447,12 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
             return False
         if set(self._actions) != set(oth._actions):
             return False
+        initial_values = self.initial_values
         oth_initial_values = oth.initial_values
-        if len(self.initial_values) != len(oth_initial_values):
+        if len(initial_values) != len(oth_initial_values):
             return False
-        for fluent, value in self.initial_values.items():
-            oth_value = oth_initial_values.get(fluent, None)
+        for fluent, args, value in initial_values.ground_items():
+            oth_value = oth_initial_values.ground_value(fluent, args)
             if oth_value is None:
                 return False
             elif value != oth_value:
@@ -141,36 +476,43 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
         return True
 
     def __hash__(self) -> int:
-        res = hash(self._kind) + hash(self._name)
-        for f in self._fluents:
-            res += hash(f)
-        for a in self._actions:
-            res += hash(a)
-        for ut in self._user_types:
-            res += hash(ut)
-        for o in self._objects:
-            res += hash(o)
-        for iv in self.initial_values.items():
-            res += hash(iv)
-        for t, el in self._timed_effects.items():
-            res += hash(t)
-            for e in set(el):
-                res += hash(e)
-        for i, gl in self._timed_goals.items():
-            res += hash(i)
-            for g in set(gl):
-                res += hash(g)
-        for g in self._goals:
-            res += hash(g)
-        return res
+        return hash(self.fingerprint)
+
+    @property
+    def fingerprint(self) -> str:
+        '''Returns a digest of the structure of this problem, as an hexadecimal string of 32 characters.
+
+        Equal problems have the same fingerprint, which does not depend on the order in which
+        the elements are added to the problem, on its environment, or on the run of the interpreter,
+        so it can be used as a key of persistent caches; the quality metrics are not part of the
+        fingerprint, as they are not compared by the equality of the problems.
+
+        The fingerprint is maintained incrementally while the problem is extended.'''
+        if self._digests is None or not self._digests.is_up_to_date():
+            self._digests = _ProblemDigests(self)
+        return self._digests.fingerprint()
+
+    @property
+    def domain_fingerprint(self) -> str:
+        '''Returns a digest of the name, the fluents, the user types and the actions of this
+        problem, as an hexadecimal string of 32 characters; as the fingerprint, it is maintained
+        incrementally, and problems with the same domain have the same domain fingerprint.'''
+        if self._digests is None or not self._digests.is_up_to_date():
+            self._digests = _ProblemDigests(self)
+        return self._digests.domain_fingerprint()
 
     def clone(self):
         new_p = Problem(self._name, self._env)
         new_p._fluents = self._fluents[:]
-        new_p._actions = [a.clone() for a in self._actions]
+        new_p._fluents_by_name = self._fluents_by_name.copy()
+        new_p._set_actions([a.clone() for a in self._actions])
         new_p._user_types = self._user_types[:]
+        new_p._user_types_by_name = self._user_types_by_name.copy()
         new_p._user_types_hierarchy = self._user_types_hierarchy.copy()
         new_p._objects = self._objects[:]
+        new_p._objects_by_name = self._objects_by_name.copy()
+        new_p._objects_by_type = {t: l[:] for t, l in self._objects_by_type.items()}
+        new_p._objects_positions = {t: d.copy() for t, d in self._objects_positions.items()}
         new_p._initial_value = self._initial_value.copy()
         new_p._timed_effects = {t: [e.clone() for e in el] for t, el in self._timed_effects.items()}
         new_p._timed_goals = {i: [g for g in gl] for i, gl in self._timed_goals.items()}
@@ -186,6 +528,24 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
         new_p._fluents_defaults = self._fluents_defaults.copy()
         return new_p
 
+    def share_domain(self) -> 'Problem':
+        '''Returns a new problem, with the same name, that shares the fluents, the user types,
+        the objects and the actions of this problem, without its initial values, goals and
+        quality metrics; the shared elements must not be modified.'''
+        new_p = type(self)(self._name, self._env, initial_defaults=self._initial_defaults)
+        new_p._fluents = self._fluents[:]
+        new_p._fluents_by_name = self._fluents_by_name.copy()
+        new_p._fluents_defaults = self._fluents_defaults.copy()
+        new_p._set_actions(self._actions[:])
+        new_p._user_types = self._user_types[:]
+        new_p._user_types_by_name = self._user_types_by_name.copy()
+        new_p._user_types_hierarchy = {t: l[:] for t, l in self._user_types_hierarchy.items()}
+        new_p._objects = self._objects[:]
+        new_p._objects_by_name = self._objects_by_name.copy()
+        new_p._objects_by_type = {t: l[:] for t, l in self._objects_by_type.items()}
+        new_p._objects_positions = {t: d.copy() for t, d in self._objects_positions.items()}
+        return new_p
+
     def has_name(self, name: str) -> bool:
         '''Returns true if the name is in the problem.'''
         return self.has_action(name) or self.has_fluent(name) or self.has_object(name) or self.has_type(name)
@@ -252,6 +612,13 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
                     static_fluents.remove(e.fluent.fluent())
         return static_fluents
 
+    def remove_fluent(self, fluent: 'up.model.fluent.Fluent'):
+        '''Removes the given fluent from the problem, together with its initial values.'''
+        FluentsSetMixin.remove_fluent(self, fluent)
+        self._initial_value = {k: v for k, v in self._initial_value.items() if k.fluent() != fluent}
+        self._kind = None
+        self._digests = None
+
     def set_initial_value(self, fluent: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent'],
                           value: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent', 'up.model.object.Object', bool,
                                        int, float, Fraction]):
@@ -259,7 +626,10 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
         fluent_exp, value_exp = self._env.expression_manager.auto_promote(fluent, value)
         if not self._env.type_checker.is_compatible_exp(fluent_exp, value_exp):
             raise UPTypeError('Initial value assignment has not compatible types!')
+        old_value = self._initial_value.get(fluent_exp, None)
         self._initial_value[fluent_exp] = value_exp
+        if self._digests is not None:
+            self._digests.set_initial_value(fluent_exp, old_value, value_exp)
 
     def initial_value(self, fluent: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent']) -> 'up.model.fnode.FNode':
         '''Gets the initial value of the given fluent.'''
@@ -275,41 +645,14 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
             print(fluent)
             raise UPProblemDefinitionError('Initial value not set!')
 
-    def _get_ith_fluent_exp(self, fluent: 'up.model.fluent.Fluent', domain_sizes: List[int], idx: int) -> 'up.model.fnode.FNode':
-        '''Returns the ith ground fluent expression.'''
-        quot = idx
-        rem = 0
-        actual_parameters = []
-        for i, p in enumerate(fluent.signature):
-            ds = domain_sizes[i];
-            rem = quot % ds
-            quot //= ds
-            v = domain_item(self, p.type, rem)
-            actual_parameters.append(v)
-        return fluent(*actual_parameters)
-
     @property
-    def initial_values(self) -> Dict['up.model.fnode.FNode', 'up.model.fnode.FNode']:
+    def initial_values(self) -> InitialValuesView:
         '''Gets the initial value of the fluents.
 
-        IMPORTANT NOTE: this property does a lot of computation, so it should be called as
-        seldom as possible.'''
-        res = self._initial_value
-        for f in self._fluents:
-            if f.arity == 0:
-                f_exp = self._env.expression_manager.FluentExp(f)
-                res[f_exp] = self.initial_value(f_exp)
-            else:
-                ground_size = 1
-                domain_sizes = []
-                for p in f.signature:
-                    ds = domain_size(self, p.type)
-                    domain_sizes.append(ds)
-                    ground_size *= ds
-                for i in range(ground_size):
-                    f_exp = self._get_ith_fluent_exp(f, domain_sizes, i)
-                    res[f_exp] = self.initial_value(f_exp)
-        return res
+        The returned mapping is a lazy view: the values of the fluents that are
+        not explicitly set are resolved on demand from the fluents defaults, so
+        the ground fluent expressions are created only while iterating it.'''
+        return InitialValuesView(self)
 
     @property
     def explicit_initial_values(self) -> Dict['up.model.fnode.FNode', 'up.model.fnode.FNode']:
@@ -332,6 +675,10 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
                 self._timed_goals[interval].append(goal_exp)
         else:
             self._timed_goals[interval] = [goal_exp]
+        if self._kind is not None:
+            self._kind.set_time('TIMED_GOALS') # type: ignore
+            self._kind.set_time('CONTINUOUS_TIME') # type: ignore
+            self._update_problem_kind_condition(goal_exp)
 
     @property
     def timed_goals(self) -> Dict['up.model.timing.TimeInterval', List['up.model.fnode.FNode']]:
@@ -341,6 +688,7 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
     def clear_timed_goals(self):
         '''Removes the timed goals.'''
         self._timed_goals = {}
+        self._kind = None
 
     def add_timed_effect(self, timing: 'up.model.timing.Timing', fluent: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent'],
                          value: 'up.model.expression.Expression', condition: 'up.model.expression.BoolExpression' = True):
@@ -390,6 +738,10 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
                 self._timed_effects[timing].append(effect)
         else:
             self._timed_effects[timing] = [effect]
+        if self._kind is not None:
+            self._kind.set_time('CONTINUOUS_TIME') # type: ignore
+            self._kind.set_time('TIMED_EFFECT') # type: ignore
+            self._update_problem_kind_effect(effect)
 
     @property
     def timed_effects(self) -> Dict['up.model.timing.Timing', List['up.model.effect.Effect']]:
@@ -399,6 +751,7 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
     def clear_timed_effects(self):
         '''Removes the timed effects.'''
         self._timed_effects = {}
+        self._kind = None
 
     def add_goal(self, goal: Union['up.model.fnode.FNode', 'up.model.fluent.Fluent', bool]):
         '''Adds a goal.'''
@@ -406,6 +759,8 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
         assert self._env.type_checker.get_type(goal_exp).is_bool_type()
         if goal_exp != self._env.expression_manager.TRUE():
             self._goals.append(goal_exp)
+            if self._kind is not None:
+                self._update_problem_kind_condition(goal_exp)
 
     @property
     def goals(self) -> List['up.model.fnode.FNode']:
@@ -415,10 +770,13 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
     def clear_goals(self):
         '''Removes the goals.'''
         self._goals = []
+        self._kind = None
 
     def add_quality_metric(self, metric: 'up.model.metrics.PlanQualityMetric'):
         '''Adds a quality metric'''
         self._metrics.append(metric)
+        if self._kind is not None:
+            self._update_problem_kind_metric(metric)
 
     @property
     def quality_metrics(self) -> List['up.model.metrics.PlanQualityMetric']:
@@ -429,8 +787,36 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
     def kind(self) -> 'up.model.problem_kind.ProblemKind':
         '''Returns the problem kind of this planning problem.
 
-        IMPORTANT NOTE: this property does a lot of computation, so it should be called as
-        seldom as possible.'''
+        The kind is maintained incrementally while the problem is extended: it is computed
+        from scratch only after some part of the problem is cleared or after some of its
+        actions or effects is modified.'''
+        if not self._update_kind():
+            self._compute_kind()
+        assert self._kind is not None
+        return up.model.problem_kind.ProblemKind(self._kind.features)
+
+    def _update_kind(self) -> bool:
+        '''Adds to the maintained kind the features of the fluents and of the actions added
+        since its last update; returns False if it must be computed from scratch instead.'''
+        if self._kind is None or self._kind_effects_modifications != up.model.effect.Effect._modifications:
+            return False
+        versions = self._kind_actions_versions
+        if self._kind_actions is not self._actions or len(versions) > len(self._actions):
+            return False
+        if self._kind_actions_modifications != up.model.action.Action._modifications:
+            if any(a._version != v for a, v in zip(self._actions, versions)):
+                return False
+        for fluent in self._fluents[self._kind_fluents:]:
+            self._update_problem_kind_fluent(fluent)
+        self._kind_fluents = len(self._fluents)
+        for action in self._actions[len(versions):]:
+            self._update_problem_kind_action(action)
+            versions.append(action._version)
+        self._kind_actions_modifications = up.model.action.Action._modifications
+        return True
+
+    def _compute_kind(self):
+        '''Computes the problem kind from scratch.'''
         self._kind = up.model.problem_kind.ProblemKind()
         self._kind.set_problem_class('ACTION_BASED') # type: ignore
         for fluent in self._fluents:
@@ -452,18 +838,25 @@ class Problem(AbstractProblem, UserTypesSetMixin, FluentsSetMixin, ActionsSetMix
         for goal in self._goals:
             self._update_problem_kind_condition(goal)
         for metric in self._metrics:
-            if isinstance(metric, up.model.metrics.MinimizeExpressionOnFinalState) or \
-               isinstance(metric, up.model.metrics.MaximizeExpressionOnFinalState):
-                self._kind.set_quality_metrics('FINAL_VALUE') # type: ignore
-            elif isinstance(metric, up.model.metrics.MinimizeActionCosts):
-                self._kind.set_quality_metrics('ACTIONS_COST') # type: ignore
-            elif isinstance(metric, up.model.metrics.MinimizeMakespan):
-                self._kind.set_quality_metrics('MAKESPAN') # type: ignore
-            elif isinstance(metric, up.model.metrics.MinimizeSequentialPlanLength):
-                self._kind.set_quality_metrics('PLAN_LENGTH') # type: ignore
-            else:
-                assert False, 'Unknown quality metric'
-        return self._kind
+            self._update_problem_kind_metric(metric)
+        self._kind_fluents = len(self._fluents)
+        self._kind_actions = self._actions
+        self._kind_actions_versions = [a._version for a in self._actions]
+        self._kind_actions_modifications = up.model.action.Action._modifications
+        self._kind_effects_modifications = up.model.effect.Effect._modifications
+
+    def _update_problem_kind_metric(self, metric: 'up.model.metrics.PlanQualityMetric'):
+        if isinstance(metric, up.model.metrics.MinimizeExpressionOnFinalState) or \
+           isinstance(metric, up.model.metrics.MaximizeExpressionOnFinalState):
+            self._kind.set_quality_metrics('FINAL_VALUE') # type: ignore
+        elif isinstance(metric, up.model.metrics.MinimizeActionCosts):
+            self._kind.set_quality_metrics('ACTIONS_COST') # type: ignore
+        elif isinstance(metric, up.model.metrics.MinimizeMakespan):
+            self._kind.set_quality_metrics('MAKESPAN') # type: ignore
+        elif isinstance(metric, up.model.metrics.MinimizeSequentialPlanLength):
+            self._kind.set_quality_metrics('PLAN_LENGTH') # type: ignore
+        else:
+            assert False, 'Unknown quality metric'
 
     def _update_problem_kind_effect(self, e: 'up.model.effect.Effect'):
         if e.is_conditional():
@@ -14,6 +14,16 @@
 #
 
 import unified_planning as up
+from unified_planning.model.types import domain_size, domain_item
+from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
+from array import array
+from bisect import bisect_right
+from fractions import Fraction
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+
+_INT64_MIN = -2**63
+_INT64_MAX = 2**63 - 1
 
 
 class State:
@@ -22,3 +32,324 @@ class State:
     def get_value(self, f: 'up.model.FNode'):
         '''Returns the value assignment for the given fluent expression'''
         raise NotImplementedError
+
+
+def _native_value(constant: 'up.model.fnode.FNode') -> Any:
+    '''Returns the python value used to represent the given constant: bool, int
+    and Fraction for the constants and the object expression itself for the objects.'''
+    if constant.is_object_exp():
+        return constant
+    return constant.constant_value()
+
+
+def _is_int64_bounded(type: 'up.model.types.Type') -> bool:
+    '''Returns True if the given int type has both bounds in the range of the 64 bits integers.'''
+    int_type = cast(up.model.types._IntType, type)
+    lb, ub = int_type.lower_bound, int_type.upper_bound
+    return lb is not None and ub is not None and _INT64_MIN <= lb and ub <= _INT64_MAX
+
+
+class GroundFluentsIndex:
+    '''Assigns a dense slot to every ground fluent of a problem.
+
+    The ground fluents of every fluent occupy a contiguous block of slots, ordered
+    with the first argument varying fastest, so the slot of a fluent expression is computed
+    from the position of its arguments inside the domain of their types.
+    The blocks are grouped by the fluent type: first the boolean fluents, then the
+    int fluents, then the real fluents and finally the object fluents.
+    The int fluents are stored in 64 bits integers only if all of them have bounds
+    in that range, see compact_ints.
+
+    IMPORTANT NOTE: the index is computed on the fluents and objects of the problem
+    at creation time, so it must be created after the problem is completely defined.'''
+    def __init__(self, problem: 'up.model.problem.Problem'):
+        self._problem = problem
+        self._offsets: Dict['up.model.fluent.Fluent', int] = {}
+        self._strides: Dict['up.model.fluent.Fluent', List[int]] = {}
+        self._block_sizes: Dict['up.model.fluent.Fluent', int] = {}
+        self._domains: Dict['up.model.types.Type', List[Any]] = {}
+        self._positions: Dict['up.model.types.Type', Dict[Any, int]] = {}
+        groups: List[List['up.model.fluent.Fluent']] = [[], [], [], []]
+        for f in problem.fluents:
+            if f.type.is_bool_type():
+                groups[0].append(f)
+            elif f.type.is_int_type():
+                groups[1].append(f)
+            elif f.type.is_real_type():
+                groups[2].append(f)
+            elif f.type.is_user_type():
+                groups[3].append(f)
+            else:
+                raise NotImplementedError
+        # the first slot of every group, followed by the total size
+        self._group_offsets: List[int] = []
+        # the first slot of every object fluent with the fluent, sorted by slot
+        self._object_fluents_offsets: List[int] = []
+        self._object_fluents: List['up.model.fluent.Fluent'] = []
+        size = 0
+        for i, group in enumerate(groups):
+            self._group_offsets.append(size)
+            for f in group:
+                self._offsets[f] = size
+                if i == 3:
+                    self._object_fluents_offsets.append(size)
+                    self._object_fluents.append(f)
+                strides = []
+                block_size = 1
+                for p in f.signature:
+                    strides.append(block_size)
+                    block_size *= len(self.domain(p.type))
+                self._strides[f] = strides
+                self._block_sizes[f] = block_size
+                size += block_size
+        self._group_offsets.append(size)
+        self._compact_ints = all(_is_int64_bounded(f.type) for f in groups[1])
+
+    @property
+    def problem(self) -> 'up.model.problem.Problem':
+        '''Returns the indexed problem.'''
+        return self._problem
+
+    @property
+    def size(self) -> int:
+        '''Returns the number of ground fluents.'''
+        return self._group_offsets[4]
+
+    @property
+    def compact_ints(self) -> bool:
+        '''Returns True if the values of all the int fluents fit in 64 bits integers,
+        namely if all of them are bounded in that range.'''
+        return self._compact_ints
+
+    @property
+    def bool_slots(self) -> range:
+        '''Returns the slots of the boolean ground fluents.'''
+        return range(self._group_offsets[0], self._group_offsets[1])
+
+    @property
+    def int_slots(self) -> range:
+        '''Returns the slots of the int ground fluents.'''
+        return range(self._group_offsets[1], self._group_offsets[2])
+
+    @property
+    def real_slots(self) -> range:
+        '''Returns the slots of the real ground fluents.'''
+        return range(self._group_offsets[2], self._group_offsets[3])
+
+    @property
+    def object_slots(self) -> range:
+        '''Returns the slots of the object ground fluents.'''
+        return range(self._group_offsets[3], self._group_offsets[4])
+
+    def domain(self, type: 'up.model.types.Type') -> List[Any]:
+        '''Returns the python values of the domain of the given type.'''
+        res = self._domains.get(type, None)
+        if res is None:
+            res = [_native_value(domain_item(self._problem, type, i)) for i in range(domain_size(self._problem, type))]
+            self._domains[type] = res
+            self._positions[type] = {v: i for i, v in enumerate(res)}
+        return res
+
+    def positions(self, type: 'up.model.types.Type') -> Dict[Any, int]:
+        '''Returns the map from the python values of the given type to their position in its domain.'''
+        self.domain(type)
+        return self._positions[type]
+
+    def offset(self, fluent: 'up.model.fluent.Fluent') -> int:
+        '''Returns the first slot of the given fluent.'''
+        return self._offsets[fluent]
+
+    def strides(self, fluent: 'up.model.fluent.Fluent') -> List[int]:
+        '''Returns, for every parameter of the given fluent, the distance between
+        the slots of two consecutive values of the parameter.'''
+        return self._strides[fluent]
+
+    def block_size(self, fluent: 'up.model.fluent.Fluent') -> int:
+        '''Returns the number of ground fluents of the given fluent.'''
+        return self._block_sizes[fluent]
+
+    def slot(self, fluent_exp: 'up.model.fnode.FNode') -> int:
+        '''Returns the slot of the given ground fluent expression.'''
+        fluent = fluent_exp.fluent()
+        try:
+            res = self._offsets[fluent]
+            for a, p, stride in zip(fluent_exp.args, fluent.signature, self._strides[fluent]):
+                res += self.positions(p.type)[_native_value(a)] * stride
+        except (KeyError, AssertionError):
+            raise UPValueError(f'{str(fluent_exp)} is not a ground fluent of the problem.')
+        return res
+
+    def object_fluent_type(self, slot: int) -> 'up.model.types.Type':
+        '''Returns the type of the object ground fluent in the given slot.'''
+        assert slot in self.object_slots
+        return self._object_fluents[bisect_right(self._object_fluents_offsets, slot) - 1].type
+
+    def initial_state(self) -> 'CompactState':
+        '''Returns the initial state of the problem.
+
+        The values are taken from the fluents defaults and from the explicit initial
+        values of the problem, without computing Problem.initial_values.'''
+        values: List[Any] = [None] * self.size
+        for f, v in self._problem.fluents_defaults.items():
+            start = self._offsets[f]
+            block_size = self._block_sizes[f]
+            values[start:start + block_size] = [_native_value(v)] * block_size
+        for f_exp, v in self._problem.explicit_initial_values.items():
+            values[self.slot(f_exp)] = _native_value(v)
+        if any(v is None for v in values):
+            raise UPProblemDefinitionError('Initial value not set!')
+        return CompactState.from_values(self, values)
+
+    def state(self, assignments: Dict['up.model.fnode.FNode', 'up.model.fnode.FNode']) -> 'CompactState':
+        '''Returns the state with the given value for every ground fluent, for example
+        the state represented by the Problem.initial_values.'''
+        values: List[Any] = [None] * self.size
+        for f_exp, v in assignments.items():
+            values[self.slot(f_exp)] = _native_value(v)
+        if any(v is None for v in values):
+            raise UPValueError('The given assignments do not define a value for every ground fluent.')
+        return CompactState.from_values(self, values)
+
+
+class CompactState(State):
+    '''This class represents a State as a set of arrays indexed by the slots of a GroundFluentsIndex.
+
+    The boolean fluents are stored in a bitset, the int fluents in an array of 64 bits
+    integers (in a list if GroundFluentsIndex.compact_ints is False), the real fluents
+    in a list of numbers and the object fluents in an array containing the position of
+    the value in the domain of the fluent type.
+
+    The copy of a state shares the arrays with the original one; an array is copied only
+    when one of the two states modifies it.'''
+
+    __slots__ = ['_index', '_bits', '_ints', '_reals', '_objects', '_owned', '_hash']
+
+    def __init__(self, index: GroundFluentsIndex, bits: bytearray, ints: Union['array[int]', List[int]],
+                 reals: List[Union[int, Fraction]], objects: 'array[int]'):
+        self._index = index
+        self._bits = bits
+        self._ints = ints
+        self._reals = reals
+        self._objects = objects
+        # the flags saying which of the bits, ints, reals and objects can be modified in place
+        self._owned = [True, True, True, True]
+        self._hash: Optional[int] = None
+
+    @staticmethod
+    def from_values(index: GroundFluentsIndex, values: List[Any]) -> 'CompactState':
+        '''Returns the state with the given python value for every slot of the index.'''
+        bool_slots = index.bool_slots
+        bits = bytearray((len(bool_slots) + 7) // 8)
+        for i in bool_slots:
+            if values[i]:
+                bits[i >> 3] |= 1 << (i & 7)
+        ints: Union['array[int]', List[int]] = values[index.int_slots.start:index.int_slots.stop]
+        if index.compact_ints:
+            ints = array('q', ints)
+        reals = values[index.real_slots.start:index.real_slots.stop]
+        objects = array('l', (index.positions(index.object_fluent_type(i))[values[i]] for i in index.object_slots))
+        return CompactState(index, bits, ints, reals, objects)
+
+    def __repr__(self) -> str:
+        return f'CompactState({", ".join(f"{str(k)}: {str(v)}" for k, v in self.items())})'
+
+    def __eq__(self, oth: object) -> bool:
+        if isinstance(oth, CompactState):
+            return self._index is oth._index and self._bits == oth._bits and self._ints == oth._ints and \
+                self._reals == oth._reals and self._objects == oth._objects
+        else:
+            return False
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            ints = self._ints.tobytes() if isinstance(self._ints, array) else tuple(self._ints)
+            self._hash = hash((bytes(self._bits), ints, tuple(self._reals), self._objects.tobytes()))
+        return self._hash
+
+    @property
+    def index(self) -> GroundFluentsIndex:
+        '''Returns the GroundFluentsIndex of this state.'''
+        return self._index
+
+    def copy(self) -> 'CompactState':
+        '''Returns a copy of this state; the copy is done lazily, when one of the states is modified.'''
+        res = CompactState(self._index, self._bits, self._ints, self._reals, self._objects)
+        res._owned = [False, False, False, False]
+        self._owned = [False, False, False, False]
+        res._hash = self._hash
+        return res
+
+    def __getitem__(self, slot: int) -> Any:
+        '''Returns the python value of the ground fluent in the given slot.'''
+        index = self._index
+        if slot < index.int_slots.start:
+            return bool(self._bits[slot >> 3] & (1 << (slot & 7)))
+        elif slot < index.real_slots.start:
+            return self._ints[slot - index.int_slots.start]
+        elif slot < index.object_slots.start:
+            return self._reals[slot - index.real_slots.start]
+        else:
+            return index.domain(index.object_fluent_type(slot))[self._objects[slot - index.object_slots.start]]
+
+    def __setitem__(self, slot: int, value: Any):
+        '''Sets the python value of the ground fluent in the given slot.'''
+        index = self._index
+        self._hash = None
+        if slot < index.int_slots.start:
+            if not self._owned[0]:
+                self._bits = bytearray(self._bits)
+                self._owned[0] = True
+            if value:
+                self._bits[slot >> 3] |= 1 << (slot & 7)
+            else:
+                self._bits[slot >> 3] &= ~(1 << (slot & 7)) & 0xff
+        elif slot < index.real_slots.start:
+            if not self._owned[1]:
+                self._ints = self._ints[:]
+                self._owned[1] = True
+            self._ints[slot - index.int_slots.start] = value
+        elif slot < index.object_slots.start:
+            if not self._owned[2]:
+                self._reals = self._reals[:]
+                self._owned[2] = True
+            self._reals[slot - index.real_slots.start] = value
+        else:
+            if not self._owned[3]:
+                self._objects = array('l', self._objects)
+                self._owned[3] = True
+            self._objects[slot - index.object_slots.start] = index.positions(index.object_fluent_type(slot))[value]
+
+    def get_value(self, f: 'up.model.FNode') -> 'up.model.FNode':
+        '''Returns the value assignment for the given ground fluent expression.'''
+        v = self[self._index.slot(f)]
+        if isinstance(v, up.model.fnode.FNode):
+            return v
+        em = self._index.problem.env.expression_manager
+        if isinstance(v, bool):
+            return em.Bool(v)
+        elif isinstance(v, int):
+            return em.Int(v)
+        else:
+            return em.Real(v)
+
+    def set_value(self, f: 'up.model.FNode', value: 'up.model.FNode'):
+        '''Sets the value assignment for the given ground fluent expression.'''
+        assert value.is_constant()
+        self[self._index.slot(f)] = _native_value(value)
+
+    def items(self) -> Iterator[Tuple['up.model.fnode.FNode', 'up.model.fnode.FNode']]:
+        '''Returns all the ground fluent expressions with their value.
+
+        IMPORTANT NOTE: this method creates an FNode for every ground fluent, so it
+        should be called as seldom as possible.'''
+        problem = self._index.problem
+        for f in problem.fluents:
+            domains = [self._index.domain(p.type) for p in f.signature]
+            for i in range(self._index.block_size(f)):
+                args = []
+                quot = i
+                for d in domains:
+                    quot, rem = divmod(quot, len(d))
+                    args.append(d[rem])
+                f_exp = f(*args)
+                yield f_exp, self.get_value(f_exp)
@@ -219,13 +219,13 @@ def domain_size(objects_set: 'unified_planning.model.objects_set.ObjectsSetMixin
     if typename.is_bool_type():
         return 2
     elif typename.is_user_type():
-        return len(list(objects_set.objects(typename)))
+        return len(objects_set.typed_objects(typename))
     elif typename.is_int_type():
         lb = typename.lower_bound # type: ignore
         ub = typename.upper_bound # type: ignore
         if lb is None or ub is None:
             raise UPProblemDefinitionError('Parameter not groundable!')
-        return ub - lb
+        return ub - lb + 1
     else:
         raise UPProblemDefinitionError('Parameter not groundable!')
 
@@ -235,7 +235,7 @@ def domain_item(objects_set: 'unified_planning.model.objects_set.ObjectsSetMixin
     if typename.is_bool_type():
         return objects_set.env.expression_manager.Bool(idx == 0)
     elif typename.is_user_type():
-        return objects_set.env.expression_manager.ObjectExp(list(objects_set.objects(typename))[idx])
+        return objects_set.env.expression_manager.ObjectExp(objects_set.typed_objects(typename)[idx])
     elif typename.is_int_type():
         lb = typename.lower_bound # type: ignore
         ub = typename.upper_bound # type: ignore
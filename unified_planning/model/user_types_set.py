@@ -31,19 +31,21 @@ class UserTypesSetMixin:
     def __init__(self, has_name_method):
         self._has_name_method = has_name_method
         self._user_types: List['up.model.types.Type'] = []
+        self._user_types_by_name: Dict[str, 'up.model.types.Type'] = {}
         # The field _user_types_hierarchy stores the information about the types and the list of their sons.
         self._user_types_hierarchy: Dict[Optional['up.model.types.Type'], List['up.model.types.Type']] = {}
 
     def _add_user_type(self, type: 'up.model.types.Type'):
         '''This method adds a Type, together with all it's ancestors, to the user_types_hierarchy'''
         assert type.is_user_type()
-        if type not in self._user_types:
-            t = cast(_UserType, type)
+        t = cast(_UserType, type)
+        if self._user_types_by_name.get(t.name, None) != type:
             if self._has_name_method(t.name):
                 raise UPProblemDefinitionError(f'The type name {t.name} is already used in the problem')
             if t.father is not None:
                 self._add_user_type(t.father)
             self._user_types.append(type)
+            self._user_types_by_name[t.name] = type
 
     @property
     def user_types(self) -> List['up.model.types.Type']:
@@ -52,19 +54,14 @@ class UserTypesSetMixin:
 
     def user_type(self, name: str) -> 'up.model.types.Type':
         '''Returns the user type with the given name.'''
-        for ut in self.user_types:
-            assert ut.is_user_type()
-            if cast(_UserType, ut).name == name:
-                return ut
-        raise UPValueError(f'UserType {name} is not defined!')
+        ut = self._user_types_by_name.get(name, None)
+        if ut is None:
+            raise UPValueError(f'UserType {name} is not defined!')
+        return ut
 
     def has_type(self, name: str) -> bool:
         '''Returns True iff the type 'name' is defined.'''
-        for ut in self.user_types:
-            assert ut.is_user_type()
-            if cast(_UserType, ut).name == name:
-                return True
-        return False
+        return name in self._user_types_by_name
 
     @property
     def user_types_hierarchy(self) -> Dict[Optional['up.model.types.Type'], List['up.model.types.Type']]:
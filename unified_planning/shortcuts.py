@@ -118,7 +118,8 @@ def OneshotPlanner(*, name: Optional[str] = None,
                    names: Optional[List[str]] = None,
                    params: Union[Dict[str, str], List[Dict[str, str]]] = None,
                    problem_kind: ProblemKind = ProblemKind(),
-                   optimality_guarantee: Optional[Union['up.solvers.solver.OptimalityGuarantee', str]] = None
+                   optimality_guarantee: Optional[Union['up.solvers.solver.OptimalityGuarantee', str]] = None,
+                   cache: Optional[Union[str, 'up.solvers.cache.ResultsCache']] = None
                    ) -> Solver:
     """
     Returns a oneshot planner. There are three ways to call this method:
@@ -130,10 +131,38 @@ def OneshotPlanner(*, name: Optional[str] = None,
                           params=[{'heuristic': 'hadd'}, {'heuristic': 'hmax'}])
     - using 'problem_kind' and 'optimality_guarantee'.
           e.g. OneshotPlanner(problem_kind=problem.kind, optimality_guarantee=SOLVED_OPTIMALLY)
+
+    If 'cache' is given (a ResultsCache or the directory of one), the definitive results
+    of the planner are stored in it and returned, without running the planner, when an
+    equal problem is solved again.
+      e.g. OneshotPlanner(name='tamer', cache='/tmp/up_results')
     """
     return get_env().factory.OneshotPlanner(name=name, names=names, params=params,
                                             problem_kind=problem_kind,
-                                            optimality_guarantee=optimality_guarantee)
+                                            optimality_guarantee=optimality_guarantee,
+                                            cache=cache)
+
+def solve_batch(problems: Iterable['up.model.AbstractProblem'], *,
+                name: Optional[str] = None,
+                names: Optional[List[str]] = None,
+                params: Union[Dict[str, str], List[Dict[str, str]]] = None,
+                problem_kind: ProblemKind = ProblemKind(),
+                optimality_guarantee: Optional[Union['up.solvers.solver.OptimalityGuarantee', str]] = None,
+                timeout: Optional[float] = None,
+                max_workers: Optional[int] = None,
+                use_processes: bool = False) -> 'up.solvers.batch.BatchResults':
+    """
+    Solves the given problems with a oneshot planner, selected as in OneshotPlanner,
+    and returns an iterator over the pairs (index of the problem, result) in the order
+    in which the problems are solved; the "metrics" field of the iterator contains the
+    aggregate metrics of the batch.
+      e.g. for i, res in solve_batch(problems, name='tamer', timeout=10, max_workers=4)
+    """
+    return get_env().factory.solve_batch(problems, name=name, names=names, params=params,
+                                         problem_kind=problem_kind,
+                                         optimality_guarantee=optimality_guarantee,
+                                         timeout=timeout, max_workers=max_workers,
+                                         use_processes=use_processes)
 
 def PlanValidator(*, name: Optional[str] = None,
                    names: Optional[List[str]] = None,
@@ -16,17 +16,25 @@
 
 from unified_planning.solvers.solver import Solver, OptimalityGuarantee, Credits
 from unified_planning.solvers.factory import Factory
+from unified_planning.solvers.cache import ResultsCache, CachedSolver
+from unified_planning.solvers.batch import BatchResults, BatchMetrics
 from unified_planning.solvers.grounder import Grounder
 from unified_planning.solvers.parallel import Parallel
+from unified_planning.solvers.portfolio import PortfolioHistory
 from unified_planning.solvers.pddl_solver import PDDLSolver
 from unified_planning.solvers.plan_validator import SequentialPlanValidator
+from unified_planning.solvers.reachability_grounder import ReachabilityGrounder
 from unified_planning.solvers.results import Result, LogMessage, PlanGenerationResult, LogLevel, PlanGenerationResultStatus, ValidationResult, ValidationResultStatus, GroundingResult
 
 __all__ = [ 'Factory',
+            'ResultsCache', 'CachedSolver',
+            'BatchResults', 'BatchMetrics',
             'Grounder',
             'Parallel',
+            'PortfolioHistory',
             'PDDLSolver',
             'SequentialPlanValidator',
+            'ReachabilityGrounder',
             'Solver', 'OptimalityGuarantee', 'Credits',
             'Result', 'LogMessage', 'PlanGenerationResult', 'LogLevel', 'PlanGenerationResultStatus', 'ValidationResult', 'ValidationResultStatus', 'GroundingResult'
         ]
@@ -0,0 +1,151 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""This module defines the solving of batches of problems."""
+
+
+import os
+import time
+import unified_planning as up
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from unified_planning.exceptions import UPUsageError
+from unified_planning.solvers.results import PlanGenerationResult, PlanGenerationResultStatus
+from typing import Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+
+@dataclass
+class BatchMetrics:
+    '''The aggregate metrics of the solving of a batch of problems.'''
+    submitted: int = 0
+    completed: int = 0
+    statuses: Dict[PlanGenerationResultStatus, int] = field(default_factory=dict)
+    solve_time: float = 0.0 # The sum of the seconds spent solving each problem
+    elapsed: float = 0.0 # The seconds from the start of the batch to the last completed problem
+
+    @property
+    def throughput(self) -> float:
+        '''Returns the number of problems completed per second.'''
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def average_solve_time(self) -> float:
+        '''Returns the average seconds spent solving a problem.'''
+        return self.solve_time / self.completed if self.completed > 0 else 0.0
+
+
+def _timed_solve(solver: 'up.solvers.solver.Solver', problem: 'up.model.AbstractProblem',
+                 timeout: Optional[float]) -> Tuple[PlanGenerationResult, float]:
+    start = time.perf_counter()
+    result = solver.solve(problem, timeout=timeout)
+    return result, time.perf_counter() - start
+
+
+class BatchResults:
+    '''An iterator over the results of a solver on a batch of problems.
+
+    The problems are taken from the given iterable and solved in a pool of
+    max_workers threads (or processes, if use_processes is True); at most
+    max_workers problems are taken before their results are consumed.
+    The iterator returns the pairs (index of the problem in the batch, result)
+    in the order in which the problems are solved, updating the metrics.
+
+    In a pool of processes, the solver and the problems must be picklable.'''
+    def __init__(self, solver: 'up.solvers.solver.Solver', problems: Iterable['up.model.AbstractProblem'],
+                 timeout: Optional[float] = None, max_workers: Optional[int] = None,
+                 use_processes: bool = False, owns_solver: bool = False):
+        if max_workers is not None and max_workers < 1:
+            raise UPUsageError('The max_workers of a batch must be at least 1.')
+        self._solver = solver
+        self._problems = iter(problems)
+        self._timeout = timeout
+        self._max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._use_processes = use_processes
+        self._owns_solver = owns_solver
+        self._executor: Optional[Executor] = None
+        self._start = 0.0
+        self._next_index = 0
+        self._pending: Dict[Future, Tuple[int, 'up.model.AbstractProblem']] = {}
+        self._done: Deque[Tuple[Future, Tuple[int, 'up.model.AbstractProblem']]] = deque()
+        self._closed = False
+        self.metrics = BatchMetrics()
+
+    def __iter__(self) -> Iterator[Tuple[int, PlanGenerationResult]]:
+        return self
+
+    def __next__(self) -> Tuple[int, PlanGenerationResult]:
+        if self._closed:
+            raise StopIteration
+        if self._executor is None:
+            self._start = time.perf_counter()
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(self._max_workers)
+        self._submit()
+        if len(self._done) == 0:
+            if len(self._pending) == 0:
+                self.close()
+                raise StopIteration
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                self._done.append((f, self._pending.pop(f)))
+        future, (index, problem) = self._done.popleft()
+        try:
+            result, solve_time = future.result()
+        except BaseException:
+            self.close()
+            raise
+        if self._use_processes and result.plan is not None:
+            # The plan refers to the copy of the problem in the worker process
+            result.plan = problem.normalize_plan(result.plan)
+        self.metrics.completed += 1
+        self.metrics.statuses[result.status] = self.metrics.statuses.get(result.status, 0) + 1
+        self.metrics.solve_time += solve_time
+        self.metrics.elapsed = time.perf_counter() - self._start
+        return index, result
+
+    def _submit(self):
+        '''Submits problems until max_workers of them are waiting to be consumed.'''
+        assert self._executor is not None
+        while len(self._pending) + len(self._done) < self._max_workers:
+            try:
+                problem = next(self._problems)
+            except StopIteration:
+                break
+            future = self._executor.submit(_timed_solve, self._solver, problem, self._timeout)
+            self._pending[future] = (self._next_index, problem)
+            self._next_index += 1
+            self.metrics.submitted += 1
+
+    def close(self):
+        '''Stops the solving of the batch, cancelling the problems not started yet.'''
+        if self._closed:
+            return
+        self._closed = True
+        if self._executor is not None:
+            for f in self._pending:
+                f.cancel()
+            self._executor.shutdown(wait=True)
+        self._pending.clear()
+        self._done.clear()
+        if self._owns_solver:
+            self._solver.destroy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,215 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""This module defines a persistent cache of the results of the solvers."""
+
+
+import hashlib
+import json
+import os
+import tempfile
+import unified_planning as up
+import unified_planning.solvers as solvers
+from unified_planning.exceptions import UPException, UPUsageError
+from unified_planning.model import Problem
+from unified_planning.solvers.results import PlanGenerationResult
+from typing import IO, Any, Callable, List, Optional, Tuple
+
+
+class ResultsCache:
+    '''A cache of the definitive PlanGenerationResults of the solvers, stored on disk
+    in the given directory, so that it can be shared among runs and processes.
+
+    The results are stored as protobuf messages, in a file for each key; a key
+    is computed from the fingerprint and the quality metrics of the problem,
+    the name of the solver and its options.
+
+    When max_entries or max_size (in bytes) are given, the least recently used
+    results are removed to keep the cache within them.
+
+    NOTE: this class requires the protobuf package.'''
+    def __init__(self, path: str, max_entries: Optional[int] = None, max_size: Optional[int] = None):
+        if max_entries is not None and max_entries < 1:
+            raise UPUsageError('The maximum number of entries of a ResultsCache must be at least 1.')
+        if max_size is not None and max_size < 1:
+            raise UPUsageError('The maximum size of a ResultsCache must be at least 1.')
+        from unified_planning.grpc.proto_reader import ProtobufReader # type: ignore[attr-defined]
+        from unified_planning.grpc.proto_writer import ProtobufWriter # type: ignore[attr-defined]
+        self._path = path
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._reader = ProtobufReader()
+        self._writer = ProtobufWriter()
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def path(self) -> str:
+        '''Returns the directory where the results are stored.'''
+        return self._path
+
+    def key(self, problem: 'up.model.AbstractProblem', solver_name: str, options: Any = None) -> Optional[str]:
+        '''Returns the key of the result of the given solver, with the given options,
+        on the given problem; None if the results on the problem can not be cached.'''
+        if type(problem) is not Problem:
+            return None
+        metrics = []
+        for m in problem.quality_metrics:
+            if isinstance(m, up.model.metrics.MinimizeActionCosts):
+                costs = sorted(f'{a.name}: {c}' for a, c in m.costs.items())
+                metrics.append(f'minimize actions-cost: {costs}, default: {m.default}')
+            else:
+                metrics.append(repr(m))
+        h = hashlib.sha256()
+        for part in [problem.fingerprint, repr(metrics), solver_name, json.dumps(options, sort_keys=True, default=str)]:
+            h.update(part.encode())
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def get(self, problem: 'up.model.AbstractProblem', solver_name: str, options: Any = None) -> Optional[PlanGenerationResult]:
+        '''Returns the cached result of the given solver, with the given options, on
+        the given problem; None if no such result is cached.'''
+        key = self.key(problem, solver_name, options)
+        if key is None:
+            return None
+        filename = self._filename(key)
+        try:
+            with open(filename, 'rb') as f:
+                data = f.read()
+            # The modification time of an entry is the time of its last use
+            os.utime(filename)
+        except FileNotFoundError:
+            return None
+        from unified_planning.grpc.generated.unified_planning_pb2 import PlanGenerationResult as PlanGenerationResultMsg
+        msg = PlanGenerationResultMsg()
+        msg.ParseFromString(data)
+        return self._reader.convert(msg, problem)
+
+    def put(self, problem: 'up.model.AbstractProblem', solver_name: str, options: Any, result: PlanGenerationResult):
+        '''Stores the result of the given solver, with the given options, on the given problem.'''
+        key = self.key(problem, solver_name, options)
+        if key is None:
+            return
+        data = self._writer.convert(result).SerializeToString()
+        # The result is written in a temporary file and moved, so that readers never see partial entries
+        fd, tmp_filename = tempfile.mkstemp(dir=self._path, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_filename, self._filename(key))
+        self._evict()
+
+    def clear(self):
+        '''Removes all the cached results.'''
+        for _, _, filename in self._entries():
+            _remove(filename)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _filename(self, key: str) -> str:
+        return os.path.join(self._path, f'{key}.upr')
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        '''Returns the modification time, the size and the file name of the cached results.'''
+        res = []
+        with os.scandir(self._path) as it:
+            for entry in it:
+                if entry.name.endswith('.upr'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    res.append((stat.st_mtime, stat.st_size, entry.path))
+        return res
+
+    def _evict(self):
+        '''Removes the least recently used results until the cache is within its limits.'''
+        if self._max_entries is None and self._max_size is None:
+            return
+        entries = sorted(self._entries())
+        count = len(entries)
+        size = sum(s for _, s, _ in entries)
+        for _, entry_size, filename in entries:
+            if (self._max_entries is None or count <= self._max_entries) and \
+               (self._max_size is None or size <= self._max_size):
+                break
+            _remove(filename)
+            count -= 1
+            size -= entry_size
+
+
+def _remove(filename: str):
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+
+
+class CachedSolver(solvers.solver.Solver):
+    """A solver that stores the definitive results of the given solver in a ResultsCache
+    and, when a problem equal to a cached one is solved again, returns the cached
+    result without calling the solver."""
+
+    def __init__(self, solver: 'up.solvers.solver.Solver', cache: ResultsCache, options: Any = None):
+        self._solver = solver
+        self._cache = cache
+        self._options = options
+
+    @property
+    def name(self) -> str:
+        return self._solver.name
+
+    @property
+    def solver(self) -> 'up.solvers.solver.Solver':
+        '''Returns the solver whose results are cached.'''
+        return self._solver
+
+    @property
+    def cache(self) -> ResultsCache:
+        '''Returns the cache of the results.'''
+        return self._cache
+
+    @staticmethod
+    def is_oneshot_planner() -> bool:
+        raise UPException('The CachedSolver type depends on its actual solver')
+
+    @staticmethod
+    def supports(problem_kind: 'up.model.ProblemKind') -> bool:
+        raise UPException('The CachedSolver supported features depends on its actual solver')
+
+    def solve(self, problem: 'up.model.AbstractProblem',
+              callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None,
+              timeout: Optional[float] = None,
+              output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
+        result = self._cache.get(problem, self.name, self._options)
+        if result is not None:
+            return result
+        result = self._solver.solve(problem, callback, timeout, output_stream)
+        if result.is_definitive_result(problem):
+            self._cache.put(problem, self.name, self._options, result)
+        return result
+
+    async def solve_async(self, problem: 'up.model.AbstractProblem',
+                          callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None,
+                          timeout: Optional[float] = None,
+                          output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
+        result = self._cache.get(problem, self.name, self._options)
+        if result is not None:
+            return result
+        result = await self._solver.solve_async(problem, callback, timeout, output_stream)
+        if result.is_definitive_result(problem):
+            self._cache.put(problem, self.name, self._options, result)
+        return result
+
+    def destroy(self):
+        self._solver.destroy()
@@ -20,7 +20,7 @@ import inspect
 import unified_planning as up
 from unified_planning.environment import Environment, get_env
 from unified_planning.model import ProblemKind
-from typing import IO, Dict, Tuple, Optional, List, Union, Type
+from typing import IO, Dict, Iterable, Tuple, Optional, List, Union, Type, cast
 
 
 DEFAULT_SOLVERS = {'enhsp' : ('up_enhsp', 'ENHSPsolver'),
@@ -31,6 +31,7 @@ DEFAULT_SOLVERS = {'enhsp' : ('up_enhsp', 'ENHSPsolver'),
                    'pyperplan' : ('up_pyperplan.solver', 'SolverImpl'),
                    'sequential_plan_validator' : ('unified_planning.solvers.plan_validator', 'SequentialPlanValidator'),
                    'up_grounder' : ('unified_planning.solvers.grounder', 'Grounder'),
+                   'up_reachability_grounder' : ('unified_planning.solvers.reachability_grounder', 'ReachabilityGrounder'),
                    'tarski_grounder' : ('unified_planning.solvers.tarski_grounder', 'TarskiGrounder')}
 
 
@@ -171,7 +172,8 @@ class Factory:
                        names: Optional[List[str]] = None,
                        params: Union[Dict[str, str], List[Dict[str, str]]] = None,
                        problem_kind: ProblemKind = ProblemKind(),
-                       optimality_guarantee: Optional[Union['up.solvers.solver.OptimalityGuarantee', str]] = None
+                       optimality_guarantee: Optional[Union['up.solvers.solver.OptimalityGuarantee', str]] = None,
+                       cache: Optional[Union[str, 'up.solvers.cache.ResultsCache']] = None
                        ) -> 'up.solvers.solver.Solver':
         """
         Returns a oneshot planner. There are three ways to call this method:
@@ -183,8 +185,41 @@ class Factory:
                               params=[{'heuristic': 'hadd'}, {'heuristic': 'hmax'}])
         - using 'problem_kind' and 'optimality_guarantee'.
           e.g. OneshotPlanner(problem_kind=problem.kind, optimality_guarantee=SOLVED_OPTIMALLY)
+
+        If 'cache' is given (a ResultsCache or the directory of one), the definitive results
+        of the planner are stored in it and returned, without running the planner, when an
+        equal problem is solved again.
+          e.g. OneshotPlanner(name='tamer', cache='/tmp/up_results')
+        """
+        if names is not None and params is None:
+            params = [{} for i in range(len(names))]
+        solver = self._get_solver('oneshot_planner', name, names, params, problem_kind, optimality_guarantee)
+        if cache is not None:
+            if isinstance(cache, str):
+                cache = up.solvers.cache.ResultsCache(cache)
+            options = list(zip(names, cast(List[Dict[str, str]], params))) if names is not None else params
+            solver = up.solvers.cache.CachedSolver(solver, cache, options)
+        return solver
+
+    def solve_batch(self, problems: Iterable['up.model.AbstractProblem'], *,
+                    name: Optional[str] = None,
+                    names: Optional[List[str]] = None,
+                    params: Union[Dict[str, str], List[Dict[str, str]]] = None,
+                    problem_kind: ProblemKind = ProblemKind(),
+                    optimality_guarantee: Optional[Union['up.solvers.solver.OptimalityGuarantee', str]] = None,
+                    timeout: Optional[float] = None,
+                    max_workers: Optional[int] = None,
+                    use_processes: bool = False) -> 'up.solvers.batch.BatchResults':
+        """
+        Solves the given problems with a oneshot planner, selected as in the OneshotPlanner
+        method, and returns an iterator over the pairs (index of the problem, result) in the
+        order in which the problems are solved. The planner is destroyed when the iteration
+        ends or when the returned iterator is closed.
+          e.g. for i, res in factory.solve_batch(problems, name='tamer', timeout=10, max_workers=4)
         """
-        return self._get_solver('oneshot_planner', name, names, params, problem_kind, optimality_guarantee)
+        solver = self.OneshotPlanner(name=name, names=names, params=params, problem_kind=problem_kind,
+                                     optimality_guarantee=optimality_guarantee)
+        return up.solvers.batch.BatchResults(solver, problems, timeout, max_workers, use_processes, owns_solver=True)
 
     def PlanValidator(self, *, name: Optional[str] = None,
                        names: Optional[List[str]] = None,
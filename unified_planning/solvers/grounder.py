@@ -15,7 +15,7 @@
 
 
 from functools import partial
-from typing import Dict, List, Optional,Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import unified_planning.environment
 import unified_planning.solvers as solvers
 import unified_planning.transformers
@@ -25,15 +25,21 @@ from unified_planning.model import Problem, ProblemKind
 
 
 class Grounder(solvers.solver.Solver):
-    """Performs grounding."""
+    """Performs grounding.
+
+    The option "processes" sets the number of processes used to ground the problem,
+    while the option "chunk_size" sets the number of parameters tuples grounded by
+    a process at a time; see unified_planning.transformers.Grounder."""
     def __init__(self, **options):
-        pass
+        self._processes = int(options.get('processes', 1))
+        self._chunk_size = int(options.get('chunk_size', 1000))
 
     def ground(self, problem: 'unified_planning.model.AbstractProblem') -> GroundingResult:
         '''This method takes an "unified_planning.model.Problem" and returns the generated
         "up.solvers.results.GroundingResult".'''
         assert isinstance(problem, Problem)
-        grounder = unified_planning.transformers.Grounder(problem)
+        grounder = unified_planning.transformers.Grounder(problem, processes=self._processes,
+                                                          chunk_size=self._chunk_size)
         grounded_problem = grounder.get_rewritten_problem()
         trace_back_map = grounder.get_rewrite_back_map()
         return GroundingResult(
@@ -42,6 +48,14 @@ class Grounder(solvers.solver.Solver):
             self.name,
             [])
 
+    def ground_actions(self, problem: 'unified_planning.model.AbstractProblem') -> Iterator[Tuple['unified_planning.model.Action', 'unified_planning.model.Action', List['unified_planning.model.FNode']]]:
+        '''This method takes an "unified_planning.model.Problem" and returns an iterator over the
+        triples (grounded_action, original_action, parameters) of its grounding, created lazily;
+        see unified_planning.transformers.Grounder.ground_actions.'''
+        assert isinstance(problem, Problem)
+        grounder = unified_planning.transformers.Grounder(problem, chunk_size=self._chunk_size)
+        return grounder.ground_actions()
+
     @property
     def name(self):
         return 'grounder'
@@ -14,22 +14,105 @@
 #
 
 
+import json
+import os
+import queue
+import signal
+import sys
+import time
 import warnings
 import unified_planning as up
 import unified_planning.solvers as solvers
-from unified_planning.plan import Plan
+from collections import deque
+from dataclasses import dataclass
+from fractions import Fraction
+from unified_planning.plan import Plan, SequentialPlan, TimeTriggeredPlan
 from unified_planning.model import ProblemKind
-from unified_planning.exceptions import UPException
+from unified_planning.exceptions import UPException, UPUsageError
+from unified_planning.solvers.portfolio import PortfolioHistory
 from unified_planning.solvers.results import LogLevel, PlanGenerationResultStatus, Result, ValidationResult, PlanGenerationResult
-from typing import IO, Callable, Dict, List, Optional, Tuple, cast
+from unified_planning.solvers.results import POSITIVE_OUTCOMES
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union, cast
 from multiprocessing import Process, Queue
 
 
+class _Run:
+    '''The run of a solver of the portfolio in a call.'''
+    def __init__(self, idx: int):
+        self.idx = idx
+        self.process: Optional[Process] = None
+        self.suspended = False
+        self.resumed_at = 0.0 # The last time the run was started or resumed
+        self.active_time = 0.0 # The time the run was active before resumed_at
+
+
 class Parallel(solvers.solver.Solver):
-    """Create a parallel instance of multiple Solvers."""
+    """Create a parallel instance of multiple Solvers.
+
+    If shared_memory is True, the problem is serialized once, as protobuf bytes, in a
+    shared memory segment that the solvers processes map and decode, instead of being
+    copied in each of them; this requires Python 3.8, the protobuf package and a problem
+    supported by the protobuf conversion.
+    If persistent is True, each solver runs in a worker process that is kept alive
+    among the calls, until destroy is called; when a solver is stopped, e.g. because
+    another solver gave a definitive result first, its worker is terminated, as the
+    solver could be left in an inconsistent state by an interrupted call, and all the
+    workers are restarted by the next call, as the terminated one might have corrupted
+    the results queue they share.
+
+    The solvers can be scheduled as a portfolio:
+    - max_concurrency is the maximum number of solvers running at the same time; the
+      others wait, in order, for a running solver to end (e.g. max_concurrency=1 runs
+      the solvers sequentially);
+    - budgets are the maximum seconds of activity of each solver (None means no limit);
+    - if time_slice is given, the running solvers are suspended after time_slice
+      seconds of activity to let the waiting ones run, interleaving them (POSIX only);
+    - if cancel_dominated is True, when a plan is found the solvers that can not
+      find a better one are stopped: all of them if the problem has no quality metrics,
+      the ones that do not guarantee optimality otherwise;
+    - if a PortfolioHistory is given, the solvers are started from the most successful
+      on the kind of the problem, and their runs are recorded in it.
 
-    def __init__(self, solvers: List[Tuple[type, Dict[str, str]]]):
+    The INTERMEDIATE results of the solvers are given to the callback of solve as they
+    arrive, and the best plan found so far, by the first quality metric of the problem
+    (by the length of the plan if the problem has no quality metrics), is returned if no
+    solver gives a definitive result; if quality_target is given, the solvers are stopped
+    as soon as a plan with that quality, or a better one, is found."""
+
+    def __init__(self, solvers: List[Tuple[type, Dict[str, str]]],
+                 shared_memory: bool = False, persistent: bool = False,
+                 max_concurrency: Optional[int] = None,
+                 budgets: Optional[List[Optional[float]]] = None,
+                 time_slice: Optional[float] = None,
+                 cancel_dominated: bool = False,
+                 history: Optional[PortfolioHistory] = None,
+                 quality_target: Optional[Union[int, float, Fraction]] = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise UPUsageError('The max_concurrency of a Parallel solver must be at least 1.')
+        if budgets is not None and len(budgets) != len(solvers):
+            raise UPUsageError('The Parallel solver needs a budget for each solver.')
+        if shared_memory and sys.version_info < (3, 8):
+            raise UPUsageError('The shared_memory of a Parallel solver requires Python 3.8 or later.')
+        if time_slice is not None:
+            if time_slice <= 0:
+                raise UPUsageError('The time_slice of a Parallel solver must be positive.')
+            if not hasattr(signal, 'SIGSTOP'):
+                raise UPUsageError('The time_slice of a Parallel solver is not supported on this platform.')
         self.solvers = solvers
+        self._shared_memory = shared_memory
+        self._persistent = persistent
+        self._max_concurrency = max_concurrency
+        self._budgets = budgets if budgets is not None else [None] * len(solvers)
+        self._time_slice = time_slice
+        self._cancel_dominated = cancel_dominated
+        self._history = history
+        self._quality_target = Fraction(quality_target) if quality_target is not None else None
+        # The worker of each solver: its process and its tasks queue
+        self._workers: List[Optional[Tuple[Process, Queue]]] = [None] * len(solvers)
+        self._results_queue: Optional[Queue] = None
+        # If a worker was terminated while it could be writing in the results queue
+        self._results_queue_unsafe = False
+        self._call_id = 0
 
     @property
     def name(self) -> str:
@@ -47,51 +130,275 @@ class Parallel(solvers.solver.Solver):
     def supports(problem_kind: 'ProblemKind') -> bool:
         raise UPException('The Parallel supported features depends on its actual solvers')
 
-    def _run_parallel(self, fname, *args) -> List[Result]:
-        signaling_queue: Queue = Queue()
-        processes = []
-        for idx, (solver_class, opts) in enumerate(self.solvers):
-            options = opts
-            _p = Process(name=str(idx),
-                         target=_run,
-                         args=(idx, solver_class, options,
-                               signaling_queue, fname, *args))
-            processes.append(_p)
-            _p.start()
-        processes_alive = len(processes)
+    def solver_key(self, idx: int) -> str:
+        '''Returns the identifier of the idx-th solver in the PortfolioHistory.'''
+        solver_class, options = self.solvers[idx]
+        return f'{solver_class.__module__}.{solver_class.__name__} {json.dumps(options, sort_keys=True, default=str)}'
+
+    def _run_parallel(self, fname, *args,
+                      callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None) -> List[Result]:
+        shm: Optional[Any] = None # The shared memory segment of the problem
+        task_args: Tuple[Any, ...] = args
+        if self._shared_memory:
+            shm, task_args = _share_args(args)
+        if callback is not None:
+            # The solvers send their intermediate results in the signaling queue
+            task_args = task_args[:1] + (_ForwardCallback(),) + task_args[2:]
+        self._call_id += 1
+        problem = args[0] if len(args) > 0 and isinstance(args[0], up.model.Problem) else None
+        # The problem whose kind the runs are recorded for in the history
+        recorded = problem if self._history is not None and fname == 'solve' else None
+        start = time.time()
+        timeout = args[2] if fname == 'solve' else None
+        deadline = start + timeout if timeout is not None else None
+        if self._history is not None and problem is not None:
+            order = self._history.order(problem.kind, [self.solver_key(i) for i in range(len(self.solvers))])
+        else:
+            order = list(range(len(self.solvers)))
+        if self._persistent:
+            if self._results_queue is None:
+                self._results_queue = Queue()
+            signaling_queue = self._results_queue
+        else:
+            signaling_queue = Queue()
+        limit = self._max_concurrency if self._max_concurrency is not None else len(self.solvers)
+        # The runs not started yet or suspended, in the order they (re)start
+        waiting: Deque[_Run] = deque(_Run(idx) for idx in order)
+        active: Dict[int, _Run] = {}
+        started: List[_Run] = []
         results: List[Result] = []
-        definitive_result_found: bool = False
-        while True:
-            if processes_alive == 0: # Every planner gave a result
-                break
-            (idx, res) = signaling_queue.get(block=True)
-            processes_alive -= 1
-            if isinstance(res, BaseException):
-                raise res
-            else:
-                assert isinstance(res, Result)
-                # If the planner is sure about the result (optimality of the result or impossibility of the problem or the problem does not need optimality) exit the loop
-                if res.is_definitive_result(*args):
-                    definitive_result_found = True
-                    break
-                else:
+        definitive_result: Optional[Result] = None
+        # The result with the best plan found so far, and its quality
+        best: Optional[Tuple[Optional[Fraction], PlanGenerationResult]] = None
+        try:
+            while len(active) > 0 or len(waiting) > 0:
+                now = time.time()
+                while len(active) < limit and len(waiting) > 0:
+                    run = waiting.popleft()
+                    if run.suspended:
+                        self._signal(run, signal.SIGCONT)
+                        run.suspended = False
+                    else:
+                        self._start_run(run, fname, task_args, signaling_queue, deadline, now)
+                        started.append(run)
+                    run.resumed_at = now
+                    active[run.idx] = run
+                try:
+                    (idx, call_id, res) = signaling_queue.get(block=True, timeout=self._wait_time(active, waiting, deadline, now))
+                except queue.Empty:
+                    idx = -1
+                now = time.time()
+                # The results of previous calls, or of stopped runs, are ignored
+                if idx in active and call_id == self._call_id and isinstance(res, _Intermediate):
+                    intermediate = res.result
+                    if isinstance(intermediate, _ProtobufResult):
+                        intermediate = intermediate.load(args[0])
+                    elif intermediate.plan is not None:
+                        intermediate.plan = args[0].normalize_plan(intermediate.plan)
+                    best = self._best(args[0], best, intermediate)
+                    assert callback is not None
+                    callback(intermediate)
+                    if self._target_reached(best):
+                        break
+                elif idx in active and call_id == self._call_id:
+                    run = active.pop(idx)
+                    run.active_time += now - run.resumed_at
+                    if isinstance(res, BaseException):
+                        raise res
+                    if isinstance(res, _ProtobufResult):
+                        res = res.load(args[0])
+                    assert isinstance(res, Result)
+                    if recorded is not None and isinstance(res, PlanGenerationResult):
+                        solved = res.status in POSITIVE_OUTCOMES or res.status == PlanGenerationResultStatus.UNSOLVABLE_PROVEN
+                        self._record(recorded, run, solved)
+                    # If the planner is sure about the result (optimality of the result or impossibility of the problem or the problem does not need optimality) exit the loop
+                    if res.is_definitive_result(*args):
+                        definitive_result = res
+                        break
                     results.append(res)
-        for p in processes:
-            p.terminate()
-        if definitive_result_found: # A planner found a definitive result
-            return [res]
+                    if isinstance(res, PlanGenerationResult):
+                        best = self._best(args[0], best, res)
+                        if self._target_reached(best):
+                            break
+                    if self._cancel_dominated and problem is not None and isinstance(res, PlanGenerationResult) \
+                       and res.status in POSITIVE_OUTCOMES:
+                        if len(problem.quality_metrics) == 0:
+                            # Every other plan would be as good as this one
+                            break
+                        for i in [i for i in active if not self._guarantees_optimality(i)]:
+                            self._cancel_run(active.pop(i), recorded, now)
+                        for run in [r for r in waiting if not self._guarantees_optimality(r.idx)]:
+                            waiting.remove(run)
+                            if run.suspended:
+                                self._cancel_run(run, recorded, now)
+                for run in list(active.values()):
+                    activity = run.active_time + now - run.resumed_at
+                    budget = self._budgets[run.idx]
+                    if budget is not None and activity >= budget:
+                        del active[run.idx]
+                        self._cancel_run(run, recorded, now)
+                    elif self._time_slice is not None and len(waiting) > 0 and now - run.resumed_at >= self._time_slice:
+                        del active[run.idx]
+                        self._signal(run, signal.SIGSTOP)
+                        run.suspended = True
+                        run.active_time = activity
+                        waiting.append(run)
+                if deadline is not None and now >= deadline:
+                    break
+        finally:
+            now = time.time()
+            for run in list(active.values()) + [r for r in waiting if r.suspended]:
+                self._cancel_run(run, recorded, now)
+            if not self._persistent:
+                for run in started:
+                    assert run.process is not None
+                    run.process.join()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            if self._results_queue_unsafe:
+                # The terminated workers might have corrupted the results queue, that the
+                # other workers use: they are stopped and a new queue is created by the next call
+                for idx in range(len(self._workers)):
+                    self._stop_worker(idx)
+                self._results_queue = None
+                self._results_queue_unsafe = False
+        if definitive_result is not None: # A planner found a definitive result
+            return [definitive_result]
+        if best is not None:
+            # The best plan is preferred to the other plans without optimality guarantees
+            best_result = best[1]
+            if best_result in results:
+                results.remove(best_result)
+            results.insert(0, PlanGenerationResult(PlanGenerationResultStatus.SOLVED_SATISFICING, best_result.plan,
+                                                   best_result.engine_name, best_result.metrics,
+                                                   best_result.log_messages))
         return results
 
+    def _best(self, problem: 'up.model.Problem', best: Optional[Tuple[Optional[Fraction], PlanGenerationResult]],
+              result: PlanGenerationResult) -> Optional[Tuple[Optional[Fraction], PlanGenerationResult]]:
+        '''Returns the best between the given best result, with its quality, and the given result.'''
+        if result.plan is None or result.status not in POSITIVE_OUTCOMES | {PlanGenerationResultStatus.INTERMEDIATE}:
+            return best
+        quality = _plan_quality(problem, result.plan)
+        if best is None or (quality is not None and (best[0] is None or quality < best[0])):
+            return (quality, result)
+        return best
+
+    def _target_reached(self, best: Optional[Tuple[Optional[Fraction], PlanGenerationResult]]) -> bool:
+        return self._quality_target is not None and best is not None and \
+               best[0] is not None and best[0] <= self._quality_target
+
+    def _guarantees_optimality(self, idx: int) -> bool:
+        try:
+            return self.solvers[idx][0].satisfies(solvers.solver.OptimalityGuarantee.SOLVED_OPTIMALLY)
+        except UPException:
+            return False
+
+    def _wait_time(self, active: Dict[int, _Run], waiting: Deque[_Run], deadline: Optional[float], now: float) -> Optional[float]:
+        '''Returns the seconds until the next deadline, budget or slice expiration; None if there is none.'''
+        times = []
+        if deadline is not None:
+            times.append(deadline - now)
+        for run in active.values():
+            budget = self._budgets[run.idx]
+            if budget is not None:
+                times.append(budget - run.active_time - (now - run.resumed_at))
+            if self._time_slice is not None and len(waiting) > 0:
+                times.append(self._time_slice - (now - run.resumed_at))
+        return max(0.0, min(times)) if len(times) > 0 else None
+
+    def _start_run(self, run: _Run, fname: str, task_args: Tuple[Any, ...], signaling_queue: Queue,
+                   deadline: Optional[float], now: float):
+        '''Starts the given run, in a new process or in the worker of its solver.'''
+        idx = run.idx
+        solver_class, options = self.solvers[idx]
+        if fname == 'solve' and self._time_slice is None:
+            # The solver is asked to respect its budget and the call deadline, that are
+            # anyway enforced by stopping it (its timeout would also count the suspensions)
+            limits = [t for t in [self._budgets[idx], deadline - now if deadline is not None else None] if t is not None]
+            if len(limits) > 0:
+                task_args = task_args[:2] + (max(0.0, min(limits)),) + task_args[3:]
+        new_group = self._time_slice is not None
+        if self._persistent:
+            worker = self._workers[idx]
+            if worker is None or not worker[0].is_alive():
+                tasks: Queue = Queue()
+                _p = Process(name=str(idx), target=_serve,
+                             args=(idx, solver_class, options, tasks, signaling_queue, new_group),
+                             daemon=True)
+                _p.start()
+                worker = (_p, tasks)
+                self._workers[idx] = worker
+            worker[1].put((self._call_id, fname, task_args))
+            run.process = worker[0]
+        else:
+            _p = Process(name=str(idx),
+                         target=_run,
+                         args=(idx, self._call_id, solver_class, options,
+                               signaling_queue, new_group, fname, *task_args))
+            _p.start()
+            run.process = _p
+
+    def _signal(self, run: _Run, sig: int):
+        '''Sends the given signal to the process of the run and, with time slices, to
+        its process group, that contains the processes started by the solver.'''
+        assert run.process is not None and run.process.pid is not None
+        try:
+            if self._time_slice is not None:
+                try:
+                    os.killpg(run.process.pid, sig)
+                    return
+                except ProcessLookupError:
+                    pass # The process has not created its group yet
+            os.kill(run.process.pid, sig)
+        except ProcessLookupError:
+            pass # The process is already terminated
+
+    def _record(self, problem: 'up.model.Problem', run: _Run, solved: bool):
+        '''Records the given run, ended after its active_time, in the history.'''
+        assert self._history is not None
+        self._history.record(problem.kind, self.solver_key(run.idx), solved, run.active_time)
+
+    def _cancel_run(self, run: _Run, recorded: Optional['up.model.Problem'], now: float):
+        '''Stops the given started run, recording it as unsolved if the problem is recorded.'''
+        if not run.suspended:
+            run.active_time += now - run.resumed_at
+        if recorded is not None:
+            self._record(recorded, run, False)
+        self._stop_run(run)
+
+    def _stop_run(self, run: _Run):
+        '''Terminates the given run, with its worker if persistent.'''
+        if self._persistent:
+            if self._time_slice is not None:
+                self._signal(run, signal.SIGKILL)
+            self._stop_worker(run.idx)
+            self._results_queue_unsafe = True
+        else:
+            assert run.process is not None
+            if self._time_slice is not None:
+                self._signal(run, signal.SIGKILL)
+            run.process.terminate()
+            if run.suspended:
+                self._signal(run, signal.SIGCONT)
+
+    def _stop_worker(self, idx: int):
+        '''Terminates the worker of the idx-th solver, if any.'''
+        worker = self._workers[idx]
+        if worker is not None:
+            worker[0].terminate()
+            worker[0].join()
+            self._workers[idx] = None
+
     def solve(self, problem: 'up.model.AbstractProblem',
                     callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None,
                     timeout: Optional[float] = None,
                     output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
-        if callback is not None:
-            warnings.warn('Parallel solvers do not support the callback system.', UserWarning)
         if output_stream is not None:
             warnings.warn('Parallel solvers do not support the output stream system.', UserWarning)
 
-        final_reports = self._run_parallel('solve', problem, None, timeout, None)
+        final_reports = self._run_parallel('solve', problem, None, timeout, None, callback=callback)
 
         result_order: List[PlanGenerationResultStatus] = [
                     PlanGenerationResultStatus.SOLVED_OPTIMALLY,  # List containing the results in the order we prefer them
@@ -133,14 +440,174 @@ class Parallel(solvers.solver.Solver):
         return cast(ValidationResult, self._run_parallel('validate', problem, plan)[0])
 
     def destroy(self):
-        pass
+        for idx, worker in enumerate(self._workers):
+            if worker is not None:
+                worker[1].put(None)
+        for idx, worker in enumerate(self._workers):
+            if worker is not None:
+                worker[0].join(1)
+                self._stop_worker(idx)
+
+
+@dataclass
+class _SharedProblem:
+    '''The reference to a problem serialized in a shared memory segment.'''
+    name: str
+    size: int
+
+
+@dataclass
+class _ProtobufPlan:
+    '''A plan serialized as protobuf bytes.'''
+    data: bytes
+
+
+class _ForwardCallback:
+    '''The callback argument of the solvers that send their intermediate results to the Parallel solver.'''
+    pass
+
+
+@dataclass
+class _Intermediate:
+    '''An intermediate result sent by a solver.'''
+    result: Any
+
+
+@dataclass
+class _ProtobufResult:
+    '''A PlanGenerationResult serialized as protobuf bytes.'''
+    data: bytes
+
+    def load(self, problem: 'up.model.Problem') -> PlanGenerationResult:
+        from unified_planning.grpc.proto_reader import ProtobufReader # type: ignore[attr-defined]
+        import unified_planning.grpc.generated.unified_planning_pb2 as up_pb2
+        msg = up_pb2.PlanGenerationResult()
+        msg.ParseFromString(self.data)
+        return ProtobufReader().convert(msg, problem)
+
 
+def _share_args(args: Tuple[Any, ...]) -> Tuple[Optional[Any], Tuple[Any, ...]]:
+    '''Serializes the problem in the given arguments in a new shared memory segment,
+    and the plan as protobuf bytes; returns the segment and the arguments to send.'''
+    from multiprocessing.shared_memory import SharedMemory
+    from unified_planning.grpc.proto_writer import ProtobufWriter # type: ignore[attr-defined]
+    if len(args) == 0 or not isinstance(args[0], up.model.Problem):
+        return None, args
+    writer = ProtobufWriter()
+    data = writer.convert(args[0]).SerializeToString()
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[:len(data)] = data
+    res: List[Any] = [_SharedProblem(shm.name, len(data))]
+    for a in args[1:]:
+        if isinstance(a, Plan):
+            res.append(_ProtobufPlan(writer.convert(a).SerializeToString()))
+        else:
+            res.append(a)
+    return shm, tuple(res)
 
-def _run(idx: int, SolverClass: type, options: Dict[str, str], signaling_queue: Queue, fname: str, *args):
+
+def _call(solver: 'up.solvers.solver.Solver', fname: str, args: Tuple[Any, ...], send: Callable[[Any], None]) -> Any:
+    '''Calls the given method of the solver, loading the shared arguments and
+    serializing the results if the problem is shared; the intermediate results are
+    given to send.'''
+    shared = len(args) > 0 and isinstance(args[0], _SharedProblem)
+    if shared:
+        args = _load_args(args)
+    if fname == 'solve' and len(args) > 1 and isinstance(args[1], _ForwardCallback):
+        def forward(result: PlanGenerationResult):
+            send(_Intermediate(_dump_result(result) if shared else result))
+        args = args[:1] + (forward,) + args[2:]
+    res = getattr(solver, fname)(*args)
+    if shared and isinstance(res, PlanGenerationResult):
+        return _dump_result(res)
+    return res
+
+
+def _dump_result(result: PlanGenerationResult) -> _ProtobufResult:
+    from unified_planning.grpc.proto_writer import ProtobufWriter # type: ignore[attr-defined]
+    return _ProtobufResult(ProtobufWriter().convert(result).SerializeToString())
+
+
+def _load_args(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    '''Loads the problem from the shared memory segment and the plan from its protobuf bytes.'''
+    from unified_planning.grpc.proto_reader import ProtobufReader # type: ignore[attr-defined]
+    import unified_planning.grpc.generated.unified_planning_pb2 as up_pb2
+    from multiprocessing.shared_memory import SharedMemory
+    reader = ProtobufReader()
+    shm = SharedMemory(args[0].name)
+    try:
+        data = bytes(shm.buf[:args[0].size])
+    finally:
+        shm.close()
+    msg = up_pb2.Problem()
+    msg.ParseFromString(data)
+    problem = reader.convert(msg, up.environment.Environment())
+    loaded_args: List[Any] = [problem]
+    for a in args[1:]:
+        if isinstance(a, _ProtobufPlan):
+            plan_msg = up_pb2.Plan()
+            plan_msg.ParseFromString(a.data)
+            loaded_args.append(reader.convert(plan_msg, problem))
+        else:
+            loaded_args.append(a)
+    return tuple(loaded_args)
+
+
+def _plan_quality(problem: 'up.model.Problem', plan: Plan) -> Optional[Fraction]:
+    '''Returns the value of the first quality metric of the problem on the given plan,
+    the lower the better, or the length of the plan if the problem has no quality metrics;
+    None if the value can not be computed.'''
+    metric = problem.quality_metrics[0] if len(problem.quality_metrics) > 0 else None
+    if metric is None or isinstance(metric, up.model.metrics.MinimizeSequentialPlanLength):
+        if isinstance(plan, (SequentialPlan, TimeTriggeredPlan)):
+            return Fraction(len(plan.actions))
+    elif isinstance(metric, up.model.metrics.MinimizeActionCosts) and isinstance(plan, SequentialPlan):
+        em = problem.env.expression_manager
+        substituter = up.walkers.Substituter(problem.env)
+        simplifier = up.walkers.Simplifier(problem.env)
+        total = Fraction(0)
+        for ai in plan.actions:
+            cost = metric.get_action_cost(ai.action)
+            if cost is None:
+                return None
+            subs: Dict[up.model.Expression, up.model.Expression] = {em.ParameterExp(p): v for p, v in zip(ai.action.parameters, ai.actual_parameters)}
+            cost = simplifier.simplify(substituter.substitute(cost, subs), problem)
+            if not (cost.is_int_constant() or cost.is_real_constant()):
+                return None
+            total += Fraction(cost.constant_value())
+        return total
+    elif isinstance(metric, up.model.metrics.MinimizeMakespan) and isinstance(plan, TimeTriggeredPlan):
+        return max((Fraction(start) + (Fraction(duration) if duration is not None else 0) for start, _, duration in plan.actions),
+                   default=Fraction(0))
+    return None
+
+
+def _run(idx: int, call_id: int, SolverClass: type, options: Dict[str, str], signaling_queue: Queue,
+         new_group: bool, fname: str, *args):
+    if new_group:
+        os.setpgrp()
     with SolverClass(**options) as s:
         try:
-            local_res = getattr(s, fname)(*args)
+            local_res = _call(s, fname, args, lambda res: signaling_queue.put((idx, call_id, res)))
         except Exception as ex:
-            signaling_queue.put((idx, ex))
+            signaling_queue.put((idx, call_id, ex))
             return
-        signaling_queue.put((idx, local_res))
+        signaling_queue.put((idx, call_id, local_res))
+
+
+def _serve(idx: int, SolverClass: type, options: Dict[str, str], tasks: Queue, signaling_queue: Queue,
+           new_group: bool):
+    '''Runs the calls received from tasks on an instance of the given solver, until None is received.'''
+    if new_group:
+        os.setpgrp()
+    with SolverClass(**options) as s:
+        while True:
+            task = tasks.get(block=True)
+            if task is None:
+                break
+            call_id, fname, args = task
+            try:
+                local_res = _call(s, fname, args, lambda res: signaling_queue.put((idx, call_id, res)))
+            except Exception as ex:
+                local_res = ex
+            signaling_queue.put((idx, call_id, local_res))
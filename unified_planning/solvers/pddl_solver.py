@@ -17,19 +17,23 @@
 import asyncio
 from asyncio.subprocess import PIPE
 import select
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import os
-import re
 import time
+import weakref
 import unified_planning as up
 import unified_planning.solvers as solvers
 from unified_planning.solvers.results import LogLevel, PlanGenerationResult, PlanGenerationResultStatus
 from unified_planning.io.pddl_writer import PDDLWriter
-from unified_planning.exceptions import UPException
+from unified_planning.exceptions import UPException, UPUsageError
 from asyncio.subprocess import PIPE
-from typing import IO, Any, Callable, Optional, List, Tuple, cast
+from collections import deque
+from fractions import Fraction
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Optional, List, Tuple, cast
 
 # This module implements two different mechanisms to execute a PDDL planner in a
 # subprocess, processing the output in real-time and imposing a timeout.
@@ -51,15 +55,110 @@ if ENV_USE_ASYNCIO is not None:
     USE_ASYNCIO_ON_UNIX = ENV_USE_ASYNCIO.lower() in ["true", "1"]
 
 
+# The directory used by default for the scratch files of the pooled PDDL solvers: a
+# RAM-backed file system if available, the default temporary directory otherwise.
+RAM_DIRECTORY = '/dev/shm'
+
+
+class _WorkerSlot:
+    '''A directory where a pooled PDDLSolver runs the planner on one problem at a time,
+    remembering the domain written in it.'''
+    def __init__(self, directory: str):
+        self.domain_filename = os.path.join(directory, 'domain.pddl')
+        self.problem_filename = os.path.join(directory, 'problem.pddl')
+        self.plan_filename = os.path.join(directory, 'plan.txt')
+        self.domain: Optional[str] = None
+
+
+class _WorkerSlots:
+    '''The worker slots of a pooled PDDLSolver, acquired by the threads calling solve and
+    by the coroutines of solve_async, in any event loop; the coroutines wait on futures,
+    to which the released slots are handed over, so that no one polls the slots.'''
+    def __init__(self, slots: Iterable[_WorkerSlot]):
+        self._free: List[_WorkerSlot] = list(slots)
+        self._available = threading.Condition()
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, 'asyncio.Future[_WorkerSlot]']] = deque()
+
+    def get(self) -> _WorkerSlot:
+        '''Returns a free slot, waiting for it if there is none.'''
+        with self._available:
+            while len(self._free) == 0:
+                self._available.wait()
+            return self._free.pop()
+
+    async def get_async(self) -> _WorkerSlot:
+        '''Returns a free slot, awaiting it if there is none.'''
+        loop = asyncio.get_running_loop()
+        with self._available:
+            if len(self._free) > 0:
+                return self._free.pop()
+            future: 'asyncio.Future[_WorkerSlot]' = loop.create_future()
+            self._async_waiters.append((loop, future))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # The slot might have been handed over before the cancellation
+            if future.done() and not future.cancelled():
+                self.put(future.result())
+            raise
+
+    def put(self, slot: _WorkerSlot):
+        '''Releases the given slot, handing it over to the first waiting coroutine, if any.'''
+        with self._available:
+            while len(self._async_waiters) > 0:
+                loop, future = self._async_waiters.popleft()
+                if not future.done():
+                    try:
+                        loop.call_soon_threadsafe(self._hand_over, future, slot)
+                        return
+                    except RuntimeError:
+                        pass # The loop is closed
+            self._free.append(slot)
+            self._available.notify()
+
+    def _hand_over(self, future: 'asyncio.Future[_WorkerSlot]', slot: _WorkerSlot):
+        if future.cancelled():
+            self.put(slot)
+        else:
+            future.set_result(slot)
+
+
 class PDDLSolver(solvers.solver.Solver):
     """
     This class is the interface of a generic PDDL solver
     that can be invocated through a subprocess call.
+
+    If pool_size is given, the solver runs in pooled mode: at most pool_size
+    planners run concurrently (solve can be called from multiple threads), each
+    one in a worker slot that is reused among the calls. The slots are created in
+    scratch_dir (by default, a RAM-backed directory if available) and a domain
+    file is rewritten only when the domain of the solved problem changes.
     """
 
-    def __init__(self, needs_requirements=True):
+    def __init__(self, needs_requirements=True, pool_size: Optional[int] = None, scratch_dir: Optional[str] = None):
         solvers.solver.Solver.__init__(self)
         self._needs_requirements = needs_requirements
+        self._slots: Optional[_WorkerSlots] = None
+        self._scratch_dir: Optional[str] = None
+        if pool_size is not None:
+            if pool_size < 1:
+                raise UPUsageError('The pool_size of a PDDLSolver must be at least 1.')
+            if scratch_dir is None and os.path.isdir(RAM_DIRECTORY) and os.access(RAM_DIRECTORY, os.W_OK):
+                scratch_dir = RAM_DIRECTORY
+            self._scratch_dir = tempfile.mkdtemp(prefix='up_pddl_', dir=scratch_dir)
+            # The scratch directory is removed by destroy or, at the latest, when the solver is collected
+            self._remove_scratch_dir = weakref.finalize(self, shutil.rmtree, self._scratch_dir, True)
+            slots = []
+            for i in range(pool_size):
+                directory = os.path.join(self._scratch_dir, f'slot_{i}')
+                os.mkdir(directory)
+                slots.append(_WorkerSlot(directory))
+            self._slots = _WorkerSlots(slots)
+
+    @property
+    def scratch_dir(self) -> Optional[str]:
+        '''Returns the directory of the worker slots, None if the solver is not pooled.'''
+        return self._scratch_dir
 
     @staticmethod
     def is_oneshot_planner() -> bool:
@@ -72,22 +171,79 @@ class PDDLSolver(solvers.solver.Solver):
         raise NotImplementedError
 
     def _plan_from_file(self, problem: 'up.model.Problem', plan_filename: str) -> 'up.plan.Plan':
-        '''Takes a problem and a filename and returns the plan parsed from the file.'''
-        actions = []
+        '''Takes a problem and a filename and returns the plan parsed from the file.
+
+        The file contains an action instance "(action p1 ... pn)" in each line, or a
+        timed action instance "start: (action p1 ... pn) [duration]" for time triggered
+        plans; the text after ";" in a line (e.g. the cost of the plan) is ignored.'''
         with open(plan_filename) as plan:
-            for line in plan.readlines():
-                if re.match(r'^\s*(;.*)?$', line):
-                    continue
-                res = re.match(r'^\s*\(\s*([\w?-]+)((\s+[\w?-]+)*)\s*\)\s*$', line)
-                if res:
-                    action = problem.action(res.group(1))
-                    parameters = []
-                    for p in res.group(2).split():
-                        parameters.append(problem.env.expression_manager.ObjectExp(problem.object(p)))
-                    actions.append(up.plan.ActionInstance(action, tuple(parameters)))
+            return self._plan_from_str(problem, plan.read())
+
+    def _plan_from_str(self, problem: 'up.model.Problem', plan: str) -> 'up.plan.Plan':
+        '''Takes a problem and the text of a plan and returns the parsed plan.'''
+        # The names are resolved with dictionaries built once; the PDDL names are case insensitive
+        actions: Dict[str, 'up.model.Action'] = {}
+        for a in problem.actions:
+            actions.setdefault(a.name.lower(), a)
+        for a in problem.actions:
+            actions[a.name] = a
+        objects: Dict[str, 'up.model.Object'] = {}
+        for o in problem.all_objects:
+            objects.setdefault(o.name.lower(), o)
+        for o in problem.all_objects:
+            objects[o.name] = o
+        object_exps: Dict[str, 'up.model.FNode'] = {}
+        em = problem.env.expression_manager
+        sequential_actions: List['up.plan.ActionInstance'] = []
+        timed_actions: List[Tuple[Fraction, 'up.plan.ActionInstance', Optional[Fraction]]] = []
+        for line in plan.splitlines():
+            line = line.split(';', 1)[0].strip()
+            if not line:
+                continue
+            open_idx = line.find('(')
+            close_idx = line.rfind(')')
+            if open_idx < 0 or close_idx < open_idx:
+                raise UPException('Error parsing plan generated by ' + self.__class__.__name__)
+            tokens = line[open_idx + 1:close_idx].split()
+            action = actions.get(tokens[0], None) if len(tokens) > 0 else None
+            if action is None and len(tokens) > 0:
+                action = actions.get(tokens[0].lower(), None)
+            if action is None:
+                raise UPException('Error parsing plan generated by ' + self.__class__.__name__)
+            parameters = []
+            for name in tokens[1:]:
+                exp = object_exps.get(name, None)
+                if exp is None:
+                    obj = objects.get(name, None) or objects.get(name.lower(), None)
+                    if obj is None:
+                        raise UPException('Error parsing plan generated by ' + self.__class__.__name__)
+                    exp = em.ObjectExp(obj)
+                    object_exps[name] = exp
+                parameters.append(exp)
+            action_instance = up.plan.ActionInstance(action, tuple(parameters))
+            prefix = line[:open_idx].strip()
+            suffix = line[close_idx + 1:].strip()
+            try:
+                if prefix:
+                    if not prefix.endswith(':'):
+                        raise ValueError
+                    duration = None
+                    if suffix:
+                        if not (suffix.startswith('[') and suffix.endswith(']')):
+                            raise ValueError
+                        duration = Fraction(suffix[1:-1].strip())
+                    timed_actions.append((Fraction(prefix[:-1].strip()), action_instance, duration))
+                elif suffix:
+                    raise ValueError
                 else:
-                    raise UPException('Error parsing plan generated by ' + self.__class__.__name__)
-        return up.plan.SequentialPlan(actions)
+                    sequential_actions.append(action_instance)
+            except ValueError:
+                raise UPException('Error parsing plan generated by ' + self.__class__.__name__)
+        if len(timed_actions) > 0:
+            if len(sequential_actions) > 0:
+                raise UPException('Error parsing plan generated by ' + self.__class__.__name__)
+            return up.plan.TimeTriggeredPlan(timed_actions)
+        return up.plan.SequentialPlan(sequential_actions)
 
     def solve(self, problem: 'up.model.AbstractProblem',
                 callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None,
@@ -95,52 +251,120 @@ class PDDLSolver(solvers.solver.Solver):
                 output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
         assert isinstance(problem, up.model.Problem)
         w = PDDLWriter(problem, self._needs_requirements)
-        plan = None
-        logs: List['up.solvers.results.LogMessage'] = []
-        with tempfile.TemporaryDirectory() as tempdir:
-            domain_filename = os.path.join(tempdir, 'domain.pddl')
-            problem_filename = os.path.join(tempdir, 'problem.pddl')
-            plan_filename = os.path.join(tempdir, 'plan.txt')
-            w.write_domain(domain_filename)
-            w.write_problem(problem_filename)
-            cmd = self._get_cmd(domain_filename, problem_filename, plan_filename)
-
-            if output_stream is None:
-                # If we do not have an output stream to write to, we simply call
-                # a subprocess and retrieve the final output and error with communicate
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                timeout_occurred: bool = False
-                proc_out: List[str] = []
-                proc_err: List[str] = []
+        if self._slots is None:
+            with tempfile.TemporaryDirectory() as tempdir:
+                domain_filename = os.path.join(tempdir, 'domain.pddl')
+                problem_filename = os.path.join(tempdir, 'problem.pddl')
+                plan_filename = os.path.join(tempdir, 'plan.txt')
+                w.write_domain(domain_filename)
+                w.write_problem(problem_filename)
+                return self._run_planner(problem, domain_filename, problem_filename, plan_filename,
+                                         timeout, output_stream)
+        slot = self._slots.get()
+        try:
+            self._prepare_slot(slot, w)
+            return self._run_planner(problem, slot.domain_filename, slot.problem_filename, slot.plan_filename,
+                                     timeout, output_stream)
+        finally:
+            self._slots.put(slot)
+
+    async def solve_async(self, problem: 'up.model.AbstractProblem',
+                          callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None,
+                          timeout: Optional[float] = None,
+                          output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
+        '''Runs the planner in an asyncio subprocess; if the call is cancelled, the planner is killed.
+
+        The files are written and the plan is parsed in the default executor of the event loop.'''
+        assert isinstance(problem, up.model.Problem)
+        w = PDDLWriter(problem, self._needs_requirements)
+        if self._slots is None:
+            with tempfile.TemporaryDirectory() as tempdir:
+                return await self._run_planner_async(problem, w, _WorkerSlot(tempdir), timeout, output_stream)
+        slot = await self._slots.get_async()
+        try:
+            return await self._run_planner_async(problem, w, slot, timeout, output_stream)
+        finally:
+            self._slots.put(slot)
+
+    async def _run_planner_async(self, problem: 'up.model.Problem', w: PDDLWriter, slot: _WorkerSlot,
+                                 timeout: Optional[float], output_stream: Optional[IO[str]]) -> 'up.solvers.results.PlanGenerationResult':
+        '''Runs the planner on the problem of the given writer in the given slot and returns its result.'''
+        loop = asyncio.get_running_loop()
+        await _in_executor(loop, self._prepare_slot, slot, w)
+        cmd = self._get_cmd(slot.domain_filename, slot.problem_filename, slot.plan_filename)
+        exec_res = await run_command_asyncio(cmd, output_stream=output_stream, timeout=timeout)
+        return await _in_executor(loop, self._planner_result, problem, slot.plan_filename, *exec_res)
+
+    def _prepare_slot(self, slot: _WorkerSlot, w: PDDLWriter):
+        '''Writes the domain, if changed, and the problem of the given writer in the given slot.'''
+        domain = w.get_domain()
+        if domain != slot.domain:
+            slot.domain = None # The file is not consistent until completely written
+            with open(slot.domain_filename, 'w') as f:
+                f.write(domain)
+            slot.domain = domain
+        w.write_problem(slot.problem_filename)
+        if os.path.isfile(slot.plan_filename):
+            os.remove(slot.plan_filename)
+
+    def _run_planner(self, problem: 'up.model.Problem', domain_filename: str, problem_filename: str,
+                     plan_filename: str, timeout: Optional[float] = None,
+                     output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
+        '''Runs the planner on the given domain and problem files and returns its result.'''
+        cmd = self._get_cmd(domain_filename, problem_filename, plan_filename)
+
+        if output_stream is None:
+            # If we do not have an output stream to write to, we simply call
+            # a subprocess and retrieve the final output and error with communicate
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            timeout_occurred: bool = False
+            proc_out: List[str] = []
+            proc_err: List[str] = []
+            try:
+                out_err_bytes = process.communicate(timeout=timeout)
+                proc_out, proc_err = [[x.decode()] for x in out_err_bytes]
+            except subprocess.TimeoutExpired:
+                timeout_occurred = True
+                # The planner must not outlive the call, as its files might be reused
+                process.kill()
+                process.communicate()
+            except BaseException:
+                # Also when the call is interrupted, e.g. by a KeyboardInterrupt
+                process.kill()
+                process.wait()
+                raise
+            retval = process.returncode
+        else:
+            if sys.platform == "win32":
+                # On windows we have to use asyncio (does not work inside notebooks)
                 try:
-                    out_err_bytes = process.communicate(timeout=timeout)
-                    proc_out, proc_err = [[x.decode()] for x in out_err_bytes]
-                except subprocess.TimeoutExpired:
-                    timeout_occurred = True
-                retval = process.returncode
+                    loop = asyncio.ProactorEventLoop()
+                    exec_res = loop.run_until_complete(run_command_asyncio(cmd, output_stream=output_stream, timeout=timeout))
+                finally:
+                    loop.close()
             else:
-                if sys.platform == "win32":
-                    # On windows we have to use asyncio (does not work inside notebooks)
-                    try:
-                        loop = asyncio.ProactorEventLoop()
-                        exec_res = loop.run_until_complete(run_command_asyncio(cmd, output_stream=output_stream, timeout=timeout))
-                    finally:
-                        loop.close()
+                # On non-windows OSs, we can choose between asyncio and posix
+                # select (see comment on USE_ASYNCIO_ON_UNIX variable for details)
+                if USE_ASYNCIO_ON_UNIX:
+                    exec_res = asyncio.run(run_command_asyncio(cmd, output_stream=output_stream, timeout=timeout))
                 else:
-                    # On non-windows OSs, we can choose between asyncio and posix
-                    # select (see comment on USE_ASYNCIO_ON_UNIX variable for details)
-                    if USE_ASYNCIO_ON_UNIX:
-                        exec_res = asyncio.run(run_command_asyncio(cmd, output_stream=output_stream, timeout=timeout))
-                    else:
-                        exec_res = run_command_posix_select(cmd, output_stream=output_stream, timeout=timeout)
-                timeout_occurred, (proc_out, proc_err), retval = exec_res
-
-            logs.append(up.solvers.results.LogMessage(LogLevel.INFO, ''.join(proc_out)))
-            logs.append(up.solvers.results.LogMessage(LogLevel.ERROR, ''.join(proc_err)))
-            if os.path.isfile(plan_filename):
-                plan = self._plan_from_file(problem, plan_filename)
-            if timeout_occurred and retval != 0:
-                return PlanGenerationResult(PlanGenerationResultStatus.TIMEOUT, plan=plan, log_messages=logs, engine_name=self.name)
+                    exec_res = run_command_posix_select(cmd, output_stream=output_stream, timeout=timeout)
+            timeout_occurred, (proc_out, proc_err), retval = exec_res
+        return self._planner_result(problem, plan_filename, timeout_occurred, (proc_out, proc_err), retval)
+
+    def _planner_result(self, problem: 'up.model.Problem', plan_filename: str, timeout_occurred: bool,
+                        output: Tuple[List[str], List[str]], retval: int) -> 'up.solvers.results.PlanGenerationResult':
+        '''Returns the result of a run of the planner, given its plan file, whether the timeout
+        occurred, its standard output and error and its return code.'''
+        plan = None
+        proc_out, proc_err = output
+        logs: List['up.solvers.results.LogMessage'] = []
+        logs.append(up.solvers.results.LogMessage(LogLevel.INFO, ''.join(proc_out)))
+        logs.append(up.solvers.results.LogMessage(LogLevel.ERROR, ''.join(proc_err)))
+        if os.path.isfile(plan_filename):
+            plan = self._plan_from_file(problem, plan_filename)
+        if timeout_occurred and retval != 0:
+            return PlanGenerationResult(PlanGenerationResultStatus.TIMEOUT, plan=plan, log_messages=logs, engine_name=self.name)
         status: PlanGenerationResultStatus = self._result_status(problem, plan)
         return PlanGenerationResult(status, plan, log_messages=logs, engine_name=self.name)
 
@@ -150,48 +374,79 @@ class PDDLSolver(solvers.solver.Solver):
         raise NotImplementedError
 
     def destroy(self):
-        pass
+        if self._scratch_dir is not None:
+            self._remove_scratch_dir()
 
 
-async def run_command_asyncio(cmd: List[str], output_stream: IO[str], timeout: Optional[float] = None) -> Tuple[bool, Tuple[List[str], List[str]], int]:
+async def run_command_asyncio(cmd: List[str], output_stream: Optional[IO[str]], timeout: Optional[float] = None) -> Tuple[bool, Tuple[List[str], List[str]], int]:
     '''
-    Executed the specified command line using asyncio primitives, imposing the specified timeout and printing online the output on output_stream.
+    Executed the specified command line using asyncio primitives, imposing the specified timeout and printing online the output on output_stream (if given).
     The function returns a boolean flag telling if a timeout occurred, a pair of string lists containing the captured standard output and standard error and the return code of the command as an integer
+    If the coroutine is cancelled, the process is killed.
     '''
     start = time.time()
     process = await asyncio.create_subprocess_exec(*cmd, stdout=PIPE, stderr=PIPE)
 
     timeout_occurred = False
     process_output: Tuple[List[str], List[str]] = ([], []) #stdout, stderr
-    while True:
-        lines = [b"", b""]
-        oks = [True, True]
-        for idx, stream in enumerate([process.stdout, process.stderr]):
-            assert stream is not None
+    try:
+        if output_stream is None:
             try:
-                lines[idx] = await asyncio.wait_for(stream.readline(), 0.5)
+                out_err_bytes = await asyncio.wait_for(process.communicate(), timeout)
+                for idx in range(2):
+                    process_output[idx].append(out_err_bytes[idx].decode().replace('\r\n', '\n'))
             except asyncio.TimeoutError:
-                oks[idx] = False
+                _kill(process)
+                timeout_occurred = True
+        while output_stream is not None:
+            lines = [b"", b""]
+            oks = [True, True]
+            for idx, stream in enumerate([process.stdout, process.stderr]):
+                assert stream is not None
+                try:
+                    lines[idx] = await asyncio.wait_for(stream.readline(), 0.5)
+                except asyncio.TimeoutError:
+                    oks[idx] = False
 
-        if all(oks) and (not lines[0] and not lines[1]): # EOF
-            break
-        else:
-            for idx in range(2):
-                output_string = lines[idx].decode().replace('\r\n', '\n')
-                output_stream.write(output_string)
-                process_output[idx].append(output_string)
-        if timeout is not None and time.time() - start >= timeout:
-            try:
-                process.kill()
-            except OSError:
-                pass # This can happen if the process is already terminated
-            timeout_occurred = True
-            break
+            if all(oks) and (not lines[0] and not lines[1]): # EOF
+                break
+            else:
+                for idx in range(2):
+                    output_string = lines[idx].decode().replace('\r\n', '\n')
+                    output_stream.write(output_string)
+                    process_output[idx].append(output_string)
+            if timeout is not None and time.time() - start >= timeout:
+                _kill(process)
+                timeout_occurred = True
+                break
+    except asyncio.CancelledError:
+        _kill(process)
+        await process.wait()
+        raise
 
     await process.wait() # Wait for the child process to exit
     return timeout_occurred, process_output, cast(int, process.returncode)
 
 
+async def _in_executor(loop: asyncio.AbstractEventLoop, function: Callable[..., Any], *args: Any) -> Any:
+    '''Calls the given function in the default executor of the given loop; if the call is
+    cancelled, the function is awaited anyway before propagating the cancellation, as it
+    can not be interrupted and it might still be using the files of the call.'''
+    future = loop.run_in_executor(None, function, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
+
+def _kill(process: 'asyncio.subprocess.Process'):
+    try:
+        process.kill()
+    except OSError:
+        pass # This can happen if the process is already terminated
+
+
 def run_command_posix_select(cmd: List[str], output_stream: IO[str], timeout: Optional[float] = None) -> Tuple[bool, Tuple[List[str], List[str]], int]:
     '''
     Executed the specified command line using posix select, imposing the specified timeout and printing online the output on output_stream.
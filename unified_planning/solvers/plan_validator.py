@@ -14,7 +14,8 @@
 #
 
 
-from typing import Dict, List, Optional
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from itertools import product
 
 import unified_planning as up
@@ -22,7 +23,9 @@ import unified_planning.environment
 import unified_planning.solvers as solvers
 import unified_planning.walkers as walkers
 from unified_planning.exceptions import UPProblemDefinitionError
-from unified_planning.model import FNode, Expression, AbstractProblem, Problem, ProblemKind, Object
+from unified_planning.model import FNode, Expression, AbstractProblem, Problem, ProblemKind, Object, Parameter
+from unified_planning.model import operators as op
+from unified_planning.model.state import GroundFluentsIndex, _native_value
 from unified_planning.solvers.results import ValidationResult, ValidationResultStatus, LogMessage, LogLevel
 from unified_planning.plan import SequentialPlan
 
@@ -164,12 +167,262 @@ class QuantifierSimplifier(walkers.Simplifier):
             raise UPProblemDefinitionError(f"Value of Parameter {str(expression)} not found in {str(self._assignments)}")
 
 
+# A compiled expression is a function that takes the state vector and the list of
+# the local values (action parameters and quantified variables) and returns the
+# value of the expression. Values are represented as in the CompactState: bool,
+# int and Fraction for the constants and the object expression FNode for the objects.
+CompiledExpression = Callable[[List[Any], List[Any]], Any]
+
+
+class _ExpressionCompiler(walkers.DagWalker):
+    '''Lowers an expression into a CompiledExpression.
+
+    The local values are laid out with the parameters given to reset first, followed by
+    the quantified variables, that are assigned to a slot the first time they are found.'''
+    def __init__(self, index: GroundFluentsIndex):
+        walkers.DagWalker.__init__(self)
+        self._index = index
+        self._locals: Dict[Any, int] = {}
+
+    def reset(self, parameters: List[Parameter]):
+        '''Clears the memoization and lays out the local values for the given parameters.'''
+        self.memoization.clear()
+        self._locals = {p: i for i, p in enumerate(parameters)}
+
+    @property
+    def locals_size(self) -> int:
+        '''Returns the number of local values needed by the expressions compiled since the last reset.'''
+        return len(self._locals)
+
+    def compile(self, expression: FNode) -> CompiledExpression:
+        '''Returns the CompiledExpression of the given expression.'''
+        return self.walk(expression)
+
+    def compile_slot(self, fluent_exp: FNode) -> CompiledExpression:
+        '''Returns a CompiledExpression that computes the slot of the given fluent expression.'''
+        assert fluent_exp.is_fluent_exp()
+        return self._slot_function(fluent_exp, [self.walk(a) for a in fluent_exp.args])
+
+    def _local_slot(self, key: Any) -> int:
+        res = self._locals.get(key, None)
+        if res is None:
+            res = len(self._locals)
+            self._locals[key] = res
+        return res
+
+    def _slot_function(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        fluent = expression.fluent()
+        offset = self._index.offset(fluent)
+        lifted_args: List[Tuple[CompiledExpression, Dict[Any, int], int]] = []
+        for exp, a, p, stride in zip(expression.args, args, fluent.signature, self._index.strides(fluent)):
+            positions = self._index.positions(p.type)
+            if exp.is_constant():
+                offset += positions[_native_value(exp)] * stride
+            else:
+                lifted_args.append((a, positions, stride))
+        if len(lifted_args) == 0:
+            return lambda s, l: offset
+        def fun(s, l):
+            res = offset
+            for a, positions, stride in lifted_args:
+                v = a(s, l)
+                try:
+                    res += positions[v] * stride
+                except KeyError:
+                    raise UPProblemDefinitionError(f'Value {str(v)} is not in the domain of fluent {str(expression)}')
+            return res
+        return fun
+
+    def walk_fluent_exp(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        slot_function = self._slot_function(expression, args)
+        if all(a.is_constant() for a in expression.args):
+            slot = slot_function([], [])
+            return lambda s, l: s[slot]
+        return lambda s, l: s[slot_function(s, l)]
+
+    def walk_param_exp(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        idx = self._locals.get(expression.parameter(), None)
+        if idx is None:
+            raise UPProblemDefinitionError(f'Value of Parameter {str(expression)} not found')
+        return lambda s, l: l[idx]
+
+    def walk_variable_exp(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        idx = self._local_slot(expression.variable())
+        return lambda s, l: l[idx]
+
+    @walkers.handles(op.OperatorKind.BOOL_CONSTANT, op.OperatorKind.INT_CONSTANT,
+                     op.OperatorKind.REAL_CONSTANT, op.OperatorKind.OBJECT_EXP)
+    def walk_constant(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        value = _native_value(expression)
+        return lambda s, l: value
+
+    def walk_and(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        def fun(s, l):
+            for a in args:
+                if not a(s, l):
+                    return False
+            return True
+        return fun
+
+    def walk_or(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        def fun(s, l):
+            for a in args:
+                if a(s, l):
+                    return True
+            return False
+        return fun
+
+    def walk_not(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, = args
+        return lambda s, l: not a(s, l)
+
+    def walk_implies(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        return lambda s, l: (not a(s, l)) or b(s, l)
+
+    def walk_iff(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        return lambda s, l: a(s, l) == b(s, l)
+
+    def _quantifier_function(self, expression: FNode, body: CompiledExpression, is_exists: bool) -> CompiledExpression:
+        variables = expression.variables()
+        idxs = [self._local_slot(v) for v in variables]
+        domains = [self._index.domain(v.type) for v in variables]
+        def fun(s, l):
+            saved = [l[i] for i in idxs]
+            res = not is_exists
+            for values in product(*domains):
+                for i, v in zip(idxs, values):
+                    l[i] = v
+                if bool(body(s, l)) == is_exists:
+                    res = is_exists
+                    break
+            for i, v in zip(idxs, saved):
+                l[i] = v
+            return res
+        return fun
+
+    def walk_exists(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        return self._quantifier_function(expression, args[0], True)
+
+    def walk_forall(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        return self._quantifier_function(expression, args[0], False)
+
+    def walk_equals(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        return lambda s, l: a(s, l) == b(s, l)
+
+    def walk_le(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        return lambda s, l: a(s, l) <= b(s, l)
+
+    def walk_lt(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        return lambda s, l: a(s, l) < b(s, l)
+
+    def walk_plus(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        return lambda s, l: sum(a(s, l) for a in args)
+
+    def walk_minus(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        return lambda s, l: a(s, l) - b(s, l)
+
+    def walk_times(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        def fun(s, l):
+            res = 1
+            for a in args:
+                res *= a(s, l)
+            return res
+        return fun
+
+    def walk_div(self, expression: FNode, args: List[CompiledExpression]) -> CompiledExpression:
+        a, b = args
+        def fun(s, l):
+            res = Fraction(a(s, l), b(s, l))
+            return res.numerator if res.denominator == 1 else res
+        return fun
+
+
+class _CompiledAction:
+    '''The preconditions and the effects of an InstantaneousAction, compiled once
+    and evaluated for every instance of the action in a plan.'''
+    def __init__(self, compiler: _ExpressionCompiler, action: 'unified_planning.model.InstantaneousAction'):
+        compiler.reset(action.parameters)
+        self.preconditions: List[Tuple[FNode, CompiledExpression]] = [(p, compiler.compile(p)) for p in action.preconditions]
+        # every effect is represented by the compiled condition (None if unconditional),
+        # the compiled slot of the fluent, the compiled value and the effect kind
+        self.effects: List[Tuple[Optional[CompiledExpression], CompiledExpression, CompiledExpression, int]] = []
+        for e in action.effects:
+            condition = compiler.compile(e.condition) if e.is_conditional() else None
+            kind = 0 if e.is_assignment() else (1 if e.is_increase() else -1)
+            self.effects.append((condition, compiler.compile_slot(e.fluent), compiler.compile(e.value), kind))
+        self.locals_size = compiler.locals_size
+
+    def unsatisfied_precondition(self, state: List[Any], local_values: List[Any]) -> Optional[FNode]:
+        '''Returns the first precondition that does not hold in the given state, None if they all hold.'''
+        for p, c in self.preconditions:
+            if not c(state, local_values):
+                return p
+        return None
+
+    def apply(self, state: List[Any], local_values: List[Any]):
+        '''Applies the effects to the given state; all the effects are evaluated in the state
+        before any of them is applied.'''
+        updates = []
+        for condition, slot, value, kind in self.effects:
+            if condition is None or condition(state, local_values):
+                s = slot(state, local_values)
+                v = value(state, local_values)
+                if kind != 0:
+                    v = state[s] + v if kind > 0 else state[s] - v
+                updates.append((s, v))
+        for s, v in updates:
+            state[s] = v
+
+
+class _CompiledProblem:
+    '''The initial state, the actions and the goals of a problem lowered
+    over the state vector defined by a GroundFluentsIndex.
+
+    The actions are compiled lazily, the first time they are found in a plan.'''
+    def __init__(self, problem: Problem):
+        self._index = GroundFluentsIndex(problem)
+        self._compiler = _ExpressionCompiler(self._index)
+        initial_state = self._index.initial_state()
+        self._initial_state = [initial_state[i] for i in range(self._index.size)]
+        self._actions: Dict['unified_planning.model.Action', _CompiledAction] = {}
+        self._compiler.reset([])
+        self.goals: List[Tuple[FNode, CompiledExpression]] = [(g, self._compiler.compile(g)) for g in problem.goals]
+        self.goals_locals_size = self._compiler.locals_size
+
+    @property
+    def initial_state(self) -> List[Any]:
+        '''Returns a fresh copy of the initial state vector.'''
+        return self._initial_state[:]
+
+    def action(self, action: 'unified_planning.model.InstantaneousAction') -> _CompiledAction:
+        '''Returns the compiled version of the given action.'''
+        res = self._actions.get(action, None)
+        if res is None:
+            res = _CompiledAction(self._compiler, action)
+            self._actions[action] = res
+        return res
+
+
 class SequentialPlanValidator(solvers.solver.Solver):
-    """Performs plan validation."""
+    """Performs plan validation.
+
+    If the option "compiled" is True, the preconditions, the effects and the goals of
+    the problem are compiled once into functions over a state vector indexed by the
+    ground fluents, so every step of the plan is evaluated without walking the expressions.
+    The compiled problem is kept until a different problem is validated, or the validated
+    problem is modified, as detected by its fingerprint (see Problem.fingerprint)."""
     def __init__(self, **options):
         self._env: 'unified_planning.environment.Environment' = unified_planning.environment.get_env(options.get('env', None))
         self.manager = self._env.expression_manager
         self._substituter = walkers.Substituter(self._env)
+        self._compiled = options.get('compiled', False)
+        self._compiled_problem: Optional[Tuple[Problem, str, _CompiledProblem]] = None
 
     def validate(self, problem: 'AbstractProblem', plan: 'unified_planning.plan.Plan') -> 'up.solvers.results.ValidationResult':
         """Returns True if and only if the plan given in input is a valid plan for the problem given in input.
@@ -177,8 +430,10 @@ class SequentialPlanValidator(solvers.solver.Solver):
         problem goal. Otherwise False is returned."""
         assert isinstance(plan, SequentialPlan)
         assert isinstance(problem, Problem)
+        if self._compiled:
+            return self._compiled_validate(problem, plan)
         self._qsimplifier = QuantifierSimplifier(self._env, problem)
-        assignments: Dict[Expression, Expression] = problem.initial_values.copy() # type: ignore
+        assignments: Dict[Expression, Expression] = dict(problem.initial_values)
         count = 0 #used for better error indexing
         for ai in plan.actions:
             action = ai.action
@@ -221,6 +476,33 @@ class SequentialPlanValidator(solvers.solver.Solver):
                     return ValidationResult(ValidationResultStatus.INVALID, self.name, logs)
         return ValidationResult(ValidationResultStatus.VALID, self.name, [])
 
+    def _compiled_validate(self, problem: Problem, plan: SequentialPlan) -> 'up.solvers.results.ValidationResult':
+        fingerprint = problem.fingerprint
+        if self._compiled_problem is None or self._compiled_problem[0] is not problem or \
+                self._compiled_problem[1] != fingerprint:
+            self._compiled_problem = (problem, fingerprint, _CompiledProblem(problem))
+        compiled_problem = self._compiled_problem[2]
+        state = compiled_problem.initial_state
+        for count, ai in enumerate(plan.actions, start=1):
+            action = ai.action
+            assert isinstance(action, unified_planning.model.InstantaneousAction)
+            compiled_action = compiled_problem.action(action)
+            local_values = [_native_value(p) for p in ai.actual_parameters]
+            local_values.extend([None] * (compiled_action.locals_size - len(local_values)))
+            p = compiled_action.unsatisfied_precondition(state, local_values)
+            if p is not None:
+                error = f'Precondition {p} of {str(count)}-th action instance {str(ai)} is not satisfied.'
+                logs = [LogMessage(LogLevel.ERROR, error)]
+                return ValidationResult(ValidationResultStatus.INVALID, self.name, logs)
+            compiled_action.apply(state, local_values)
+        local_values = [None] * compiled_problem.goals_locals_size
+        for g, c in compiled_problem.goals:
+            if not c(state, local_values):
+                error = f'Goal {str(g)} is not reached by the plan.'
+                logs = [LogMessage(LogLevel.ERROR, error)]
+                return ValidationResult(ValidationResultStatus.INVALID, self.name, logs)
+        return ValidationResult(ValidationResultStatus.VALID, self.name, [])
+
     def _get_ground_fluent(self, fluent:FNode, assignments: Dict[Expression, Expression]) -> FNode:
         assert fluent.is_fluent_exp()
         new_args = []
@@ -0,0 +1,85 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""This module defines the history used to order the solvers of a portfolio."""
+
+
+import json
+import os
+import tempfile
+import threading
+from unified_planning.model import ProblemKind
+from typing import Dict, List, Optional, Sequence
+
+
+class PortfolioHistory:
+    '''The history of the runs of the solvers of a portfolio, for each problem kind.
+
+    For each problem kind and solver, the history records the number of runs, of the
+    runs that solved the problem (finding a plan or proving it unsolvable) and their
+    total time; the solvers are ordered by their estimated success rate and, among
+    equal rates, by their average time.
+
+    If a path is given, the history is loaded from it (when it exists) and saved in
+    it after every recorded run.'''
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._lock = threading.Lock()
+        # problem kind -> solver -> [runs, successes, total time]
+        self._stats: Dict[str, Dict[str, List[float]]] = {}
+        if path is not None and os.path.isfile(path):
+            with open(path) as f:
+                self._stats = json.load(f)
+
+    @staticmethod
+    def _kind_key(problem_kind: ProblemKind) -> str:
+        return ' '.join(sorted(problem_kind.features))
+
+    def record(self, problem_kind: ProblemKind, solver: str, solved: bool, time: float):
+        '''Records a run of the given solver on a problem of the given kind.'''
+        with self._lock:
+            stats = self._stats.setdefault(self._kind_key(problem_kind), {}).setdefault(solver, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += 1 if solved else 0
+            stats[2] += time
+            if self._path is not None:
+                self._save()
+
+    def success_rate(self, problem_kind: ProblemKind, solver: str) -> float:
+        '''Returns the estimated probability that the given solver solves a problem of
+        the given kind; the estimate of a solver without runs is 0.5.'''
+        runs, successes, _ = self._stats.get(self._kind_key(problem_kind), {}).get(solver, [0, 0, 0.0])
+        return (successes + 1) / (runs + 2)
+
+    def average_time(self, problem_kind: ProblemKind, solver: str) -> float:
+        '''Returns the average time of the runs of the given solver on the problems of
+        the given kind; 0 if it has no runs.'''
+        runs, _, time = self._stats.get(self._kind_key(problem_kind), {}).get(solver, [0, 0, 0.0])
+        return time / runs if runs > 0 else 0.0
+
+    def order(self, problem_kind: ProblemKind, solvers: Sequence[str]) -> List[int]:
+        '''Returns the indexes of the given solvers, from the most to the least promising
+        on a problem of the given kind.'''
+        with self._lock:
+            return sorted(range(len(solvers)),
+                          key=lambda i: (-self.success_rate(problem_kind, solvers[i]),
+                                         self.average_time(problem_kind, solvers[i])))
+
+    def _save(self):
+        assert self._path is not None
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_filename = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self._stats, f)
+        os.replace(tmp_filename, self._path)
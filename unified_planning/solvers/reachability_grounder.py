@@ -0,0 +1,282 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""This module implements a grounder based on the delete relaxation reachability analysis."""
+
+
+from functools import partial
+from itertools import product
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+import unified_planning as up
+import unified_planning.transformers
+from unified_planning.model import Problem, ProblemKind, Action, InstantaneousAction, DurativeAction, FNode, Fluent
+from unified_planning.model.types import domain_size, domain_item
+from unified_planning.solvers.grounder import lift_action_instance
+from unified_planning.solvers.results import GroundingResult
+from unified_planning.solvers.solver import Solver, Credits
+
+
+# The arguments of a fluent expression in a precondition or in an effect: an int is
+# the index of an action parameter, a FNode is a constant.
+_Template = Tuple[Union[int, FNode], ...]
+
+
+class _ReachedFacts:
+    '''The ground boolean fluent expressions reached by the relaxed fixpoint, indexed
+    by the value of each of their arguments.'''
+    def __init__(self):
+        self._facts: Dict[Fluent, Set[Tuple[FNode, ...]]] = {}
+        self._index: Dict[Tuple[Fluent, int, FNode], List[Tuple[FNode, ...]]] = {}
+
+    def add(self, fluent: Fluent, args: Tuple[FNode, ...]) -> bool:
+        '''Adds the given fact and returns True if it was not already reached.'''
+        facts = self._facts.setdefault(fluent, set())
+        if args in facts:
+            return False
+        facts.add(args)
+        for i, a in enumerate(args):
+            self._index.setdefault((fluent, i, a), []).append(args)
+        return True
+
+    def facts(self, fluent: Fluent) -> Iterable[Tuple[FNode, ...]]:
+        return self._facts.get(fluent, ())
+
+    def matching(self, fluent: Fluent, position: int, value: FNode) -> Iterable[Tuple[FNode, ...]]:
+        '''Returns the facts of the given fluent with the given value as argument in the given position.'''
+        return self._index.get((fluent, position, value), ())
+
+
+class _RelaxedAction:
+    '''The delete relaxation of a lifted action: the positive boolean fluent
+    expressions of its preconditions, the (in)equalities between its parameters
+    and the boolean fluent expressions its effects can make true.'''
+    def __init__(self, problem: Problem, action: Action, universal: Set[Fluent]):
+        self.action = action
+        self.domains: List[List[FNode]] = []
+        self.domains_sets: List[Set[FNode]] = []
+        for p in action.parameters:
+            if p.type.is_user_type():
+                em = problem.env.expression_manager
+                domain = [em.ObjectExp(o) for o in problem.typed_objects(p.type)]
+            else:
+                domain = [domain_item(problem, p.type, i) for i in range(domain_size(problem, p.type))]
+            self.domains.append(domain)
+            self.domains_sets.append(set(domain))
+        self._params = {p: i for i, p in enumerate(action.parameters)}
+        self.preconditions: List[Tuple[Fluent, _Template]] = []
+        self.filters: List[Tuple[bool, _Template]] = []
+        self.add_effects: List[Tuple[Fluent, _Template]] = []
+        conditions: List[FNode] = []
+        effects: List['up.model.effect.Effect'] = []
+        if isinstance(action, InstantaneousAction):
+            conditions.extend(action.preconditions)
+            effects.extend(action.effects)
+            if action.simulated_effect is not None:
+                universal.update(f.fluent() for f in action.simulated_effect.fluents)
+        elif isinstance(action, DurativeAction):
+            for interval, cl in action.conditions.items():
+                # Only the conditions holding at start surely hold before the effects of the action
+                if interval.lower == up.model.StartTiming() and not interval.is_left_open():
+                    conditions.extend(cl)
+            for el in action.effects.values():
+                effects.extend(el)
+            for se in action.simulated_effects.values():
+                universal.update(f.fluent() for f in se.fluents)
+        else:
+            raise NotImplementedError
+        for c in conditions:
+            self._add_condition(c)
+        for e in effects:
+            if e.fluent.fluent().type.is_bool_type() and not e.value.is_false():
+                template = self._template(e.fluent)
+                if template is None:
+                    universal.add(e.fluent.fluent())
+                else:
+                    self.add_effects.append((e.fluent.fluent(), template))
+
+    def _template(self, exp: FNode) -> Optional[_Template]:
+        '''Returns the template of the arguments of the given fluent expression, or None
+        if some argument is neither a parameter nor a constant.'''
+        res: List[Union[int, FNode]] = []
+        for a in exp.args:
+            if a.is_parameter_exp():
+                res.append(self._params[a.parameter()])
+            elif a.is_constant():
+                res.append(a)
+            else:
+                return None
+        return tuple(res)
+
+    def _add_condition(self, c: FNode):
+        '''Collects the relaxed conditions of the given precondition. The conditions that
+        are not understood are optimistically considered satisfiable.'''
+        if c.is_and():
+            for a in c.args:
+                self._add_condition(a)
+        elif c.is_fluent_exp():
+            template = self._template(c)
+            if template is not None:
+                self.preconditions.append((c.fluent(), template))
+        elif c.is_equals() or (c.is_not() and c.arg(0).is_equals()):
+            eq = c if c.is_equals() else c.arg(0)
+            template = self._template(eq)
+            if template is not None:
+                self.filters.append((c.is_equals(), template))
+
+    def groundings(self, reached: _ReachedFacts, universal: Set[Fluent]) -> Iterator[Tuple[FNode, ...]]:
+        '''Returns the parameters tuples whose relaxed preconditions are satisfied by the reached facts.'''
+        literals = [(f, t) for f, t in self.preconditions if f not in universal]
+        binding: List[Optional[FNode]] = [None] * len(self.domains)
+        yield from self._join(literals, 0, binding, reached)
+
+    def _join(self, literals: List[Tuple[Fluent, _Template]], i: int, binding: List[Optional[FNode]],
+              reached: _ReachedFacts) -> Iterator[Tuple[FNode, ...]]:
+        if i == len(literals):
+            free = [j for j, b in enumerate(binding) if b is None]
+            for values in product(*(self.domains[j] for j in free)):
+                complete = binding[:]
+                for j, v in zip(free, values):
+                    complete[j] = v
+                if all(self._check_filter(is_equals, t, complete) for is_equals, t in self.filters):
+                    yield tuple(complete) # type: ignore
+            return
+        fluent, template = literals[i]
+        candidates = None
+        for position, t in enumerate(template):
+            value = binding[t] if isinstance(t, int) else t
+            if value is not None:
+                candidates = reached.matching(fluent, position, value)
+                break
+        if candidates is None:
+            candidates = reached.facts(fluent)
+        for atom in candidates:
+            new_binding = binding[:]
+            for t, a in zip(template, atom):
+                if isinstance(t, int):
+                    b = new_binding[t]
+                    if b is None and a in self.domains_sets[t]:
+                        new_binding[t] = a
+                    elif b is not a:
+                        break
+                elif t is not a:
+                    break
+            else:
+                yield from self._join(literals, i + 1, new_binding, reached)
+
+    def _check_filter(self, is_equals: bool, template: _Template, binding: List[Optional[FNode]]) -> bool:
+        left, right = [binding[t] if isinstance(t, int) else t for t in template]
+        return (left is right) == is_equals
+
+    def apply(self, grounding: Tuple[FNode, ...]) -> Iterator[Tuple[Fluent, Tuple[FNode, ...]]]:
+        '''Returns the facts added by the given grounding of the action.'''
+        for fluent, template in self.add_effects:
+            yield fluent, tuple(grounding[t] if isinstance(t, int) else t for t in template)
+
+
+def reachable_groundings(problem: Problem) -> Dict[Action, List[Tuple[FNode, ...]]]:
+    '''Computes, with a fixpoint on the delete relaxation of the given problem, the
+    parameters tuples of the actions that might be applicable in a reachable state.
+
+    The returned map can be given as grounding_actions_map to the
+    unified_planning.transformers.Grounder. The parameters tuples of every action
+    are sorted as in the combinatorial grounding.
+
+    The analysis is an over-approximation: the conditions that are not positive boolean
+    fluent expressions or (in)equalities of parameters are considered satisfiable.'''
+    # The fluents whose ground expressions are all considered reached
+    universal: Set[Fluent] = set()
+    reached = _ReachedFacts()
+    for f, v in problem.fluents_defaults.items():
+        if f.type.is_bool_type() and v.is_true():
+            universal.add(f)
+    for f_exp, v in problem.explicit_initial_values.items():
+        if v.is_true():
+            reached.add(f_exp.fluent(), tuple(f_exp.args))
+    for el in problem.timed_effects.values():
+        for e in el:
+            if e.fluent.fluent().type.is_bool_type() and not e.value.is_false():
+                if all(a.is_constant() for a in e.fluent.args):
+                    reached.add(e.fluent.fluent(), tuple(e.fluent.args))
+                else:
+                    universal.add(e.fluent.fluent())
+    relaxed_actions = [_RelaxedAction(problem, a, universal) for a in problem.actions]
+    groundings: Dict[Action, Set[Tuple[FNode, ...]]] = {a: set() for a in problem.actions}
+    # The fluents with new reached facts in the last iteration; None in the first one
+    changed: Optional[Set[Fluent]] = None
+    while changed is None or len(changed) > 0:
+        new_changed: Set[Fluent] = set()
+        for ra in relaxed_actions:
+            if changed is not None and all(f not in changed for f, _ in ra.preconditions):
+                continue
+            action_groundings = groundings[ra.action]
+            for g in list(ra.groundings(reached, universal)):
+                if g in action_groundings:
+                    continue
+                action_groundings.add(g)
+                for fluent, atom in ra.apply(g):
+                    if fluent not in universal and reached.add(fluent, atom):
+                        new_changed.add(fluent)
+        changed = new_changed
+    res: Dict[Action, List[Tuple[FNode, ...]]] = {}
+    for ra in relaxed_actions:
+        action_groundings = groundings[ra.action]
+        if len(ra.domains) == 0 and len(action_groundings) == 0:
+            continue
+        positions = [{v: i for i, v in enumerate(d)} for d in ra.domains]
+        res[ra.action] = sorted(action_groundings, key=lambda g: tuple(p[v] for p, v in zip(positions, g)))
+    return res
+
+
+class ReachabilityGrounder(Solver):
+    """Performs grounding, instantiating only the actions that are reachable
+    in the delete relaxation of the problem."""
+    def __init__(self, **options):
+        self._processes = int(options.get('processes', 1))
+
+    @property
+    def name(self):
+        return 'up_reachability_grounder'
+
+    def ground(self, problem: 'up.model.AbstractProblem') -> GroundingResult:
+        '''This method takes an "unified_planning.model.Problem" and returns the generated
+        "up.solvers.results.GroundingResult".'''
+        assert isinstance(problem, Problem)
+        grounder = unified_planning.transformers.Grounder(problem, grounding_actions_map=reachable_groundings(problem),
+                                                          processes=self._processes)
+        grounded_problem = grounder.get_rewritten_problem()
+        trace_back_map = grounder.get_rewrite_back_map()
+        return GroundingResult(
+            grounded_problem,
+            partial(lift_action_instance, map=trace_back_map),
+            self.name,
+            [])
+
+    @staticmethod
+    def supported_kind() -> ProblemKind:
+        return up.solvers.grounder.Grounder.supported_kind()
+
+    @staticmethod
+    def supports(problem_kind):
+        return problem_kind <= ReachabilityGrounder.supported_kind()
+
+    @staticmethod
+    def is_grounder():
+        return True
+
+    @staticmethod
+    def get_credits(**kwargs) -> Optional[Credits]:
+        return None
+
+    def destroy(self):
+        pass
@@ -15,11 +15,13 @@
 """This module defines the solver interface."""
 
 
+import asyncio
 import unified_planning as up
+from functools import partial
 from unified_planning.model import ProblemKind
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import IO, Optional, Callable, Union
+from typing import IO, Iterable, Optional, Callable, Union
 
 
 
@@ -105,6 +107,39 @@ class Solver:
         output_stream are not None and the planner ignores them.'''
         raise NotImplementedError
 
+    async def solve_async(self, problem: 'up.model.AbstractProblem',
+                          callback: Optional[Callable[['up.solvers.results.PlanGenerationResult'], None]] = None,
+                          timeout: Optional[float] = None,
+                          output_stream: Optional[IO[str]] = None) -> 'up.solvers.results.PlanGenerationResult':
+        '''This coroutine is the asyncio version of the "solve" method, with the same parameters.
+
+        By default, "solve" is run in the default executor of the running event loop,
+        so it must be thread-safe; solvers that run the planning in another process
+        should override this method so that the cancellation of the call stops the planner.'''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.solve, problem, callback, timeout, output_stream))
+
+    def solve_batch(self, problems: Iterable['up.model.AbstractProblem'],
+                    timeout: Optional[float] = None,
+                    max_workers: Optional[int] = None,
+                    use_processes: bool = False) -> 'up.solvers.batch.BatchResults':
+        '''This method solves the given problems concurrently and returns an iterator
+        over the pairs (index of the problem, up.solvers.results.PlanGenerationResult),
+        in the order in which the problems are solved.
+
+        :param problems: is the iterable of the problems to solve; it is consumed while
+        the results are consumed, so it can be a generator of many problems.
+        :param timeout: is the time in seconds that the planner has at max to solve each problem, defaults to None.
+        :param max_workers: is the maximum number of problems solved at the same time,
+        defaults to the number of CPUs.
+        :param use_processes: if True, the problems are solved in a pool of processes instead
+        of a pool of threads; in this case the solver and the problems must be picklable.
+        :return: the up.solvers.batch.BatchResults iterator, whose "metrics" field contains
+        the aggregate metrics of the batch (e.g. its throughput).
+
+        The "solve" method of the solver must be thread-safe to use a pool of threads.'''
+        return up.solvers.batch.BatchResults(self, problems, timeout, max_workers, use_processes)
+
     def validate(self, problem: 'up.model.AbstractProblem', plan: 'up.plan.Plan') -> 'up.solvers.results.ValidationResult':
         raise NotImplementedError
 
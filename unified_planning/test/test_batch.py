@@ -0,0 +1,105 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import time
+import unified_planning as up
+from unified_planning.shortcuts import *
+from unified_planning.solvers import Factory, PlanGenerationResult, PlanGenerationResultStatus
+from unified_planning.test import TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class ExamplesPlanner(up.solvers.Solver):
+    '''A planner that returns the plans of the example problems with the given name.'''
+    def __init__(self, **options):
+        self._delay = float(options.get('delay', 0))
+
+    @property
+    def name(self):
+        return 'examples'
+
+    @staticmethod
+    def is_oneshot_planner():
+        return True
+
+    @staticmethod
+    def supports(problem_kind):
+        return True
+
+    def solve(self, problem, callback=None, timeout=None, output_stream=None):
+        time.sleep(self._delay)
+        if timeout is not None and timeout < self._delay:
+            return PlanGenerationResult(PlanGenerationResultStatus.TIMEOUT, None, self.name)
+        example = get_example_problems()[problem.name]
+        return PlanGenerationResult(PlanGenerationResultStatus.SOLVED_SATISFICING, example.plan, self.name)
+
+    def destroy(self):
+        pass
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.problems = get_example_problems()
+        self.names = ['basic', 'robot', 'robot_loader', 'robot_decrease']
+
+    def check_results(self, results):
+        self.assertEqual(sorted(i for i, _ in results), list(range(len(self.names))))
+        for i, res in results:
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            self.assertEqual(res.plan, self.problems[self.names[i]].plan)
+
+    def test_threads(self):
+        planner = ExamplesPlanner(delay=0.05)
+        batch = planner.solve_batch((self.problems[n].problem for n in self.names), max_workers=2)
+        results = list(batch)
+        self.check_results(results)
+        self.assertEqual(batch.metrics.submitted, 4)
+        self.assertEqual(batch.metrics.completed, 4)
+        self.assertEqual(batch.metrics.statuses, {PlanGenerationResultStatus.SOLVED_SATISFICING: 4})
+        self.assertGreater(batch.metrics.throughput, 0)
+        self.assertGreaterEqual(batch.metrics.average_solve_time, 0.05)
+
+        batch = planner.solve_batch([self.problems[n].problem for n in self.names], timeout=0.01)
+        for _, res in batch:
+            self.assertEqual(res.status, PlanGenerationResultStatus.TIMEOUT)
+
+        with self.assertRaises(up.exceptions.UPUsageError):
+            planner.solve_batch([], max_workers=0)
+
+    def test_processes(self):
+        planner = ExamplesPlanner()
+        results = list(planner.solve_batch([self.problems[n].problem for n in self.names],
+                                           max_workers=2, use_processes=True))
+        self.check_results(results)
+
+    def test_factory(self):
+        factory = Factory(get_env(), {'examples': ('unified_planning.test.test_batch', 'ExamplesPlanner')})
+        with factory.solve_batch([self.problems[n].problem for n in self.names], name='examples') as batch:
+            results = list(batch)
+        self.check_results(results)
+
+    def test_solve_async(self):
+        planner = ExamplesPlanner(delay=0.05)
+
+        async def solve_all():
+            return await asyncio.gather(*[planner.solve_async(self.problems[n].problem) for n in self.names])
+
+        self.check_results(list(enumerate(asyncio.run(solve_all()))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unified_planning as up
+from unified_planning.shortcuts import *
+from unified_planning.test import TestCase, main
+from unified_planning.io import BinaryWriter, BinaryReader
+from unified_planning.test.examples import get_example_problems
+
+
+class TestBinaryIO(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.problems = get_example_problems()
+
+    def test_examples_io(self):
+        reader = BinaryReader()
+        with tempfile.TemporaryDirectory() as tempdir:
+            for name, example in self.problems.items():
+                problem = example.problem
+                filename = os.path.join(tempdir, f'{name}.upb')
+                BinaryWriter(problem).write_problem(filename)
+                parsed_problem = reader.read_problem(filename)
+                self.assertEqual(problem, parsed_problem)
+                self.assertEqual(str(problem), str(parsed_problem))
+                self.assertEqual(problem.kind, parsed_problem.kind)
+                self.assertEqual(problem.fingerprint, parsed_problem.fingerprint)
+
+    def test_lazy_loading(self):
+        problem = self.problems['robot_loader_adv'].problem
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, 'problem.upb')
+            BinaryWriter(problem).write_problem(filename)
+            with BinaryReader().open(filename) as problem_file:
+                self.assertEqual(problem_file.name, problem.name)
+                self.assertEqual(problem_file.action_names, [a.name for a in problem.actions])
+                # Only the accessed action and its expressions are decoded
+                action = problem_file.action('unload')
+                self.assertEqual(action, problem.action('unload'))
+                self.assertEqual(sum(a is not None for a in problem_file._actions), 1)
+                self.assertIn(None, problem_file._nodes)
+                self.assertIs(problem_file.action('unload'), action)
+                self.assertEqual(problem_file.goals, problem.goals)
+                parsed_problem = problem_file.problem
+                # The problem shares the actions already decoded
+                self.assertIs(parsed_problem.action('unload'), action)
+            self.assertEqual(problem, parsed_problem)
+
+            with open(filename, 'wb') as f:
+                f.write(b'(define (problem p))')
+            with self.assertRaises(up.exceptions.UPValueError):
+                BinaryReader().open(filename)
+
+    def test_unsupported(self):
+        problem = self.problems['robot'].problem.clone()
+        problem.action('move').set_simulated_effect(up.model.SimulatedEffect([], lambda problem, state, parameters: []))
+        with self.assertRaises(up.exceptions.UPUnsupportedProblemTypeError):
+            BinaryWriter(problem).get_problem()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import os
+import tempfile
+from itertools import islice, product
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.exceptions import UPUsageError
@@ -6,6 +8,10 @@ from unified_planning.model.problem_kind import basic_classical_kind, classical_
 from unified_planning.test import TestCase, skipIfNoPlanValidatorForProblemKind, skipIfNoOneshotPlannerForProblemKind, skipIfSolverNotAvailable
 from unified_planning.test.examples import get_example_problems
 from unified_planning.transformers import Grounder as TransformersGrounder
+from unified_planning.transformers.grounder import _product_slice
+from unified_planning.solvers.reachability_grounder import reachable_groundings
+from unified_planning.plan import ActionInstance
+from unified_planning.io import PDDLWriter
 
 
 class TestGrounder(TestCase):
@@ -48,6 +54,147 @@ class TestGrounder(TestCase):
             with PlanValidator(problem_kind=problem.kind) as pv:
                 self.assertTrue(pv.validate(problem, plan))
 
+    def test_parallel(self):
+        for example in ['robot_locations_connected', 'robot_loader_adv', 'matchcellar']:
+            problem = self.problems[example].problem
+            gro = TransformersGrounder(problem)
+            grounded_problem = gro.get_rewritten_problem()
+            par_gro = TransformersGrounder(problem, processes=2, chunk_size=3)
+            par_grounded_problem = par_gro.get_rewritten_problem()
+            self.assertEqual([a.name for a in grounded_problem.actions], [a.name for a in par_grounded_problem.actions])
+            self.assertEqual(grounded_problem, par_grounded_problem)
+            back_map = gro.get_rewrite_back_map()
+            for a, (original_action, params) in par_gro.get_rewrite_back_map().items():
+                self.assertEqual(back_map[grounded_problem.action(a.name)], (original_action, params))
+        with Grounder(name='up_grounder', params={'processes': 2}) as grounder:
+            ground_result = grounder.ground(problem)
+            self.assertEqual(ground_result.problem, par_grounded_problem)
+        # The chunks of the product of the domains start from their first tuple
+        items_list = [[1, 2, 3], [4, 5], [6, 7, 8, 9]]
+        for start, stop in [(0, None), (5, 11), (7, 100), (23, None), (24, None)]:
+            self.assertEqual(list(_product_slice(items_list, start, stop)), # type: ignore
+                             list(islice(product(*items_list), start, stop)))
+
+    def test_static_preconditions(self):
+        Location = UserType('Location')
+        robot_at = Fluent('robot_at', BoolType(), position=Location)
+        connected = Fluent('connected', BoolType(), l_from=Location, l_to=Location)
+        blocked = Fluent('blocked', BoolType(), position=Location)
+        move = InstantaneousAction('move', l_from=Location, l_to=Location)
+        l_from = move.parameter('l_from')
+        l_to = move.parameter('l_to')
+        move.add_precondition(And(robot_at(l_from), connected(l_from, l_to)))
+        move.add_precondition(Not(blocked(l_to)))
+        move.add_effect(robot_at(l_from), False)
+        move.add_effect(robot_at(l_to), True)
+        problem = Problem('static_preconditions')
+        problem.add_fluent(robot_at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_fluent(blocked, default_initial_value=False)
+        problem.add_action(move)
+        locations = [problem.add_object(f'l{i}', Location) for i in range(20)]
+        for i in range(19):
+            problem.set_initial_value(connected(locations[i + 1], locations[i]), True)
+            problem.set_initial_value(connected(locations[i], locations[i + 1]), True)
+        problem.set_initial_value(blocked(locations[5]), True)
+        problem.set_initial_value(robot_at(locations[0]), True)
+        problem.add_goal(robot_at(locations[19]))
+
+        gro = TransformersGrounder(problem)
+        self.assertEqual(len(list(gro._grounded_params(move))), 36)
+        grounded_problem = gro.get_rewritten_problem()
+        names = [f'move_l{i}_l{j}' for i in range(20) for j in range(20) if abs(i - j) == 1 and j != 5]
+        self.assertEqual(names, [a.name for a in grounded_problem.actions])
+
+    def test_reachability_grounder(self):
+        Location = UserType('Location')
+        robot_at = Fluent('robot_at', BoolType(), position=Location)
+        connected = Fluent('connected', BoolType(), l_from=Location, l_to=Location)
+        move = InstantaneousAction('move', l_from=Location, l_to=Location)
+        l_from = move.parameter('l_from')
+        l_to = move.parameter('l_to')
+        move.add_precondition(robot_at(l_from))
+        move.add_precondition(connected(l_from, l_to))
+        move.add_precondition(Not(Equals(l_from, l_to)))
+        move.add_effect(robot_at(l_from), False)
+        move.add_effect(robot_at(l_to), True)
+        problem = Problem('reachability')
+        problem.add_fluent(robot_at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_action(move)
+        locations = [problem.add_object(f'l{i}', Location) for i in range(6)]
+        # l0 -> l1 -> l2 and l3 -> l4 -> l5 -> l3, with l3, l4 and l5 not reachable from l0
+        for i, j in [(0, 1), (1, 2), (3, 4), (4, 5), (5, 3), (2, 2)]:
+            problem.set_initial_value(connected(locations[i], locations[j]), True)
+        problem.set_initial_value(robot_at(locations[0]), True)
+        problem.add_goal(robot_at(locations[2]))
+
+        grounding_actions_map = reachable_groundings(problem)
+        l0, l1, l2 = [ObjectExp(l) for l in locations[:3]]
+        self.assertEqual(grounding_actions_map[move], [(l0, l1), (l1, l2)])
+
+        with Grounder(name='up_reachability_grounder') as grounder:
+            ground_result = grounder.ground(problem)
+            grounded_problem = ground_result.problem
+            self.assertEqual(['move_l0_l1', 'move_l1_l2'], [a.name for a in grounded_problem.actions])
+            ai = ActionInstance(grounded_problem.action('move_l1_l2'))
+            self.assertEqual(ground_result.lift_action_instance(ai).actual_parameters, (l1, l2))
+
+        for example in ['robot_loader_adv', 'matchcellar', 'hierarchical_blocks_world']:
+            problem = self.problems[example].problem
+            grounded_problem = TransformersGrounder(problem).get_rewritten_problem()
+            reachable_problem = TransformersGrounder(problem, grounding_actions_map=reachable_groundings(problem)).get_rewritten_problem()
+            self.assertEqual(grounded_problem, reachable_problem)
+
+    def test_ground_actions(self):
+        for example in ['robot_loader_adv', 'matchcellar', 'hierarchical_blocks_world', 'robot_locations_connected']:
+            problem = self.problems[example].problem
+            gro = TransformersGrounder(problem)
+            grounded_problem = gro.get_rewritten_problem()
+            with Grounder(name='up_grounder') as grounder:
+                triples = list(grounder.ground_actions(problem))
+            self.assertEqual([a.name for a in grounded_problem.actions], [a.name for a, _, _ in triples])
+            trace_back_map = gro.get_rewrite_back_map()
+            for grounded_action, original_action, params in triples:
+                self.assertEqual(grounded_problem.action(grounded_action.name), grounded_action)
+                self.assertEqual(trace_back_map[grounded_problem.action(grounded_action.name)], (original_action, params))
+
+            with tempfile.TemporaryDirectory() as tempdir:
+                streamed_filename = os.path.join(tempdir, 'streamed_domain.pddl')
+                domain_filename = os.path.join(tempdir, 'domain.pddl')
+                actions = (a for a, _, _ in TransformersGrounder(problem).ground_actions())
+                PDDLWriter(problem).write_domain_with_actions(streamed_filename, actions)
+                grounded_problem.name = problem.name
+                PDDLWriter(grounded_problem).write_domain(domain_filename)
+                with open(streamed_filename) as streamed_domain, open(domain_filename) as domain:
+                    # the requirements are the ones of the original problem
+                    streamed_lines = [l for l in streamed_domain if ':requirements' not in l]
+                    lines = [l for l in domain if ':requirements' not in l]
+                    self.assertEqual(streamed_lines, lines)
+
+    def test_fresh_names(self):
+        Location = UserType('Location')
+        at = Fluent('at', BoolType(), position=Location)
+        move = InstantaneousAction('move', l_from=Location, l_to=Location)
+        move.add_precondition(at(move.parameter('l_from')))
+        move.add_effect(at(move.parameter('l_to')), True)
+        problem = Problem('fresh_names')
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_fluent('move_l0_l1', BoolType(), default_initial_value=False)
+        problem.add_action(move)
+        problem.add_objects([Object('l0', Location), Object('l1', Location)])
+        names = ['move_l0_l0', 'move_l0_l1_0', 'move_l1_l0', 'move_l1_l1']
+        self.assertEqual(names, [a.name for a in TransformersGrounder(problem).get_rewritten_problem().actions])
+        self.assertEqual(names, [a.name for a, _, _ in TransformersGrounder(problem).ground_actions()])
+        # the joined names of different groundings are equal when the names contain underscores
+        problem.add_objects([Object('l0_l1', Location), Object('l1_l0', Location)])
+        names = [a.name for a in TransformersGrounder(problem).get_rewritten_problem().actions]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn('move_l0_l1_l0_0', names)
+        self.assertEqual(names, [a.name for a, _, _ in TransformersGrounder(problem).ground_actions()])
+        par_gro = TransformersGrounder(problem, processes=2, chunk_size=3)
+        self.assertEqual(names, [a.name for a in par_gro.get_rewritten_problem().actions])
+
     @skipIfNoOneshotPlannerForProblemKind(classical_kind.union(full_numeric_kind))
     @skipIfNoPlanValidatorForProblemKind(classical_kind.union(full_numeric_kind))
     def test_robot_locations_connected(self):
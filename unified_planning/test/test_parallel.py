@@ -0,0 +1,194 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import tempfile
+import time
+import unified_planning as up
+from unified_planning.shortcuts import *
+from unified_planning.solvers import Parallel, PlanGenerationResult, PlanGenerationResultStatus, PortfolioHistory
+from unified_planning.solvers.results import POSITIVE_OUTCOMES
+from unified_planning.test import TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class ExamplePlanner(up.solvers.Solver):
+    '''A planner that returns, after the given delay, the plan of the example
+    problem with the same name of the solved problem.'''
+    def __init__(self, **options):
+        self._delay = float(options.get('delay', 0))
+        self._work = float(options.get('work', 0))
+        self._intermediate = options.get('intermediate', [])
+        self._status = PlanGenerationResultStatus[options.get('status', 'SOLVED_OPTIMALLY')]
+
+    @property
+    def name(self):
+        return 'example'
+
+    @staticmethod
+    def is_oneshot_planner():
+        return True
+
+    @staticmethod
+    def supports(problem_kind):
+        return True
+
+    def solve(self, problem, callback=None, timeout=None, output_stream=None):
+        if callback is not None:
+            # Intermediate plans with the given lengths
+            action = problem.normalize_plan(get_example_problems()[problem.name].plan).actions[0]
+            for length in self._intermediate:
+                plan = up.plan.SequentialPlan([action] * length)
+                callback(PlanGenerationResult(PlanGenerationResultStatus.INTERMEDIATE, plan, self.name))
+        time.sleep(self._delay)
+        start = time.process_time()
+        while time.process_time() - start < self._work:
+            pass
+        plan = None
+        if self._status in POSITIVE_OUTCOMES:
+            plan = problem.normalize_plan(get_example_problems()[problem.name].plan)
+        return PlanGenerationResult(self._status, plan, self.name, metrics={'pid': str(os.getpid())})
+
+    def destroy(self):
+        pass
+
+
+class TestParallel(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.problems = get_example_problems()
+
+    def test_shared_memory(self):
+        problem, plan = self.problems['robot_loader'].problem, self.problems['robot_loader'].plan
+        for persistent in [False, True]:
+            with Parallel([(ExamplePlanner, {'delay': 0.5}), (ExamplePlanner, {})],
+                          shared_memory=True, persistent=persistent) as planner:
+                res = planner.solve(problem)
+                self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_OPTIMALLY)
+                self.assertEqual(res.plan, plan)
+                # The actions of the plan are the ones of the given problem
+                for ai in res.plan.actions:
+                    self.assertIs(ai.action, problem.action(ai.action.name))
+
+    def test_persistent(self):
+        problem = self.problems['robot'].problem
+        planners = [(ExamplePlanner, {'status': 'SOLVED_SATISFICING'}), (ExamplePlanner, {'status': 'SOLVED_SATISFICING'})]
+        with Parallel(planners, persistent=True) as planner:
+            pids = set()
+            for _ in range(4):
+                res = planner.solve(problem)
+                self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+                self.assertEqual(res.plan, self.problems['robot'].plan)
+                pids.add(res.metrics['pid'])
+            # The same two workers solved all the problems
+            self.assertLessEqual(len(pids), 2)
+        with Parallel(planners) as planner:
+            pids = set(planner.solve(problem).metrics['pid'] for _ in range(4))
+            self.assertEqual(len(pids), 4)
+
+        # The worker of the slower solver is terminated, and all the workers are restarted
+        planners = [(ExamplePlanner, {}), (ExamplePlanner, {'delay': 30})]
+        start = time.time()
+        with Parallel(planners, persistent=True) as planner:
+            pids = set()
+            for _ in range(3):
+                res = planner.solve(problem)
+                self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_OPTIMALLY)
+                pids.add(res.metrics['pid'])
+                self.assertEqual(planner._workers, [None, None])
+            self.assertEqual(len(pids), 3)
+        self.assertLess(time.time() - start, 10)
+
+    def test_portfolio(self):
+        problem = self.problems['robot'].problem
+        # A sequential portfolio, where the first solver exceeds its budget
+        planners = [(ExamplePlanner, {'delay': 30}), (ExamplePlanner, {})]
+        start = time.time()
+        with Parallel(planners, max_concurrency=1, budgets=[0.5, None]) as planner:
+            res = planner.solve(problem)
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_OPTIMALLY)
+        self.assertLess(time.time() - start, 10)
+
+        # Interleaved slices: both solvers need 0.5 seconds of CPU and get it
+        planners = [(ExamplePlanner, {'work': 0.5, 'status': 'SOLVED_SATISFICING'}),
+                    (ExamplePlanner, {'work': 0.5, 'status': 'UNSOLVABLE_INCOMPLETELY'})]
+        with Parallel(planners, max_concurrency=1, time_slice=0.1) as planner:
+            res = planner.solve(problem)
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            self.assertEqual(len(res.log_messages), 2)
+        # The second solver, without a plan and that can not end first, is stopped by the first one
+        planners = [(ExamplePlanner, {'work': 0.1, 'status': 'SOLVED_SATISFICING'}),
+                    (ExamplePlanner, {'delay': 30, 'status': 'UNSOLVABLE_INCOMPLETELY'})]
+        start = time.time()
+        with Parallel(planners, max_concurrency=1, time_slice=0.1, cancel_dominated=True) as planner:
+            res = planner.solve(problem)
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            self.assertEqual(len(res.log_messages), 1)
+        self.assertLess(time.time() - start, 10)
+
+        with self.assertRaises(up.exceptions.UPUsageError):
+            Parallel(planners, budgets=[1])
+
+    def test_history(self):
+        problem = self.problems['robot'].problem
+        planners = [(ExamplePlanner, {'status': 'UNSOLVABLE_INCOMPLETELY'}), (ExamplePlanner, {'status': 'SOLVED_SATISFICING'})]
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'history.json')
+            with Parallel(planners, history=PortfolioHistory(path)) as planner:
+                planner.solve(problem)
+            history = PortfolioHistory(path)
+            keys = [Parallel(planners).solver_key(i) for i in range(2)]
+            self.assertEqual(history.order(problem.kind, keys), [1, 0])
+            self.assertGreater(history.success_rate(problem.kind, keys[1]), history.success_rate(problem.kind, keys[0]))
+
+        # The runs stopped by their budget are recorded as unsolved, with their activity
+        planners = [(ExamplePlanner, {'delay': 30}), (ExamplePlanner, {'delay': 0.1})]
+        history = PortfolioHistory()
+        with Parallel(planners, max_concurrency=1, budgets=[0.5, None], history=history) as planner:
+            self.assertEqual(planner.solve(problem).status, PlanGenerationResultStatus.SOLVED_OPTIMALLY)
+            keys = [planner.solver_key(i) for i in range(2)]
+        self.assertEqual(history.success_rate(problem.kind, keys[0]), 1 / 3)
+        self.assertGreaterEqual(history.average_time(problem.kind, keys[0]), 0.5)
+        self.assertEqual(history.success_rate(problem.kind, keys[1]), 2 / 3)
+
+    def test_anytime(self):
+        problem = self.problems['robot'].problem
+        action = self.problems['robot'].plan.actions[0]
+        planners = [(ExamplePlanner, {'intermediate': [5, 3], 'delay': 0.5, 'status': 'TIMEOUT'}),
+                    (ExamplePlanner, {'intermediate': [4], 'delay': 0.5, 'status': 'TIMEOUT'})]
+        for shared_memory in [False, True]:
+            reports = []
+            with Parallel(planners, shared_memory=shared_memory) as planner:
+                res = planner.solve(problem, callback=reports.append)
+            self.assertEqual(sorted(len(r.plan.actions) for r in reports), [3, 4, 5])
+            for r in reports:
+                self.assertEqual(r.status, PlanGenerationResultStatus.INTERMEDIATE)
+                self.assertIs(r.plan.actions[0].action, problem.action(action.action.name))
+            # The best intermediate plan is returned
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            self.assertEqual(len(res.plan.actions), 3)
+
+        planners = [(ExamplePlanner, {'intermediate': [5, 2], 'delay': 30, 'status': 'TIMEOUT'}),
+                    (ExamplePlanner, {'delay': 30, 'status': 'TIMEOUT'})]
+        start = time.time()
+        with Parallel(planners, quality_target=2) as planner:
+            res = planner.solve(problem, callback=lambda r: None)
+        self.assertLess(time.time() - start, 10)
+        self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+        self.assertEqual(len(res.plan.actions), 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -289,6 +289,99 @@ class TestPddlIO(TestCase):
         self.assertEqual(2, len(problem.method("m-drive-to-via").subtasks))
         self.assertEqual(2, len(problem.task_network.subtasks))
 
+    def test_streaming_reader(self):
+        reader = PDDLReader()
+        streaming_reader = PDDLReader(backend='streaming')
+        for name in ['depot', 'counters', 'sailing', 'matchcellar', 'visit_costs']:
+            domain_filename = os.path.join(PDDL_DOMAINS_PATH, name, 'domain.pddl')
+            problem_filename = os.path.join(PDDL_DOMAINS_PATH, name, 'problem.pddl')
+            problem = reader.parse_problem(domain_filename, problem_filename)
+            streamed_problem = streaming_reader.parse_problem(domain_filename, problem_filename)
+            self.assertEqual(problem, streamed_problem)
+            self.assertEqual(str(problem), str(streamed_problem))
+            self.assertEqual(str(reader.parse_problem(domain_filename)), str(streaming_reader.parse_problem(domain_filename)))
+
+        domain_filename = os.path.join(PDDL_DOMAINS_PATH, 'htn-transport', 'domain.hddl')
+        problem_filename = os.path.join(PDDL_DOMAINS_PATH, 'htn-transport', 'problem.hddl')
+        problem = streaming_reader.parse_problem(domain_filename, problem_filename)
+        assert isinstance(problem, up.model.htn.HierarchicalProblem)
+        self.assertEqual(["deliver", "get-to", "load", "unload"], [task.name for task in problem.tasks])
+        self.assertEqual(2, len(problem.task_network.subtasks))
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            problem_filename = os.path.join(tempdir, 'problem.pddl')
+            with open(problem_filename, 'w') as f:
+                f.write('(define (problem p) (:domain depot) (:init (clear')
+            with self.assertRaises(SyntaxError):
+                streaming_reader.parse_problem(os.path.join(PDDL_DOMAINS_PATH, 'depot', 'domain.pddl'), problem_filename)
+        with self.assertRaises(up.exceptions.UPUsageError):
+            PDDLReader(backend='unknown')
+
+    def test_quantifiers_reader(self):
+        domain = '''(define (domain q)
+ (:types t)
+ (:predicates (p ?x - t) (r ?x - t ?y - t))
+ (:action a
+  :parameters (?z - t)
+  :precondition (and (forall (?x - t) (p ?x)) (exists (?x ?y -t) (r ?x ?y)) (exists (?x - t) (r ?x ?z)))
+  :effect (p ?z)))'''
+        with tempfile.TemporaryDirectory() as tempdir:
+            domain_filename = os.path.join(tempdir, 'domain.pddl')
+            with open(domain_filename, 'w') as f:
+                f.write(domain)
+            for backend in ['pyparsing', 'streaming']:
+                problem = PDDLReader(backend=backend).parse_problem(domain_filename)
+                t = problem.user_type('t')
+                z = problem.action('a').parameter('z')
+                p, r = problem.fluent('p'), problem.fluent('r')
+                x, y = Variable('x', t), Variable('y', t)
+                self.assertEqual(problem.action('a').preconditions,
+                                 [And(Forall(p(x), x), Exists(r(x, y), x, y), Exists(r(x, z), x))])
+
+    def test_parse_problems(self):
+        domain_filename = os.path.join(PDDL_DOMAINS_PATH, 'depot', 'domain.pddl')
+        problem_filename = os.path.join(PDDL_DOMAINS_PATH, 'depot', 'problem.pddl')
+        for backend in ['pyparsing', 'streaming']:
+            reader = PDDLReader(backend=backend)
+            template = reader.parse_domain(domain_filename)
+            problems = [reader.parse_problem_file(template, problem_filename)]
+            problems.extend(reader.parse_problems(template, [problem_filename], max_workers=2))
+            for problem in problems:
+                self.assertEqual(problem, reader.parse_problem(domain_filename, problem_filename))
+                # The elements of the domain are shared
+                for a, domain_a in zip(problem.actions, template.domain.actions):
+                    self.assertIs(a, domain_a)
+                for f, domain_f in zip(problem.fluents, template.domain.fluents):
+                    self.assertIs(f, domain_f)
+            self.assertEqual(len(template.domain.all_objects), 0)
+
+        # The metric of the problems parsed in the pool has the same shape
+        domain_filename = os.path.join(PDDL_DOMAINS_PATH, 'visit_costs', 'domain.pddl')
+        problem_filename = os.path.join(PDDL_DOMAINS_PATH, 'visit_costs', 'problem.pddl')
+        for backend in ['pyparsing', 'streaming']:
+            reader = PDDLReader(backend=backend)
+            problem = reader.parse_problem(domain_filename, problem_filename)
+            for parsed_problem in reader.parse_problems(domain_filename, [problem_filename], max_workers=2):
+                self.assertEqual(parsed_problem, problem)
+                self.assertEqual(str(parsed_problem.quality_metrics), str(problem.quality_metrics))
+
+        # The actions without the total-cost are computed once
+        problem = self.problems['basic_with_costs'].problem
+        with tempfile.TemporaryDirectory() as tempdir:
+            domain_filename = os.path.join(tempdir, 'domain.pddl')
+            problem_filename = os.path.join(tempdir, 'problem.pddl')
+            w = PDDLWriter(problem)
+            w.write_domain(domain_filename)
+            w.write_problem(problem_filename)
+            reader = PDDLReader()
+            problems = reader.parse_problems(domain_filename, [problem_filename, problem_filename])
+            for parsed_problem in problems:
+                self.assertEqual(parsed_problem, reader.parse_problem(domain_filename, problem_filename))
+                self.assertEqual(parsed_problem.quality_metrics[0].costs,
+                                 {parsed_problem.action(a.name): c for a, c in problem.quality_metrics[0].costs.items()})
+            self.assertIs(problems[0].action('a'), problems[1].action('a'))
+            self.assertFalse(problems[0].has_fluent('total-cost'))
+
     def test_examples_io(self):
         for example in self.problems.values():
             problem = example.problem
@@ -306,6 +399,8 @@ class TestPddlIO(TestCase):
 
                 reader = PDDLReader()
                 parsed_problem = reader.parse_problem(domain_filename, problem_filename)
+                streamed_problem = PDDLReader(backend='streaming').parse_problem(domain_filename, problem_filename)
+                self.assertEqual(str(parsed_problem), str(streamed_problem))
 
                 if problem.has_type('object') and problem.kind.has_hierarchical_typing():
                     object_rename: str = 'object'
@@ -364,6 +459,41 @@ class TestPddlIO(TestCase):
             self.assertNotIn('10/3', pddl_txt)
             self.assertIn('3.333333333', pddl_txt)
 
+    def test_domain_reuse(self):
+        problem = self.problems['robot_loader'].problem
+        with tempfile.TemporaryDirectory() as tempdir:
+            domain_filename = os.path.join(tempdir, 'domain.pddl')
+            w = PDDLWriter(problem)
+            w.write_domain(domain_filename)
+            # A problem with the same domain reuses the domain text
+            other_problem = problem.clone()
+            other_problem.clear_goals()
+            w = PDDLWriter(other_problem)
+            self.assertIs(w.get_domain(), PDDLWriter(problem).get_domain())
+            # The domain file is written on every call
+            other_problem.add_fluent('flag', BoolType(), default_initial_value=False)
+            w.write_domain(domain_filename)
+            with open(domain_filename) as f:
+                self.assertIn('(flag)', f.read())
+            with open(domain_filename, 'w') as f:
+                f.write('')
+            w.write_domain(domain_filename)
+            with open(domain_filename) as f:
+                self.assertEqual(f.read(), w.get_domain())
+
+        # The domains with the fluents declared in a different order are written in their order
+        a = Fluent('a')
+        b = Fluent('b')
+        problem_ab = Problem('order')
+        problem_ab.add_fluent(a, default_initial_value=False)
+        problem_ab.add_fluent(b, default_initial_value=False)
+        problem_ba = Problem('order')
+        problem_ba.add_fluent(b, default_initial_value=False)
+        problem_ba.add_fluent(a, default_initial_value=False)
+        self.assertEqual(problem_ab.domain_fingerprint, problem_ba.domain_fingerprint)
+        self.assertIn('(a) (b)', PDDLWriter(problem_ab).get_domain())
+        self.assertIn('(b) (a)', PDDLWriter(problem_ba).get_domain())
+
 def _is_same_user_type_considering_object_renaming(original_type: unified_planning.model.Type,
                                                     tested_type: unified_planning.model.Type,
                                                     object_rename: str) -> bool:
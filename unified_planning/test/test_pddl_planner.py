@@ -14,6 +14,12 @@
 #
 
 
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 import unified_planning as up
 from unified_planning.shortcuts import *
@@ -23,6 +29,29 @@ from unified_planning.test.examples import get_example_problems
 
 VERYSMALL_TIMEOUT=0.0001
 
+
+class ScriptedPDDLSolver(up.solvers.PDDLSolver):
+    '''A PDDL solver running a python script that writes the plan "(a)".'''
+    def __init__(self, delay=0.05, **options):
+        up.solvers.PDDLSolver.__init__(self, **options)
+        self.domain_files = []
+        self.delay = delay
+
+    @property
+    def name(self):
+        return 'scripted'
+
+    def _get_cmd(self, domain_filename, problem_filename, plan_filename):
+        self.domain_files.append((domain_filename, os.stat(domain_filename).st_mtime_ns))
+        script = 'import sys, time; time.sleep(float(sys.argv[2])); open(sys.argv[1], "w").write("(a)\\n")'
+        return [sys.executable, '-c', script, plan_filename, str(self.delay)]
+
+    def _result_status(self, problem, plan):
+        if plan is None:
+            return PlanGenerationResultStatus.UNSOLVABLE_PROVEN
+        return PlanGenerationResultStatus.SOLVED_SATISFICING
+
+
 class TestPDDLPlanner(TestCase):
     def setUp(self):
         TestCase.setUp(self)
@@ -267,3 +296,90 @@ class TestPDDLPlanner(TestCase):
                 else:
                     self.assertEqual(lm.level, up.solvers.LogLevel.ERROR)
                     self.assertEqual(lm.message, '')
+
+    def test_pooled_solver(self):
+        problem = self.problems['basic'].problem
+        a = problem.action('a')
+        planner = ScriptedPDDLSolver(pool_size=2)
+        scratch_dir = planner.scratch_dir
+        self.assertTrue(os.path.isdir(scratch_dir))
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(planner.solve, [problem] * 8))
+        for res in results:
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            self.assertEqual(len(res.plan.actions), 1)
+            self.assertEqual(res.plan.actions[0].action, a)
+        # The domain file of each slot is written once
+        self.assertEqual(len(planner.domain_files), 8)
+        self.assertLessEqual(len(set(planner.domain_files)), 2)
+        planner.destroy()
+        self.assertFalse(os.path.exists(scratch_dir))
+
+        with self.assertRaises(up.exceptions.UPUsageError):
+            ScriptedPDDLSolver(pool_size=0)
+
+    def test_solve_async(self):
+        problem = self.problems['basic'].problem
+        a = problem.action('a')
+
+        async def solve_all(planner):
+            return await asyncio.gather(*[planner.solve_async(problem) for _ in range(6)])
+
+        for pool_size in [None, 2]:
+            with ScriptedPDDLSolver(pool_size=pool_size) as planner:
+                for res in asyncio.run(solve_all(planner)):
+                    self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+                    self.assertEqual(res.plan.actions[0].action, a)
+                output_stream = StringIO()
+                res = asyncio.run(planner.solve_async(problem, output_stream=output_stream))
+                self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+
+        async def cancel(planner):
+            task = asyncio.ensure_future(planner.solve_async(problem))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with ScriptedPDDLSolver(delay=30, pool_size=1) as planner:
+            start = time.time()
+            res = asyncio.run(planner.solve_async(problem, timeout=0.5))
+            self.assertEqual(res.status, PlanGenerationResultStatus.TIMEOUT)
+            asyncio.run(cancel(planner))
+            self.assertLess(time.time() - start, 10)
+            # The slot of the cancelled call is available again
+            planner.delay = 0
+            res = asyncio.run(planner.solve_async(problem))
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+
+        async def wait_for_slot(planner):
+            # A call waiting for the slot is cancelled, the others get it when it is released
+            waiting = asyncio.ensure_future(planner.solve_async(problem))
+            await asyncio.sleep(0.1)
+            waiting.cancel()
+            return await asyncio.gather(*[planner.solve_async(problem) for _ in range(2)])
+
+        with ScriptedPDDLSolver(delay=0.3, pool_size=1) as planner:
+            # The slot is held by a thread calling solve
+            thread = threading.Thread(target=planner.solve, args=(problem, ))
+            thread.start()
+            time.sleep(0.1)
+            for res in asyncio.run(wait_for_slot(planner)):
+                self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            thread.join()
+            self.assertEqual(len(planner._slots._free), 1)
+
+    def test_plan_parsing(self):
+        problem, plan = self.problems['robot_loader'].problem, self.problems['robot_loader'].plan
+        planner = ScriptedPDDLSolver()
+        text = '\n'.join(['; a plan', '(move l1 l2)', '  ( LOAD l2 )  ', '', '(move L2 l1) ; a comment',
+                          '(unload l1)', '; cost = 4 (unit cost)'])
+        self.assertEqual(planner._plan_from_str(problem, text), plan)
+
+        problem, plan = self.problems['temporal_conditional'].problem, self.problems['temporal_conditional'].plan
+        text = '0.000: (take_ok o1 o2) [3.000]\n1.0: (set_giver o2) [2]\n'
+        self.assertEqual(planner._plan_from_str(problem, text), plan)
+
+        for text in ['(move l1 l3)', '(fly l1 l2)', '0.0 (move l1 l2)', '(move l1 l2) [1]', 'move l1 l2']:
+            with self.assertRaises(up.exceptions.UPException):
+                planner._plan_from_str(self.problems['robot_loader'].problem, text)
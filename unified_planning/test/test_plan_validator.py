@@ -17,7 +17,8 @@ import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.test import TestCase, main
 from unified_planning.test.examples import get_example_problems
-from unified_planning.solvers import SequentialPlanValidator
+from unified_planning.solvers import SequentialPlanValidator, ValidationResultStatus
+from unified_planning.plan import SequentialPlan
 from unified_planning.environment import get_env
 
 class TestProblem(TestCase):
@@ -33,6 +34,30 @@ class TestProblem(TestCase):
             problem, plan = p.problem, p.plan
             self.assertTrue(pv.validate(problem, plan))
 
+    def test_all_compiled(self):
+        pv = SequentialPlanValidator(env=get_env())
+        cpv = SequentialPlanValidator(env=get_env(), compiled=True)
+        for p in self.problems.values():
+            if p.problem.kind.has_continuous_time():
+                continue
+            problem, plan = p.problem, p.plan
+            res = cpv.validate(problem, plan)
+            self.assertEqual(res.status, ValidationResultStatus.VALID)
+            for invalid_plan in [SequentialPlan([]), SequentialPlan(plan.actions[1:])]:
+                expected = pv.validate(problem, invalid_plan)
+                res = cpv.validate(problem, invalid_plan)
+                self.assertEqual(res.status, expected.status)
+                self.assertEqual(res.log_messages, expected.log_messages)
+
+    def test_compiled_modified_problem(self):
+        cpv = SequentialPlanValidator(env=get_env(), compiled=True)
+        problem = self.problems['robot'].problem.clone()
+        plan = self.problems['robot'].plan
+        self.assertEqual(cpv.validate(problem, plan).status, ValidationResultStatus.VALID)
+        # The compiled problem is rebuilt when the problem is modified
+        problem.add_goal(Not(problem.goals[0]))
+        self.assertEqual(cpv.validate(problem, plan).status, ValidationResultStatus.INVALID)
+
     def test_all_from_factory(self):
         with PlanValidator(name='sequential_plan_validator') as pv:
             self.assertEqual(pv.name, 'sequential_plan_validator')
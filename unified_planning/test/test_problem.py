@@ -13,10 +13,13 @@
 # limitations under the License.
 
 
+import pickle
 import unified_planning as up
 from unified_planning.shortcuts import *
 from unified_planning.test import TestCase, main, examples
 from unified_planning.test.examples import get_example_problems
+from unified_planning.model.types import domain_size, domain_item
+from unified_planning.exceptions import UPValueError, UPProblemDefinitionError
 from typing import OrderedDict
 
 
@@ -453,6 +456,218 @@ class TestProblem(TestCase):
                     self.assertEqual(problem.initial_value(distance(locations[i], locations[j])), Int(-1))
                     self.assertEqual(problem.initial_value(cost(locations[i], locations[j])), Int(0))
 
+    def test_initial_values_view(self):
+        Location = UserType('Location')
+        robot_at = Fluent('robot_at', BoolType(), position=Location)
+        distance = Fluent('distance', IntType(), l_from=Location, l_to=Location)
+        l1, l2, l3 = [Object(f'l{i}', Location) for i in range(1, 4)]
+        problem = Problem('initial_values_view')
+        problem.add_fluent(robot_at, default_initial_value=False)
+        problem.add_fluent(distance, default_initial_value=1)
+        problem.add_objects([l1, l2, l3])
+        problem.set_initial_value(robot_at(l2), True)
+        problem.set_initial_value(distance(l1, l1), 0)
+        initial_values = problem.initial_values
+        self.assertEqual(len(initial_values), 3 + 9)
+        self.assertEqual(len(list(initial_values.items())), 3 + 9)
+        self.assertEqual(len(problem.explicit_initial_values), 2)
+        self.assertEqual(list(initial_values)[:2], [robot_at(l2), distance(l1, l1)])
+        self.assertEqual(initial_values[robot_at(l1)], FALSE())
+        self.assertEqual(initial_values[robot_at(l2)], TRUE())
+        self.assertEqual(initial_values[distance(l1, l1)], Int(0))
+        self.assertEqual(initial_values[distance(l3, l1)], Int(1))
+        self.assertIn(distance(l2, l3), initial_values)
+        self.assertNotIn(ObjectExp(l1), initial_values)
+        l4 = Object('l4', Location)
+        self.assertNotIn(robot_at(l4), initial_values)
+        self.assertIsNone(initial_values.get(robot_at(l4), None))
+        self.assertEqual(initial_values.ground_value(distance, (ObjectExp(l1), ObjectExp(l1))), Int(0))
+        self.assertEqual(initial_values.ground_value(distance, (ObjectExp(l2), ObjectExp(l4))), None)
+
+        problem.add_object(l4)
+        self.assertEqual(len(initial_values), 4 + 16)
+        self.assertEqual(initial_values.ground_value(distance, (ObjectExp(l2), ObjectExp(l4))), Int(1))
+        self.assertEqual(initial_values, dict(initial_values.items()))
+        self.assertEqual(problem, problem.clone())
+        self.assertEqual(hash(problem), hash(problem.clone()))
+
+    def test_typed_objects(self):
+        Location = UserType('Location')
+        Room = UserType('Room', Location)
+        Hall = UserType('Hall', Location)
+        problem = Problem('typed_objects')
+        r1 = problem.add_object('r1', Room)
+        l1 = problem.add_object('l1', Location)
+        h1 = problem.add_object('h1', Hall)
+        r2 = problem.add_object('r2', Room)
+        self.assertEqual(problem.typed_objects(Location), [r1, l1, h1, r2])
+        self.assertEqual(problem.typed_objects(Room), [r1, r2])
+        self.assertEqual(list(problem.objects(Hall)), [h1])
+        self.assertEqual(problem.typed_objects(UserType('Other')), [])
+        self.assertEqual(problem.object_position(r2, Location), 3)
+        self.assertEqual(problem.object_position(r2, Room), 1)
+        with self.assertRaises(UPValueError):
+            problem.object_position(l1, Room)
+        self.assertEqual(problem.object('h1'), h1)
+        self.assertTrue(problem.has_object('l1'))
+        self.assertFalse(problem.has_object('l2'))
+        with self.assertRaises(UPValueError):
+            problem.object('l2')
+        self.assertEqual(domain_size(problem, Location), 4)
+        self.assertEqual(domain_item(problem, Room, 1), ObjectExp(r2))
+
+        new_problem = problem.clone()
+        h2 = new_problem.add_object('h2', Hall)
+        self.assertEqual(new_problem.typed_objects(Location), [r1, l1, h1, r2, h2])
+        self.assertEqual(problem.typed_objects(Location), [r1, l1, h1, r2])
+        self.assertFalse(problem.has_object('h2'))
+
+    def test_domain_size(self):
+        problem = Problem('domains')
+        # The int domains include both bounds
+        self.assertEqual(domain_size(problem, IntType(0, 2)), 3)
+        self.assertEqual(domain_size(problem, IntType(-1, -1)), 1)
+        self.assertEqual([domain_item(problem, IntType(0, 2), i) for i in range(3)], [Int(0), Int(1), Int(2)])
+        self.assertEqual(domain_size(problem, BoolType()), 2)
+        with self.assertRaises(UPProblemDefinitionError):
+            domain_size(problem, IntType(0))
+
+    def test_names(self):
+        problem = self.problems['robot_loader_adv'].problem.clone()
+        for name in ['robot_at', 'move', 'Location', 'l1']:
+            self.assertTrue(problem.has_name(name))
+        self.assertFalse(problem.has_name('l4'))
+        self.assertEqual(problem.fluent('cargo_at').name, 'cargo_at')
+        self.assertEqual(problem.user_type('Robot').name, 'Robot') # type: ignore
+        with self.assertRaises(UPValueError):
+            problem.fluent('l1')
+        with self.assertRaises(UPValueError):
+            problem.user_type('l1')
+        with self.assertRaises(UPProblemDefinitionError):
+            problem.add_fluent('move', BoolType())
+        move = problem.action('move')
+        move.name = 'new_move'
+        self.assertFalse(problem.has_action('move'))
+        self.assertFalse(problem.has_name('move'))
+        self.assertEqual(problem.action('new_move'), move)
+        shared_problem = problem.share_domain()
+        pickled_problem = pickle.loads(pickle.dumps(problem))
+        move.name = 'move'
+        self.assertTrue(shared_problem.has_action('move'))
+        self.assertFalse(shared_problem.has_action('new_move'))
+        pickled_move = pickled_problem.action('new_move')
+        pickled_move.name = 'move'
+        self.assertIs(pickled_problem.action('move'), pickled_move)
+        self.assertIs(problem.action('move'), move)
+        problem.clear_actions()
+        self.assertFalse(problem.has_name('move'))
+        move.name = 'new_move'
+        self.assertFalse(problem.has_name('new_move'))
+        cargo_at = problem.fluent('cargo_at')
+        fingerprint = problem.fingerprint
+        problem.remove_fluent(cargo_at)
+        self.assertFalse(problem.has_fluent('cargo_at'))
+        self.assertNotIn(cargo_at, problem.fluents)
+        self.assertTrue(all(f.fluent() != cargo_at for f in problem.explicit_initial_values))
+        self.assertNotEqual(problem.fingerprint, fingerprint)
+        with self.assertRaises(UPValueError):
+            problem.remove_fluent(cargo_at)
+
+    def test_share_domain(self):
+        problem = self.problems['robot_loader_adv'].problem
+        new_problem = problem.share_domain()
+        self.assertEqual(new_problem.name, problem.name)
+        self.assertEqual(new_problem.fluents, problem.fluents)
+        self.assertEqual(new_problem.user_types, problem.user_types)
+        self.assertEqual(new_problem.all_objects, problem.all_objects)
+        for a, new_a in zip(problem.actions, new_problem.actions):
+            self.assertIs(a, new_a)
+        self.assertEqual(len(new_problem.explicit_initial_values), 0)
+        self.assertEqual(len(new_problem.goals), 0)
+        new_problem.add_object('l5', problem.user_type('Location'))
+        self.assertFalse(problem.has_object('l5'))
+
+    def test_incremental_kind(self):
+        x = Fluent('x', IntType())
+        a = InstantaneousAction('a')
+        a.add_effect(x, 1)
+        problem = Problem('incremental_kind')
+        problem.add_fluent(x, default_initial_value=0)
+        problem.add_action(a)
+        kind = problem.kind
+        self.assertTrue(kind.has_numeric_fluents())
+        self.assertFalse(kind.has_increase_effects())
+        kind.set_time('CONTINUOUS_TIME')
+        self.assertFalse(problem.kind.has_continuous_time())
+        a.add_increase_effect(x, 1)
+        self.assertTrue(problem.kind.has_increase_effects())
+        b = InstantaneousAction('b')
+        b.add_precondition(Not(Equals(x, 2)))
+        problem.add_action(b)
+        self.assertTrue(problem.kind.has_negative_conditions())
+        problem.add_goal(Or(Equals(x, 3), Equals(x, 4)))
+        self.assertTrue(problem.kind.has_disjunctive_conditions())
+        problem.add_timed_effect(GlobalStartTiming(5), x, 5)
+        self.assertTrue(problem.kind.has_timed_effect())
+        problem.clear_goals()
+        self.assertFalse(problem.kind.has_disjunctive_conditions())
+        problem.clear_actions()
+        self.assertFalse(problem.kind.has_increase_effects())
+        problem.clear_timed_effects()
+        self.assertFalse(problem.kind.has_timed_effect())
+        for example in self.problems.values():
+            problem = example.problem
+            kind = problem.kind
+            problem._kind = None
+            self.assertEqual(kind, problem.kind)
+
+    def test_fingerprint(self):
+        fingerprints = set()
+        other_problems = get_example_problems()
+        for name, example in self.problems.items():
+            problem = example.problem
+            self.assertEqual(problem.fingerprint, problem.clone().fingerprint)
+            self.assertEqual(problem.fingerprint, other_problems[name].problem.fingerprint)
+            fingerprints.add(problem.fingerprint)
+        self.assertEqual(len(fingerprints), len(self.problems))
+
+        Location = UserType('Location')
+        visited = Fluent('visited', BoolType(), position=Location)
+        def visited_problem(default, initial_values):
+            problem = Problem('visited')
+            problem.add_fluent(visited, default_initial_value=default)
+            locations = [problem.add_object(f'l{i}', Location) for i in range(3)]
+            for i, v in initial_values:
+                problem.set_initial_value(visited(locations[i]), v)
+            return problem
+        problem = visited_problem(False, [(1, True)])
+        same_problems = [visited_problem(None, [(2, False), (1, True), (0, False)]),
+                         visited_problem(True, [(0, False), (2, False)])]
+        for oth in same_problems:
+            self.assertEqual(problem.fingerprint, oth.fingerprint)
+            self.assertEqual(problem, oth)
+        fingerprint = problem.fingerprint
+        problem.set_initial_value(visited(problem.object('l1')), False)
+        self.assertNotEqual(fingerprint, problem.fingerprint)
+        self.assertEqual(problem.fingerprint, visited_problem(False, []).fingerprint)
+        visit = InstantaneousAction('visit', position=Location)
+        problem.add_action(visit)
+        fingerprint = problem.fingerprint
+        domain_fingerprint = problem.domain_fingerprint
+        visit.add_effect(visited(visit.parameter('position')), True)
+        self.assertNotEqual(fingerprint, problem.fingerprint)
+        self.assertNotEqual(domain_fingerprint, problem.domain_fingerprint)
+        cloned_problem = problem.clone()
+        problem.add_goal(visited(problem.object('l2')))
+        self.assertNotEqual(problem.fingerprint, cloned_problem.fingerprint)
+        # The goals, the objects and the initial values are not part of the domain
+        other_problem = cloned_problem.clone()
+        other_problem.add_object('l3', Location)
+        self.assertEqual(problem.domain_fingerprint, other_problem.domain_fingerprint)
+        self.assertNotEqual(problem, cloned_problem)
+        problem.clear_goals()
+        self.assertEqual(hash(problem), hash(cloned_problem))
+
     def test_htn_problem_creation(self):
         problems = examples.hierarchical.get_example_problems()
         problem = problems['htn-go']
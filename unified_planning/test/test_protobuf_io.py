@@ -273,6 +273,26 @@ class TestProtobufProblems(TestCase):
 
             self.assertEqual(problem, problem_up)
 
+    def test_expression_table(self):
+        pb_writer = ProtobufWriter(expression_table=True)
+        for name, example in self.problems.items():
+            problem = example.problem
+            problem_pb = pb_writer.convert(problem)
+            problem_up = self.pb_reader.convert(problem_pb)
+
+            self.assertEqual(problem, problem_up)
+            self.assertLessEqual(problem_pb.ByteSize(), self.pb_writer.convert(problem).ByteSize())
+
+        # Every distinct expression is encoded once
+        problem = self.problems["hierarchical_blocks_world"].problem
+        with Grounder(name="up_grounder") as grounder:
+            grounded_problem = grounder.ground(problem).problem
+        problem_pb = pb_writer.convert(grounded_problem)
+        nodes = [n.SerializeToString() for n in problem_pb.expression_table.nodes]
+        self.assertEqual(len(nodes), len(set(nodes)))
+        self.assertLess(2 * problem_pb.ByteSize(), self.pb_writer.convert(grounded_problem).ByteSize())
+        self.assertEqual(grounded_problem, self.pb_reader.convert(problem_pb))
+
     def test_all_plans(self):
         for name, example in self.problems.items():
             problem = example.problem
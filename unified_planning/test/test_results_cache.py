@@ -0,0 +1,122 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import tempfile
+import unified_planning as up
+from unified_planning.shortcuts import *
+from unified_planning.solvers import Factory, PlanGenerationResult, PlanGenerationResultStatus
+from unified_planning.solvers import ResultsCache, CachedSolver
+from unified_planning.test import TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class CountingPlanner(up.solvers.Solver):
+    '''A planner that returns the plans of the example problems and counts its calls.'''
+    calls = 0
+
+    def __init__(self, **options):
+        self._plans = {e.problem: e.plan for e in get_example_problems().values()}
+
+    @property
+    def name(self):
+        return 'counting'
+
+    @staticmethod
+    def is_oneshot_planner():
+        return True
+
+    @staticmethod
+    def supports(problem_kind):
+        return True
+
+    def solve(self, problem, callback=None, timeout=None, output_stream=None):
+        CountingPlanner.calls += 1
+        for p, plan in self._plans.items():
+            if p == problem:
+                return PlanGenerationResult(PlanGenerationResultStatus.SOLVED_OPTIMALLY, plan, self.name)
+        return PlanGenerationResult(PlanGenerationResultStatus.UNSOLVABLE_PROVEN, None, self.name)
+
+    def destroy(self):
+        pass
+
+
+class TestResultsCache(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.problems = get_example_problems()
+        CountingPlanner.calls = 0
+
+    def test_cached_results(self):
+        problem, plan = self.problems['robot'].problem, self.problems['robot'].plan
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache = ResultsCache(tempdir)
+            planner = CachedSolver(CountingPlanner(), cache, {'opt': 1})
+            res = planner.solve(problem)
+            self.assertEqual(CountingPlanner.calls, 1)
+            self.assertEqual(len(cache), 1)
+            # An equal problem, in a new cache on the same directory, does not call the planner
+            planner = CachedSolver(CountingPlanner(), ResultsCache(tempdir), {'opt': 1})
+            cached_res = planner.solve(problem.clone())
+            self.assertEqual(CountingPlanner.calls, 1)
+            self.assertEqual(cached_res.status, PlanGenerationResultStatus.SOLVED_OPTIMALLY)
+            self.assertEqual(cached_res.engine_name, 'counting')
+            self.assertEqual(str(cached_res.plan), str(plan))
+            self.assertEqual(str(res.plan), str(cached_res.plan))
+            # Different options do not share results
+            planner = CachedSolver(CountingPlanner(), cache, {'opt': 2})
+            planner.solve(problem)
+            self.assertEqual(CountingPlanner.calls, 2)
+            self.assertEqual(len(cache), 2)
+
+            unsolvable = problem.clone()
+            unsolvable.add_goal(FALSE())
+            res = planner.solve(unsolvable)
+            cached_res = planner.solve(unsolvable)
+            self.assertEqual(CountingPlanner.calls, 3)
+            self.assertEqual(cached_res.status, PlanGenerationResultStatus.UNSOLVABLE_PROVEN)
+            self.assertIsNone(cached_res.plan)
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache = ResultsCache(tempdir, max_entries=2)
+            planner = CachedSolver(CountingPlanner(), cache)
+            names = ['basic', 'robot', 'robot_loader']
+            for name in names:
+                planner.solve(self.problems[name].problem)
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get(self.problems['basic'].problem, 'counting'))
+            self.assertIsNotNone(cache.get(self.problems['robot_loader'].problem, 'counting'))
+            with self.assertRaises(up.exceptions.UPUsageError):
+                ResultsCache(tempdir, max_size=0)
+
+    def test_factory(self):
+        problem = self.problems['basic'].problem
+        factory = Factory(get_env(), {'counting': ('unified_planning.test.test_results_cache', 'CountingPlanner')})
+        with tempfile.TemporaryDirectory() as tempdir:
+            for _ in range(3):
+                with factory.OneshotPlanner(name='counting', cache=tempdir) as planner:
+                    self.assertEqual(planner.name, 'counting')
+                    res = planner.solve(problem)
+                    self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_OPTIMALLY)
+            self.assertEqual(CountingPlanner.calls, 1)
+            # The names of a parallel planner do not require its params
+            with factory.OneshotPlanner(names=['counting', 'counting'], cache=tempdir) as planner:
+                self.assertIsInstance(planner, CachedSolver)
+
+
+if __name__ == "__main__":
+    main()
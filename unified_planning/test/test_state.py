@@ -0,0 +1,102 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unified_planning
+from unified_planning.shortcuts import *
+from unified_planning.exceptions import UPValueError
+from unified_planning.test import TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class TestState(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.problems = get_example_problems()
+
+    def test_initial_state(self):
+        for p in self.problems.values():
+            problem = p.problem
+            index = GroundFluentsIndex(problem)
+            state = index.initial_state()
+            initial_values = problem.initial_values
+            self.assertEqual(index.size, len(initial_values))
+            for f_exp, v in initial_values.items():
+                self.assertEqual(state.get_value(f_exp), v)
+            self.assertEqual(state, index.state(initial_values))
+            self.assertEqual(hash(state), hash(index.state(initial_values)))
+            self.assertEqual(dict(state.items()), initial_values)
+
+    def test_copy_on_write(self):
+        problem = self.problems['robot_loader'].problem
+        index = GroundFluentsIndex(problem)
+        state = index.initial_state()
+        robot_at = problem.fluent('robot_at')
+        cargo_at = problem.fluent('cargo_at')
+        l1 = problem.object('l1')
+        l2 = problem.object('l2')
+        copy = state.copy()
+        self.assertEqual(state, copy)
+        copy.set_value(robot_at(l1), FALSE())
+        copy.set_value(robot_at(l2), TRUE())
+        self.assertNotEqual(state, copy)
+        self.assertTrue(state.get_value(robot_at(l1)).is_true())
+        self.assertTrue(state.get_value(robot_at(l2)).is_false())
+        self.assertTrue(copy.get_value(robot_at(l1)).is_false())
+        self.assertTrue(copy.get_value(robot_at(l2)).is_true())
+        copy.set_value(robot_at(l1), TRUE())
+        copy.set_value(robot_at(l2), FALSE())
+        self.assertEqual(state, copy)
+        self.assertEqual(hash(state), hash(copy))
+        self.assertEqual(state.get_value(cargo_at(l2)), copy.get_value(cargo_at(l2)))
+
+    def test_object_fluents(self):
+        problem = self.problems['robot_fluent_of_user_type'].problem
+        index = GroundFluentsIndex(problem)
+        state = index.initial_state()
+        is_at = problem.fluent('is_at')
+        r1 = problem.object('r1')
+        l1 = problem.object('l1')
+        l2 = problem.object('l2')
+        self.assertEqual(state.get_value(is_at(r1)), ObjectExp(l2))
+        copy = state.copy()
+        copy.set_value(is_at(r1), ObjectExp(l1))
+        self.assertEqual(copy.get_value(is_at(r1)), ObjectExp(l1))
+        self.assertEqual(state.get_value(is_at(r1)), ObjectExp(l2))
+        with self.assertRaises(UPValueError):
+            copy.get_value(is_at(Object('r3', r1.type)))
+
+    def test_int_fluents(self):
+        problem = Problem('counters')
+        bounded = Fluent('bounded', IntType(0, 10))
+        unbounded = Fluent('unbounded', IntType())
+        problem.add_fluent(bounded, default_initial_value=0)
+        index = GroundFluentsIndex(problem)
+        self.assertTrue(index.compact_ints)
+        problem.add_fluent(unbounded, default_initial_value=2**70)
+        index = GroundFluentsIndex(problem)
+        self.assertFalse(index.compact_ints)
+        state = index.initial_state()
+        self.assertEqual(state.get_value(unbounded()), Int(2**70))
+        copy = state.copy()
+        copy.set_value(unbounded(), Int(-2**80))
+        self.assertEqual(copy.get_value(unbounded()), Int(-2**80))
+        self.assertEqual(state.get_value(unbounded()), Int(2**70))
+        copy.set_value(unbounded(), Int(2**70))
+        self.assertEqual(state, copy)
+        self.assertEqual(hash(state), hash(copy))
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,9 @@ class ActionBasedTransformer(Transformer):
         self._problem: Problem = problem
         self._new_problem: Optional[Problem] = None
         self._simplifier = up.walkers.Simplifier(self._env)
+        # The field _fresh_names_counters maps every base name given to get_fresh_name to the
+        # next counter to try, so that the names already returned are not checked again.
+        self._fresh_names_counters: Dict[str, int] = {}
 
     def get_original_action(self, action: Action) -> Action:
         '''After the method get_rewritten_problem is called, this function should
@@ -135,10 +138,11 @@ class ActionBasedTransformer(Transformer):
         assert self._new_problem is not None
         if parameters_names != []:
             raise NotImplementedError
-        count = 0
+        count = self._fresh_names_counters.get(original_name, 0)
         while(True):
             new_name = f'{self._name}_{original_name}_{str(count)}'
             if self._problem.has_name(new_name) or self._new_problem.has_name(new_name):
                 count += 1
             else:
+                self._fresh_names_counters[original_name] = count + 1
                 return new_name
@@ -15,16 +15,20 @@
 """This module defines the grounder class."""
 
 
+import io
+import pickle
 import unified_planning
+from unified_planning.environment import Environment
 from unified_planning.exceptions import UPUsageError, UPProblemDefinitionError
 from unified_planning.plan import Plan
-from unified_planning.model import Problem, Action, Type, Expression, Effect, Parameter, DurativeAction, InstantaneousAction, FNode, SimulatedEffect
-from unified_planning.model.types import domain_size,  domain_item
+from unified_planning.model import Problem, Action, Type, Expression, Effect, Parameter, DurativeAction, InstantaneousAction, FNode, SimulatedEffect, Fluent, Object
+from unified_planning.model.types import domain_size,  domain_item, TIME
 from unified_planning.transformers.ab_transformer import ActionBasedTransformer
 from unified_planning.plan import SequentialPlan, TimeTriggeredPlan, ActionInstance
 from unified_planning.walkers import Substituter
 from itertools import product
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from multiprocessing import Pool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 
 class Grounder(ActionBasedTransformer):
@@ -35,7 +39,8 @@ class Grounder(ActionBasedTransformer):
     but only grounded actions.
     '''
     def __init__(self, problem: Problem, name: str = 'grnd', \
-            grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = None):
+            grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = None, *,
+            processes: int = 1, chunk_size: int = 1000):
         '''This class transforms an unified_planning problem into a grounded problem, with the method
         get_rewritten_problem(). The problem is given at creation time.
         The name is added in front of every grounded action and at the beginning of the problem's name.
@@ -43,7 +48,11 @@ class Grounder(ActionBasedTransformer):
         If the grounding_actions_map is None, the problem is grounded in a combinatorial way, while if
         it is given, it represents a map between an action of the original problem and a list of tuple
         of it's parameters. The resulting problem will have an action for every tuple in the map,
-        obtained by applying the action to the specific parameters of the tuple.'''
+        obtained by applying the action to the specific parameters of the tuple.
+
+        If processes is greater than 1, the parameters tuples of every action are split in chunks of
+        chunk_size tuples, that are grounded by a pool of processes. The resulting problem is the same
+        obtained by the sequential grounding, with the actions in the same order.'''
         ActionBasedTransformer.__init__(self, problem, name)
         if problem.kind.has_hierarchical(): # type: ignore
             raise UPProblemDefinitionError('The grounder does not support hierarchical problems!')
@@ -55,6 +64,16 @@ class Grounder(ActionBasedTransformer):
         #this data structure maps the grounded action with the objects the action grounds
         self._map_parameters: Dict[Action, List[FNode]] = {}
         self._grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = grounding_actions_map
+        if processes < 1 or chunk_size < 1:
+            raise UPUsageError('The grounder processes and chunk_size must be positive!')
+        self._processes = processes
+        self._chunk_size = chunk_size
+        self._static_fluents: Optional[Set[Fluent]] = None
+        self._static_facts: Optional[_StaticFacts] = None
+        #this data structure maps an action to the parameters tuples consistent with its static preconditions
+        self._static_candidates: Dict[Action, Optional[List[Tuple[FNode, ...]]]] = {}
+        #this data structure maps an action to the domains of its parameters
+        self._items_lists: Dict[Action, List[List[FNode]]] = {}
 
     def get_rewrite_back_map(self) -> Dict[Action, Tuple[Action, List[FNode]]]:
         '''Returns a map from an action of the grounded problem to the
@@ -82,54 +101,233 @@ class Grounder(ActionBasedTransformer):
         self._new_problem = self._problem.clone()
         self._new_problem.name = f'{self._name}_{self._problem.name}'
         self._new_problem.clear_actions()
+        names = self._grounded_names()
+        if self._processes > 1:
+            self._ground_in_parallel(names)
+        else:
+            for old_action in self._problem.actions:
+                self._ground_action(old_action, names)
+        return self._new_problem
+
+    def ground_actions(self) -> Iterator[Tuple[Action, Action, List[FNode]]]:
+        '''Returns an iterator over the triples (grounded_action, original_action, parameters),
+        where the grounded_action is obtained applying the parameters to the original_action.
+
+        The grounded actions are the ones of the problem created by get_rewritten_problem(), with
+        the same names and in the same order, but they are created lazily, one at a time, and they
+        are not stored by the grounder: at most their names are kept to give them fresh names.'''
+        names = self._grounded_names()
         for old_action in self._problem.actions:
-            #contains the type of every parameter of the action
-            type_list: List[Type] = [param.type for param in old_action.parameters]
-            #if the action does not have parameters, it does not need to be grounded.
-            if len(type_list) == 0:
-                if self._grounding_actions_map is None or \
-                    self._grounding_actions_map.get(old_action, None) is not None:
-                    new_action = old_action.clone()
-                    self._new_problem.add_action(new_action)
-                    self._new_to_old[new_action] = old_action
-                    self._map_parameters[new_action] = []
-                    self._old_to_new[old_action] = [new_action]
+            for new_action, params in self._fresh_grounded_actions(old_action, self._grounded_actions(old_action), names):
+                yield new_action, old_action, params
+
+    def _grounded_names(self) -> Optional[Set[str]]:
+        '''Returns the set in which the names of the grounded actions are collected to give
+        them fresh names, or None if they do not need to be collected.
+
+        When the grounding is combinatorial and the names of the actions and of the objects
+        do not contain underscores, different groundings are named with different joined
+        names, also after appending a counter to them, so only the names of the original
+        problem must be avoided.'''
+        if self._grounding_actions_map is None and \
+            not any('_' in a.name for a in self._problem.actions) and \
+            not any('_' in o.name for o in self._problem.all_objects):
+            return None
+        return set()
+
+    def _fresh_grounded_actions(self, old_action: Action, grounded_actions: Iterable[Tuple[Action, Tuple[FNode, ...]]],
+                                names: Optional[Set[str]]) -> Iterator[Tuple[Action, List[FNode]]]:
+        '''Gives fresh names to the given grounded derivates of the given action and returns
+        them, together with their parameters, in the same order; the names are fresh with
+        respect to the original problem and to the names collected in the given set.'''
+        em = self._problem.env.expression_manager
+        for new_action, grounded_params in grounded_actions:
+            params = em.auto_promote(grounded_params)
+            if len(params) > 0:
+                new_name = new_action.name
+                count = 0
+                while self._problem.has_name(new_name) or (names is not None and new_name in names):
+                    new_name = f'{new_action.name}_{str(count)}'
+                    count += 1
+                if new_name != new_action.name:
+                    new_action.name = new_name
+                if names is not None:
+                    names.add(new_name)
+            yield new_action, params
+        # the candidates and the domains of an action are not needed anymore once it is grounded
+        self._static_candidates.pop(old_action, None)
+        self._items_lists.pop(old_action, None)
+
+    def _grounded_actions(self, old_action: Action) -> Iterator[Tuple[Action, Tuple[FNode, ...]]]:
+        '''Returns an iterator over the feasible grounded derivates of the given action,
+        together with their parameters tuples.'''
+        #if the action does not have parameters, it does not need to be grounded.
+        if len(old_action.parameters) == 0:
+            if self._grounding_actions_map is None or \
+                self._grounding_actions_map.get(old_action, None) is not None:
+                yield old_action.clone(), tuple()
+            return
+        for grounded_params in self._grounded_params(old_action):
+            new_action = self._create_action_with_given_subs(old_action, self._subs(old_action, grounded_params))
+            #when the action is None it means it is not feasible,
+            # it's conditions are in contraddiction within one another.
+            if new_action is not None:
+                yield new_action, grounded_params
+
+    def _ground_action(self, old_action: Action, names: Optional[Set[str]]):
+        '''Adds to the new problem the grounded derivates of the given action.'''
+        for new_action, params in self._fresh_grounded_actions(old_action, self._grounded_actions(old_action), names):
+            self._add_grounded_action(old_action, new_action, params)
+
+    def _grounded_params(self, old_action: Action, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[FNode, ...]]:
+        '''Returns the parameters tuples of the given action, from the start-th to the stop-th.'''
+        if self._grounding_actions_map is None:
+            # a list containing the list of object in the problem of the given type.
+            # So, if the problem has 2 Locations l1 and l2, and 2 Robots r1 and r2, and
+            # the action move_to takes as parameters a Robot and a Location,
+            # the variable state at this point will be the following:
+            # type_list = [Robot, Location]
+            # objects_list = [[r1, r2], [l1, l2]]
+            # the product of *objects_list will be:
+            # [(r1, l1), (r1, l2), (r2, l1), (r2,l2)]
+            candidates = self._get_static_candidates(old_action)
+            if candidates is not None:
+                return iter(candidates[start:stop])
+            return _product_slice(self._items_list(old_action), start, stop)
+        else:
+            # The grounding_actions_map is not None, therefore it must be used to ground
+            return iter(self._grounding_actions_map[old_action][start:stop])
+
+    def _grounded_params_count(self, old_action: Action) -> int:
+        '''Returns the number of parameters tuples of the given action.'''
+        if self._grounding_actions_map is None:
+            candidates = self._get_static_candidates(old_action)
+            if candidates is not None:
+                return len(candidates)
+            res = 1
+            for param in old_action.parameters:
+                res *= domain_size(self._problem, param.type)
+            return res
+        else:
+            return len(self._grounding_actions_map[old_action])
+
+    def _items_list(self, old_action: Action) -> List[List[FNode]]:
+        '''Returns the domain of every parameter of the given action.'''
+        items_list = self._items_lists.get(old_action, None)
+        if items_list is None:
+            items_list = []
+            for param in old_action.parameters:
+                size = domain_size(self._problem, param.type)
+                items_list.append([domain_item(self._problem, param.type, j) for j in range(size)])
+            self._items_lists[old_action] = items_list
+        return items_list
+
+    def _get_static_candidates(self, old_action: Action) -> Optional[List[Tuple[FNode, ...]]]:
+        '''Returns the parameters tuples of the given action that satisfy its preconditions
+        on the static fluents, in the order of the combinatorial grounding, or None if the
+        action has no such precondition.
+
+        The tuples are enumerated joining the true facts of the static fluents, so the
+        assignments that falsify a static precondition are never generated.'''
+        if old_action in self._static_candidates:
+            return self._static_candidates[old_action]
+        if self._static_fluents is None:
+            self._static_fluents = self._problem.get_static_fluents()
+            self._static_facts = _StaticFacts(self._problem)
+        assert self._static_facts is not None
+        params = {p: i for i, p in enumerate(old_action.parameters)}
+        conditions: List[FNode] = []
+        if isinstance(old_action, InstantaneousAction):
+            conditions.extend(old_action.preconditions)
+        elif isinstance(old_action, DurativeAction):
+            # a static fluent has the same value at every time, so every condition can be used
+            for cl in old_action.conditions.values():
+                conditions.extend(cl)
+        literals: List[Tuple[bool, Fluent, Tuple[Union[int, FNode], ...]]] = []
+        stack = conditions[::-1]
+        while len(stack) > 0:
+            c = stack.pop()
+            if c.is_and():
+                stack.extend(c.args[::-1])
                 continue
-            grounded_params_list: Optional[Iterator[Tuple[FNode, ...]]] = None
-            if self._grounding_actions_map is None:
-                # a list containing the list of object in the problem of the given type.
-                # So, if the problem has 2 Locations l1 and l2, and 2 Robots r1 and r2, and
-                # the action move_to takes as parameters a Robot and a Location,
-                # the variable state at this point will be the following:
-                # type_list = [Robot, Location]
-                # objects_list = [[r1, r2], [l1, l2]]
-                # the product of *objects_list will be:
-                # [(r1, l1), (r1, l2), (r2, l1), (r2,l2)]
-                ground_size = 1
-                domain_sizes = []
-                for t in type_list:
-                    ds = domain_size(self._new_problem, t)
-                    domain_sizes.append(ds)
-                    ground_size *= ds
-                items_list: List[List[FNode]] = []
-                for size, type in zip(domain_sizes, type_list):
-                    items_list.append([domain_item(self._new_problem, type, j) for j in range(size)])
-                grounded_params_list = product(*items_list)
+            positive = not c.is_not()
+            f_exp = c if positive else c.arg(0)
+            if not f_exp.is_fluent_exp() or f_exp.fluent() not in self._static_fluents:
+                continue
+            template: List[Union[int, FNode]] = []
+            for a in f_exp.args:
+                if a.is_parameter_exp():
+                    template.append(params[a.parameter()])
+                elif a.is_constant():
+                    template.append(a)
+                else:
+                    break
             else:
-                # The grounding_actions_map is not None, therefore it must be used to ground
-                grounded_params_list = iter(self._grounding_actions_map[old_action])
-            assert grounded_params_list is not None
-            for grounded_params in grounded_params_list:
-                subs: Dict[Expression, Expression] = dict(zip(old_action.parameters, list(grounded_params)))
-                new_action = self._create_action_with_given_subs(old_action, subs)
-                #when the action is None it means it is not feasible,
-                # it's conditions are in contraddiction within one another.
-                if new_action is not None:
-                    self._map_parameters[new_action] = self._new_problem.env.expression_manager.auto_promote(subs.values())
-                    self._new_problem.add_action(new_action)
-                    self._new_to_old[new_action] = old_action
-                    self._map_old_to_new_action(old_action, new_action)
-        return self._new_problem
+                literals.append((positive, f_exp.fluent(), tuple(template)))
+        if len(literals) == 0:
+            self._static_candidates[old_action] = None
+            return None
+        items_list = self._items_list(old_action)
+        # the positive literals whose true facts are known are joined, the others are checked
+        joined = [(f, t) for positive, f, t in literals if positive and self._static_facts.is_indexed(f)]
+        checked = [(positive, f, t) for positive, f, t in literals if not (positive and self._static_facts.is_indexed(f))]
+        domains_sets = [set(items) for items in items_list]
+        res: List[Tuple[FNode, ...]] = []
+        binding: List[Optional[FNode]] = [None] * len(items_list)
+        for candidate in self._static_facts.join(joined, binding, items_list, domains_sets):
+            if all(self._static_facts.holds(f, tuple(candidate[x] if isinstance(x, int) else x for x in t)) == positive
+                   for positive, f, t in checked):
+                res.append(candidate)
+        positions = [{v: i for i, v in enumerate(items)} for items in items_list]
+        res.sort(key=lambda c: tuple(p[v] for p, v in zip(positions, c)))
+        self._static_candidates[old_action] = res
+        return res
+
+    def _subs(self, old_action: Action, grounded_params: Tuple[FNode, ...]) -> Dict[Expression, Expression]:
+        return dict(zip(old_action.parameters, list(grounded_params)))
+
+    def _add_grounded_action(self, old_action: Action, new_action: Action, params: List[FNode]):
+        '''Adds a feasible grounded action, with a fresh name, to the new problem.'''
+        assert self._new_problem is not None
+        self._map_parameters[new_action] = params
+        self._new_problem.add_action(new_action)
+        self._new_to_old[new_action] = old_action
+        self._map_old_to_new_action(old_action, new_action)
+
+    def _ground_in_parallel(self, names: Optional[Set[str]]):
+        '''Grounds the actions of the problem with a pool of processes. The chunks
+        are collected in the order they are submitted, so the resulting actions
+        are added in the same order of the sequential grounding.'''
+        assert self._new_problem is not None
+        parallel_actions: Dict[int, int] = {}
+        chunks: List[Tuple[int, int, int]] = []
+        for i, old_action in enumerate(self._problem.actions):
+            if len(old_action.parameters) == 0 or _has_simulated_effects(old_action):
+                continue
+            count = self._grounded_params_count(old_action)
+            start = len(chunks)
+            for s in range(0, count, self._chunk_size):
+                chunks.append((i, s, min(s + self._chunk_size, count)))
+            parallel_actions[i] = len(chunks) - start
+        with Pool(self._processes, initializer=_init_worker,
+                  initargs=(self._problem, self._name, self._grounding_actions_map)) as pool:
+            results = pool.imap(_ground_chunk, chunks)
+            for i, old_action in enumerate(self._problem.actions):
+                if i not in parallel_actions:
+                    self._ground_action(old_action, names)
+                    continue
+                grounded_actions = self._collect_chunks(old_action, parallel_actions[i], results)
+                for new_action, params in self._fresh_grounded_actions(old_action, grounded_actions, names):
+                    self._add_grounded_action(old_action, new_action, params)
+
+    def _collect_chunks(self, old_action: Action, chunks: int, results: Iterator[bytes]) -> Iterator[Tuple[Action, Tuple[FNode, ...]]]:
+        '''Returns the feasible grounded derivates of the given action in the next chunks
+        of results of the worker processes, together with their parameters tuples.'''
+        for _ in range(chunks):
+            start, grounded = _GroundActionsUnpickler(io.BytesIO(next(results)), self._problem).load()
+            grounded_params_list = list(self._grounded_params(old_action, start, start + self._chunk_size))
+            for idx, new_action in grounded:
+                yield new_action, grounded_params_list[idx]
 
     def _create_effect_with_given_subs(self, old_effect: Effect, subs: Dict[Expression, Expression]) -> Optional[Effect]:
         new_fluent = self._substituter.substitute(old_effect.fluent, subs)
@@ -141,13 +339,17 @@ class Grounder(ActionBasedTransformer):
             return Effect(new_fluent, new_value, new_condition, old_effect.kind)
 
     def _create_action_with_given_subs(self, old_action: Action, subs: Dict[Expression, Expression]) -> Optional[Action]:
-        naming_list: List[str] = []
+        '''Returns the action obtained applying the given substitution to the given action,
+        or None if the action is not feasible. The returned action is named joining the
+        names of the action and of the parameters, the fresh name is given when the action
+        is added to the new problem.'''
+        naming_list: List[str] = [old_action.name]
         for param, value in subs.items():
             assert isinstance(param, Parameter)
             assert isinstance(value, FNode)
             naming_list.append(str(value))
         if isinstance(old_action, InstantaneousAction):
-            new_action = InstantaneousAction(self.get_fresh_name(old_action.name, naming_list))
+            new_action = InstantaneousAction('_'.join(naming_list))
             for p in old_action.preconditions:
                 new_action.add_precondition(self._substituter.substitute(p, subs))
             for e in old_action.effects:
@@ -169,7 +371,7 @@ class Grounder(ActionBasedTransformer):
             new_action._set_preconditions(new_preconditions)
             return new_action
         elif isinstance(old_action, DurativeAction):
-            new_durative_action = DurativeAction(self.get_fresh_name(old_action.name, naming_list))
+            new_durative_action = DurativeAction('_'.join(naming_list))
             new_durative_action.set_duration_constraint(old_action.duration)
             for i, cl in old_action.conditions.items():
                 for c in cl:
@@ -230,10 +432,197 @@ class Grounder(ActionBasedTransformer):
         assert self._new_problem is not None
         name_list = [original_name]
         name_list.extend(parameters_names)
-        new_name = '_'.join(name_list)
-        base_name = new_name
-        count = 0
+        base_name = '_'.join(name_list)
+        count = self._fresh_names_counters.get(base_name, 0)
+        new_name = base_name if count == 0 else f'{base_name}_{str(count - 1)}'
         while(self._problem.has_name(new_name) or self._new_problem.has_name(new_name)):
             new_name = f'{base_name}_{str(count)}'
             count += 1
+        self._fresh_names_counters[base_name] = count + 1
         return new_name
+
+
+class _StaticFacts:
+    '''The initial values of the boolean fluents of a problem. The true facts of the
+    fluents that are false by default are indexed by the value of each argument.'''
+    def __init__(self, problem: Problem):
+        self._initial_values = problem.initial_values
+        self._indexed: Set[Fluent] = set()
+        self._index: Dict[Tuple[Fluent, int, FNode], List[Tuple[FNode, ...]]] = {}
+        self._facts: Dict[Fluent, List[Tuple[FNode, ...]]] = {}
+        for f, v in problem.fluents_defaults.items():
+            if v.is_false():
+                self._indexed.add(f)
+        for f_exp, v in problem.explicit_initial_values.items():
+            f = f_exp.fluent()
+            if f in self._indexed and v.is_true():
+                self._facts.setdefault(f, []).append(tuple(f_exp.args))
+                for i, a in enumerate(f_exp.args):
+                    self._index.setdefault((f, i, a), []).append(tuple(f_exp.args))
+
+    def is_indexed(self, fluent: Fluent) -> bool:
+        return fluent in self._indexed
+
+    def holds(self, fluent: Fluent, args: Tuple[FNode, ...]) -> Optional[bool]:
+        '''Returns the initial value of the given boolean fluent applied to the given
+        arguments, or None if it is not a ground fluent expression of the problem.'''
+        v = self._initial_values.ground_value(fluent, args)
+        return None if v is None else v.is_true()
+
+    def join(self, literals: List[Tuple[Fluent, Tuple[Union[int, FNode], ...]]], binding: List[Optional[FNode]],
+             items_list: List[List[FNode]], domains_sets: List[Set[FNode]]) -> Iterator[Tuple[FNode, ...]]:
+        '''Returns the completions of the given binding of the parameters that make
+        true all the given indexed literals.'''
+        if len(literals) == 0:
+            free = [j for j, b in enumerate(binding) if b is None]
+            for values in product(*(items_list[j] for j in free)):
+                for j, v in zip(free, values):
+                    binding[j] = v
+                yield tuple(binding) # type: ignore
+            for j in free:
+                binding[j] = None
+            return
+        fluent, template = literals[0]
+        candidates: Iterable[Tuple[FNode, ...]] = self._facts.get(fluent, [])
+        for position, t in enumerate(template):
+            value = binding[t] if isinstance(t, int) else t
+            if value is not None:
+                candidates = self._index.get((fluent, position, value), [])
+                break
+        for fact in candidates:
+            new_binding = binding[:]
+            for t, a in zip(template, fact):
+                if isinstance(t, int):
+                    b = new_binding[t]
+                    if b is None and a in domains_sets[t]:
+                        new_binding[t] = a
+                    elif b is not a:
+                        break
+                elif t is not a:
+                    break
+            else:
+                yield from self.join(literals[1:], new_binding, items_list, domains_sets)
+
+
+def _product_slice(items_list: List[List[FNode]], start: int, stop: Optional[int]) -> Iterator[Tuple[FNode, ...]]:
+    '''Returns the tuples of the product of the given lists from the start-th to the
+    stop-th; the start-th tuple is decoded from start as a mixed-radix number, so the
+    previous tuples are not enumerated.'''
+    sizes = [len(items) for items in items_list]
+    count = 1
+    for size in sizes:
+        count *= size
+    if stop is None or stop > count:
+        stop = count
+    indexes = [0] * len(sizes)
+    rest = start
+    for j in range(len(sizes) - 1, -1, -1):
+        rest, indexes[j] = divmod(rest, sizes[j])
+    for _ in range(start, stop):
+        yield tuple(items[i] for items, i in zip(items_list, indexes))
+        j = len(sizes) - 1
+        while j >= 0:
+            indexes[j] += 1
+            if indexes[j] < sizes[j]:
+                break
+            indexes[j] = 0
+            j -= 1
+
+
+def _has_simulated_effects(action: Action) -> bool:
+    if isinstance(action, InstantaneousAction):
+        return action.simulated_effect is not None
+    elif isinstance(action, DurativeAction):
+        return len(action.simulated_effects) > 0
+    return False
+
+
+class _GroundActionsPickler(pickle.Pickler):
+    '''Pickles the actions grounded in a worker process, replacing the expressions,
+    the environment and the symbols of the problem with references that are
+    resolved by the _GroundActionsUnpickler in the parent process.'''
+    def __init__(self, file: io.BytesIO):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        # The same reference is returned for the same expression, so that the
+        # pickle memo shares the common subexpressions.
+        self._fnodes_ids: Dict[FNode, Tuple[Any, ...]] = {}
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, FNode):
+            res = self._fnodes_ids.get(obj, None)
+            if res is None:
+                res = ('fnode', obj.node_type, obj.args, obj._content.payload)
+                self._fnodes_ids[obj] = res
+            return res
+        elif isinstance(obj, Environment):
+            return 'env'
+        elif isinstance(obj, Fluent):
+            return ('fluent', obj.name)
+        elif isinstance(obj, Object):
+            return ('object', obj.name)
+        elif isinstance(obj, Type):
+            if obj.is_user_type():
+                return ('user_type', obj.name) # type: ignore
+            elif obj.is_int_type() or obj.is_real_type():
+                return ('int_type' if obj.is_int_type() else 'real_type', obj.lower_bound, obj.upper_bound) # type: ignore
+            elif obj.is_bool_type():
+                return ('bool_type', )
+            elif obj.is_time_type():
+                return ('time_type', )
+        return None
+
+
+class _GroundActionsUnpickler(pickle.Unpickler):
+    '''Unpickles the actions pickled by the _GroundActionsPickler, creating the
+    expressions in the environment of the given problem.'''
+    def __init__(self, file: io.BytesIO, problem: Problem):
+        pickle.Unpickler.__init__(self, file)
+        self._problem = problem
+
+    def persistent_load(self, pid: Any) -> Any:
+        env = self._problem.env
+        if pid == 'env':
+            return env
+        elif pid[0] == 'fnode':
+            return env.expression_manager.create_node(pid[1], pid[2], pid[3])
+        elif pid[0] == 'fluent':
+            return self._problem.fluent(pid[1])
+        elif pid[0] == 'object':
+            return self._problem.object(pid[1])
+        elif pid[0] == 'user_type':
+            return self._problem.user_type(pid[1])
+        elif pid[0] == 'int_type':
+            return env.type_manager.IntType(pid[1], pid[2])
+        elif pid[0] == 'real_type':
+            return env.type_manager.RealType(pid[1], pid[2])
+        elif pid[0] == 'bool_type':
+            return env.type_manager.BoolType()
+        elif pid[0] == 'time_type':
+            return TIME
+        raise pickle.UnpicklingError(f'Unknown persistent id: {pid}')
+
+
+# The grounder used by the worker processes of the parallel grounding.
+_worker_grounder: Optional[Grounder] = None
+
+
+def _init_worker(problem: Problem, name: str, grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]]):
+    global _worker_grounder
+    _worker_grounder = Grounder(problem, name, grounding_actions_map)
+
+
+def _ground_chunk(chunk: Tuple[int, int, int]) -> bytes:
+    '''Grounds the parameters tuples from start to stop of the action_idx-th action of
+    the problem and returns the pickled list of the feasible actions, together with
+    the positions of their parameters tuples in the chunk.'''
+    assert _worker_grounder is not None
+    action_idx, start, stop = chunk
+    old_action = _worker_grounder._problem.actions[action_idx]
+    grounded = []
+    for i, grounded_params in enumerate(_worker_grounder._grounded_params(old_action, start, stop)):
+        new_action = _worker_grounder._create_action_with_given_subs(old_action, _worker_grounder._subs(old_action, grounded_params))
+        if new_action is not None:
+            grounded.append((i, new_action))
+    buf = io.BytesIO()
+    _GroundActionsPickler(buf).dump((start, grounded))
+    return buf.getvalue()
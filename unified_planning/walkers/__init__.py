@@ -22,3 +22,4 @@ from unified_planning.walkers.simplifier import Simplifier
 from unified_planning.walkers.substituter import Substituter
 from unified_planning.walkers.type_checker import TypeChecker
 from unified_planning.walkers.free_vars import FreeVarsExtractor
+from unified_planning.walkers.digester import Digester
@@ -0,0 +1,73 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import hashlib
+import unified_planning.walkers as walkers
+from unified_planning.model import FNode, OperatorKind
+from typing import Iterable, List
+
+
+# The digests are integers modulo this prime, so that the sums and the products
+# of digests are digests as well.
+MODULUS = 2**127 - 1
+
+
+def digest(*items: object) -> int:
+    """Returns a digest of the string representations of the given items that
+    does not change among different runs of the interpreter."""
+    h = hashlib.blake2b(digest_size=16)
+    for i in items:
+        h.update(str(i).encode())
+        h.update(b'\0')
+    return int.from_bytes(h.digest(), 'big') % MODULUS
+
+
+def digest_of_set(digests: Iterable[int]) -> int:
+    """Returns the digest of the set of the given digests, that does not depend
+    on their order nor on their repetitions."""
+    return sum(set(digests)) % MODULUS
+
+
+class Digester(walkers.DagWalker):
+    """This expression walker returns a digest of a given expression, that does
+    not depend on the environment of the expression nor on the run of the interpreter."""
+
+    def __init__(self):
+        walkers.DagWalker.__init__(self)
+
+    def get(self, expression: FNode) -> int:
+        """Returns the digest of the given expression."""
+        return self.walk(expression)
+
+    @walkers.handles(OperatorKind)
+    def walk_all_types(self, expression: FNode, args: List[int]) -> int:
+        if expression.is_object_exp():
+            o = expression.object()
+            payload = f'{o.type} {o.name}'
+        elif expression.is_fluent_exp():
+            payload = repr(expression.fluent())
+        elif expression.is_parameter_exp():
+            payload = repr(expression.parameter())
+        elif expression.is_variable_exp():
+            payload = repr(expression.variable())
+        elif expression.is_exists() or expression.is_forall():
+            payload = ', '.join(repr(v) for v in expression.variables())
+        elif expression.is_constant():
+            payload = repr(expression.constant_value())
+        elif expression.is_timing_exp():
+            payload = repr(expression.timing())
+        else:
+            payload = ''
+        return digest(expression.node_type.name, payload, *args)